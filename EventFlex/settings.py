@@ -33,6 +33,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'EventFlex_app.middleware.ApiCompressionMiddleware',  # Compress large API responses
+    'EventFlex_app.middleware.StaticAssetMiddleware',  # Pre-compressed static assets
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -98,6 +100,39 @@ else:
     }
 
 
+# Cache backend: 'locmem' (default, per process), 'file' (shared by all processes on
+# one host) or a full backend path such as django.core.cache.backends.redis.RedisCache
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+if CACHE_BACKEND == 'file':
+    default_cache = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', str(BASE_DIR / '.cache')),
+    }
+elif CACHE_BACKEND == 'locmem':
+    default_cache = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'eventflex',
+    }
+else:
+    default_cache = {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+default_cache['KEY_PREFIX'] = os.getenv('CACHE_KEY_PREFIX', '')
+
+CACHES = {
+    'default': default_cache,
+    # {% cache %} fragments stay per process so a deploy (restart) always drops them
+    'template_fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'eventflex-fragments',
+    },
+}
+
+# Rendered marketing pages are cached this many seconds (0 disables the page cache)
+PAGE_CACHE_SECONDS = int(os.getenv('PAGE_CACHE_SECONDS', 3600))
+
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -131,6 +166,21 @@ STATICFILES_DIRS = [
 # Vercel static files configuration
 STATIC_ROOT = BASE_DIR / 'staticfiles_build' / 'static'
 
+# Minified, content-hashed, pre-compressed assets served by StaticAssetMiddleware.
+# On by default in production; requires collectstatic (build_files.sh) to have run.
+STATIC_ASSET_PIPELINE = os.getenv('STATIC_ASSET_PIPELINE', str(not DEBUG)) == 'True'
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'EventFlex_app.assets.CompressedManifestStaticFilesStorage' if STATIC_ASSET_PIPELINE
+            else 'django.contrib.staticfiles.storage.StaticFilesStorage'
+        ),
+    },
+}
+
 MEDIA_URL = os.getenv('MEDIA_URL', '/media/')
 MEDIA_ROOT = BASE_DIR / os.getenv('MEDIA_ROOT', 'media')
 
@@ -157,4 +207,31 @@ JWT_COOKIE_SECURE = not DEBUG  # Use secure cookies in production
 JWT_COOKIE_HTTPONLY = True  # Prevent JavaScript access
 JWT_COOKIE_SAMESITE = 'Lax'  # CSRF protection
 
+# Idempotency-Key replay window for payment endpoints
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.getenv('IDEMPOTENCY_KEY_TTL_HOURS', 24))
+
+# Delta-sync cursors never pass change-log entries younger than this many seconds: ids are taken at
+# INSERT but become visible at COMMIT, so a lower id may still be in flight (keep it above the
+# longest request transaction, e.g. finish_job for a large crew)
+SYNC_CURSOR_LAG_SECONDS = int(os.getenv('SYNC_CURSOR_LAG_SECONDS', 30))
+
+# API JSON encoder: 'auto' uses orjson when installed, 'stdlib' forces the json module
+API_JSON_ENCODER = os.getenv('API_JSON_ENCODER', 'auto')
+# API responses at least this large are brotli/gzip-compressed (0 disables)
+API_COMPRESSION_MIN_BYTES = int(os.getenv('API_COMPRESSION_MIN_BYTES', 1024))
+
+# Landing/signup page counters: fresh for LANDING_STATS_TTL seconds, then served stale
+# (while one request refreshes them) for up to LANDING_STATS_STALE_TTL more seconds
+LANDING_STATS_TTL = int(os.getenv('LANDING_STATS_TTL', 300))
+LANDING_STATS_STALE_TTL = int(os.getenv('LANDING_STATS_STALE_TTL', 3600))
+
+# Seconds between checks for changed rows by each process's in-memory autocomplete index
+AUTOCOMPLETE_REFRESH_SECONDS = int(os.getenv('AUTOCOMPLETE_REFRESH_SECONDS', 10))
+# Build those indexes in a background thread when the WSGI process starts
+AUTOCOMPLETE_WARM_ON_START = os.getenv('AUTOCOMPLETE_WARM_ON_START', 'True') == 'True'
+# Suggestion usage counts are buffered per process and upserted this often (0 writes them immediately).
+# Vercel freezes the function after each response and kills it without exit hooks, so a buffer
+# waiting for a timer or atexit would be lost there: write inline by default on Vercel.
+AUTOCOMPLETE_FLUSH_SECONDS = float(os.getenv('AUTOCOMPLETE_FLUSH_SECONDS', 0 if os.getenv('VERCEL') else 5))
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -9,11 +9,21 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'EventFlex.settings')
 
 application = get_wsgi_application()
 
+# Build the in-memory autocomplete indexes before the first typeahead needs them
+if settings.AUTOCOMPLETE_WARM_ON_START:
+    from EventFlex_app.autocomplete import warm_in_background
+    warm_in_background()
+
+# Write buffered suggestion usage counts when the server process stops
+from EventFlex_app.suggestion_counts import flush_at_exit
+flush_at_exit()
+
 # Vercel serverless function handler
 app = application
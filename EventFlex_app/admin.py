@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import UserProfile, Job, Application, Transaction, Message, AutocompleteSuggestion, BlacklistedToken, VerificationDocument, Review
+from .models import UserProfile, Job, Application, CalendarEntry, Transaction, Message, AutocompleteSuggestion, BlacklistedToken, VerificationDocument, Review, ChangeLogEntry, IdempotencyKey, WalletSummary, MonthlyTransactionRollup
 
 # Register your models here.
 
@@ -15,7 +15,7 @@ class UserProfileAdmin(admin.ModelAdmin):
 class JobAdmin(admin.ModelAdmin):
 	list_display = ('title', 'organizer', 'date', 'location', 'pay_rate')
 	search_fields = ('title', 'organizer__user__username', 'location')
-	list_filter = ('event_type',)
+	list_filter = ('event_type', 'city')
 
 
 @admin.register(Application)
@@ -25,6 +25,14 @@ class ApplicationAdmin(admin.ModelAdmin):
 	list_filter = ('status',)
 
 
+@admin.register(CalendarEntry)
+class CalendarEntryAdmin(admin.ModelAdmin):
+	list_display = ('profile', 'kind', 'starts_at', 'ends_at', 'application')
+	search_fields = ('profile__user__username', 'note')
+	list_filter = ('kind',)
+	raw_id_fields = ('profile', 'application')
+
+
 @admin.register(Transaction)
 class TransactionAdmin(admin.ModelAdmin):
 	list_display = ('user', 'amount', 'created_at')
@@ -99,7 +107,7 @@ class VerificationDocumentAdmin(admin.ModelAdmin):
 			# Update UserProfile KYC status
 			user_profile = verification.user
 			user_profile.kyc_verified = True
-			user_profile.save()
+			user_profile.save(update_fields=['kyc_verified'])
 			
 			count += 1
 		
@@ -129,4 +137,32 @@ class ReviewAdmin(admin.ModelAdmin):
 	readonly_fields = ('created_at', 'updated_at')
 
 
+@admin.register(ChangeLogEntry)
+class ChangeLogEntryAdmin(admin.ModelAdmin):
+	list_display = ('id', 'profile', 'entity_type', 'entity_id', 'action', 'created_at')
+	list_filter = ('entity_type', 'action')
+	search_fields = ('profile__user__username',)
+
 
+@admin.register(IdempotencyKey)
+class IdempotencyKeyAdmin(admin.ModelAdmin):
+	list_display = ('key', 'user', 'status_code', 'created_at', 'expires_at')
+	search_fields = ('key', 'user__username')
+	readonly_fields = ('user', 'key', 'request_hash', 'status_code', 'response_body', 'created_at', 'expires_at')
+	
+	def has_add_permission(self, request):
+		return False
+
+
+@admin.register(WalletSummary)
+class WalletSummaryAdmin(admin.ModelAdmin):
+	list_display = ('profile', 'balance', 'pending_amount', 'total_earned', 'total_events', 'activity_stale', 'updated_at')
+	search_fields = ('profile__user__username',)
+	readonly_fields = ('updated_at',)
+
+
+@admin.register(MonthlyTransactionRollup)
+class MonthlyTransactionRollupAdmin(admin.ModelAdmin):
+	list_display = ('user', 'month', 'transaction_type', 'total_amount', 'transaction_count')
+	list_filter = ('transaction_type', 'month')
+	search_fields = ('user__user__username',)
@@ -0,0 +1,154 @@
+"""
+JSON Responses for EventFlex
+Fast, centrally encoded JSON bodies and negotiated compression for the /api/ surface
+
+Encoding: JsonResponse is a drop-in for django.http.JsonResponse. Bodies
+are serialized with orjson when it is installed (optional dependency) and
+with the stdlib json module otherwise; API_JSON_ENCODER = 'stdlib' forces
+the fallback. Both backends share one set of rules, so views put model
+values in their payloads as they are:
+
+    Decimal            -> "1500.00"  (string, exact)
+    datetime/date/time -> "2025-01-02T03:04:05+00:00"  (isoformat)
+    UUID, lazy strings -> str()
+
+Output is compact UTF-8 and identical for both backends.
+
+Compression (ApiCompressionMiddleware): API responses of at least
+API_COMPRESSION_MIN_BYTES are brotli- (if the optional brotli package is
+installed) or gzip-compressed according to Accept-Encoding. Smaller bodies
+are sent as they are; compressing them costs more than it saves.
+"""
+
+import gzip
+import json
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.conf import settings
+from django.http import JsonResponse as DjangoJsonResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.functional import Promise
+
+from .assets import accepted_encodings
+
+# Import for fast JSON encoding (optional, the stdlib encoder is the fallback)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Import for brotli compression (optional, gzip is always available)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Levels tuned for per-request compression, not the build-time maximum used in assets.py
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_CONTENT_TYPES = ('application/json', 'text/')
+
+
+def encode_default(value):
+    """Encode the non-JSON types EventFlex payloads contain (see module docstring)"""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Promise)):
+        return str(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+class _StdlibEncoder(json.JSONEncoder):
+    def default(self, value):
+        return encode_default(value)
+
+
+def _use_orjson():
+    return orjson is not None and getattr(settings, 'API_JSON_ENCODER', 'auto') != 'stdlib'
+
+
+def dumps(data):
+    """
+    Serialize data to compact UTF-8 JSON bytes with the configured backend
+
+    Values orjson refuses (integers wider than 64 bits, timezone-aware
+    times) are retried with the stdlib encoder.
+    """
+    if _use_orjson():
+        try:
+            return orjson.dumps(data, default=encode_default, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, cls=_StdlibEncoder, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class JsonResponse(DjangoJsonResponse):
+    """
+    django.http.JsonResponse serialized with dumps()
+
+    Passing encoder or json_dumps_params keeps Django's behaviour exactly,
+    for callers that need a custom encoder.
+    """
+
+    def __init__(self, data, encoder=None, safe=True, json_dumps_params=None, **kwargs):
+        if encoder is not None or json_dumps_params is not None:
+            super().__init__(data, encoder=encoder or _StdlibEncoder, safe=safe,
+                             json_dumps_params=json_dumps_params, **kwargs)
+            return
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                'In order to allow non-dict objects to be serialized set the '
+                'safe parameter to False.'
+            )
+        kwargs.setdefault('content_type', 'application/json')
+        super(DjangoJsonResponse, self).__init__(content=dumps(data), **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Compression
+# ---------------------------------------------------------------------------
+
+def _compress(data, accepted):
+    """Return (encoding, bytes) for the best encoding the client accepts, or (None, data)"""
+    if brotli is not None and 'br' in accepted:
+        return 'br', brotli.compress(data, quality=BROTLI_QUALITY)
+    if 'gzip' in accepted:
+        return 'gzip', gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    return None, data
+
+
+def compress_response(request, response):
+    """
+    Compress an API response body in place when it is large enough
+
+    Streaming responses (exports compress themselves), bodies that already
+    have a Content-Encoding and non-text content types are left untouched.
+    """
+    min_bytes = getattr(settings, 'API_COMPRESSION_MIN_BYTES', 1024)
+    if not min_bytes or response.streaming or response.has_header('Content-Encoding'):
+        return response
+    if not response.get('Content-Type', '').startswith(COMPRESSIBLE_CONTENT_TYPES):
+        return response
+    if len(response.content) < min_bytes:
+        return response
+
+    # The body now depends on Accept-Encoding, whether or not this client gets it compressed
+    patch_vary_headers(response, ('Accept-Encoding',))
+
+    encoding, compressed = _compress(response.content, accepted_encodings(request))
+    if encoding is None or len(compressed) >= len(response.content):
+        return response
+
+    response.content = compressed
+    response['Content-Encoding'] = encoding
+    response['Content-Length'] = str(len(compressed))
+    # The compressed bytes differ from the identity representation
+    etag = response.get('ETag')
+    if etag and etag.startswith('"'):
+        response['ETag'] = 'W/' + etag
+    return response
@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete
 
 
 class EventflexAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'EventFlex_app'
+
+    def ready(self):
+        from . import autocomplete
+
+        # Deleted suggestions cannot be seen by the incremental refresh, so every index is rebuilt
+        post_delete.connect(autocomplete.suggestion_deleted, sender=self.get_model('AutocompleteSuggestion'),
+                            dispatch_uid='autocomplete_suggestion_deleted')
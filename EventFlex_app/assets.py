@@ -0,0 +1,386 @@
+"""
+Static Asset Pipeline for EventFlex
+Minifies, fingerprints and pre-compresses static files at collectstatic time and serves them
+
+Build (build_files.sh runs collectstatic with STATIC_ASSET_PIPELINE=True):
+
+    1. CSS and JS are minified as they are written to STATIC_ROOT (comments
+       and layout whitespace only; string, template and regex literals are
+       copied verbatim)
+    2. ManifestStaticFilesStorage stores every file a second time under a
+       content-hashed name (script.3f2a9c1b.js) and {% static %} emits it
+    3. every hashed text asset gets a .gz sibling, plus a .br sibling when
+       the optional brotli package is installed
+
+Serving (StaticAssetMiddleware): the best pre-compressed variant the
+client accepts is sent with Vary: Accept-Encoding. Hashed names never
+change content, so they are marked immutable for a year; returning
+visitors do not even revalidate them.
+"""
+
+import gzip
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.http import FileResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+# Import for brotli pre-compression (optional, gzip is always produced)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.mjs', '.json', '.map', '.svg', '.txt', '.html', '.xml')
+
+# Hashed assets never change; unhashed names may, so they are only cached briefly
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+MUTABLE_MAX_AGE = 60 * 60
+
+
+# ---------------------------------------------------------------------------
+# Minification
+# ---------------------------------------------------------------------------
+
+_CSS_COMMENT = re.compile(r'/\*(?!!).*?\*/', re.S)
+_CSS_STRING = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')''')
+_CSS_SPACE_AROUND = re.compile(r'\s*([{};,>])\s*')
+
+
+def minify_css(source):
+    """Strip comments and layout whitespace from a stylesheet (strings are left untouched)"""
+    parts = _CSS_STRING.split(source)
+    for index in range(0, len(parts), 2):
+        # Even indexes are outside string literals
+        part = _CSS_COMMENT.sub('', parts[index])
+        part = re.sub(r'\s+', ' ', part)
+        part = _CSS_SPACE_AROUND.sub(r'\1', part)
+        parts[index] = part.replace(';}', '}')
+    return ''.join(parts).strip()
+
+
+# A '/' after one of these starts a regular expression literal rather than a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'instanceof', 'new',
+    'delete', 'void', 'throw', 'yield', 'await',
+}
+
+
+def _is_word_char(char):
+    return char.isalnum() or char in '_$\\' or ord(char) > 127
+
+
+def _copy_quoted(source, index, out):
+    """Copy a '...' or "..." literal starting at index; return the index after it"""
+    quote = source[index]
+    end = index + 1
+    while end < len(source):
+        char = source[end]
+        if char == '\\':
+            end += 2
+            continue
+        end += 1
+        if char == quote:
+            out.append(source[index:end])
+            return end
+    raise ValueError('Unterminated string literal')
+
+
+def _copy_template(source, index, out):
+    """
+    Copy template literal text starting at index (just after ` or a closing })
+
+    Returns:
+        tuple: (next index, True if it stopped at a ${ substitution)
+    """
+    start = index
+    while index < len(source):
+        char = source[index]
+        if char == '\\':
+            index += 2
+        elif char == '`':
+            out.append(source[start:index + 1])
+            return index + 1, False
+        elif char == '$' and source.startswith('${', index):
+            out.append(source[start:index + 2])
+            return index + 2, True
+        else:
+            index += 1
+    raise ValueError('Unterminated template literal')
+
+
+def _copy_regex(source, index, out):
+    """Copy a /.../flags literal starting at index; return the index after it"""
+    end = index + 1
+    in_class = False
+    while end < len(source):
+        char = source[end]
+        if char == '\\':
+            end += 2
+            continue
+        if char == '\n':
+            break
+        end += 1
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            while end < len(source) and _is_word_char(source[end]):
+                end += 1
+            out.append(source[index:end])
+            return end
+    raise ValueError('Unterminated regular expression literal')
+
+
+def minify_js(source):
+    """
+    Strip comments and layout whitespace from a script
+
+    Conservative on purpose: line breaks are kept (one per run of blank
+    lines) so automatic semicolon insertion behaves exactly as before,
+    and literals are copied verbatim. /*! ... */ license comments stay.
+    """
+    out = []
+    last = ''              # previous token (a punctuation char or a whole word)
+    pending_space = ''     # whitespace seen since the previous token: '', ' ' or '\n'
+    brace_depth = 0
+    template_braces = []   # brace depth at each open ${ substitution
+    index = 0
+    length = len(source)
+
+    while index < length:
+        char = source[index]
+
+        if char.isspace():
+            if char == '\n' or pending_space == '\n':
+                pending_space = '\n'
+            else:
+                pending_space = ' '
+            index += 1
+            continue
+
+        if char == '/' and source.startswith('//', index):
+            end = source.find('\n', index)
+            index = length if end == -1 else end
+            continue
+
+        if char == '/' and source.startswith('/*', index):
+            end = source.find('*/', index + 2)
+            if end == -1:
+                raise ValueError('Unterminated comment')
+            comment = source[index:end + 2]
+            index = end + 2
+            if comment.startswith('/*!'):
+                out.append(comment)
+                pending_space = '\n'
+            elif '\n' in comment:
+                pending_space = '\n'
+            elif not pending_space:
+                pending_space = ' '
+            continue
+
+        if pending_space and out:
+            previous = out[-1][-1]
+            if pending_space == '\n':
+                out.append('\n')
+            elif (
+                (_is_word_char(previous) and _is_word_char(char))
+                or (previous in '+-' and char in '+-')
+                or (previous.isdigit() and char == '.')
+                or previous == '/' or char == '/'
+            ):
+                out.append(' ')
+        pending_space = ''
+
+        if char in '\'"':
+            index = _copy_quoted(source, index, out)
+            last = ')'
+        elif char == '`':
+            out.append('`')
+            index, substitution = _copy_template(source, index + 1, out)
+            if substitution:
+                template_braces.append(brace_depth)
+                last = '('
+            else:
+                last = ')'
+        elif char == '}' and template_braces and template_braces[-1] == brace_depth:
+            template_braces.pop()
+            out.append('}')
+            index, substitution = _copy_template(source, index + 1, out)
+            if substitution:
+                template_braces.append(brace_depth)
+                last = '('
+            else:
+                last = ')'
+        elif char == '/' and (not last or last in _REGEX_PRECEDERS or last in _REGEX_KEYWORDS):
+            index = _copy_regex(source, index, out)
+            last = ')'
+        elif _is_word_char(char):
+            end = index + 1
+            while end < length and _is_word_char(source[end]):
+                end += 1
+            last = source[index:end]
+            out.append(last)
+            index = end
+        else:
+            if char == '{':
+                brace_depth += 1
+            elif char == '}':
+                brace_depth -= 1
+            out.append(char)
+            last = char
+            index += 1
+
+    return ''.join(out).strip() + '\n'
+
+
+_MINIFIERS = {
+    '.css': minify_css,
+    '.js': minify_js,
+    '.mjs': minify_js,
+}
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+def _precompressed_variants(data):
+    """Yield (suffix, bytes) for each encoding that actually shrinks the file"""
+    variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=11)))
+    for suffix, compressed in variants:
+        if len(compressed) < len(data):
+            yield suffix, compressed
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    ManifestStaticFilesStorage that also minifies CSS/JS and writes .gz/.br siblings
+
+    Fingerprints are computed from the source files, so they change exactly
+    when the sources do.
+    """
+
+    def _save(self, name, content):
+        minify = _MINIFIERS.get(os.path.splitext(name)[1])
+        if minify is not None and '.min.' not in name:
+            content.seek(0)
+            text = content.read()
+            if isinstance(text, bytes):
+                text = text.decode('utf-8')
+            content = ContentFile(minify(text).encode('utf-8'))
+        return super()._save(name, content)
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+
+        for name in sorted(set(self.hashed_files.values())):
+            if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            with self.open(name) as asset:
+                data = asset.read()
+            for suffix, compressed in _precompressed_variants(data):
+                if self.exists(name + suffix):
+                    self.delete(name + suffix)
+                self._save(name + suffix, ContentFile(compressed))
+                yield name, name + suffix, True
+
+
+# ---------------------------------------------------------------------------
+# Serving
+# ---------------------------------------------------------------------------
+
+# Negotiation order: the smallest encoding first
+_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+_asset_index = None
+
+
+def _build_asset_index():
+    """Map every file under STATIC_ROOT to its size, mtime, variants and immutability"""
+    root = str(settings.STATIC_ROOT)
+    storage = CompressedManifestStaticFilesStorage()
+    hashed_names = set(storage.hashed_files.values())
+
+    index = {}
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, root).replace(os.sep, '/')
+            if name.endswith(('.gz', '.br')) and name[:-3] in hashed_names:
+                continue
+            variants = {
+                encoding: path + suffix
+                for encoding, suffix in _ENCODINGS
+                if os.path.exists(path + suffix)
+            }
+            index[name] = {
+                'path': path,
+                'mtime': int(os.stat(path).st_mtime),
+                'variants': variants,
+                'immutable': name in hashed_names,
+                'content_type': mimetypes.guess_type(name)[0] or 'application/octet-stream',
+            }
+    return index
+
+
+def accepted_encodings(request):
+    """Content codings the client accepts (Accept-Encoding entries without q=0)"""
+    accepted = set()
+    for item in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        coding, _, params = item.strip().partition(';')
+        if params.replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def static_asset_response(request, name):
+    """
+    Response for a collected static file, or None if STATIC_ROOT has no such file
+
+    Args:
+        request: GET/HEAD request
+        name: Path relative to STATIC_URL
+    """
+    global _asset_index
+    if _asset_index is None:
+        _asset_index = _build_asset_index()
+
+    asset = _asset_index.get(name)
+    if asset is None:
+        return None
+
+    path, encoding = asset['path'], None
+    accepted = accepted_encodings(request)
+    for candidate, _ in _ENCODINGS:
+        if candidate in asset['variants'] and candidate in accepted:
+            path, encoding = asset['variants'][candidate], candidate
+            break
+
+    response = FileResponse(open(path, 'rb'), content_type=asset['content_type'])
+    if encoding:
+        response['Content-Encoding'] = encoding
+    if asset['variants']:
+        patch_vary_headers(response, ('Accept-Encoding',))
+    response['Last-Modified'] = http_date(asset['mtime'])
+    if asset['immutable']:
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=MUTABLE_MAX_AGE)
+
+    conditional = get_conditional_response(request, last_modified=asset['mtime'], response=response)
+    if conditional is not response:
+        response.close()
+    return conditional
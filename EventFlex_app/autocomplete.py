@@ -0,0 +1,578 @@
+"""
+Autocomplete Index for EventFlex
+In-process typeahead over AutocompleteSuggestion, with no query per keystroke
+
+get_autocomplete_suggestions used to run value__icontains on every
+keystroke, which scans every row of the field type. Each process now keeps
+one SuggestionIndex per field_type, built from the table when the WSGI
+process starts (AUTOCOMPLETE_WARM_ON_START, in a background thread) or else
+the first time that field type is asked for:
+
+    - every value is indexed under each of its words: the casefolded text
+      from the start of that word to the end of the value (cut to
+      KEY_LENGTH characters). The keys live in one sorted list, so the keys
+      starting with a query are a contiguous range found with bisect
+    - every prefix whose range holds more than SCAN_LIMIT keys (the busy
+      nodes of a trie over the keys) has its TOP_K suggestions by usage
+      precomputed; smaller ranges are ranked on the fly
+
+A query matches a value when it is the start of one of the value's words:
+"gal" finds "Corporate Gala", "ala" does not. Ties in usage_count go to the
+most recently updated value, as with the model's ordering.
+
+When a query of FUZZY_MIN_LENGTH or more characters has fewer exact matches
+than requested, typo-tolerant matches follow them ("Banglore" finds
+"Bangalore"). Each query word is compared with the words of the indexed
+values: the words sharing the most trigrams with it are candidates, and
+those within max_edits() typos (insertions, deletions, substitutions or
+swapped neighbours) replace it. The first letter is taken as typed, which
+keeps the trigram lists short. The last word may still be half typed, so
+it is compared with word prefixes. The corrected query is then looked up
+like an exact one.
+
+At most every AUTOCOMPLETE_REFRESH_SECONDS a lookup also reads the rows
+whose updated_at moved since the previous refresh (one indexed query) and
+overlays them on the index. Usage counts only grow, so the precomputed
+lists stay valid as long as the changed rows are ranked alongside them.
+The index is rebuilt when that overlay grows past DELTA_LIMIT rows, when a
+value is renamed, and when any process deletes suggestions (a generation
+counter in the cache, bumped by invalidate()).
+
+Run `python manage.py benchmark_autocomplete` to measure build time and
+lookup latency at a million suggestions, and
+`python manage.py merge_autocomplete_suggestions` to fold near-duplicate
+rows ("bangalore", "Bangalore ", "Banglore") into the most used spelling.
+"""
+
+import bisect
+import heapq
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.utils import timezone
+
+GENERATION_KEY = 'eventflex:autocomplete:generation'
+
+# Suggestions returned per lookup (and precomputed per busy prefix)
+TOP_K = 10
+
+# Index keys are cut to this many characters; longer queries are checked against the full value
+KEY_LENGTH = 32
+
+# Prefixes matching more keys than this get their top suggestions precomputed
+SCAN_LIMIT = 128
+
+# Changed rows overlaid on an index before it is rebuilt from scratch
+DELTA_LIMIT = 1000
+
+# Rows saved just before a refresh may commit after it has read the table
+REFRESH_OVERLAP = timedelta(seconds=2)
+
+# Queries this long get typo-tolerant matches when exact ones run short
+FUZZY_MIN_LENGTH = 4
+
+# Vocabulary words sharing the most trigrams with a query word that are re-ranked by edit distance
+FUZZY_CANDIDATES = 50
+
+# Corrections of the last query word looked up per query
+FUZZY_WORDS = 3
+
+# Shorter values are only merged with exact duplicates (after normalization), not typos
+MERGE_MIN_LENGTH = 5
+
+# Sorts after every character, so key + _END bounds the keys starting with key
+_END = '\U0010ffff'
+
+# A value is indexed from its start and from every letter or digit that follows anything else
+_WORD_START = re.compile(r'(?<![^\W_])[^\W_]')
+
+_WORD = re.compile(r'[^\W_]+')
+
+
+def _refresh_seconds():
+    return getattr(settings, 'AUTOCOMPLETE_REFRESH_SECONDS', 10)
+
+
+def normalize(text):
+    """Casefolded text with runs of whitespace collapsed to one space"""
+    return ' '.join(text.casefold().split())
+
+
+def _word_starts(text):
+    starts = [match.start() for match in _WORD_START.finditer(text)]
+    if text and (not starts or starts[0]):
+        starts.insert(0, 0)
+    return starts
+
+
+def words(text):
+    """The letter/digit runs of already normalized text"""
+    return _WORD.findall(text)
+
+
+def max_edits(length):
+    """Typos tolerated in a word of this length"""
+    if length < FUZZY_MIN_LENGTH:
+        return 0
+    return 1 if length < 8 else 2
+
+
+def trigrams(word):
+    """Three-character slices of word, padded at the front only so a half-typed word still shares them"""
+    padded = '  ' + word
+    return {padded[i:i + 3] for i in range(len(word))}
+
+
+def edit_distance(word, other, limit, prefix=False):
+    """
+    Optimal string alignment distance between word and other, capped at limit + 1
+
+    Only the diagonal band of width 2 * limit + 1 is computed; anything
+    outside it is already more than limit edits away.
+
+    Args:
+        prefix: Compare word with the closest prefix of other instead (for half-typed words)
+    """
+    length, other_length = len(word), len(other)
+    over = limit + 1
+    if other_length < length - limit or (not prefix and other_length > length + limit):
+        return over
+
+    before, previous = None, [j if j <= limit else over for j in range(other_length + 1)]
+    for i in range(1, length + 1):
+        char = word[i - 1]
+        lo, hi = max(1, i - limit), min(other_length, i + limit)
+        current = [over] * (other_length + 1)
+        current[0] = i if i <= limit else over
+        for j in range(lo, hi + 1):
+            other_char = other[j - 1]
+            value = previous[j - 1] + (char != other_char)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if j > 1 and i > 1 and char == other[j - 2] and word[i - 2] == other_char and before[j - 2] + 1 < value:
+                value = before[j - 2] + 1
+            current[j] = value if value < over else over
+        if min(current[lo - 1:hi + 1]) > limit:
+            return over
+        before, previous = previous, current
+
+    return min(previous) if prefix else previous[-1]
+
+
+class SuggestionIndex:
+    """Sorted word keys and precomputed top suggestions for one field_type"""
+
+    def __init__(self, rows):
+        """
+        Args:
+            rows: (id, value, usage_count, updated_at timestamp) tuples
+        """
+        self.ids = []
+        self.values = []
+        self.normalized = []
+        self.usage = array('q')
+        self.stamps = array('d')
+        self.positions = {}
+        self.delta = ()
+        # Vocabulary for typo tolerance: word -> summed usage, first letter + trigram -> words
+        self.word_usage = {}
+        self.grams = {}
+
+        keys, owners = [], []
+        for pk, value, usage_count, stamp in rows:
+            entry = self._add(pk, value, usage_count, stamp)
+            text = self.normalized[entry]
+            for start in _word_starts(text):
+                keys.append(text[start:start + KEY_LENGTH])
+                owners.append(entry)
+
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = [keys[i] for i in order]
+        self.owners = array('q', [owners[i] for i in order])
+        del keys, owners, order
+
+        # Scores do not change during the build, so rank by one precomputed int instead of _score tuples
+        ranks = array('q', bytes(8 * len(self.values)))
+        for rank, entry in enumerate(sorted(range(len(self.values)), key=self._score)):
+            ranks[entry] = rank
+        self.top = {}
+        self._build_top('', 0, len(self.keys), ranks.__getitem__)
+
+    def _add(self, pk, value, usage_count, stamp):
+        entry = len(self.values)
+        self.ids.append(pk)
+        self.values.append(value)
+        self.normalized.append(normalize(value))
+        self.usage.append(usage_count)
+        self.stamps.append(stamp)
+        self.positions[pk] = entry
+        for word in set(words(self.normalized[entry])):
+            if word.isdigit():
+                continue
+            if word not in self.word_usage:
+                self.word_usage[word] = 0
+                for gram in trigrams(word):
+                    self.grams.setdefault(word[0] + gram, []).append(word)
+            self.word_usage[word] += usage_count
+        return entry
+
+    def _score(self, entry):
+        return self.usage[entry], self.stamps[entry]
+
+    def _best(self, entries, score=None):
+        return heapq.nlargest(TOP_K, set(entries), key=score or self._score)
+
+    def _build_top(self, prefix, lo, hi, score):
+        """Top entries of keys[lo:hi], which all start with prefix, stored for busy prefixes"""
+        depth = len(prefix)
+        if hi - lo <= SCAN_LIMIT or depth >= KEY_LENGTH:
+            return self._best(self.owners[lo:hi], score)
+
+        candidates = []
+        start = lo
+        # A key equal to the prefix sorts before all longer ones
+        while start < hi and len(self.keys[start]) == depth:
+            candidates.append(self.owners[start])
+            start += 1
+        while start < hi:
+            child = self.keys[start][:depth + 1]
+            end = bisect.bisect_left(self.keys, child + _END, start, hi)
+            candidates.extend(self._build_top(child, start, end, score))
+            start = end
+
+        top = tuple(self._best(candidates, score))
+        self.top[prefix] = top
+        return top
+
+    def _matches(self, entry, query):
+        text = self.normalized[entry]
+        return any(text.startswith(query, start) for start in _word_starts(text))
+
+    def search(self, query, limit=TOP_K):
+        """Positions of the best entries with a word starting with query ('' for the most used overall)"""
+        query = normalize(query)
+        key = query[:KEY_LENGTH]
+
+        candidates = self.top.get(key) if key == query else None
+        if candidates is None:
+            lo = bisect.bisect_left(self.keys, key)
+            hi = bisect.bisect_left(self.keys, key + _END, lo)
+            candidates = self.owners[lo:hi]
+            if key != query:
+                candidates = [entry for entry in candidates if self._matches(entry, query)]
+
+        changed = [entry for entry in self.delta if self._matches(entry, query)]
+        if changed:
+            candidates = [*candidates, *changed]
+        return self._best(candidates)[:limit]
+
+    def corrections(self, word, prefix=False):
+        """
+        Vocabulary words within max_edits() of word, closest and most used first
+
+        Returns:
+            list: (distance, word) tuples; [(0, word)] for words too short to correct
+        """
+        limit = max_edits(len(word))
+        if not limit or (not prefix and word in self.word_usage):
+            return [(0, word)]
+
+        shared = Counter()
+        for gram in trigrams(word):
+            shared.update(self.grams.get(word[0] + gram, ()))
+        # A typo changes at most three of the word's trigrams, a swap of neighbours four
+        needed = len(word) - 4 * limit
+
+        found = []
+        for other, count in shared.most_common(FUZZY_CANDIDATES):
+            if count < needed:
+                break
+            distance = edit_distance(word, other, limit, prefix)
+            if distance <= limit:
+                found.append((distance, -self.word_usage[other], other))
+        found.sort()
+        return [(distance, other) for distance, _, other in found]
+
+    def fuzzy_search(self, query, limit=TOP_K):
+        """Positions of the best entries matching query after correcting its typos"""
+        query_words = words(normalize(query))
+        if not query_words:
+            return []
+
+        fixed = []
+        for word in query_words[:-1]:
+            options = self.corrections(word)
+            if not options:
+                return []
+            fixed.append(options[0][1])
+
+        found = []
+        for _, word in self.corrections(query_words[-1], prefix=True)[:FUZZY_WORDS]:
+            for entry in self.search(' '.join([*fixed, word]), limit):
+                if entry not in found:
+                    found.append(entry)
+            if len(found) >= limit:
+                break
+        return found[:limit]
+
+    def suggestions(self, query, limit=TOP_K):
+        """
+        search() as the API's {'value', 'usage_count'} dicts, topped up with
+        fuzzy_search() matches when there are fewer than limit
+        """
+        entries = self.search(query, limit)
+        if len(entries) < limit and len(normalize(query)) >= FUZZY_MIN_LENGTH:
+            entries += [entry for entry in self.fuzzy_search(query, limit) if entry not in entries]
+        return [
+            {'value': self.values[entry], 'usage_count': self.usage[entry]}
+            for entry in entries[:limit]
+        ]
+
+    def apply(self, rows):
+        """
+        Overlay changed rows on the index
+
+        Returns:
+            bool: False when a row was renamed, which needs a rebuild
+        """
+        changed = []
+        for pk, value, usage_count, stamp in rows:
+            entry = self.positions.get(pk)
+            if entry is None:
+                changed.append(self._add(pk, value, usage_count, stamp))
+            elif self.values[entry] != value:
+                return False
+            elif (usage_count, stamp) != self._score(entry):
+                self.usage[entry] = usage_count
+                self.stamps[entry] = stamp
+                changed.append(entry)
+        if changed:
+            # Replaced rather than mutated: lookups in other threads iterate the old tuple
+            self.delta = tuple({*self.delta, *changed})
+        return True
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+class _FieldIndex:
+    """An index plus the bookkeeping for refreshing it"""
+
+    def __init__(self, index, generation, watermark):
+        self.index = index
+        self.generation = generation
+        self.watermark = watermark
+        self.checked_at = time.monotonic()
+
+
+def _rows(queryset):
+    for pk, value, usage_count, updated_at in queryset.values_list('id', 'value', 'usage_count', 'updated_at').iterator(chunk_size=5000):
+        yield pk, value, usage_count, updated_at.timestamp()
+
+
+def _build(field_type, generation):
+    from .models import AutocompleteSuggestion
+
+    # Read before the rows, so anything saved during the build is picked up by the next refresh
+    watermark = timezone.now()
+    index = SuggestionIndex(_rows(AutocompleteSuggestion.objects.filter(field_type=field_type)))
+    return _FieldIndex(index, generation, watermark)
+
+
+def _refresh(field_type, state):
+    from .models import AutocompleteSuggestion
+
+    generation = cache.get(GENERATION_KEY, 0)
+    if state is None or state.generation != generation or len(state.index.delta) > DELTA_LIMIT:
+        return _build(field_type, generation)
+
+    watermark = timezone.now()
+    changed = AutocompleteSuggestion.objects.filter(
+        field_type=field_type,
+        updated_at__gte=state.watermark - REFRESH_OVERLAP,
+    )
+    if not state.index.apply(_rows(changed)):
+        return _build(field_type, generation)
+    state.watermark = watermark
+    state.checked_at = time.monotonic()
+    return state
+
+
+def get_index(field_type):
+    """
+    The process's SuggestionIndex for field_type, built or refreshed as needed
+
+    While one thread refreshes an index, the others keep using the previous one.
+    """
+    state = _indexes.get(field_type)
+    if state is not None and time.monotonic() - state.checked_at < _refresh_seconds():
+        return state.index
+
+    if not _lock.acquire(blocking=state is None):
+        return state.index
+    try:
+        state = _indexes.get(field_type)
+        if state is None or time.monotonic() - state.checked_at >= _refresh_seconds():
+            state = _indexes[field_type] = _refresh(field_type, state)
+        return state.index
+    finally:
+        _lock.release()
+
+
+def suggest(field_type, query='', limit=TOP_K):
+    """The most used suggestions of field_type with a word starting with query"""
+    return get_index(field_type).suggestions(query, limit)
+
+
+def warm():
+    """Build the index of every field type (run at process start by warm_in_background)"""
+    from .models import AutocompleteSuggestion
+
+    try:
+        for field_type, _ in AutocompleteSuggestion.FIELD_TYPES:
+            get_index(field_type)
+    except DatabaseError:
+        # Not migrated yet: the indexes are built by the first lookups instead
+        pass
+    finally:
+        connection.close()
+
+
+def warm_in_background():
+    """Start warm() in a daemon thread so the server does not wait for it"""
+    threading.Thread(target=warm, name='autocomplete-warm', daemon=True).start()
+
+
+def record(suggestion):
+    """Show a suggestion this process just saved without waiting for the next refresh"""
+    state = _indexes.get(suggestion.field_type)
+    if state is None:
+        return
+    with _lock:
+        row = (suggestion.id, suggestion.value, suggestion.usage_count, suggestion.updated_at.timestamp())
+        if not state.index.apply([row]):
+            _indexes.pop(suggestion.field_type, None)
+
+
+def invalidate():
+    """Make every process rebuild its indexes (after suggestions are deleted)"""
+    cache.add(GENERATION_KEY, 0, None)
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        # Evicted between add() and incr(): a fresh value still differs from what processes saw
+        cache.set(GENERATION_KEY, time.time_ns(), None)
+    _indexes.clear()
+
+
+def suggestion_deleted(sender, **kwargs):
+    """post_delete receiver for AutocompleteSuggestion (including cascades from UserProfile)"""
+    invalidate()
+
+
+def _merge_key(value):
+    """Value with case, spacing and punctuation differences removed"""
+    return ' '.join(words(normalize(value)))
+
+
+def _one_deletion(key):
+    return {key, *(key[:i] + key[i + 1:] for i in range(len(key)))}
+
+
+def near_duplicate_groups(rows):
+    """
+    Group suggestions that differ only by case, spacing, punctuation or one typo
+
+    The most used row of a group is its canonical value. Values shorter than
+    MERGE_MIN_LENGTH, and values whose numbers differ ("Batch 12" and
+    "Batch 13"), are only grouped when they are identical after
+    normalization. Candidates for a typo are found through their one-character
+    deletions, so the cost stays linear in the number of rows.
+
+    Args:
+        rows: (id, value, usage_count) tuples of one field type
+
+    Returns:
+        list: (canonical row, [duplicate rows]) for every group with duplicates
+    """
+    groups = {}
+    by_deletion = {}
+    for row in sorted(rows, key=lambda row: (-row[2], row[0])):
+        key = _merge_key(row[1])
+        if key in groups:
+            groups[key][1].append(row)
+            continue
+
+        canonical = None
+        if len(key) >= MERGE_MIN_LENGTH:
+            digits = re.findall(r'\d+', key)
+            for variant in _one_deletion(key):
+                for other in by_deletion.get(variant, ()):
+                    if (re.findall(r'\d+', other) == digits and edit_distance(key, other, 1) <= 1
+                            and (canonical is None or groups[other][2] < groups[canonical][2])):
+                        canonical = other
+        if canonical is not None:
+            groups[canonical][1].append(row)
+            continue
+
+        groups[key] = (row, [], len(groups))
+        if len(key) >= MERGE_MIN_LENGTH:
+            for variant in _one_deletion(key):
+                by_deletion.setdefault(variant, []).append(key)
+
+    return [(canonical, duplicates) for canonical, duplicates, _ in groups.values() if duplicates]
+
+
+def merge_near_duplicates(field_types=None, dry_run=False):
+    """
+    Fold near-duplicate suggestions into their canonical row
+
+    The duplicates' usage counts are added to the canonical row and the
+    duplicates are deleted (which makes every process rebuild its indexes).
+
+    Args:
+        field_types: Field types to merge, or None for all of them
+        dry_run: Only report what would be merged
+
+    Returns:
+        list: (field_type, canonical value, [duplicate values], usage added) per group
+    """
+    from django.db import transaction
+    from django.db.models import F
+    from .models import AutocompleteSuggestion
+
+    if field_types is None:
+        field_types = [field_type for field_type, _ in AutocompleteSuggestion.FIELD_TYPES]
+
+    merged = []
+    for field_type in field_types:
+        rows = AutocompleteSuggestion.objects.filter(field_type=field_type).values_list('id', 'value', 'usage_count')
+        groups = near_duplicate_groups(rows.iterator(chunk_size=5000))
+        if not groups:
+            continue
+
+        for canonical, duplicates in groups:
+            merged.append((field_type, canonical[1], [row[1] for row in duplicates], sum(row[2] for row in duplicates)))
+        if dry_run:
+            continue
+
+        with transaction.atomic():
+            now = timezone.now()
+            for canonical, duplicates in groups:
+                AutocompleteSuggestion.objects.filter(id=canonical[0]).update(
+                    usage_count=F('usage_count') + sum(row[2] for row in duplicates), updated_at=now
+                )
+            duplicate_ids = [row[0] for _, duplicates in groups for row in duplicates]
+            for start in range(0, len(duplicate_ids), 500):
+                AutocompleteSuggestion.objects.filter(id__in=duplicate_ids[start:start + 500]).delete()
+    return merged
@@ -0,0 +1,299 @@
+"""
+Staff Availability for EventFlex
+Booking calendar with double-booking checks when applying and hiring
+
+Application.availability is free text, so nothing stopped a staff member
+from being accepted for two events at the same time. Each staff member now
+has CalendarEntry rows:
+
+    - bookings, one per accepted application, spanning the job's date and
+      start/end time: book() wherever an application becomes accepted,
+      unbook() wherever it stops being accepted
+    - unavailable blocks the staff member enters (add_unavailable())
+
+An entry [s, e) overlaps [start, end) when s < end and e > start. No entry
+is longer than MAX_SPAN (longer unavailable blocks are stored in pieces),
+so every overlapping entry starts after start - MAX_SPAN: the check is one
+range scan of the (profile, starts_at) index bounded on both sides,
+O(log n + k) however long the calendar grows, instead of an unbounded
+"ends after start" condition that has to visit the whole past.
+
+Batch checks (bulk accepts, free/busy) read the entries of every staff
+member involved with one such query and probe them in memory through a
+CalendarIndex: per staff member, entries sorted by start and found with
+bisect over the same bounded window.
+
+Jobs without a date occupy no time. A job without times takes its whole
+date; one whose end_time is not after its start_time ends the next day.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+# Longest single CalendarEntry; bounds the index range scanned by an overlap check
+MAX_SPAN = timedelta(days=31)
+
+# Longest unavailable block a staff member can enter at once
+MAX_UNAVAILABLE = timedelta(days=366)
+
+
+class CalendarConflict(Exception):
+    """Raised when bookings or unavailable blocks would overlap a staff member's existing entries"""
+
+    def __init__(self, conflicts):
+        # {application id (bookings) or None (unavailable blocks): [overlapping CalendarEntry, ...]}
+        self.conflicts = conflicts
+        super().__init__('Staff member is already booked or unavailable at this time')
+
+
+def job_interval(job):
+    """(starts_at, ends_at) a job occupies, or None when it has no date"""
+    if job.date is None:
+        return None
+    starts_at = datetime.combine(job.date, job.start_time or time.min)
+    if job.end_time is None:
+        ends_at = datetime.combine(job.date + timedelta(days=1), time.min)
+    else:
+        ends_at = datetime.combine(job.date, job.end_time)
+        if ends_at <= starts_at:
+            ends_at += timedelta(days=1)
+    return timezone.make_aware(starts_at), timezone.make_aware(ends_at)
+
+
+def overlapping(profile_ids, starts_at, ends_at):
+    """CalendarEntry queryset of the given staff members' entries overlapping [starts_at, ends_at)"""
+    from .models import CalendarEntry
+    return CalendarEntry.objects.filter(
+        profile_id__in=profile_ids,
+        starts_at__gt=starts_at - MAX_SPAN,
+        starts_at__lt=ends_at,
+        ends_at__gt=starts_at,
+    )
+
+
+class CalendarIndex:
+    """In-memory overlap lookups over CalendarEntry rows of several staff members"""
+
+    def __init__(self, entries=()):
+        self._starts = {}
+        self._entries = {}
+        for entry in entries:
+            self.add(entry)
+
+    @classmethod
+    def load(cls, profile_ids, starts_at, ends_at):
+        """Index of the staff members' entries overlapping [starts_at, ends_at), read with one query"""
+        return cls(overlapping(profile_ids, starts_at, ends_at))
+
+    def add(self, entry):
+        starts = self._starts.setdefault(entry.profile_id, [])
+        position = bisect_right(starts, entry.starts_at)
+        starts.insert(position, entry.starts_at)
+        self._entries.setdefault(entry.profile_id, []).insert(position, entry)
+
+    def overlapping(self, profile_id, starts_at, ends_at):
+        """The profile's entries overlapping [starts_at, ends_at), by start"""
+        starts = self._starts.get(profile_id)
+        if not starts:
+            return []
+        low = bisect_right(starts, starts_at - MAX_SPAN)
+        high = bisect_left(starts, ends_at)
+        return [entry for entry in self._entries[profile_id][low:high] if entry.ends_at > starts_at]
+
+
+def conflicts_for_job(profile_id, job):
+    """Entries of a staff member overlapping a job, in start order"""
+    interval = job_interval(job)
+    if interval is None:
+        return []
+    return list(overlapping([profile_id], *interval))
+
+
+def find_conflicts(applications):
+    """
+    Applications whose acceptance would double-book their applicant
+
+    Applications are taken in order and each one that fits is counted as
+    booked for the ones after it, so two overlapping applications of the
+    same staff member in one batch flag the second.
+
+    Args:
+        applications: Applications with job loaded
+
+    Returns:
+        dict: {application id: [overlapping CalendarEntry, ...]}
+    """
+    from .models import CalendarEntry
+
+    dated = [(application, job_interval(application.job)) for application in applications]
+    dated = [(application, interval) for application, interval in dated if interval is not None]
+    if not dated:
+        return {}
+
+    index = CalendarIndex.load(
+        {application.applicant_id for application, _ in dated},
+        min(starts_at for _, (starts_at, _) in dated),
+        max(ends_at for _, (_, ends_at) in dated),
+    )
+    conflicts = {}
+    for application, (starts_at, ends_at) in dated:
+        found = [
+            entry for entry in index.overlapping(application.applicant_id, starts_at, ends_at)
+            if entry.application_id != application.id
+        ]
+        if found:
+            conflicts[application.id] = found
+        else:
+            index.add(CalendarEntry(
+                profile_id=application.applicant_id, kind='booking',
+                starts_at=starts_at, ends_at=ends_at, application_id=application.id,
+            ))
+    return conflicts
+
+
+def _lock_profiles(profile_ids):
+    """Lock staff profile rows so concurrent calendar writes for the same staff member take turns"""
+    from .models import UserProfile
+    list(UserProfile.objects.select_for_update().filter(id__in=profile_ids).order_by('id').values_list('id', flat=True))
+
+
+def book(applications):
+    """
+    Write a booking for each application being accepted
+
+    Must run inside transaction.atomic(). The applicants' profile rows are
+    locked before the check, so two concurrent accepts of the same staff
+    member for overlapping jobs cannot both pass it. Nothing is written when
+    any application conflicts.
+
+    Raises:
+        CalendarConflict: Some applications overlap existing entries or each other
+    """
+    from .models import CalendarEntry
+
+    applications = list(applications)
+    if not applications:
+        return []
+    _lock_profiles(sorted({application.applicant_id for application in applications}))
+    conflicts = find_conflicts(applications)
+    if conflicts:
+        raise CalendarConflict(conflicts)
+
+    bookings = []
+    for application in applications:
+        interval = job_interval(application.job)
+        if interval is not None:
+            bookings.append(CalendarEntry(
+                profile_id=application.applicant_id, kind='booking',
+                starts_at=interval[0], ends_at=interval[1], application_id=application.id,
+            ))
+    unbook(applications)
+    return CalendarEntry.objects.bulk_create(bookings)
+
+
+def unbook(applications):
+    """Delete the bookings of applications that are no longer accepted"""
+    from .models import CalendarEntry
+    ids = [application.id for application in applications]
+    if ids:
+        CalendarEntry.objects.filter(application_id__in=ids).delete()
+
+
+def add_unavailable(profile, starts_at, ends_at, note=''):
+    """
+    Block out time in a staff member's calendar
+
+    Blocks longer than MAX_SPAN are stored as consecutive pieces. Overlapping
+    other unavailable blocks is allowed; overlapping a booking is not (the
+    staff member withdraws from the event first).
+
+    Must run inside transaction.atomic().
+
+    Returns:
+        list: The CalendarEntry pieces created
+
+    Raises:
+        CalendarConflict: The block overlaps bookings
+        ValueError: The block is empty or longer than MAX_UNAVAILABLE
+    """
+    from .models import CalendarEntry
+
+    if ends_at <= starts_at:
+        raise ValueError('End must be after start')
+    if ends_at - starts_at > MAX_UNAVAILABLE:
+        raise ValueError(f'Unavailable blocks are limited to {MAX_UNAVAILABLE.days} days')
+
+    _lock_profiles([profile.id])
+    bookings = list(overlapping([profile.id], starts_at, ends_at).filter(kind='booking'))
+    if bookings:
+        raise CalendarConflict({None: bookings})
+
+    pieces = []
+    while starts_at < ends_at:
+        piece_end = min(ends_at, starts_at + MAX_SPAN)
+        pieces.append(CalendarEntry(
+            profile=profile, kind='unavailable', starts_at=starts_at, ends_at=piece_end, note=note,
+        ))
+        starts_at = piece_end
+    return CalendarEntry.objects.bulk_create(pieces)
+
+
+def free_busy(profile_ids, starts_at, ends_at):
+    """
+    Busy time of several staff members within [starts_at, ends_at), read with one query
+
+    Overlapping and touching entries are merged and clipped to the range;
+    what makes a staff member busy is not revealed.
+
+    Returns:
+        dict: {profile id: [(busy_from, busy_until), ...]}, every id present
+    """
+    busy = {profile_id: [] for profile_id in profile_ids}
+    entries = overlapping(profile_ids, starts_at, ends_at).order_by('profile_id', 'starts_at')
+    for profile_id, entry_start, entry_end in entries.values_list('profile_id', 'starts_at', 'ends_at'):
+        entry_start, entry_end = max(entry_start, starts_at), min(entry_end, ends_at)
+        intervals = busy[profile_id]
+        if intervals and entry_start <= intervals[-1][1]:
+            intervals[-1] = (intervals[-1][0], max(intervals[-1][1], entry_end))
+        else:
+            intervals.append((entry_start, entry_end))
+    return busy
+
+
+def entry_to_dict(entry):
+    return {
+        'id': entry.id,
+        'kind': entry.kind,
+        'starts_at': entry.starts_at,
+        'ends_at': entry.ends_at,
+        'application_id': entry.application_id,
+        'note': entry.note,
+    }
+
+
+def rebuild_bookings():
+    """
+    Recreate the bookings of every accepted application from its job's date and times
+
+    Returns:
+        int: Number of bookings written
+    """
+    from .models import Application, CalendarEntry
+
+    with transaction.atomic():
+        CalendarEntry.objects.filter(kind='booking').delete()
+        bookings = []
+        for application in Application.objects.filter(status='accepted').select_related('job').only(
+            'id', 'applicant_id', 'job__date', 'job__start_time', 'job__end_time',
+        ):
+            interval = job_interval(application.job)
+            if interval is not None:
+                bookings.append(CalendarEntry(
+                    profile_id=application.applicant_id, kind='booking',
+                    starts_at=interval[0], ends_at=interval[1], application_id=application.id,
+                ))
+        CalendarEntry.objects.bulk_create(bookings, batch_size=500)
+    return len(bookings)
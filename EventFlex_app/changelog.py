@@ -0,0 +1,139 @@
+"""
+Change Log Utilities for EventFlex
+Records row changes for dashboard delta sync (see sync_changes view)
+
+Every mutating view calls one of the record_* helpers below. One
+ChangeLogEntry is written per affected profile so the sync endpoint can
+answer "what changed for me since cursor N" with a single indexed range
+scan on (profile, id).
+
+Entry ids are allocated when a row is inserted but only become visible
+when its transaction commits, so a slow transaction (finish_job for a big
+crew, bulk decisions) can commit id N after a quick request committed
+N + 1. A client that synced to N + 1 would never see N. safe_cursor()
+therefore never hands out a cursor past entries younger than
+SYNC_CURSOR_LAG_SECONDS: newer entries are still sent, and sent again on
+the next call, which is harmless because deltas carry whole rows.
+
+The same hooks keep wallet aggregates current: ledger rows are folded into
+the owner's WalletSummary and monthly rollup, and job/application changes
+flag the pending and event counts of every profile that sees them for
+recomputation.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .summaries import apply_transactions, apply_to_monthly_rollups, mark_activity_stale
+
+
+def safe_cursor():
+    """
+    Newest change-log id no uncommitted entry can fall below
+
+    That is the newest entry older than SYNC_CURSOR_LAG_SECONDS, or 0 when
+    there is none. Reads back through the id index only as far as the
+    entries written within the lag window.
+    """
+    from .models import ChangeLogEntry
+
+    settled = timezone.now() - timedelta(seconds=getattr(settings, 'SYNC_CURSOR_LAG_SECONDS', 30))
+    return ChangeLogEntry.objects.filter(created_at__lt=settled).order_by('-id').values_list('id', flat=True).first() or 0
+
+
+def record_changes(entity_type, entity_ids, profile_ids, action='upsert'):
+    """
+    Append change entries for a set of entities and the profiles that see them
+
+    Args:
+        entity_type: One of ChangeLogEntry.ENTITY_TYPES ('job', 'application', ...)
+        entity_ids: Iterable of changed row ids
+        profile_ids: Iterable of UserProfile ids whose dashboards show these rows
+        action: 'upsert' (default) or 'delete'
+
+    Returns:
+        int: Number of log entries written
+    """
+    from .models import ChangeLogEntry
+
+    profile_ids = {pid for pid in profile_ids if pid}
+    entries = [
+        ChangeLogEntry(profile_id=profile_id, entity_type=entity_type, entity_id=entity_id, action=action)
+        for entity_id in entity_ids
+        for profile_id in profile_ids
+    ]
+    ChangeLogEntry.objects.bulk_create(entries, batch_size=1000)
+    return len(entries)
+
+
+def record_job_change(job, action='upsert'):
+    """
+    Log a job change for its organizer and every applicant (their application cards embed the job)
+
+    Args:
+        job: Job instance
+        action: 'upsert' or 'delete'
+    """
+    from .models import Application
+
+    applicant_ids = list(Application.objects.filter(job_id=job.id).values_list('applicant_id', flat=True))
+    mark_activity_stale([job.organizer_id, *applicant_ids])
+    return record_changes('job', [job.id], [job.organizer_id, *applicant_ids], action)
+
+
+def record_application_changes(applications, action='upsert'):
+    """
+    Log application changes for the applicant and the job's organizer
+
+    Args:
+        applications: Iterable of Application instances (job should be loaded or select_related)
+        action: 'upsert' or 'delete'
+    """
+    from .models import ChangeLogEntry
+
+    entries = []
+    for app in applications:
+        for profile_id in {app.applicant_id, app.job.organizer_id}:
+            entries.append(ChangeLogEntry(
+                profile_id=profile_id, entity_type='application', entity_id=app.id, action=action
+            ))
+    ChangeLogEntry.objects.bulk_create(entries, batch_size=1000)
+    mark_activity_stale({entry.profile_id for entry in entries})
+    return len(entries)
+
+
+def record_message(message):
+    """Log a new message for both sender and recipient"""
+    return record_changes('message', [message.id], [message.sender_id, message.recipient_id])
+
+
+def record_transactions(transactions):
+    """Log ledger rows for the wallet owner of each transaction and fold them into wallet aggregates"""
+    from .models import ChangeLogEntry
+
+    apply_transactions(transactions)
+    apply_to_monthly_rollups(transactions)
+    entries = [
+        ChangeLogEntry(profile_id=txn.user_id, entity_type='transaction', entity_id=txn.id)
+        for txn in transactions
+    ]
+    ChangeLogEntry.objects.bulk_create(entries, batch_size=1000)
+    return len(entries)
+
+
+def prune_change_log(days=30):
+    """
+    Delete change log entries older than the retention window
+
+    Clients holding a cursor older than the oldest remaining entry are told
+    to reset (full reload) by the sync endpoint.
+
+    Returns:
+        int: Number of entries deleted
+    """
+    from .models import ChangeLogEntry
+    cutoff = timezone.now() - timedelta(days=days)
+    count, _ = ChangeLogEntry.objects.filter(created_at__lt=cutoff).delete()
+    return count
@@ -0,0 +1,195 @@
+"""
+Export Utilities for EventFlex
+Streams CSV (or XLSX) downloads of ledgers and job reports in constant memory
+
+Rows come from querysets consumed with .iterator(chunk_size=...), so
+neither the queryset cache nor the response body ever holds the whole
+export. CSV is written row by row into a StreamingHttpResponse and can be
+gzip-compressed on the fly. XLSX needs openpyxl (optional dependency); its
+write-only workbook spools rows to a temporary file that is then streamed.
+"""
+
+import csv
+import tempfile
+import zlib
+from decimal import Decimal
+
+from django.db.models import OuterRef, Subquery
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+
+# Import for XLSX exports (optional, CSV works without it)
+try:
+    from openpyxl import Workbook
+except ImportError:
+    Workbook = None
+
+EXPORT_CHUNK_SIZE = 2000
+
+CENTS = Decimal('0.01')
+
+# Flush compressed output once this many bytes are pending
+GZIP_FLUSH_BYTES = 64 * 1024
+
+TRANSACTION_COLUMNS = [
+    'id', 'created_at', 'transaction_type', 'status', 'amount', 'balance_after',
+    'event', 'job_id', 'application_id', 'counterparty', 'note',
+]
+
+JOB_REPORT_COLUMNS = [
+    'application_id', 'username', 'full_name', 'email', 'phone', 'status', 'applied_at',
+    'ai_rating', 'escrow_held', 'paid_amount', 'paid_at',
+]
+
+
+class ExportUnavailable(Exception):
+    """Raised when the requested export format needs a dependency that is not installed"""
+
+
+class _Echo:
+    """File-like object whose write() returns the value, so csv.writer yields lines"""
+
+    def write(self, value):
+        return value
+
+
+def _csv_chunks(columns, rows):
+    writer = csv.writer(_Echo())
+    # BOM so Excel opens UTF-8 (₹, names) correctly
+    yield '\ufeff'.encode('utf-8') + writer.writerow(columns).encode('utf-8')
+    for row in rows:
+        yield writer.writerow(row).encode('utf-8')
+
+
+def _gzip_chunks(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    pending = []
+    pending_size = 0
+    for chunk in chunks:
+        pending.append(compressor.compress(chunk))
+        pending_size += len(pending[-1])
+        if pending_size >= GZIP_FLUSH_BYTES:
+            yield b''.join(pending)
+            pending, pending_size = [], 0
+    pending.append(compressor.flush())
+    yield b''.join(pending)
+
+
+def _xlsx_file(columns, rows):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(columns)
+    for row in rows:
+        sheet.append(row)
+    spool = tempfile.TemporaryFile()
+    workbook.save(spool)
+    spool.seek(0)
+    return spool
+
+
+def export_response(filename, columns, rows, file_format='csv', compress=False):
+    """
+    Build a streaming download for an export
+
+    Args:
+        filename: Base file name without extension
+        columns: Header row
+        rows: Iterable of row sequences (consumed lazily)
+        file_format: 'csv' (default) or 'xlsx'
+        compress: gzip the CSV stream on the fly (served as .csv.gz)
+
+    Returns:
+        StreamingHttpResponse or FileResponse
+
+    Raises:
+        ExportUnavailable: xlsx requested but openpyxl is not installed
+    """
+    if file_format == 'xlsx':
+        if Workbook is None:
+            raise ExportUnavailable('XLSX export requires openpyxl; use format=csv')
+        return FileResponse(
+            _xlsx_file(columns, rows),
+            as_attachment=True,
+            filename=f'{filename}.xlsx',
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        )
+
+    chunks = _csv_chunks(columns, rows)
+    if compress:
+        response = StreamingHttpResponse(_gzip_chunks(chunks), content_type='application/gzip')
+        response['Content-Disposition'] = f'attachment; filename="{filename}.csv.gz"'
+    else:
+        response = StreamingHttpResponse(chunks, content_type='text/csv; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
+    return response
+
+
+def _money(value):
+    # Subquery annotations are not quantized by every backend (SQLite returns 300, not 300.00)
+    return Decimal(value).quantize(CENTS) if value is not None else ''
+
+
+def _timestamp(value):
+    return timezone.localtime(value).strftime('%Y-%m-%d %H:%M:%S') if value else ''
+
+
+def transaction_rows(profile):
+    """Yield the full ledger of a profile, oldest first, as TRANSACTION_COLUMNS rows"""
+    from .models import Transaction
+
+    transactions = (
+        Transaction.objects.filter(user=profile)
+        .select_related('job', 'application__job', 'related_user__user')
+        .order_by('created_at', 'id')
+    )
+    for txn in transactions.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        job = txn.job or (txn.application.job if txn.application else None)
+        yield [
+            txn.id,
+            _timestamp(txn.created_at),
+            txn.transaction_type,
+            txn.status,
+            txn.amount,
+            txn.balance_after,
+            job.title if job else '',
+            job.id if job else '',
+            txn.application_id or '',
+            txn.related_user.user.username if txn.related_user else '',
+            txn.note,
+        ]
+
+
+def job_report_rows(job):
+    """Yield every application of a job with its escrow hold and payout, as JOB_REPORT_COLUMNS rows"""
+    from .models import Application, Transaction
+
+    payments = Transaction.objects.filter(
+        application_id=OuterRef('id'),
+        user_id=OuterRef('applicant_id'),
+        transaction_type='payment',
+        status='completed',
+    ).order_by('-id')
+    applications = (
+        Application.objects.filter(job=job)
+        .select_related('applicant__user')
+        .annotate(
+            paid_amount=Subquery(payments.values('amount')[:1]),
+            paid_at=Subquery(payments.values('created_at')[:1]),
+        )
+        .order_by('created_at', 'id')
+    )
+    for app in applications.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        user = app.applicant.user
+        yield [
+            app.id,
+            user.username,
+            app.full_name or user.get_full_name(),
+            app.email or user.email,
+            app.phone or app.applicant.phone,
+            app.status,
+            _timestamp(app.created_at),
+            app.ai_rating if app.ai_rating is not None else '',
+            app.escrow_amount,
+            _money(app.paid_amount),
+            _timestamp(app.paid_at),
+        ]
@@ -0,0 +1,164 @@
+"""
+Sparse Fieldsets for EventFlex API serializers
+Lets clients ask for just the fields they render (?fields=, ?expand=)
+
+A Resource declares, in output order, the keys a model serializes to:
+Field entries name the columns they read, Relation entries embed another
+Resource. A Selection is the subset one request asked for. It builds the
+dict and also narrows the queryset with .only()/.select_related(), so
+unrequested columns are never read from the database or encoded.
+
+Query parameters (comma separated, dots reach into relations):
+
+    ?fields=id,title,organizer.username   only these keys
+    ?expand=organizer                     embed these relations as objects
+
+Without either parameter the endpoint's default shape is returned
+unchanged. A relation that is not expanded is sent as its id
+(organizer_id). Naming a relation in fields, or selecting one of its
+fields, expands it.
+"""
+
+
+class FieldSelectionError(ValueError):
+    """Raised for ?fields=/?expand= entries the resource does not have"""
+
+
+class Field:
+    """A serialized key, the model columns it reads and how to read it"""
+
+    def __init__(self, name, columns=None, getter=None):
+        self.name = name
+        self.columns = (name,) if columns is None else tuple(columns)
+        self.getter = getter or (lambda obj, attr=self.columns[0]: getattr(obj, attr))
+
+
+class Relation:
+    """A foreign key serialized as a nested Resource when expanded, else as <name>_id"""
+
+    def __init__(self, name, resource, attname=None):
+        self.name = name
+        self.resource = resource
+        self.attname = attname or f'{name}_id'
+
+
+class Resource:
+    """Ordered Field/Relation entries plus the relations embedded by default"""
+
+    def __init__(self, entries, default_expand=()):
+        self.entries = list(entries)
+        self.by_name = {entry.name: entry for entry in self.entries}
+        self.default_expand = tuple(default_expand)
+
+    def select(self, fields=None, expand=None):
+        """Selection for fields/expand paths (lists, or None for the default shape)"""
+        return Selection(self, fields, expand)
+
+    def select_from_request(self, request, default_expand=None):
+        """
+        Selection for the request's ?fields= and ?expand= parameters
+
+        Args:
+            default_expand: Relations to embed when the client sends neither
+                parameter (defaults to the resource's own default)
+        Raises:
+            FieldSelectionError: for unknown names
+        """
+        fields = _split_param(request.GET.get('fields'))
+        expand = _split_param(request.GET.get('expand'))
+        if fields is None and expand is None and default_expand is not None:
+            expand = list(default_expand)
+        return Selection(self, fields, expand)
+
+
+def _split_param(value):
+    if value is None:
+        return None
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+def _group(paths):
+    """Split dotted paths into own names and {relation: [sub paths]}"""
+    own, nested = [], {}
+    for path in paths or ():
+        head, _, rest = path.partition('.')
+        if rest:
+            nested.setdefault(head, []).append(rest)
+        else:
+            own.append(head)
+    return own, nested
+
+
+class Selection:
+    """The part of a Resource one request asked for"""
+
+    def __init__(self, resource, fields=None, expand=None):
+        self.resource = resource
+        own_fields, nested_fields = _group(fields)
+        own_expand, nested_expand = _group(expand)
+
+        for name in [*own_fields, *nested_fields]:
+            if name not in resource.by_name:
+                raise FieldSelectionError(f'unknown field: {name}')
+        for name in [*own_expand, *nested_expand, *nested_fields]:
+            if not isinstance(resource.by_name.get(name), Relation):
+                raise FieldSelectionError(f'cannot expand: {name}')
+
+        if fields is None and expand is None:
+            expanded = set(resource.default_expand)
+        else:
+            expanded = {*own_expand, *nested_expand, *nested_fields}
+            expanded.update(name for name in own_fields if isinstance(resource.by_name[name], Relation))
+
+        wanted = None if fields is None else {*own_fields, *nested_fields}
+        self.entries = [entry for entry in resource.entries if wanted is None or entry.name in wanted]
+        self.children = {}
+        for entry in self.entries:
+            if isinstance(entry, Relation) and entry.name in expanded:
+                # Inside an explicitly shaped request, nested relations are only embedded when asked for
+                child_expand = nested_expand.get(entry.name, None if fields is None and expand is None else [])
+                self.children[entry.name] = Selection(entry.resource, nested_fields.get(entry.name), child_expand)
+
+    def serialize(self, obj):
+        """Dict of the selected keys of obj"""
+        data = {}
+        for entry in self.entries:
+            if isinstance(entry, Field):
+                data[entry.name] = entry.getter(obj)
+            elif entry.name in self.children:
+                related = getattr(obj, entry.name)
+                data[entry.name] = None if related is None else self.children[entry.name].serialize(related)
+            else:
+                data[entry.attname] = getattr(obj, entry.attname)
+        return data
+
+    def columns(self, prefix=''):
+        """Model paths to load for this selection, for QuerySet.only()"""
+        columns = []
+        for entry in self.entries:
+            if isinstance(entry, Field):
+                columns.extend(prefix + column for column in entry.columns)
+            elif entry.name in self.children:
+                columns.append(prefix + entry.name)
+                columns.extend(self.children[entry.name].columns(f'{prefix}{entry.name}__'))
+            else:
+                columns.append(prefix + entry.attname)
+        return columns
+
+    def related(self, prefix=''):
+        """Relation paths to join, for QuerySet.select_related()"""
+        paths = set()
+        for column in self.columns(prefix):
+            head, sep, _ = column.rpartition('__')
+            if sep:
+                paths.add(head)
+        for name, child in self.children.items():
+            paths.add(prefix + name)
+        return sorted(paths)
+
+    def apply(self, queryset):
+        """Narrow queryset to the selected columns and join the embedded relations"""
+        related = self.related()
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*self.columns())
@@ -0,0 +1,249 @@
+"""
+Locations for EventFlex
+Offline geocoding of Job.location / UserProfile.city and radius search
+
+Places used to be free text only ("Bandra West, Mumbai, Maharashtra",
+"bangalore", "Banglore"), so "jobs near me" could only be a city__icontains
+guess. Every save of a Job or UserProfile (see GeoLocatedModel) now looks
+the text up in a gazetteer of Indian cities bundled with the app
+(data/indian_cities.csv: name, state, latitude, longitude, |-separated
+aliases), with no network call:
+
+    - the comma-separated parts are tried right to left, since addresses end
+      with the city; within a part, the longest run of words naming a city
+      or one of its aliases ("Navi Mumbai", "Bombay") wins
+    - failing that, each word is compared with one-word names starting with
+      the same letter, within autocomplete.max_edits() typos
+
+The match gives the row its canonical city name and that city's
+coordinates, plus their geohash (GEOHASH_PRECISION characters) in an
+indexed column. Rows whose text names no known city have no coordinates
+and never show up in radius searches.
+
+A geohash cell is a base32 prefix, so all rows inside one are a single
+range of the geohash index. nearby() covers the circle's bounding box with
+at most MAX_CELLS cells of the finest precision that allows it, merges
+neighbouring cells into one range, reads (pk, latitude, longitude) for the
+rows in those ranges and keeps the ones within the radius by haversine
+distance. A 20 km search is a handful of index range scans however many
+rows the table holds.
+"""
+
+import csv
+import math
+import re
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+from django.db.models import Q
+
+from .autocomplete import edit_distance, max_edits, normalize, words
+
+GAZETTEER_PATH = Path(__file__).resolve().parent / 'data' / 'indian_cities.csv'
+
+# Stored geohash length; 7 characters is a cell of about 150 m
+GEOHASH_PRECISION = 7
+
+# Most cells (index ranges before merging) a radius search may read
+MAX_CELLS = 24
+
+MAX_RADIUS_KM = 200
+
+EARTH_RADIUS_KM = 6371.0088
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+# Separators between the parts of an address
+_PARTS = re.compile(r'[,;/|()\n]')
+
+City = namedtuple('City', ['name', 'state', 'latitude', 'longitude'])
+
+
+@lru_cache(maxsize=None)
+def _gazetteer():
+    """({name or alias key: City}, {first letter: [one-word keys]}, most words in a key)"""
+    by_key = {}
+    with open(GAZETTEER_PATH, newline='', encoding='utf-8') as handle:
+        for row in csv.DictReader(handle):
+            city = City(row['name'], row['state'], float(row['latitude']), float(row['longitude']))
+            for name in [row['name'], *filter(None, row['aliases'].split('|'))]:
+                # First entry wins, so a city's own name is never taken by another city's alias
+                by_key.setdefault(_key(name), city)
+
+    by_letter = {}
+    for key in by_key:
+        if ' ' not in key:
+            by_letter.setdefault(key[0], []).append(key)
+    return by_key, by_letter, max(key.count(' ') + 1 for key in by_key)
+
+
+def _key(text):
+    return ' '.join(words(normalize(text)))
+
+
+def geocode(text):
+    """
+    The gazetteer City named in free text, or None
+
+    Args:
+        text: A city name or address, possibly misspelled
+    """
+    if not text:
+        return None
+    by_key, by_letter, longest = _gazetteer()
+    parts = [words(normalize(part)) for part in reversed(_PARTS.split(text))]
+
+    for part in parts:
+        for size in range(min(longest, len(part)), 0, -1):
+            for start in range(len(part) - size, -1, -1):
+                city = by_key.get(' '.join(part[start:start + size]))
+                if city is not None:
+                    return city
+
+    for part in parts:
+        for word in reversed(part):
+            limit = max_edits(len(word))
+            if not limit or not word.isalpha():
+                continue
+            best = min(
+                ((edit_distance(word, key, limit), key) for key in by_letter.get(word[0], ())),
+                default=None,
+            )
+            if best is not None and best[0] <= limit:
+                return by_key[best[1]]
+    return None
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """Base32 geohash of a point"""
+    lat_lo, lat_hi, lon_lo, lon_hi = -90.0, 90.0, -180.0, 180.0
+    chars, value, bits, even = [], 0, 0, True
+    while len(chars) < precision:
+        if even:
+            middle = (lon_lo + lon_hi) / 2
+            if longitude >= middle:
+                value, lon_lo = value * 2 + 1, middle
+            else:
+                value, lon_hi = value * 2, middle
+        else:
+            middle = (lat_lo + lat_hi) / 2
+            if latitude >= middle:
+                value, lat_lo = value * 2 + 1, middle
+            else:
+                value, lat_hi = value * 2, middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            value, bits = 0, 0
+    return ''.join(chars)
+
+
+def _cell_size(precision):
+    """(latitude, longitude) degrees spanned by a geohash cell"""
+    bits = 5 * precision
+    return 180.0 / 2 ** (bits // 2), 360.0 / 2 ** ((bits + 1) // 2)
+
+
+def _successor(cell):
+    """The first cell of the same length after cell, or None after the last one"""
+    for position in range(len(cell) - 1, -1, -1):
+        index = _BASE32.index(cell[position])
+        if index < len(_BASE32) - 1:
+            return cell[:position] + _BASE32[index + 1] + '0' * (len(cell) - position - 1)
+    return None
+
+
+def covering_cells(latitude, longitude, radius_km):
+    """
+    Geohash cells covering the bounding box of a circle, at most MAX_CELLS of them
+
+    Returns:
+        list: Sorted cells, all of the finest precision that fits within MAX_CELLS
+    """
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    south, north = max(-90.0, latitude - lat_delta), min(90.0, latitude + lat_delta)
+    widest = math.cos(math.radians(min(89.0, max(abs(south), abs(north)))))
+    lon_delta = min(180.0, lat_delta / widest)
+    west, east = max(-180.0, longitude - lon_delta), min(180.0, longitude + lon_delta)
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_step, lon_step = _cell_size(precision)
+        first_row, last_row = math.floor((south + 90) / lat_step), math.floor((north + 90) / lat_step)
+        first_col, last_col = math.floor((west + 180) / lon_step), math.floor((east + 180) / lon_step)
+        if (last_row - first_row + 1) * (last_col - first_col + 1) <= MAX_CELLS or precision == 1:
+            break
+
+    return sorted({
+        encode_geohash(min(90.0, (row + 0.5) * lat_step - 90), min(180.0, (col + 0.5) * lon_step - 180), precision)
+        for row in range(first_row, last_row + 1)
+        for col in range(first_col, last_col + 1)
+    })
+
+
+def covering_ranges(latitude, longitude, radius_km):
+    """covering_cells() as [start, end) geohash ranges, neighbouring cells merged; end None is unbounded"""
+    ranges = []
+    for cell in covering_cells(latitude, longitude, radius_km):
+        if ranges and ranges[-1][1] == cell:
+            ranges[-1][1] = _successor(cell)
+        else:
+            ranges.append([cell, _successor(cell)])
+    return [tuple(bounds) for bounds in ranges]
+
+
+def haversine_km(latitude, longitude, other_latitude, other_longitude):
+    """Great-circle distance between two points in kilometres"""
+    lat1, lat2 = math.radians(latitude), math.radians(other_latitude)
+    half_lat = (lat2 - lat1) / 2
+    half_lon = math.radians(other_longitude - longitude) / 2
+    a = math.sin(half_lat) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(half_lon) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def nearby(queryset, latitude, longitude, radius_km, limit=None):
+    """
+    Rows of a GeoLocatedModel queryset within radius_km of a point, nearest first
+
+    Returns:
+        list: (pk, distance_km) pairs, distances rounded to 0.1 km
+    """
+    within = Q()
+    for start, end in covering_ranges(latitude, longitude, radius_km):
+        within |= Q(geohash__gte=start, geohash__lt=end) if end else Q(geohash__gte=start)
+
+    found = []
+    for pk, row_latitude, row_longitude in queryset.filter(within).values_list('pk', 'latitude', 'longitude'):
+        distance = haversine_km(latitude, longitude, row_latitude, row_longitude)
+        if distance <= radius_km:
+            found.append((distance, pk))
+    found.sort()
+    return [(pk, round(distance, 1)) for distance, pk in found[:limit]]
+
+
+def backfill(model, batch_size=500):
+    """
+    Geocode the rows of a GeoLocatedModel written before it geocoded on save
+
+    Only rows whose derived fields change are written, with bulk_update()
+    and a bumped updated_at so conditional GETs see the new coordinates.
+
+    Returns:
+        tuple: (rows read, rows updated, rows with coordinates)
+    """
+    from django.utils import timezone
+
+    derived = ['city', 'latitude', 'longitude', 'geohash']
+    read = located = 0
+    changed = []
+    for row in model.objects.only('pk', model.geocoded_from, *derived).iterator(chunk_size=batch_size):
+        read += 1
+        before = [getattr(row, name) for name in derived]
+        located += row.geocode() is not None
+        if [getattr(row, name) for name in derived] != before:
+            row.updated_at = timezone.now()
+            changed.append(row)
+
+    model.objects.bulk_update(changed, [*derived, 'updated_at'], batch_size=batch_size)
+    return read, len(changed), located
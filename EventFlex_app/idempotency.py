@@ -0,0 +1,142 @@
+"""
+Idempotency Utilities for EventFlex
+Replays stored responses for retried payment requests (Idempotency-Key header)
+
+Mobile clients retry add_funds, withdraw_funds, release_payment and
+finish_job when a request times out. A client that sends the same
+Idempotency-Key header on every attempt gets the first attempt's response
+back without the view running again, so no money moves twice and the
+expensive checks are skipped.
+
+The key is claimed in its own transaction, so a concurrent retry sees it
+and gets 409. The view and the write of its response then run in one
+transaction: the money movement and the stored response commit together
+or not at all. A key whose request never finished (the worker died) keeps
+answering 409 until its TTL runs out rather than being reclaimed, since
+it cannot be told apart from a request that is merely slow.
+
+Requests without the header behave exactly as before.
+"""
+
+import hashlib
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
+from django.utils import timezone
+
+from .api_json import JsonResponse
+
+IDEMPOTENCY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MAX_KEY_LENGTH = 255
+
+
+def _request_hash(request):
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(b'\0')
+    digest.update(request.path.encode())
+    digest.update(b'\0')
+    digest.update(request.body)
+    return digest.hexdigest()
+
+
+def _replay(record):
+    response = HttpResponse(record.response_body, status=record.status_code, content_type='application/json')
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def _claim(user, key, request_hash):
+    """
+    Reserve a key for this request, or return the existing record
+
+    Returns:
+        tuple: (record, created)
+    """
+    from .models import IdempotencyKey
+
+    now = timezone.now()
+    ttl = timedelta(hours=getattr(settings, 'IDEMPOTENCY_KEY_TTL_HOURS', 24))
+
+    record = IdempotencyKey.objects.filter(user=user, key=key).first()
+    if record is not None:
+        if record.expires_at > now:
+            return record, False
+        record.delete()
+
+    try:
+        with transaction.atomic():
+            record = IdempotencyKey.objects.create(
+                user=user, key=key, request_hash=request_hash, expires_at=now + ttl
+            )
+    except IntegrityError:
+        # A concurrent retry claimed the key between our lookup and insert
+        return IdempotencyKey.objects.get(user=user, key=key), False
+    return record, True
+
+
+def idempotent(view_func):
+    """
+    Decorator that makes a POST view safe to retry with an Idempotency-Key header
+
+    - first request: the view runs and its response (status < 500) is stored
+    - retry with the same key and payload: the stored response is returned
+    - retry while the first request is still running (or died mid-way): 409
+    - same key with a different payload: 422
+    - 5xx responses and exceptions roll back the view's writes and release
+      the key so the client can retry
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        key = request.META.get(IDEMPOTENCY_HEADER, '').strip()
+        if not key or request.method != 'POST' or not request.user.is_authenticated:
+            return view_func(request, *args, **kwargs)
+
+        if len(key) > MAX_KEY_LENGTH:
+            return JsonResponse({'error': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters'}, status=400)
+
+        request_hash = _request_hash(request)
+        record, created = _claim(request.user, key, request_hash)
+
+        if not created:
+            if record.request_hash != request_hash:
+                return JsonResponse({'error': 'Idempotency-Key was already used for a different request'}, status=422)
+            if record.status_code is None:
+                return JsonResponse({'error': 'A request with this Idempotency-Key is still being processed'}, status=409)
+            return _replay(record)
+
+        try:
+            with transaction.atomic():
+                response = view_func(request, *args, **kwargs)
+                release = response.status_code >= 500 or getattr(response, 'streaming', False)
+                if response.status_code >= 500:
+                    transaction.set_rollback(True)
+                elif not release:
+                    type(record).objects.filter(id=record.id).update(
+                        status_code=response.status_code,
+                        response_body=response.content.decode('utf-8'),
+                    )
+        except Exception:
+            record.delete()
+            raise
+
+        if release:
+            record.delete()
+        return response
+
+    return wrapper
+
+
+def cleanup_expired_idempotency_keys():
+    """
+    Delete idempotency records past their TTL (should be run periodically)
+
+    Returns:
+        int: Number of records deleted
+    """
+    from .models import IdempotencyKey
+    count, _ = IdempotencyKey.objects.filter(expires_at__lt=timezone.now()).delete()
+    return count
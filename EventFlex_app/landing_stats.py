@@ -0,0 +1,131 @@
+"""
+Landing Statistics for EventFlex
+Cached marketing counters for the landing and signup pages
+
+index_view and signup_page_view show the number of professionals, the
+number of events and the share of events that hired someone. Those counts
+used to be recomputed on every (mostly anonymous, often bot) page view.
+
+The counters are now kept in the Django cache:
+
+    - younger than LANDING_STATS_TTL seconds: served as is, no queries
+    - older than that but younger than TTL + LANDING_STATS_STALE_TTL:
+      still served; the one request that wins the refresh lock recomputes
+      them while every other request keeps getting the stale values
+    - missing (cold cache or fully expired): computed inline
+
+The refresh lock is a RefreshLock row taken with a conditional UPDATE, so it
+holds across worker processes whatever cache backend is configured. The
+counters themselves live in the default cache: with the default LocMemCache
+each process keeps (and refreshes) its own copy, one worker at a time.
+
+With a shared cache (CACHE_BACKEND=file or a server backend), run
+`python manage.py warm_landing_stats` from cron more often than the TTL and
+page views never compute the counters at all.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Exists, OuterRef
+from django.utils import timezone
+
+CACHE_KEY = 'eventflex:landing_stats'
+LOCK_NAME = 'landing_stats'
+
+# Shown when there are no events yet (matches the template defaults)
+DEFAULT_SUCCESS_RATE = 98
+
+# A refresh that has not finished after this long (crashed worker) no longer blocks others
+REFRESH_LOCK_TIMEOUT = 30
+
+
+def _ttl():
+    return getattr(settings, 'LANDING_STATS_TTL', 300)
+
+
+def _stale_ttl():
+    return getattr(settings, 'LANDING_STATS_STALE_TTL', 3600)
+
+
+def compute_landing_stats():
+    """
+    Count staff profiles, events and events with at least one accepted application (two queries)
+
+    Returns:
+        dict: total_professionals, total_events, success_rate (int percent)
+    """
+    from .models import UserProfile, Job, Application
+
+    total_professionals = UserProfile.objects.filter(user_type='staff').count()
+
+    hired = Application.objects.filter(job=OuterRef('pk'), status='accepted')
+    events = Job.objects.aggregate(
+        total=Count('id'),
+        with_accepted=Count('id', filter=Exists(hired)),
+    )
+    total_events = events['total']
+    success_rate = int(events['with_accepted'] / total_events * 100) if total_events else DEFAULT_SUCCESS_RATE
+
+    return {
+        'total_professionals': total_professionals,
+        'total_events': total_events,
+        'success_rate': success_rate,
+    }
+
+
+def refresh_landing_stats():
+    """Recompute the counters and store them in the cache, returning the new values"""
+    stats = compute_landing_stats()
+    cache.set(CACHE_KEY, {'stats': stats, 'computed_at': time.time()}, _ttl() + _stale_ttl())
+    return stats
+
+
+def _acquire_refresh_lock():
+    """
+    Take the refresh lease for REFRESH_LOCK_TIMEOUT seconds
+
+    Returns:
+        datetime or None: The lease expiry (needed to release it), or None if another worker holds it
+    """
+    from .models import RefreshLock
+
+    now = timezone.now()
+    locked_until = now + timedelta(seconds=REFRESH_LOCK_TIMEOUT)
+    # Only one concurrent UPDATE can match an expired lease; the database serializes them
+    if RefreshLock.objects.filter(name=LOCK_NAME, locked_until__lte=now).update(locked_until=locked_until):
+        return locked_until
+    _, created = RefreshLock.objects.get_or_create(name=LOCK_NAME, defaults={'locked_until': locked_until})
+    return locked_until if created else None
+
+
+def _release_refresh_lock(locked_until):
+    from .models import RefreshLock
+
+    # Leaves a lease alone if ours expired and another worker has since taken it
+    RefreshLock.objects.filter(name=LOCK_NAME, locked_until=locked_until).update(locked_until=timezone.now())
+
+
+def get_landing_stats():
+    """
+    Landing counters from the cache, refreshing them if they are stale
+
+    At most one caller at a time, across all workers, recomputes stale
+    counters (a conditional UPDATE on a RefreshLock row); the others are
+    served the stale values meanwhile.
+    """
+    entry = cache.get(CACHE_KEY)
+    if entry is None:
+        return refresh_landing_stats()
+
+    if time.time() - entry['computed_at'] >= _ttl():
+        locked_until = _acquire_refresh_lock()
+        if locked_until is not None:
+            try:
+                return refresh_landing_stats()
+            finally:
+                _release_refresh_lock(locked_until)
+
+    return entry['stats']
@@ -0,0 +1,180 @@
+"""
+Management command to benchmark the in-memory autocomplete index
+Usage: python manage.py benchmark_autocomplete [--entries 1000000] [--queries 20000] [--db-rows 0]
+
+Builds a SuggestionIndex from synthetic suggestions (event names, roles and
+Indian venues with usage counts following a long tail) and reports:
+
+    - build time, index keys and precomputed prefixes
+    - lookup latency (median, p99, max) by query length, over prefixes of
+      the words of indexed values
+    - typo-tolerant lookup latency over misspelled words (one or two
+      random edits after the first letter), and how often the intended
+      word is suggested, for real event words and for the denser made-up
+      venue names
+    - with --db-rows N, the old value__icontains query over N rows inserted
+      inside a transaction that is rolled back afterwards
+
+Only --db-rows touches the database.
+"""
+
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from EventFlex_app.autocomplete import (
+    SuggestionIndex, TOP_K, FUZZY_MIN_LENGTH, max_edits, normalize, words,
+)
+from EventFlex_app.models import AutocompleteSuggestion
+
+ADJECTIVES = ['Corporate', 'Annual', 'Grand', 'Royal', 'Summer', 'Winter', 'Charity', 'Private', 'Destination',
+              'Traditional', 'Luxury', 'Startup', 'College', 'Regional', 'International', 'Festive']
+EVENTS = ['Gala', 'Wedding', 'Conference', 'Concert', 'Product Launch', 'Exhibition', 'Sangeet', 'Reception',
+          'Award Night', 'Trade Fair', 'Hackathon', 'Fashion Show', 'Diwali Mela', 'Sports Meet', 'Workshop']
+ROLES = ['Coordinator', 'Usher', 'Bartender', 'Host', 'Security', 'Photographer', 'Decorator', 'Anchor',
+         'Caterer', 'Stage Manager', 'Registration Desk', 'Sound Engineer', 'Valet', 'Runner']
+SYLLABLES = ['ka', 'ra', 'ma', 'na', 'pur', 'gan', 'dha', 'vi', 'sha', 'li', 'ko', 'ta', 'bad', 'nag', 'ru',
+             'ja', 'la', 'chi', 'wa', 'desh', 'gar', 'ho', 'pe', 'su', 'ban', 'tir', 'mu', 'ki', 'van', 'dor']
+PLACES = ['Mumbai', 'Delhi', 'Bengaluru', 'Hyderabad', 'Chennai', 'Kolkata', 'Pune', 'Ahmedabad', 'Jaipur',
+          'Lucknow', 'Kochi', 'Goa', 'Chandigarh', 'Indore', 'Bhopal', 'Nagpur', 'Surat', 'Vadodara']
+
+
+class Command(BaseCommand):
+    help = 'Benchmark building and querying the autocomplete index over synthetic suggestions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entries', type=int, default=1_000_000,
+                            help='Suggestions in the index (default: 1000000)')
+        parser.add_argument('--queries', type=int, default=20_000,
+                            help='Timed lookups (default: 20000)')
+        parser.add_argument('--db-rows', type=int, default=0,
+                            help='Also time the old icontains query over this many rows (default: 0, skipped)')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        self.stdout.write(self.style.SUCCESS('\n=== AUTOCOMPLETE INDEX BENCHMARK ===\n'))
+
+        rows = list(self._rows(rng, options['entries']))
+        started = time.perf_counter()
+        index = SuggestionIndex(rows)
+        built = time.perf_counter() - started
+        self.stdout.write(
+            f'Built {len(index.values):,} suggestions in {built:.2f} s: '
+            f'{len(index.keys):,} keys, {len(index.top):,} precomputed prefixes'
+        )
+
+        queries = self._queries(rng, index, options['queries'])
+        by_length = {}
+        for query in queries:
+            started = time.perf_counter()
+            index.search(query, TOP_K)
+            by_length.setdefault(min(len(query), 8), []).append(time.perf_counter() - started)
+
+        self.stdout.write(self.style.MIGRATE_HEADING('\nLookup latency (microseconds)'))
+        self.stdout.write(f'  {"length":<8}{"lookups":>9}{"median":>10}{"p99":>10}{"max":>10}')
+        for length, timings in sorted(by_length.items()):
+            timings.sort()
+            label = f'{length}+' if length == 8 else str(length)
+            self.stdout.write(
+                f'  {label:<8}{len(timings):>9,}{statistics.median(timings) * 1e6:>10.1f}'
+                f'{timings[int(len(timings) * 0.99)] * 1e6:>10.1f}{timings[-1] * 1e6:>10.1f}'
+            )
+
+        self._benchmark_fuzzy(rng, index, options['queries'] // 10)
+
+        if options['db_rows']:
+            self._benchmark_db(rows[:options['db_rows']], queries[:200])
+
+        self.stdout.write(self.style.SUCCESS('\n=== END BENCHMARK ===\n'))
+
+    def _rows(self, rng, count):
+        """(id, value, usage_count, timestamp) tuples with distinct values"""
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+        seen = set()
+        pk = 0
+        while pk < count:
+            # Made-up venue names give the typo-tolerant lookup a vocabulary of tens of thousands of words
+            venue = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randrange(2, 4))).capitalize()
+            value = (f'{rng.choice(ADJECTIVES)} {rng.choice(EVENTS)} {rng.choice(ROLES)} - '
+                     f'{venue} {rng.choice(PLACES)} {rng.randrange(1, 100_000)}')
+            if value in seen:
+                continue
+            seen.add(value)
+            pk += 1
+            usage_count = max(1, int(rng.paretovariate(1.2)))
+            yield pk, value, usage_count, base + rng.randrange(0, 365 * 86400)
+
+    def _queries(self, rng, index, count):
+        """Prefixes (0 to 12 characters) of randomly chosen words of indexed values"""
+        queries = []
+        for _ in range(count):
+            words = index.values[rng.randrange(len(index.values))].split()
+            start = rng.randrange(len(words))
+            queries.append(' '.join(words[start:])[:rng.randrange(0, 13)])
+        return queries
+
+    def _benchmark_fuzzy(self, rng, index, count):
+        """Misspell words of indexed values and time suggestions() for them"""
+        real = set(words(normalize(' '.join(ADJECTIVES + EVENTS + ROLES + PLACES))))
+        vocabulary = [word for word in index.word_usage if len(word) >= FUZZY_MIN_LENGTH]
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f'\nTypo-tolerant lookups ({len(vocabulary):,} words of {FUZZY_MIN_LENGTH}+ letters)'
+        ))
+        for label, pool in (('event words', sorted(word for word in vocabulary if word in real)),
+                            ('venue names', [word for word in vocabulary if word not in real])):
+            timings, recovered = [], 0
+            for _ in range(count):
+                word = rng.choice(pool)
+                typo = word
+                for _ in range(max_edits(len(word))):
+                    typo = self._misspell(rng, typo)
+                started = time.perf_counter()
+                suggestions = index.suggestions(typo, TOP_K)
+                timings.append(time.perf_counter() - started)
+                recovered += any(word in words(normalize(item['value'])) for item in suggestions)
+
+            timings.sort()
+            self.stdout.write(
+                f'  {label:<12} {count:,} misspelled: median {statistics.median(timings) * 1000:.2f} ms, '
+                f'p99 {timings[int(len(timings) * 0.99)] * 1000:.2f} ms, max {timings[-1] * 1000:.2f} ms, '
+                f'intended word suggested for {recovered * 100 / count:.1f}%'
+            )
+
+    def _misspell(self, rng, word):
+        """word with one random substitution, deletion, insertion or swap of neighbours"""
+        position = rng.randrange(1, len(word))
+        letter = rng.choice('abcdefghijklmnopqrstuvwxyz')
+        return rng.choice([
+            word[:position] + letter + word[position + 1:],
+            word[:position] + word[position + 1:],
+            word[:position] + letter + word[position:],
+            word[:position - 1] + word[position] + word[position - 1] + word[position + 1:],
+        ])
+
+    def _benchmark_db(self, rows, queries):
+        self.stdout.write(self.style.MIGRATE_HEADING(f'\nvalue__icontains over {len(rows):,} rows'))
+        with transaction.atomic():
+            AutocompleteSuggestion.objects.bulk_create(
+                [AutocompleteSuggestion(field_type='previous_events', value=value, usage_count=usage_count)
+                 for _, value, usage_count, _ in rows],
+                batch_size=5000,
+            )
+            timings = []
+            for query in queries:
+                started = time.perf_counter()
+                list(AutocompleteSuggestion.objects.filter(
+                    field_type='previous_events', value__icontains=query,
+                ).values_list('value', 'usage_count')[:TOP_K])
+                timings.append(time.perf_counter() - started)
+            transaction.set_rollback(True)
+
+        timings.sort()
+        self.stdout.write(
+            f'  {len(timings)} queries: median {statistics.median(timings) * 1000:.2f} ms, '
+            f'p99 {timings[int(len(timings) * 0.99)] * 1000:.2f} ms'
+        )
@@ -0,0 +1,138 @@
+"""
+Management command to benchmark API JSON encoding and response compression
+Usage: python manage.py benchmark_json [--items 50 500 2000] [--repeat 20]
+
+Builds in-memory (unsaved) profiles, jobs, applications and transactions,
+serializes them with the same helpers the views use (my_applications,
+jobs_list and wallet history shapes) and reports, per payload size:
+
+    - encode time for Django's stock encoder, the stdlib backend of
+      api_json and orjson (when installed)
+    - body size uncompressed, gzip and brotli (when installed) and the
+      time each compression takes
+
+Nothing touches the database.
+"""
+
+import gzip
+import json
+import time
+from datetime import date, datetime, time as clock, timedelta, timezone
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test.utils import override_settings
+
+from EventFlex_app import api_json
+from EventFlex_app.models import UserProfile, Job, Application, Transaction
+from EventFlex_app.views import _application_to_dict, _job_to_dict, _transaction_to_dict
+
+
+class Command(BaseCommand):
+    help = 'Benchmark JSON encoders and compression over representative API payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, nargs='+', default=[50, 500, 2000],
+                            help='Rows per payload (default: 50 500 2000)')
+        parser.add_argument('--repeat', type=int, default=20,
+                            help='Timed runs per measurement, the best is reported (default: 20)')
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        self.stdout.write(self.style.SUCCESS('\n=== JSON RESPONSE BENCHMARK ===\n'))
+        self.stdout.write(f'orjson: {"installed" if api_json.orjson else "not installed"}, '
+                          f'brotli: {"installed" if api_json.brotli else "not installed"}\n')
+
+        for count in options['items']:
+            for name, payload in self._payloads(count).items():
+                self.stdout.write(self.style.MIGRATE_HEADING(f'{name} ({count} rows)'))
+
+                encoders = [('django', lambda: json.dumps(payload, cls=DjangoJSONEncoder).encode('utf-8'))]
+                encoders.append(('stdlib', self._with_backend('stdlib', payload)))
+                if api_json.orjson is not None:
+                    encoders.append(('orjson', self._with_backend('auto', payload)))
+
+                for label, encode in encoders:
+                    seconds, body = self._best(encode, repeat)
+                    self.stdout.write(f'  encode {label:<8} {seconds * 1000:>9.2f} ms {len(body):>11,} bytes')
+
+                body = api_json.dumps(payload)
+                compressors = [('gzip', lambda: gzip.compress(body, compresslevel=api_json.GZIP_LEVEL, mtime=0))]
+                if api_json.brotli is not None:
+                    compressors.append(('br', lambda: api_json.brotli.compress(body, quality=api_json.BROTLI_QUALITY)))
+                for label, compress in compressors:
+                    seconds, compressed = self._best(compress, repeat)
+                    self.stdout.write(
+                        f'  {label:<15} {seconds * 1000:>9.2f} ms {len(compressed):>11,} bytes '
+                        f'({len(compressed) * 100 / len(body):.1f}%)'
+                    )
+
+        self.stdout.write(self.style.SUCCESS('\n=== END BENCHMARK ===\n'))
+
+    def _with_backend(self, backend, payload):
+        def encode():
+            with override_settings(API_JSON_ENCODER=backend):
+                return api_json.dumps(payload)
+        return encode
+
+    def _best(self, func, repeat):
+        best, result = None, None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    def _payloads(self, count):
+        """my_applications, jobs_list and transactions shaped payloads with count rows each"""
+        now = datetime(2025, 1, 15, 10, 30, 12, 345678, tzinfo=timezone.utc)
+
+        def profile(pk, user_type):
+            user = User(id=pk, username=f'user{pk}', email=f'user{pk}@example.com',
+                        first_name='Priya', last_name='Kumar')
+            return UserProfile(
+                id=pk, user=user, user_type=user_type, city='Mumbai', phone='+91 98765 43210',
+                bio='Event professional from Mumbai. Ready to deliver exceptional service for your events!',
+                wallet_balance=Decimal('125400.50'), escrow_balance=Decimal('30000.00'),
+                average_rating=Decimal('4.62'), total_reviews=37, total_events_completed=52,
+            )
+
+        organizers = [profile(pk, 'organizer') for pk in range(1, 11)]
+        staff = profile(100, 'staff')
+
+        jobs, applications, transactions = [], [], []
+        for index in range(count):
+            job = Job(
+                id=index + 1, organizer=organizers[index % len(organizers)],
+                title=f'Corporate Gala Night {index}', role='Event Coordinator', event_type='Corporate',
+                number_of_staff=5, skills='Communication, Crowd management, Hospitality',
+                date=date(2025, 2, 1) + timedelta(days=index % 90), start_time=clock(18, 0), end_time=clock(23, 30),
+                location='Bandra Kurla Complex, Mumbai', pay_rate=Decimal('2500.00'), payment_type='event',
+                description='Coordinate guest arrivals, manage the stage schedule and brief the hospitality team.',
+                requirements='2+ years of event experience',
+            )
+            application = Application(
+                id=index + 1, job=job, applicant=staff, status='accepted', created_at=now,
+                cover_message='I have coordinated over fifty corporate events in Mumbai.',
+                full_name='Priya Kumar', email='priya@example.com', phone='+91 98765 43210',
+                experience_years='5', relevant_skills='Crowd management, Hospitality',
+                availability='Weekends and evenings', why_interested='I enjoy large corporate events.',
+                ai_rating=Decimal('4.5'), ai_rating_details='Strong skill match',
+            )
+            transaction = Transaction(
+                id=index + 1, user=staff, transaction_type='payment', amount=Decimal('2500.00'),
+                job=job, related_user=job.organizer, note=f'Payment for {job.title}',
+                balance_after=Decimal('125400.50'), created_at=now,
+            )
+            jobs.append(job)
+            applications.append(application)
+            transactions.append(transaction)
+
+        return {
+            'my_applications': {'applications': [_application_to_dict(app) for app in applications]},
+            'jobs_list': {'jobs': [_job_to_dict(job) for job in jobs]},
+            'transactions': {'transactions': [_transaction_to_dict(txn) for txn in transactions]},
+        }
@@ -0,0 +1,82 @@
+"""
+Management command to benchmark the set-based payout engine
+Usage: python manage.py benchmark_payouts [--staff 200 1000 5000]
+
+Builds a throwaway event with N hired staff inside a transaction, runs
+release_job_payouts, reports wall time and statement count, then rolls
+everything back. Nothing is left in the database.
+"""
+
+import time
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from EventFlex_app.models import UserProfile, Job, Application, Transaction
+from EventFlex_app.payouts import release_job_payouts
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmark finish_job payouts for events with many hired staff'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--staff', type=int, nargs='+', default=[200, 1000, 5000],
+                            help='Hired staff counts to benchmark (default: 200 1000 5000)')
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('\n=== PAYOUT ENGINE BENCHMARK ===\n'))
+        self.stdout.write(f'{"staff":>8} {"statements":>11} {"seconds":>9} {"ms/hire":>9}')
+
+        for staff_count in options['staff']:
+            try:
+                with transaction.atomic():
+                    job, organizer = self._build_event(staff_count)
+
+                    with CaptureQueriesContext(connection) as queries:
+                        started = time.perf_counter()
+                        result = release_job_payouts(job.id, organizer.id)
+                        elapsed = time.perf_counter() - started
+
+                    paid = Transaction.objects.filter(job=job, transaction_type='payment').count()
+                    assert paid == staff_count == result['payments_released']
+
+                    self.stdout.write(
+                        f'{staff_count:>8} {len(queries):>11} {elapsed:>9.3f} {elapsed * 1000 / staff_count:>9.3f}'
+                    )
+                    raise _Rollback()
+            except _Rollback:
+                pass
+
+        self.stdout.write(self.style.SUCCESS('\n=== END BENCHMARK (all data rolled back) ===\n'))
+
+    def _build_event(self, staff_count):
+        pay_rate = Decimal('1500.00')
+        prefix = f'bench_payout_{staff_count}_'
+
+        organizer_user = User.objects.create(username=f'{prefix}org')
+        organizer = UserProfile.objects.create(
+            user=organizer_user, user_type='organizer', wallet_balance=pay_rate * staff_count
+        )
+        job = Job.objects.create(organizer=organizer, title='Benchmark Event', pay_rate=pay_rate)
+
+        users = User.objects.bulk_create(
+            [User(username=f'{prefix}{i}') for i in range(staff_count)], batch_size=500
+        )
+        if users[0].pk is None:
+            users = list(User.objects.filter(username__startswith=prefix).exclude(id=organizer_user.id))
+        profiles = UserProfile.objects.bulk_create(
+            [UserProfile(user=user, user_type='staff') for user in users], batch_size=500
+        )
+        if profiles[0].pk is None:
+            profiles = list(UserProfile.objects.filter(user__in=users))
+        Application.objects.bulk_create(
+            [Application(job=job, applicant=profile, status='accepted') for profile in profiles], batch_size=500
+        )
+        return job, organizer
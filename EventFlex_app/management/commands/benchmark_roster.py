@@ -0,0 +1,194 @@
+"""
+Management command to benchmark roster proposals at thousands of applicants
+Usage: python manage.py benchmark_roster [--applicants 5000] [--jobs 8] [--positions 80] [--db]
+
+Builds a day of synthetic jobs (overlapping shifts, one role each, the
+positions spread over them) and pending applications from a staff pool in
+which some people apply to several jobs and some are already booked, then
+reports for roster.assign():
+
+    - latency (median and max over --repeat runs) with a budget covering
+      every position and with a budget for half of them
+    - positions filled, calendar conflicts and budget skips
+    - total score against the relaxed bound of each job's best applicants
+      with no budget or calendar limits
+
+With --db the same data is inserted inside a transaction that is rolled
+back afterwards, and roster.propose() is timed end to end (queries
+included), as the roster API runs it.
+"""
+
+import random
+import statistics
+import time
+from datetime import date, datetime, time as clock, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from EventFlex_app import roster
+from EventFlex_app.availability import CalendarIndex, job_interval
+from EventFlex_app.models import Application, CalendarEntry, Job, UserProfile
+
+ROLES = ['Usher', 'Bartender', 'Host', 'Security', 'Runner', 'Registration Desk', 'Valet', 'Photographer',
+         'Stage Manager', 'Sound Engineer', 'Caterer', 'Decorator']
+EVENT_DAY = date(2030, 3, 14)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark crew roster proposals over synthetic jobs and applicants'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--applicants', type=int, default=5000, help='Pending applications (default: 5000)')
+        parser.add_argument('--jobs', type=int, default=8, help='Jobs on the event day (default: 8)')
+        parser.add_argument('--positions', type=int, default=80, help='Open positions over all jobs (default: 80)')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per budget (default: 5)')
+        parser.add_argument('--db', action='store_true', help='Also time propose() against the database')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        self.stdout.write(self.style.SUCCESS('\n=== ROSTER BENCHMARK ===\n'))
+
+        jobs = self._jobs(rng, options['jobs'], options['positions'])
+        staff_count = max(1, options['applicants'] * 2 // 3)
+        applications = self._applications(rng, jobs, staff_count, options['applicants'])
+        booked = rng.sample(range(staff_count), staff_count // 10)
+        self.stdout.write(
+            f'{len(jobs)} jobs, {sum(job["positions"] for job in jobs)} positions, {len(applications):,} applications '
+            f'from {staff_count:,} staff, {len(booked):,} of them already booked that day'
+        )
+
+        openings = [
+            roster.Opening(index, job['title'], job['role'], job['pay_rate'], job['positions'], self._interval(job))
+            for index, job in enumerate(jobs)
+        ]
+        candidates = [
+            roster.Candidate(pk, job_index, staff, f'Staff {staff}', ai_rating, average_rating, reviews)
+            for pk, (job_index, staff, ai_rating, average_rating, reviews) in enumerate(applications, start=1)
+        ]
+        entries = [self._booking(rng, staff) for staff in booked]
+        demand = sum(opening.pay_rate * opening.positions for opening in openings)
+
+        self.stdout.write(self.style.MIGRATE_HEADING('\nroster.assign()'))
+        for label, budget in (('full budget', demand), ('half budget', demand / 2)):
+            timings = []
+            for _ in range(options['repeat']):
+                calendar = CalendarIndex(entries)
+                started = time.perf_counter()
+                result = roster.assign(openings, candidates, budget, calendar)
+                timings.append(time.perf_counter() - started)
+            self._report(label, timings, result, openings, candidates)
+
+        if options['db']:
+            self._benchmark_db(jobs, applications, staff_count, booked)
+
+        self.stdout.write(self.style.SUCCESS('\n=== END BENCHMARK ===\n'))
+
+    def _jobs(self, rng, count, positions):
+        """Shifts across the day with positions split at random (at least one each)"""
+        cuts = sorted(rng.sample(range(1, positions), min(count, positions) - 1))
+        sizes = [b - a for a, b in zip([0] + cuts, cuts + [positions])]
+        jobs = []
+        for index, size in enumerate(sizes):
+            start = rng.choice([8, 10, 12, 14, 16, 18])
+            jobs.append({
+                'title': f'Expo shift {index + 1}', 'role': ROLES[index % len(ROLES)], 'positions': size,
+                'pay_rate': Decimal(rng.choice([800, 1000, 1200, 1500, 2000])),
+                'start_time': clock(start), 'end_time': clock((start + rng.choice([4, 6, 8])) % 24),
+            })
+        return jobs
+
+    def _applications(self, rng, jobs, staff_count, count):
+        """(job index, staff index, ai_rating, average_rating, total_reviews); a third of staff apply twice"""
+        reputation = [
+            (Decimal(str(round(rng.uniform(2.5, 5.0), 2))), rng.choice([0, 0, 1, 3, 8, 20, 50]))
+            for _ in range(staff_count)
+        ]
+        seen = set()
+        applications = []
+        while len(applications) < count:
+            staff = rng.randrange(staff_count) if len(applications) >= staff_count else len(applications)
+            job_index = rng.randrange(len(jobs))
+            if (job_index, staff) in seen:
+                continue
+            seen.add((job_index, staff))
+            applications.append((job_index, staff, Decimal(str(round(rng.uniform(1.0, 5.0), 1))), *reputation[staff]))
+        return applications
+
+    def _interval(self, job):
+        return job_interval(Job(date=EVENT_DAY, start_time=job['start_time'], end_time=job['end_time']))
+
+    def _booking(self, rng, staff):
+        start = timezone.make_aware(datetime.combine(EVENT_DAY, clock(rng.randrange(6, 20))))
+        return CalendarEntry(profile_id=staff, kind='booking', starts_at=start, ends_at=start + timedelta(hours=4))
+
+    def _report(self, label, timings, result, openings, candidates):
+        filled = sum(len(hires) for hires in result['hires'].values())
+        total = sum(candidate_score for hires in result['hires'].values() for _, candidate_score in hires)
+        best = {}
+        for candidate in candidates:
+            best.setdefault(candidate.job_id, []).append(roster.score(candidate))
+        bound = sum(
+            sum(sorted(best.get(opening.job_id, []), reverse=True)[:opening.positions]) for opening in openings
+        )
+        self.stdout.write(
+            f'  {label:<12} median {statistics.median(timings) * 1000:.1f} ms, max {max(timings) * 1000:.1f} ms; '
+            f'filled {filled}/{sum(opening.positions for opening in openings)}, cost ₹{result["cost"]}, '
+            f'skipped {result["skipped"]["calendar_conflict"]} busy / {result["skipped"]["over_budget"]} over budget; '
+            f'score {total:.1f} of relaxed bound {bound:.1f}'
+        )
+
+    def _benchmark_db(self, jobs, applications, staff_count, booked):
+        self.stdout.write(self.style.MIGRATE_HEADING('\nroster.propose() against the database'))
+        with transaction.atomic():
+            organizer = UserProfile.objects.create(
+                user=User.objects.create(username='benchmark_roster_organizer'), user_type='organizer',
+                wallet_balance=sum(job['pay_rate'] * job['positions'] for job in jobs),
+            )
+            users = User.objects.bulk_create(
+                [User(username=f'benchmark_roster_{index}') for index in range(staff_count)], batch_size=500,
+            )
+            profiles = UserProfile.objects.bulk_create(
+                [UserProfile(user=user, user_type='staff') for user in users], batch_size=500,
+            )
+            job_rows = Job.objects.bulk_create([
+                Job(organizer=organizer, title=job['title'], role=job['role'], number_of_staff=job['positions'],
+                    pay_rate=job['pay_rate'], date=EVENT_DAY, start_time=job['start_time'], end_time=job['end_time'])
+                for job in jobs
+            ])
+            for profile, (average_rating, reviews) in zip(profiles, self._reputations(applications, staff_count)):
+                profile.average_rating, profile.total_reviews = average_rating, reviews
+            UserProfile.objects.bulk_update(profiles, ['average_rating', 'total_reviews'], batch_size=500)
+            Application.objects.bulk_create([
+                Application(job=job_rows[job_index], applicant=profiles[staff], ai_rating=ai_rating)
+                for job_index, staff, ai_rating, _, _ in applications
+            ], batch_size=500)
+            rng = random.Random(0)
+            bookings = [self._booking(rng, staff) for staff in booked]
+            for booking in bookings:
+                booking.profile_id = profiles[booking.profile_id].id
+            CalendarEntry.objects.bulk_create(bookings, batch_size=500)
+
+            timings = []
+            for _ in range(3):
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    proposal = roster.propose(organizer, job_rows)
+                    timings.append(time.perf_counter() - started)
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f'  {proposal["applications_considered"]:,} applications: median {statistics.median(timings) * 1000:.1f} ms, '
+            f'max {max(timings) * 1000:.1f} ms, {len(queries)} queries, {len(proposal["decisions"])} hires proposed'
+        )
+
+    def _reputations(self, applications, staff_count):
+        reputations = [(Decimal('0'), 0)] * staff_count
+        for _, staff, _, average_rating, reviews in applications:
+            reputations[staff] = (average_rating, reviews)
+        return reputations
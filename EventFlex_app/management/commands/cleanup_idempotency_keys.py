@@ -0,0 +1,20 @@
+"""
+Management command to clean up expired idempotency records
+Usage: python manage.py cleanup_idempotency_keys
+"""
+
+from django.core.management.base import BaseCommand
+from EventFlex_app.idempotency import cleanup_expired_idempotency_keys
+
+
+class Command(BaseCommand):
+    help = 'Delete Idempotency-Key records older than IDEMPOTENCY_KEY_TTL_HOURS'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Cleaning up expired idempotency keys...')
+        
+        count = cleanup_expired_idempotency_keys()
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully deleted {count} expired idempotency key(s)')
+        )
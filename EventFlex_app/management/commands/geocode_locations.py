@@ -0,0 +1,27 @@
+"""
+Management command to geocode existing jobs and profiles
+Usage: python manage.py geocode_locations
+
+Jobs and profiles are geocoded whenever they are saved (see geo.py); run
+this once after migrating, and again after adding cities or aliases to
+data/indian_cities.csv, to place rows that were saved before.
+"""
+
+from django.core.management.base import BaseCommand
+from EventFlex_app.geo import backfill
+from EventFlex_app.models import Job, UserProfile
+
+
+class Command(BaseCommand):
+    help = 'Set city, latitude, longitude and geohash of every Job and UserProfile from their location text'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Geocoding jobs and profiles...')
+
+        for model, field in ((Job, 'location'), (UserProfile, 'city')):
+            read, updated, located = backfill(model)
+            self.stdout.write(
+                f'  {model.__name__}: {located} of {read} placed from {field}, {updated} updated'
+            )
+
+        self.stdout.write(self.style.SUCCESS('Successfully geocoded locations'))
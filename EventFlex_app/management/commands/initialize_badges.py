@@ -14,7 +14,7 @@ class Command(BaseCommand):
             # Set default badge to rising_star if empty or update based on existing reviews
             if not profile.badge or profile.badge == '':
                 profile.badge = 'rising_star'
-                profile.save()
+                profile.save(update_fields=['badge'])
                 updated_count += 1
                 self.stdout.write(f"Set {profile.user.username} to Rising Star")
             else:
@@ -0,0 +1,37 @@
+"""
+Management command to merge near-duplicate autocomplete suggestions
+Usage: python manage.py merge_autocomplete_suggestions [--field-type location role ...] [--dry-run]
+
+Folds suggestions that differ only by case, spacing, punctuation or one
+typo ("Bangalore", "bangalore", "Banglore") into the most used spelling,
+adding their usage counts to it. Run it from cron; the typo-tolerant lookup
+keeps new variants from being suggested in the meantime.
+"""
+
+from django.core.management.base import BaseCommand
+from EventFlex_app.autocomplete import merge_near_duplicates
+from EventFlex_app.models import AutocompleteSuggestion
+
+
+class Command(BaseCommand):
+    help = 'Merge near-duplicate AutocompleteSuggestion rows into their most used spelling'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--field-type', nargs='+', dest='field_types',
+                            choices=[field_type for field_type, _ in AutocompleteSuggestion.FIELD_TYPES],
+                            help='Only merge these field types (default: all)')
+        parser.add_argument('--dry-run', action='store_true', help='Report the merges without writing them')
+
+    def handle(self, *args, **options):
+        self.stdout.write('Looking for near-duplicate suggestions...')
+
+        merged = merge_near_duplicates(options['field_types'], dry_run=options['dry_run'])
+        for field_type, canonical, duplicates, added in merged:
+            variants = ', '.join(repr(value) for value in duplicates)
+            self.stdout.write(f'  {field_type}: {canonical!r} <- {variants} (+{added})')
+
+        removed = sum(len(duplicates) for _, _, duplicates, _ in merged)
+        verb = 'Would merge' if options['dry_run'] else 'Successfully merged'
+        self.stdout.write(
+            self.style.SUCCESS(f'{verb} {removed} suggestion{"" if removed == 1 else "s"} into {len(merged)}')
+        )
@@ -0,0 +1,23 @@
+"""
+Management command to prune old dashboard sync change log entries
+Usage: python manage.py prune_change_log [--days 30]
+"""
+
+from django.core.management.base import BaseCommand
+from EventFlex_app.changelog import prune_change_log
+
+
+class Command(BaseCommand):
+    help = 'Delete delta-sync change log entries older than the retention window'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30, help='Retention window in days (default: 30)')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Pruning change log entries older than {options['days']} day(s)...")
+        
+        count = prune_change_log(days=options['days'])
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully deleted {count} change log entr{"y" if count == 1 else "ies"}')
+        )
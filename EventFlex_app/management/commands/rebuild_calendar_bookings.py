@@ -0,0 +1,23 @@
+"""
+Management command to rebuild staff calendar bookings from accepted applications
+Usage: python manage.py rebuild_calendar_bookings
+
+Bookings are written as applications are accepted (see availability.py).
+Run this once after migrating, so staff hired before the calendar existed
+are counted as busy, and whenever a job's date or times were edited
+directly in the database or the admin. Unavailable blocks are kept.
+"""
+
+from django.core.management.base import BaseCommand
+from EventFlex_app.availability import rebuild_bookings
+
+
+class Command(BaseCommand):
+    help = 'Recreate CalendarEntry bookings for every accepted application'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding calendar bookings...')
+
+        count = rebuild_bookings()
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully wrote {count} booking{"" if count == 1 else "s"}'))
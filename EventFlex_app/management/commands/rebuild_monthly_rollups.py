@@ -0,0 +1,25 @@
+"""
+Management command to re-derive the monthly transaction rollup from the ledger
+Usage: python manage.py rebuild_monthly_rollups [--profile ID ...]
+
+Deletes the rollup rows (for everyone, or only the given profiles) and
+rebuilds them from completed transactions with one grouped query.
+"""
+
+from django.core.management.base import BaseCommand
+from EventFlex_app.summaries import rebuild_monthly_rollups
+
+
+class Command(BaseCommand):
+    help = 'Rebuild MonthlyTransactionRollup rows from completed transactions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', type=int, nargs='+', dest='profile_ids',
+                            help='Only rebuild these UserProfile ids')
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding monthly transaction rollups...')
+
+        count = rebuild_monthly_rollups(options['profile_ids'])
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully wrote {count} rollup row(s)'))
@@ -0,0 +1,28 @@
+"""
+Management command to rebuild materialized wallet summaries from the ledger
+Usage: python manage.py rebuild_wallet_summaries [--profile ID ...]
+
+Recomputes balance, total earned, monthly buckets, pending pay and event
+counts for every profile (or only the given ones). Safe to run at any time;
+existing summary rows are overwritten.
+"""
+
+from django.core.management.base import BaseCommand
+from EventFlex_app.summaries import rebuild_wallet_summaries
+
+
+class Command(BaseCommand):
+    help = 'Rebuild WalletSummary rows from transactions, applications and jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', type=int, nargs='+', dest='profile_ids',
+                            help='Only rebuild these UserProfile ids')
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding wallet summaries...')
+
+        count = rebuild_wallet_summaries(options['profile_ids'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully rebuilt {count} wallet summar{"y" if count == 1 else "ies"}')
+        )
@@ -20,7 +20,7 @@ class Command(BaseCommand):
             
             old_count = profile.total_events_completed
             profile.total_events_completed = completed_jobs
-            profile.save()
+            profile.save(update_fields=['total_events_completed'])
             
             if old_count != completed_jobs:
                 updated_count += 1
@@ -0,0 +1,119 @@
+"""
+Management command to stress test the wallet service under concurrency
+Usage: python manage.py wallet_stress_test [--threads 8] [--operations 50] [--amount 10]
+
+Creates a throwaway organizer, then hammers its wallet from several threads
+with interleaved credits and debits (each thread uses its own database
+connection). Afterwards it checks that:
+
+    - the balance never went negative and equals start + credits - debits
+    - exactly one ledger row exists per successful operation
+    - no ledger row recorded a negative balance_after
+
+The throwaway user and its ledger are deleted at the end.
+"""
+
+import random
+import threading
+import time
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, OperationalError
+from django.db.models import Sum
+
+from EventFlex_app.models import UserProfile, Transaction
+from EventFlex_app.wallet import credit, debit, InsufficientFunds
+
+
+class Command(BaseCommand):
+    help = 'Run concurrent credits/debits against one wallet and verify the ledger stays consistent'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help='Concurrent workers (default: 8)')
+        parser.add_argument('--operations', type=int, default=50, help='Operations per worker (default: 50)')
+        parser.add_argument('--amount', type=str, default='10', help='Amount per operation (default: 10)')
+        parser.add_argument('--starting-balance', type=str, default='100',
+                            help='Opening balance; keep it low so debits hit insufficient funds (default: 100)')
+
+    def handle(self, *args, **options):
+        amount = Decimal(options['amount'])
+        starting_balance = Decimal(options['starting_balance'])
+
+        user = User.objects.create(username=f'wallet_stress_{int(time.time() * 1000)}')
+        profile = UserProfile.objects.create(user=user, user_type='organizer', wallet_balance=starting_balance)
+
+        lock = threading.Lock()
+        stats = {'credits': 0, 'debits': 0, 'rejected': 0, 'retries': 0, 'errors': []}
+
+        def worker(seed):
+            rng = random.Random(seed)
+            try:
+                for _ in range(options['operations']):
+                    is_debit = rng.random() < 0.6
+                    while True:
+                        try:
+                            if is_debit:
+                                debit(profile.id, amount, 'withdrawal', note='stress test')
+                            else:
+                                credit(profile.id, amount, 'deposit', note='stress test')
+                            key = 'debits' if is_debit else 'credits'
+                            break
+                        except InsufficientFunds:
+                            key = 'rejected'
+                            break
+                        except OperationalError:
+                            # SQLite serializes writers; back off and retry when the file is locked
+                            with lock:
+                                stats['retries'] += 1
+                            time.sleep(rng.uniform(0.001, 0.01))
+                    with lock:
+                        stats[key] += 1
+            except Exception as exc:
+                with lock:
+                    stats['errors'].append(repr(exc))
+            finally:
+                connection.close()
+
+        self.stdout.write(self.style.SUCCESS('\n=== WALLET STRESS TEST ===\n'))
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(options['threads'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        try:
+            profile.refresh_from_db()
+            ledger = Transaction.objects.filter(user=profile)
+            expected = starting_balance + amount * stats['credits'] - amount * stats['debits']
+            deposited = ledger.filter(transaction_type='deposit').aggregate(total=Sum('amount'))['total'] or 0
+            withdrawn = ledger.filter(transaction_type='withdrawal').aggregate(total=Sum('amount'))['total'] or 0
+            balances_after = list(ledger.values_list('balance_after', flat=True))
+
+            self.stdout.write(f'Workers: {options["threads"]} x {options["operations"]} operations in {elapsed:.2f}s')
+            self.stdout.write(
+                f'Credits: {stats["credits"]}  Debits: {stats["debits"]}  '
+                f'Rejected (insufficient funds): {stats["rejected"]}  Lock retries: {stats["retries"]}'
+            )
+            self.stdout.write(f'Final balance: ₹{profile.wallet_balance} (expected ₹{expected})')
+
+            problems = list(stats['errors'])
+            if profile.wallet_balance != expected:
+                problems.append(f'balance {profile.wallet_balance} != expected {expected}')
+            if profile.wallet_balance < 0:
+                problems.append('balance went negative')
+            if starting_balance + deposited - withdrawn != profile.wallet_balance:
+                problems.append('ledger totals do not reconcile with balance')
+            if len(balances_after) != stats['credits'] + stats['debits']:
+                problems.append(f'{len(balances_after)} ledger rows for {stats["credits"] + stats["debits"]} operations')
+            if any(balance < 0 for balance in balances_after):
+                problems.append('a ledger row recorded a negative balance')
+        finally:
+            user.delete()
+
+        if problems:
+            raise CommandError('Wallet consistency check failed:\n  ' + '\n  '.join(problems))
+        self.stdout.write(self.style.SUCCESS('\nLedger consistent: no lost updates, no overdraft\n'))
@@ -1,10 +1,14 @@
 """
-JWT Authentication Middleware for EventFlex
-Automatically authenticates users based on JWT tokens from cookies or headers
+Middleware for EventFlex
+JWT authentication from cookies or headers, pre-compressed static asset serving
+and compression of large API responses
 """
 
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.utils.deprecation import MiddlewareMixin
+from .api_json import compress_response
+from .assets import static_asset_response
 from .jwt_utils import verify_jwt_token, get_token_from_request
 
 
@@ -51,3 +55,38 @@ class JWTAuthenticationMiddleware(MiddlewareMixin):
         # (only for web users who haven't migrated to JWT yet)
         
         return None
+
+
+class StaticAssetMiddleware(MiddlewareMixin):
+    """
+    Middleware to serve collected static files when the asset pipeline is enabled
+    
+    Runs before sessions and authentication so asset requests skip them. Picks
+    the .br/.gz variant the client accepts and marks fingerprinted files as
+    immutable (see assets.py). Unknown paths fall through to the URL resolver.
+    """
+    
+    def process_request(self, request):
+        """Serve the request from STATIC_ROOT if it targets a collected file"""
+        if not getattr(settings, 'STATIC_ASSET_PIPELINE', False):
+            return None
+        if request.method not in ('GET', 'HEAD') or not request.path.startswith(settings.STATIC_URL):
+            return None
+        
+        return static_asset_response(request, request.path[len(settings.STATIC_URL):])
+
+
+class ApiCompressionMiddleware(MiddlewareMixin):
+    """
+    Middleware to brotli/gzip-compress /api/ responses above a size threshold
+    
+    Sits near the top of MIDDLEWARE so it sees the final body. Thresholds and
+    encodings are described in api_json.py.
+    """
+    
+    def process_response(self, request, response):
+        """Compress the response if it is an API response the client can decode"""
+        if not request.path.startswith('/api/'):
+            return response
+        
+        return compress_response(request, response)
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EventFlex_app', '0015_userprofile_profile_picture'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(choices=[('job', 'Job'), ('application', 'Application'), ('message', 'Message'), ('transaction', 'Transaction')], max_length=20)),
+                ('entity_id', models.BigIntegerField()),
+                ('action', models.CharField(choices=[('upsert', 'Created/Updated'), ('delete', 'Deleted')], default='upsert', max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='change_log', to='EventFlex_app.userprofile')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['profile', 'id'], name='EventFlex_a_profile_d8a5bd_idx'), models.Index(fields=['created_at'], name='EventFlex_a_created_642aca_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-19 12:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EventFlex_app', '0017_idempotencykey'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WalletSummary',
+            fields=[
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='wallet_summary', serialize=False, to='EventFlex_app.userprofile')),
+                ('balance', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
+                ('total_earned', models.DecimalField(decimal_places=2, default=0.0, max_digits=12)),
+                ('monthly_earnings', models.JSONField(blank=True, default=dict)),
+                ('pending_amount', models.DecimalField(decimal_places=2, default=0.0, max_digits=12)),
+                ('pending_count', models.PositiveIntegerField(default=0)),
+                ('total_events', models.PositiveIntegerField(default=0)),
+                ('activity_stale', models.BooleanField(default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
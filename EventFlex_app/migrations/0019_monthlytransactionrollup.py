@@ -0,0 +1,54 @@
+# Generated by Django 5.2.7 on 2026-10-19 12:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_rollups(apps, schema_editor):
+    Transaction = apps.get_model('EventFlex_app', 'Transaction')
+    MonthlyTransactionRollup = apps.get_model('EventFlex_app', 'MonthlyTransactionRollup')
+    grouped = (Transaction.objects.filter(status='completed')
+               .annotate(month_start=TruncMonth('created_at'))
+               .values('user_id', 'month_start', 'transaction_type')
+               .annotate(total=Sum('amount'), count=Count('id')))
+    MonthlyTransactionRollup.objects.bulk_create(
+        (
+            MonthlyTransactionRollup(
+                user_id=row['user_id'],
+                month=row['month_start'].date(),
+                transaction_type=row['transaction_type'],
+                total_amount=row['total'],
+                transaction_count=row['count'],
+            )
+            for row in grouped.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EventFlex_app', '0018_walletsummary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyTransactionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('transaction_type', models.CharField(choices=[('deposit', 'Deposit'), ('escrow_hold', 'Escrow Hold'), ('escrow_release', 'Escrow Release'), ('payment', 'Payment'), ('withdrawal', 'Withdrawal'), ('refund', 'Refund')], max_length=32)),
+                ('total_amount', models.DecimalField(decimal_places=2, default=0.0, max_digits=14)),
+                ('transaction_count', models.PositiveIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='EventFlex_app.userprofile')),
+            ],
+            options={
+                'ordering': ['month', 'transaction_type'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'month', 'transaction_type'), name='unique_monthly_rollup')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
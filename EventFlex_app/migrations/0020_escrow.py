@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-19 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EventFlex_app', '0019_monthlytransactionrollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='escrow_amount',
+            field=models.DecimalField(decimal_places=2, default=0.0, max_digits=10),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='escrow_balance',
+            field=models.DecimalField(decimal_places=2, default=0.0, max_digits=12),
+        ),
+    ]
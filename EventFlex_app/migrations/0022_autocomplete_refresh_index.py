@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-19 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EventFlex_app', '0021_row_versions'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='autocompletesuggestion',
+            index=models.Index(fields=['field_type', 'updated_at'], name='EventFlex_a_field_t_47abdb_idx'),
+        ),
+    ]
@@ -1,8 +1,86 @@
+from decimal import Decimal
+
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
+
+
+class VersionedQuerySet(models.QuerySet):
+	"""QuerySet whose update() also bumps updated_at (API ETags are derived from it)"""
+	
+	def update(self, **kwargs):
+		kwargs.setdefault('updated_at', timezone.now())
+		return super().update(**kwargs)
+
+
+class VersionedModel(models.Model):
+	"""
+	Abstract model with an updated_at row version that every write path bumps
+	
+	auto_now alone misses queryset .update() calls (wallet, payouts) and
+	save(update_fields=[...]) calls that don't list the field; both are
+	covered here so conditional GETs never see a stale version.
+	"""
+	updated_at = models.DateTimeField(auto_now=True)
+	
+	objects = VersionedQuerySet.as_manager()
+	
+	class Meta:
+		abstract = True
+	
+	def save(self, *args, **kwargs):
+		update_fields = kwargs.get('update_fields')
+		if update_fields is not None and 'updated_at' not in update_fields:
+			kwargs['update_fields'] = [*update_fields, 'updated_at']
+		super().save(*args, **kwargs)
+
+
+class GeoLocatedModel(VersionedModel):
+	"""
+	Abstract model geocoded from a free-text place field on every write
+	
+	geocoded_from names that field. city is set to the gazetteer's spelling
+	of the city found in it, and latitude, longitude and geohash to that
+	city's coordinates; they are cleared when no known city is named (see
+	geo.py). save(update_fields=[...]) only geocodes when the list includes
+	geocoded_from, and then writes the derived fields too.
+	"""
+	geocoded_from = 'city'
+	
+	latitude = models.FloatField(null=True, blank=True)
+	longitude = models.FloatField(null=True, blank=True)
+	geohash = models.CharField(max_length=12, blank=True, db_index=True)
+	
+	class Meta:
+		abstract = True
+	
+	def geocode(self):
+		"""Set city and the coordinate fields from the geocoded_from text"""
+		from .geo import encode_geohash, geocode
+		place = geocode(getattr(self, self.geocoded_from))
+		if place is None:
+			if self.geocoded_from != 'city':
+				self.city = ''
+			self.latitude = self.longitude = None
+			self.geohash = ''
+			return None
+		self.city = place.name
+		self.latitude, self.longitude = place.latitude, place.longitude
+		self.geohash = encode_geohash(place.latitude, place.longitude)
+		return place
+	
+	def save(self, *args, **kwargs):
+		update_fields = kwargs.get('update_fields')
+		if update_fields is None:
+			self.geocode()
+		elif self.geocoded_from in update_fields:
+			self.geocode()
+			derived = [name for name in ('city', 'latitude', 'longitude', 'geohash') if name not in update_fields]
+			kwargs['update_fields'] = [*update_fields, *derived]
+		super().save(*args, **kwargs)
 
 
-class UserProfile(models.Model):
+class UserProfile(GeoLocatedModel):
 	USER_TYPES = (('organizer', 'Organizer'), ('staff', 'EventPro'))
 	BADGE_LEVELS = (
 		('rising_star', 'Rising Star'),
@@ -19,10 +97,11 @@ class UserProfile(models.Model):
 	kyc_verified = models.BooleanField(default=False)
 	video_verified = models.BooleanField(default=False)
 	badge = models.CharField(max_length=32, choices=BADGE_LEVELS, default='rising_star')
-	wallet_balance = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+	wallet_balance = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'))
+	escrow_balance = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))  # held for accepted staff, see wallet.py
 	
 	# Reputation fields
-	average_rating = models.DecimalField(max_digits=3, decimal_places=2, default=0.00)
+	average_rating = models.DecimalField(max_digits=3, decimal_places=2, default=Decimal('0.00'))
 	total_reviews = models.PositiveIntegerField(default=0)
 	total_events_completed = models.PositiveIntegerField(default=0)
 	
@@ -45,19 +124,18 @@ class UserProfile(models.Model):
 		)
 	
 	def add_funds(self, amount, note=""):
-		"""Add funds to wallet"""
-		self.wallet_balance += amount
-		self.save()
+		"""Add funds to wallet (atomic UPDATE + ledger row, see wallet.py)"""
+		from .wallet import credit
+		txn = credit(self.id, amount, 'deposit', note=note)
+		self.wallet_balance = txn.balance_after
 		return self.wallet_balance
 	
 	def deduct_funds(self, amount, note=""):
-		"""Deduct funds from wallet"""
-		if self.wallet_balance >= amount:
-			self.wallet_balance -= amount
-			self.save()
-			return self.wallet_balance
-		else:
-			raise ValueError("Insufficient balance")
+		"""Deduct funds from wallet; raises InsufficientFunds (a ValueError) if short"""
+		from .wallet import debit
+		txn = debit(self.id, amount, 'withdrawal', note=note)
+		self.wallet_balance = txn.balance_after
+		return self.wallet_balance
 	
 	def update_badge(self):
 		"""Update badge based on average rating"""
@@ -69,7 +147,7 @@ class UserProfile(models.Model):
 			self.badge = 'pro'
 		else:
 			self.badge = 'rising_star'
-		self.save()
+		self.save(update_fields=['badge'])
 		return self.badge
 	
 	def update_rating(self):
@@ -78,17 +156,19 @@ class UserProfile(models.Model):
 		reviews = self.received_reviews.all()
 		if reviews.exists():
 			avg = reviews.aggregate(Avg('rating'))['rating__avg']
-			self.average_rating = round(avg, 2) if avg else 0.00
+			self.average_rating = round(avg, 2) if avg else Decimal('0.00')
 			self.total_reviews = reviews.count()
 		else:
-			self.average_rating = 0.00
+			self.average_rating = Decimal('0.00')
 			self.total_reviews = 0
-		self.save()
+		self.save(update_fields=['average_rating', 'total_reviews'])
 		self.update_badge()
 		return self.average_rating
 
 
-class Job(models.Model):
+class Job(GeoLocatedModel):
+	geocoded_from = 'location'
+	
 	STATUS_CHOICES = [
 		('active', 'Active'),
 		('completed', 'Completed'),
@@ -105,7 +185,8 @@ class Job(models.Model):
 	start_time = models.TimeField(null=True, blank=True)
 	end_time = models.TimeField(null=True, blank=True)
 	location = models.CharField(max_length=300, blank=True)
-	pay_rate = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+	city = models.CharField(max_length=120, blank=True)  # canonical city found in location, see GeoLocatedModel
+	pay_rate = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0'))
 	payment_type = models.CharField(max_length=32, default='event')
 	description = models.TextField(blank=True)
 	requirements = models.CharField(max_length=400, blank=True)
@@ -137,11 +218,48 @@ class Application(models.Model):
 	
 	ai_rating = models.DecimalField(max_digits=2, decimal_places=1, null=True, blank=True, default=None)
 	ai_rating_details = models.TextField(blank=True)
+	
+	# Pay currently held in the organizer's escrow for this hire (0 when nothing is held)
+	escrow_amount = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'))
 
 	def __str__(self):
 		return f"{self.applicant} -> {self.job} ({self.status})"
 
 
+class CalendarEntry(models.Model):
+	"""
+	A busy interval in a staff member's calendar (see availability.py)
+	
+	Bookings are written when an application is accepted and deleted when it
+	stops being accepted; unavailable blocks are entered by the staff member.
+	No entry is longer than availability.MAX_SPAN, which keeps overlap checks
+	on (profile, starts_at) a bounded index range scan.
+	"""
+	KINDS = (
+		('booking', 'Booking'),
+		('unavailable', 'Unavailable'),
+	)
+	
+	profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name='calendar_entries')
+	kind = models.CharField(max_length=20, choices=KINDS)
+	starts_at = models.DateTimeField()
+	ends_at = models.DateTimeField()
+	application = models.OneToOneField(
+		Application, on_delete=models.CASCADE, null=True, blank=True, related_name='booking'
+	)
+	note = models.CharField(max_length=200, blank=True)
+	created_at = models.DateTimeField(auto_now_add=True)
+	
+	class Meta:
+		ordering = ['starts_at']
+		indexes = [
+			models.Index(fields=['profile', 'starts_at']),
+		]
+	
+	def __str__(self):
+		return f"{self.profile_id} {self.kind} {self.starts_at:%Y-%m-%d %H:%M} - {self.ends_at:%Y-%m-%d %H:%M}"
+
+
 class Transaction(models.Model):
 	TRANSACTION_TYPES = (
 		('deposit', 'Deposit'),
@@ -165,7 +283,7 @@ class Transaction(models.Model):
 	
 	# Metadata
 	note = models.CharField(max_length=300, blank=True)
-	balance_after = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+	balance_after = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'))
 	created_at = models.DateTimeField(auto_now_add=True)
 	
 	class Meta:
@@ -207,6 +325,10 @@ class AutocompleteSuggestion(models.Model):
 	class Meta:
 		unique_together = ('field_type', 'value')
 		ordering = ['-usage_count', '-updated_at']
+		indexes = [
+			# Incremental refresh of the in-process autocomplete index
+			models.Index(fields=['field_type', 'updated_at']),
+		]
 	
 	def __str__(self):
 		return f"{self.field_type}: {self.value}"
@@ -306,11 +428,11 @@ class VerificationDocument(models.Model):
 		# Update UserProfile KYC status when verification is approved
 		if self.status == 'approved' and old_status != 'approved':
 			self.user.kyc_verified = True
-			self.user.save()
+			self.user.save(update_fields=['kyc_verified'])
 		elif self.status == 'rejected' and old_status == 'approved':
 			# If previously approved is now rejected, remove KYC status
 			self.user.kyc_verified = False
-			self.user.save()
+			self.user.save(update_fields=['kyc_verified'])
 
 
 class Review(models.Model):
@@ -350,3 +472,100 @@ class Review(models.Model):
 
 
 
+
+
+class ChangeLogEntry(models.Model):
+	"""Append-only log of row changes, one entry per affected user, used as the delta-sync cursor"""
+	ENTITY_TYPES = (
+		('job', 'Job'),
+		('application', 'Application'),
+		('message', 'Message'),
+		('transaction', 'Transaction'),
+	)
+	ACTIONS = (('upsert', 'Created/Updated'), ('delete', 'Deleted'))
+	
+	profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name='change_log')
+	entity_type = models.CharField(max_length=20, choices=ENTITY_TYPES)
+	entity_id = models.BigIntegerField()
+	action = models.CharField(max_length=10, choices=ACTIONS, default='upsert')
+	created_at = models.DateTimeField(auto_now_add=True)
+	
+	class Meta:
+		ordering = ['id']
+		indexes = [
+			models.Index(fields=['profile', 'id']),
+			models.Index(fields=['created_at']),
+		]
+	
+	def __str__(self):
+		return f"#{self.id} {self.entity_type}:{self.entity_id} {self.action} for {self.profile_id}"
+
+
+class IdempotencyKey(models.Model):
+	"""Stored outcome of a money-moving request, replayed when a client retries with the same Idempotency-Key"""
+	user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='idempotency_keys')
+	key = models.CharField(max_length=255)
+	request_hash = models.CharField(max_length=64)  # sha256 of method, path and body
+	status_code = models.PositiveSmallIntegerField(null=True, blank=True)  # null while the request is in flight
+	response_body = models.TextField(blank=True, default='')
+	created_at = models.DateTimeField(auto_now_add=True)
+	expires_at = models.DateTimeField()
+	
+	class Meta:
+		constraints = [
+			models.UniqueConstraint(fields=['user', 'key'], name='unique_idempotency_key_per_user'),
+		]
+		indexes = [
+			models.Index(fields=['expires_at']),
+		]
+	
+	def __str__(self):
+		return f"{self.key} ({self.status_code or 'in progress'}) for {self.user.username}"
+
+
+class WalletSummary(models.Model):
+	"""Materialized wallet statistics for one profile (see summaries.py), read by wallet_stats in a single query"""
+	profile = models.OneToOneField(UserProfile, on_delete=models.CASCADE, primary_key=True, related_name='wallet_summary')
+	
+	# Maintained incrementally from ledger writes
+	balance = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('0.00'))
+	total_earned = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+	monthly_earnings = models.JSONField(default=dict, blank=True)  # {"2026-10": "1500.00", ...}
+	
+	# Derived from applications/jobs; recomputed on read after activity_stale is set
+	pending_amount = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+	pending_count = models.PositiveIntegerField(default=0)
+	total_events = models.PositiveIntegerField(default=0)
+	activity_stale = models.BooleanField(default=True)
+	
+	updated_at = models.DateTimeField(auto_now=True)
+	
+	def __str__(self):
+		return f"Wallet summary for {self.profile_id}"
+
+
+class MonthlyTransactionRollup(models.Model):
+	"""Completed ledger totals per (user, month, transaction type), maintained by summaries.apply_to_monthly_rollups"""
+	user = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name='monthly_rollups')
+	month = models.DateField()  # first day of the month
+	transaction_type = models.CharField(max_length=32, choices=Transaction.TRANSACTION_TYPES)
+	total_amount = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0.00'))
+	transaction_count = models.PositiveIntegerField(default=0)
+	
+	class Meta:
+		ordering = ['month', 'transaction_type']
+		constraints = [
+			models.UniqueConstraint(fields=['user', 'month', 'transaction_type'], name='unique_monthly_rollup'),
+		]
+	
+	def __str__(self):
+		return f"{self.user_id} {self.month:%Y-%m} {self.transaction_type}: {self.total_amount}"
+
+
+class RefreshLock(models.Model):
+	"""Named lease shared by every worker; taken with a conditional UPDATE on locked_until (see landing_stats.py)"""
+	name = models.CharField(max_length=100, primary_key=True)
+	locked_until = models.DateTimeField()
+	
+	def __str__(self):
+		return f"{self.name} until {self.locked_until}"
@@ -0,0 +1,88 @@
+"""
+Page Cache for EventFlex
+Serves rendered marketing pages from the cache with ETag/Last-Modified validators
+
+The pricing, FAQ, about, policy, contact, success-stories and verification
+pages are plain templates with no per-user content. cached_page stores the
+rendered bytes together with an ETag (content hash) and Last-Modified (the
+template's modification time), so a hit is one cache read and a browser
+revalidation is answered with 304 Not Modified without sending the page.
+
+The cache key includes the template's modification time, so editing a
+template invalidates its page on the next request, even with the
+file-based backend that survives restarts.
+"""
+
+import hashlib
+import os
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.template.loader import get_template
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+# Template name -> file path, resolved once per process
+_template_paths = {}
+
+
+def _template_mtime(template_name):
+    path = _template_paths.get(template_name)
+    if path is None:
+        path = _template_paths[template_name] = get_template(template_name).origin.name
+    return int(os.stat(path).st_mtime)
+
+
+def _page_response(entry):
+    response = HttpResponse(entry['content'], content_type=entry['content_type'])
+    response['ETag'] = entry['etag']
+    response['Last-Modified'] = http_date(entry['last_modified'])
+    # Browsers may keep the page but must revalidate it (cheap 304s thanks to the validators)
+    patch_cache_control(response, public=True, max_age=0)
+    return response
+
+
+def cached_page(template_name):
+    """
+    Decorator that caches a template-only page view for PAGE_CACHE_SECONDS
+
+    Args:
+        template_name: Template the view renders (its mtime versions the cache entry)
+
+    Only successful GET/HEAD responses are cached; the query string is
+    ignored because these pages do not read it.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            timeout = getattr(settings, 'PAGE_CACHE_SECONDS', 3600)
+            if request.method not in ('GET', 'HEAD') or not timeout:
+                return view_func(request, *args, **kwargs)
+
+            last_modified = _template_mtime(template_name)
+            key = f'eventflex:page:{request.path}:{last_modified}'
+            entry = cache.get(key)
+            if entry is None:
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200 or getattr(response, 'streaming', False):
+                    return response
+                entry = {
+                    'content': response.content,
+                    'content_type': response['Content-Type'],
+                    'etag': f'"{hashlib.md5(response.content, usedforsecurity=False).hexdigest()}"',
+                    'last_modified': last_modified,
+                }
+                cache.set(key, entry, timeout)
+
+            return get_conditional_response(
+                request,
+                etag=entry['etag'],
+                last_modified=entry['last_modified'],
+                response=_page_response(entry),
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,143 @@
+"""
+Payout Engine for EventFlex
+Releases event payments to every hired staff member as a set-based operation
+
+finish_job used to loop over accepted applications, saving each staff
+profile and inserting each ledger row separately (2 statements per hire).
+release_job_payouts does the same work in a fixed number of statements no
+matter how many staff were hired:
+
+    1. lock the job row and the organizer row (SELECT ... FOR UPDATE)
+    2. read the accepted applications and lock/read the staff balances
+    3. one UPDATE for the organizer, one UPDATE for all staff (F() expressions)
+    4. one batched INSERT for all ledger rows, with balance_after precomputed
+    5. one UPDATE marking the job completed (plus batched change-log inserts)
+
+Pay already held in escrow at accept time is drawn from the organizer's
+escrow_balance; only hires without a hold (or pay-rate increases since
+the hold) are charged to the wallet.
+"""
+
+from collections import Counter
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+
+from .changelog import record_job_change, record_transactions
+from .wallet import InsufficientFunds  # noqa: F401 (re-exported for callers of this module)
+
+
+class JobAlreadyFinished(Exception):
+    """Raised when payouts were already released for a job"""
+
+
+def release_job_payouts(job_id, organizer_id):
+    """
+    Pay all accepted staff of a job and mark it completed, atomically
+
+    Args:
+        job_id: Job primary key
+        organizer_id: UserProfile id of the organizer paying out
+
+    Returns:
+        dict: {'job', 'payments_released', 'total_amount', 'organizer_balance', 'ledger'}
+
+    Raises:
+        JobAlreadyFinished: if the job is already completed
+        InsufficientFunds: if the organizer cannot cover every hire
+    """
+    from .models import UserProfile, Job, Application, Transaction
+
+    with transaction.atomic():
+        # Lock the job first so two concurrent finish requests cannot both pay out
+        job = Job.objects.select_for_update().get(id=job_id)
+        if job.status == 'completed':
+            raise JobAlreadyFinished(job.title)
+
+        organizer_balance = (
+            UserProfile.objects.select_for_update()
+            .values_list('wallet_balance', flat=True)
+            .get(id=organizer_id)
+        )
+
+        accepted = Application.objects.filter(job_id=job.id, status='accepted')
+        hires = list(accepted.values_list('id', 'applicant_id', 'escrow_amount'))
+
+        pay_rate = job.pay_rate
+        total_payment = pay_rate * len(hires)
+        held_total = sum((held for _, _, held in hires), Decimal('0'))
+        wallet_due = total_payment - held_total
+        if organizer_balance < wallet_due:
+            raise InsufficientFunds(required=wallet_due, available=organizer_balance)
+
+        ledger = []
+        if hires:
+            staff_balances = dict(
+                UserProfile.objects.select_for_update()
+                .filter(id__in=accepted.values('applicant_id'))
+                .values_list('id', 'wallet_balance')
+            )
+
+            # One UPDATE for the organizer and one per distinct hire count (normally exactly one)
+            new_organizer_balance = organizer_balance - wallet_due
+            UserProfile.objects.filter(id=organizer_id).update(
+                wallet_balance=F('wallet_balance') - wallet_due,
+                escrow_balance=F('escrow_balance') - held_total,
+            )
+            if held_total:
+                accepted.update(escrow_amount=0)
+
+            hires_per_staff = Counter(applicant_id for _, applicant_id, _ in hires)
+            if set(hires_per_staff.values()) == {1}:
+                UserProfile.objects.filter(id__in=accepted.values('applicant_id')).update(
+                    wallet_balance=F('wallet_balance') + pay_rate
+                )
+            else:
+                for count in set(hires_per_staff.values()):
+                    staff_ids = [staff_id for staff_id, n in hires_per_staff.items() if n == count]
+                    UserProfile.objects.filter(id__in=staff_ids).update(
+                        wallet_balance=F('wallet_balance') + pay_rate * count
+                    )
+
+            ledger.append(Transaction(
+                user_id=organizer_id,
+                transaction_type='escrow_release',
+                amount=total_payment,
+                status='completed',
+                job_id=job.id,
+                balance_after=new_organizer_balance,
+                note=f'Payment released for event: {job.title}'
+            ))
+
+            running = dict(staff_balances)
+            for application_id, staff_id, _ in hires:
+                running[staff_id] = running.get(staff_id, Decimal('0')) + pay_rate
+                ledger.append(Transaction(
+                    user_id=staff_id,
+                    transaction_type='payment',
+                    amount=pay_rate,
+                    status='completed',
+                    application_id=application_id,
+                    job_id=job.id,
+                    related_user_id=organizer_id,
+                    balance_after=running[staff_id],
+                    note=f'Payment received for: {job.title}'
+                ))
+
+            Transaction.objects.bulk_create(ledger, batch_size=1000)
+            record_transactions(ledger)
+        else:
+            new_organizer_balance = organizer_balance
+
+        Job.objects.filter(id=job.id).update(status='completed')
+        job.status = 'completed'
+        record_job_change(job)
+
+    return {
+        'job': job,
+        'payments_released': len(hires),
+        'total_amount': total_payment,
+        'organizer_balance': new_organizer_balance,
+        'ledger': ledger,
+    }
@@ -0,0 +1,99 @@
+"""
+Job Reports for EventFlex
+Application counts and hiring cost per job, computed with conditional aggregation
+
+download_report used to issue one COUNT per status (five round trips per
+job). Every status count here is a Count(..., filter=Q(status=...)) inside
+a single aggregate(), and the multi-job report groups the same expressions
+by job so a date range of any size is still one query.
+"""
+
+from decimal import Decimal
+
+from django.db.models import Count, Q, Sum
+
+# Statuses reported individually; anything else is only part of the total
+REPORTED_STATUSES = ('accepted', 'pending', 'rejected', 'withdrawn')
+
+CENTS = Decimal('0.01')
+
+
+def _application_aggregates(prefix=''):
+    """Count/Sum expressions for an Application queryset, or a Job queryset with prefix='applications__'"""
+    status = f'{prefix}status'
+    aggregates = {'total_applications': Count(f'{prefix}id')}
+    for name in REPORTED_STATUSES:
+        aggregates[name] = Count(f'{prefix}id', filter=Q(**{status: name}))
+    aggregates['escrow_held'] = Sum(f'{prefix}escrow_amount', filter=Q(**{status: 'accepted'}))
+    return aggregates
+
+
+def _report_row(job_fields, counts, pay_rate):
+    row = dict(job_fields)
+    row.update({name: counts[name] for name in ('total_applications',) + REPORTED_STATUSES})
+    # SQLite returns aggregated decimals unquantized (300 rather than 300.00)
+    row['escrow_held'] = str((counts['escrow_held'] or Decimal('0')).quantize(CENTS))
+    row['total_cost'] = str((pay_rate * counts['accepted']).quantize(CENTS))
+    return row
+
+
+def job_report(job):
+    """
+    Application summary for one job (one query)
+
+    Returns:
+        dict: job_title, event_date, location, total_applications, per-status
+        counts, escrow_held and total_cost (pay_rate × accepted)
+    """
+    from .models import Application
+
+    counts = Application.objects.filter(job=job).aggregate(**_application_aggregates())
+    return _report_row({
+        'job_title': job.title,
+        'event_date': job.date.isoformat() if job.date else None,
+        'location': job.location,
+    }, counts, job.pay_rate)
+
+
+def organizer_jobs_report(organizer_id, date_from, date_to):
+    """
+    Application summary for every job of an organizer with an event date in range (one grouped query)
+
+    Args:
+        organizer_id: UserProfile id of the organizer
+        date_from: First event date included
+        date_to: Last event date included
+
+    Returns:
+        dict: {'jobs': [per-job rows as in job_report plus job_id/status], 'totals': {...}}
+    """
+    from .models import Job
+
+    jobs = (
+        Job.objects.filter(organizer_id=organizer_id, date__range=(date_from, date_to))
+        .values('id', 'title', 'date', 'location', 'status', 'pay_rate')
+        .annotate(**_application_aggregates('applications__'))
+        .order_by('date', 'id')
+    )
+
+    rows = []
+    totals = {name: 0 for name in ('total_applications',) + REPORTED_STATUSES}
+    escrow_held = Decimal('0.00')
+    total_cost = Decimal('0.00')
+    for job in jobs:
+        rows.append(_report_row({
+            'job_id': job['id'],
+            'job_title': job['title'],
+            'event_date': job['date'].isoformat(),
+            'location': job['location'],
+            'status': job['status'],
+        }, job, job['pay_rate']))
+        for name in totals:
+            totals[name] += job[name]
+        escrow_held += job['escrow_held'] or 0
+        total_cost += job['pay_rate'] * job['accepted']
+
+    totals['jobs'] = len(rows)
+    totals['escrow_held'] = str(escrow_held.quantize(CENTS))
+    totals['total_cost'] = str(total_cost.quantize(CENTS))
+    return {'jobs': rows, 'totals': totals}
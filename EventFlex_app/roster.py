@@ -0,0 +1,215 @@
+"""
+Crew Rosters for EventFlex
+Proposes which pending applicants to hire for one job or a day's jobs
+
+An organizer staffing 80 positions used to read applications one by one.
+propose() picks applicants for a set of the organizer's jobs (each job is
+one role with number_of_staff positions, less the staff already accepted):
+
+    - each application scores AI_WEIGHT * ai_rating / 5 plus
+      REPUTATION_WEIGHT * the applicant's reputation / 5, where reputation
+      is average_rating shrunk towards PRIOR_RATING by PRIOR_REVIEWS
+      imaginary reviews, so one 5-star review does not beat fifty 4.8s
+    - the hires' total pay may not exceed the organizer's wallet balance
+      (what accepting them would move into escrow)
+    - nobody is proposed for a job overlapping their calendar (bookings and
+      unavailable blocks, see availability.py) or another job proposed to
+      them in the same roster
+
+assign() fills positions greedily: applications in descending score, each
+taken if its job has a position open, the applicant is free and the pay
+fits the remaining budget. When the budget covers every open position the
+greedy order is exact for applicants who applied to one job of the set
+(the usual case). When it does not, applications are taken by score per
+rupee instead, the knapsack greedy that spends a short budget on the
+positions that buy the most score. Min-cost flow would be exact for the
+pure assignment, but neither the budget nor the time overlaps fit a flow
+network, and successive shortest paths over thousands of applications are
+far slower than the one sort this needs.
+
+Nothing is accepted here: the response carries the bulk-decision body
+that hires the proposal.
+"""
+
+from collections import namedtuple
+from decimal import Decimal
+
+from . import availability
+
+AI_WEIGHT = 0.6
+REPUTATION_WEIGHT = 0.4
+
+# Reputation of a staff member with no reviews, and how many reviews it counts as
+PRIOR_RATING = 3.0
+PRIOR_REVIEWS = 3
+
+# Most jobs in one roster
+MAX_JOBS = 50
+
+Opening = namedtuple('Opening', ['job_id', 'title', 'role', 'pay_rate', 'positions', 'interval'])
+Candidate = namedtuple('Candidate', [
+    'application_id', 'job_id', 'applicant_id', 'name', 'ai_rating', 'average_rating', 'total_reviews',
+])
+
+
+def reputation(average_rating, total_reviews):
+    """average_rating (0-5) shrunk towards PRIOR_RATING for staff with few reviews"""
+    return (float(average_rating) * total_reviews + PRIOR_RATING * PRIOR_REVIEWS) / (total_reviews + PRIOR_REVIEWS)
+
+
+def score(candidate):
+    """0-1 ranking score of an application"""
+    return (AI_WEIGHT * float(candidate.ai_rating or 0) / 5
+            + REPUTATION_WEIGHT * reputation(candidate.average_rating, candidate.total_reviews) / 5)
+
+
+def assign(openings, candidates, budget, calendar=None):
+    """
+    Choose candidates for the openings (see module docstring)
+
+    Args:
+        openings: Opening per job; positions is what is still open
+        candidates: Pending applications to the openings' jobs
+        budget: Decimal the hires' pay may add up to
+        calendar: availability.CalendarIndex of the candidates' entries over
+            the openings' intervals; None when nobody has any
+
+    Returns:
+        dict: {
+            'hires': {job_id: [(candidate, score), ...] best first},
+            'cost': Decimal, 'by_density': bool,
+            'skipped': {'calendar_conflict': n, 'over_budget': n},
+        }
+    """
+    from .models import CalendarEntry
+
+    calendar = calendar if calendar is not None else availability.CalendarIndex()
+    openings = {opening.job_id: opening for opening in openings}
+    remaining = {job_id: opening.positions for job_id, opening in openings.items()}
+    demand = sum(opening.pay_rate * opening.positions for opening in openings.values())
+    by_density = demand > budget
+
+    ranked = [(score(candidate), candidate) for candidate in candidates if candidate.job_id in openings]
+    if by_density:
+        ranked.sort(key=lambda item: (
+            -item[0] / float(openings[item[1].job_id].pay_rate or Decimal('0.01')), -item[0], item[1].application_id,
+        ))
+    else:
+        ranked.sort(key=lambda item: (-item[0], item[1].application_id))
+
+    hires = {job_id: [] for job_id in openings}
+    skipped = {'calendar_conflict': 0, 'over_budget': 0}
+    cost = Decimal('0')
+    open_jobs = sum(1 for positions in remaining.values() if positions > 0)
+    for candidate_score, candidate in ranked:
+        if not open_jobs:
+            break
+        job_id = candidate.job_id
+        if remaining[job_id] <= 0:
+            continue
+        opening = openings[job_id]
+        if opening.interval is not None and calendar.overlapping(candidate.applicant_id, *opening.interval):
+            skipped['calendar_conflict'] += 1
+            continue
+        if cost + opening.pay_rate > budget:
+            skipped['over_budget'] += 1
+            if all(cost + openings[other].pay_rate > budget for other, left in remaining.items() if left):
+                break
+            continue
+
+        hires[job_id].append((candidate, candidate_score))
+        cost += opening.pay_rate
+        remaining[job_id] -= 1
+        if not remaining[job_id]:
+            open_jobs -= 1
+        if opening.interval is not None:
+            calendar.add(CalendarEntry(
+                profile_id=candidate.applicant_id, kind='booking', starts_at=opening.interval[0],
+                ends_at=opening.interval[1], application_id=candidate.application_id,
+            ))
+
+    for chosen in hires.values():
+        chosen.sort(key=lambda item: (-item[1], item[0].application_id))
+    return {'hires': hires, 'cost': cost, 'by_density': by_density, 'skipped': skipped}
+
+
+def propose(organizer, jobs):
+    """
+    Roster proposal for some of an organizer's jobs, read with four queries
+
+    Args:
+        organizer: UserProfile whose wallet_balance is the budget
+        jobs: The organizer's Jobs (active, not drafts)
+
+    Returns:
+        dict: JSON-ready proposal per job, totals and the bulk-decision body
+    """
+    from django.db.models import Count, Q
+    from .models import Application, Job, UserProfile
+
+    jobs = list(Job.objects.filter(id__in=[job.id for job in jobs]).annotate(
+        hired=Count('applications', filter=Q(applications__status='accepted')),
+    ).order_by('date', 'start_time', 'id'))
+    openings = [
+        Opening(job.id, job.title, job.role, job.pay_rate, max(0, job.number_of_staff - job.hired),
+                availability.job_interval(job))
+        for job in jobs
+    ]
+
+    pending = Application.objects.filter(job__in=[job.id for job in jobs], status='pending')
+    candidates = [
+        Candidate(pk, job_id, applicant_id, full_name or username, ai_rating, average_rating, total_reviews)
+        for pk, job_id, applicant_id, full_name, username, ai_rating, average_rating, total_reviews
+        in pending.values_list(
+            'id', 'job_id', 'applicant_id', 'full_name', 'applicant__user__username', 'ai_rating',
+            'applicant__average_rating', 'applicant__total_reviews',
+        )
+    ]
+
+    intervals = [opening.interval for opening in openings if opening.interval is not None]
+    calendar = None
+    if intervals and candidates:
+        calendar = availability.CalendarIndex.load(
+            pending.values('applicant_id'),
+            min(starts_at for starts_at, _ in intervals),
+            max(ends_at for _, ends_at in intervals),
+        )
+
+    budget = UserProfile.objects.values_list('wallet_balance', flat=True).get(id=organizer.id)
+    result = assign(openings, candidates, budget, calendar)
+
+    hired = {job.id: job.hired for job in jobs}
+    roster = []
+    for opening in openings:
+        chosen = result['hires'][opening.job_id]
+        roster.append({
+            'job_id': opening.job_id,
+            'title': opening.title,
+            'role': opening.role,
+            'pay_rate': opening.pay_rate,
+            'already_hired': hired[opening.job_id],
+            'open_positions': opening.positions,
+            'unfilled': opening.positions - len(chosen),
+            'proposed': [{
+                'application_id': candidate.application_id,
+                'applicant_id': candidate.applicant_id,
+                'name': candidate.name,
+                'ai_rating': float(candidate.ai_rating) if candidate.ai_rating is not None else None,
+                'average_rating': candidate.average_rating,
+                'total_reviews': candidate.total_reviews,
+                'score': round(candidate_score, 4),
+            } for candidate, candidate_score in chosen],
+        })
+
+    return {
+        'roster': roster,
+        'applications_considered': len(candidates),
+        'budget': budget,
+        'total_cost': result['cost'],
+        'remaining_budget': budget - result['cost'],
+        'ranked_by': 'score_per_rupee' if result['by_density'] else 'score',
+        'skipped': result['skipped'],
+        'decisions': [
+            {'id': hire['application_id'], 'decision': 'accept'} for entry in roster for hire in entry['proposed']
+        ],
+    }
@@ -0,0 +1,195 @@
+// EventFlex - login and signup pages
+import {
+    API_BASE,
+    currentUser,
+    onPageReady,
+    saveCurrentUser,
+    showToast,
+} from 'eventflex/core';
+
+function initUserTypeSelectors() {
+    const selectors = document.querySelectorAll('.user-type-selector');
+    if (!selectors.length) return;
+
+    const urlParams = new URLSearchParams(window.location.search);
+    const typeFromUrl = urlParams.get('type');
+
+    selectors.forEach((selector) => {
+        const buttons = selector.querySelectorAll('.user-type-btn');
+        if (!buttons.length) return;
+
+        const resolveForm = () => {
+            const next = selector.nextElementSibling;
+            if (next && next.tagName === 'FORM') return next;
+            return selector.closest('.auth-card')?.querySelector('form') || null;
+        };
+
+        const form = resolveForm();
+
+        const activate = (button) => {
+            buttons.forEach((btn) => btn.classList.toggle('active', btn === button));
+            if (form) {
+                form.dataset.userType = button.dataset.type || '';
+            }
+        };
+
+        buttons.forEach((button) => {
+            button.addEventListener('click', () => activate(button));
+        });
+
+        let initial = selector.querySelector('.user-type-btn.active');
+        if (typeFromUrl) {
+            const matchingBtn = Array.from(buttons).find(btn => btn.dataset.type === typeFromUrl);
+            if (matchingBtn) {
+                initial = matchingBtn;
+            }
+        }
+        initial = initial || buttons[0];
+        if (initial) activate(initial);
+    });
+}
+
+async function handleLogin(form) {
+    const formData = new FormData(form);
+    const payload = {
+        username: (formData.get('username') || '').toString().trim(),
+        password: (formData.get('password') || '').toString(),
+    };
+
+    if (!payload.username || !payload.password) {
+        showToast('Please enter username and password.', 'warning');
+        return;
+    }
+
+    try {
+        const res = await fetch(`${API_BASE}/auth/login/`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload),
+            credentials: 'include',
+        });
+
+        const data = await res.json();
+        console.log('Login response data:', data); // Debug log
+
+        if (!res.ok) {
+            showToast(data.error || 'Login failed', 'error');
+            return;
+        }
+
+        if (data.profile) {
+            console.log('Profile data received:', data.profile); // Debug log
+            saveCurrentUser(data.profile);
+        } else {
+            console.log('No profile in response, using username only');
+            saveCurrentUser({ username: payload.username });
+        }
+
+        showToast(`Welcome back, ${currentUser.username}!`, 'success');
+
+        setTimeout(() => {
+            if (currentUser.user_type === 'organizer') {
+                window.location.href = '/organizer-dashboard/';
+            } else {
+                window.location.href = '/staff-portal/';
+            }
+        }, 1000);
+    } catch (err) {
+        showToast('Network error during login', 'error');
+        console.error('Login error:', err);
+    }
+}
+
+async function handleSignup(form) {
+    const formData = new FormData(form);
+    const payload = {
+        username: (formData.get('username') || '').toString().trim(),
+        email: (formData.get('email') || '').toString().trim(),
+        password: (formData.get('password') || '').toString(),
+        phone: (formData.get('phone') || '').toString().trim(),
+        user_type: form.dataset.userType || 'staff',
+        city: (formData.get('city') || '').toString(),
+    };
+
+    console.log('Signup payload:', payload); // Debug log
+
+    if (!payload.username || !payload.password) {
+        showToast('Username and password are required.', 'warning');
+        console.error('Missing required fields:', { username: payload.username, password: payload.password });
+        return;
+    }
+
+    try {
+        const res = await fetch(`${API_BASE}/auth/register/`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload),
+            credentials: 'include'
+        });
+
+        const data = await res.json();
+        console.log('Signup response:', data); // Debug log
+
+        if (!res.ok) {
+            showToast(data.error || 'Registration failed', 'error');
+            return;
+        }
+
+        // Save user profile data to localStorage
+        if (data.profile) {
+            saveCurrentUser(data.profile);
+        }
+
+        showToast('Account created successfully! Redirecting...', 'success');
+
+        // Redirect to appropriate dashboard based on user type
+        setTimeout(() => {
+            if (payload.user_type === 'organizer') {
+                window.location.href = '/organizer-dashboard/';
+            } else {
+                window.location.href = '/staff-portal/';
+            }
+        }, 1500);
+    } catch (err) {
+        showToast('Network error during registration', 'error');
+        console.error('Signup error:', err);
+    }
+}
+
+window.togglePassword = function togglePassword(event) {
+    const trigger = event?.currentTarget || event?.target;
+    if (!trigger) return;
+    const input = trigger.parentElement?.querySelector('input');
+    if (!input) return;
+
+    const isPassword = input.getAttribute('type') === 'password';
+    input.setAttribute('type', isPassword ? 'text' : 'password');
+
+    trigger.classList.toggle('fa-eye', !isPassword);
+    trigger.classList.toggle('fa-eye-slash', isPassword);
+    trigger.setAttribute('aria-pressed', String(isPassword));
+};
+
+// ============ PAGE INITIALIZATION ============
+function initAuthForms() {
+    const loginForm = document.getElementById('loginForm');
+    if (loginForm) {
+        loginForm.addEventListener('submit', async (event) => {
+            event.preventDefault();
+            await handleLogin(loginForm);
+        });
+    }
+
+    const signupForm = document.getElementById('signupForm');
+    if (signupForm) {
+        signupForm.addEventListener('submit', async (event) => {
+            event.preventDefault();
+            await handleSignup(signupForm);
+        });
+    }
+}
+
+onPageReady(() => {
+    initUserTypeSelectors();
+    initAuthForms();
+});
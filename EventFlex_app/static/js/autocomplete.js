@@ -0,0 +1,118 @@
+// EventFlex - datalist suggestions for job and application fields.
+// Loaded by dashboard.js when one of those fields is first focused.
+import {
+    API_BASE,
+} from 'eventflex/core';
+
+const autocompleteFields = {
+    'event_type': 'event_type',
+    'role': 'role',
+    'location': 'location',
+    'skillInput': 'skills',
+
+    'apply-role': 'role',
+    'apply-skills': 'skills',
+    'apply-previous-events': 'previous_events'
+};
+
+async function loadSuggestions(fieldId, fieldType) {
+    try {
+        const response = await fetch(`${API_BASE}/autocomplete/suggestions/?field_type=${fieldType}`);
+        if (!response.ok) return;
+
+        const data = await response.json();
+        const datalistId = fieldId.includes('apply-')
+            ? `${fieldId}-suggestions`
+            : `${fieldId.replace('Input', '')}-suggestions`;
+
+        const datalist = document.getElementById(datalistId);
+        if (!datalist) return;
+
+        datalist.innerHTML = '';
+
+        data.suggestions.forEach(suggestion => {
+            const option = document.createElement('option');
+            option.value = suggestion.value;
+            datalist.appendChild(option);
+        });
+    } catch (error) {
+        console.error('Error loading autocomplete suggestions:', error);
+    }
+}
+
+async function saveSuggestion(fieldType, value) {
+    if (!value || value.trim().length < 2) return;
+
+    try {
+        await fetch(`${API_BASE}/autocomplete/save/`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            credentials: 'include',
+            body: JSON.stringify({
+                field_type: fieldType,
+                value: value.trim()
+            })
+        });
+    } catch (error) {
+        console.error('Error saving autocomplete suggestion:', error);
+    }
+}
+
+function initializeAutocomplete() {
+    Object.keys(autocompleteFields).forEach(fieldId => {
+        const field = document.getElementById(fieldId);
+        const inputField = document.querySelector(`input[name="${fieldId}"], textarea[name="${fieldId}"]`);
+        const targetField = field || inputField;
+
+        if (targetField) {
+            const fieldType = autocompleteFields[fieldId];
+
+            loadSuggestions(fieldId, fieldType);
+
+            targetField.addEventListener('blur', function () {
+                if (this.value) {
+                    saveSuggestion(fieldType, this.value);
+                    setTimeout(() => loadSuggestions(fieldId, fieldType), 500);
+                }
+            });
+        }
+    });
+
+    const jobPostForm = document.getElementById('jobPostForm');
+    if (jobPostForm) {
+        jobPostForm.addEventListener('submit', function (e) {
+            const eventType = document.querySelector('[name="event_type"]');
+            const role = document.querySelector('[name="role"]');
+            const location = document.querySelector('[name="location"]');
+            const skills = document.querySelector('[name="skills"]');
+
+            if (eventType && eventType.value) saveSuggestion('event_type', eventType.value);
+            if (role && role.value) saveSuggestion('role', role.value);
+            if (location && location.value) saveSuggestion('location', location.value);
+            if (skills && skills.value) saveSuggestion('skills', skills.value);
+        });
+    }
+
+    const applicationForm = document.getElementById('application-form');
+    if (applicationForm) {
+        applicationForm.addEventListener('submit', function (e) {
+            const role = document.getElementById('apply-role');
+            const skills = document.getElementById('apply-skills');
+            const previousEvents = document.getElementById('apply-previous-events');
+
+            if (role && role.value) saveSuggestion('role', role.value);
+            if (skills && skills.value) saveSuggestion('skills', skills.value);
+            if (previousEvents && previousEvents.value) saveSuggestion('previous_events', previousEvents.value);
+        });
+    }
+}
+
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', initializeAutocomplete);
+} else {
+    initializeAutocomplete();
+}
+
+window.addEventListener('modalShown', initializeAutocomplete);
@@ -0,0 +1,312 @@
+// EventFlex - chat modal opened from booking and event cards.
+// Loaded on the first call to one of its window functions.
+import {
+    escapeHtml,
+    ready,
+    showToast,
+} from 'eventflex/core';
+import {
+    loadConversations,
+} from 'eventflex/messaging';
+
+// ============================================
+// OLX-STYLE CHAT SYSTEM
+// ============================================
+
+let chatPollInterval = null;
+let lastMessageId = 0;
+
+// Open chat modal with a specific user
+window.openChatModal = async function (partnerId, partnerName, partnerAvatar) {
+    const modal = document.getElementById('chat-modal');
+    const partnerIdInput = document.getElementById('chat-partner-id');
+    const partnerNameEl = document.getElementById('chat-partner-name');
+    const partnerAvatarEl = document.getElementById('chat-partner-avatar');
+    const messagesContainer = document.getElementById('chat-messages');
+
+    if (!modal || !partnerIdInput) return;
+
+    // Set partner info
+    partnerIdInput.value = partnerId;
+    if (partnerNameEl) partnerNameEl.textContent = partnerName || 'User';
+    if (partnerAvatarEl) {
+        partnerAvatarEl.src = partnerAvatar || `https://ui-avatars.com/api/?name=${encodeURIComponent(partnerName)}&background=6366f1&color=fff`;
+    }
+
+    // Clear messages
+    if (messagesContainer) messagesContainer.innerHTML = '<div class="chat-empty"><i class="fas fa-comments"></i><p>Loading messages...</p></div>';
+
+    // Show modal
+    modal.style.display = 'flex';
+    document.body.style.overflow = 'hidden';
+
+    // Load chat history
+    await loadChatMessages(partnerId);
+
+    // Start polling for new messages
+    startChatPolling(partnerId);
+
+    // Focus input
+    const input = document.getElementById('chat-message-input');
+    if (input) setTimeout(() => input.focus(), 300);
+};
+
+// Close chat modal
+window.closeChatModal = function () {
+    const modal = document.getElementById('chat-modal');
+    if (modal) {
+        modal.style.display = 'none';
+        document.body.style.overflow = 'auto';
+    }
+
+    // Stop polling
+    stopChatPolling();
+
+    // Clear partner ID
+    const partnerIdInput = document.getElementById('chat-partner-id');
+    if (partnerIdInput) partnerIdInput.value = '';
+};
+
+// Navigate to messages section with current conversation
+window.goToMessagesSection = function () {
+    const partnerIdInput = document.getElementById('chat-partner-id');
+    const partnerNameEl = document.getElementById('chat-partner-name');
+    const partnerAvatarEl = document.getElementById('chat-partner-avatar');
+
+    if (!partnerIdInput || !partnerIdInput.value) return;
+
+    const partnerId = partnerIdInput.value;
+    const partnerName = partnerNameEl ? partnerNameEl.textContent : 'User';
+    const partnerAvatar = partnerAvatarEl ? partnerAvatarEl.src : '';
+
+    // Close the modal
+    closeChatModal();
+
+    // Navigate to messages section
+    window.location.hash = '#messages';
+
+    // Wait for section to load, then open the conversation
+    setTimeout(async () => {
+        // Load conversations first
+        await loadConversations();
+
+        // Select the conversation
+        if (typeof selectConversation === 'function') {
+            await selectConversation(partnerId, partnerName, partnerAvatar);
+        } else if (typeof window.openChat === 'function') {
+            await window.openChat(partnerId, partnerName, partnerAvatar);
+        }
+    }, 300);
+};
+
+// Load chat messages
+async function loadChatMessages(partnerId) {
+    try {
+        const res = await fetch(`/api/messages/?partner_id=${partnerId}`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) {
+            throw new Error('Failed to load messages');
+        }
+
+        const data = await res.json();
+        const messages = data.results || [];
+
+        renderChatMessages(messages, partnerId);
+
+        // Track last message ID
+        if (messages.length > 0) {
+            lastMessageId = messages[messages.length - 1].id;
+        }
+
+        // Scroll to bottom
+        scrollChatToBottom();
+
+    } catch (error) {
+        console.error('Error loading messages:', error);
+        const messagesContainer = document.getElementById('chat-messages');
+        if (messagesContainer) {
+            messagesContainer.innerHTML = '<div class="chat-empty"><i class="fas fa-exclamation-circle"></i><p>Failed to load messages</p></div>';
+        }
+    }
+}
+
+// Render chat messages
+function renderChatMessages(messages, partnerId) {
+    const messagesContainer = document.getElementById('chat-messages');
+    if (!messagesContainer) return;
+
+    if (messages.length === 0) {
+        messagesContainer.innerHTML = '<div class="chat-empty"><i class="fas fa-comments"></i><p>No messages yet. Start the conversation!</p></div>';
+        return;
+    }
+
+    let html = '';
+    let lastDate = '';
+
+    messages.forEach(msg => {
+        const msgDate = new Date(msg.created_at);
+        const dateStr = msgDate.toLocaleDateString();
+
+        // Add date separator if date changed
+        if (dateStr !== lastDate) {
+            html += `<div class="chat-date-separator"><span>${formatChatDate(msgDate)}</span></div>`;
+            lastDate = dateStr;
+        }
+
+        // Determine if message was sent by current user
+        // If sender is not the partner, then it was sent by us
+        const isSent = msg.sender.id != partnerId;
+        const messageClass = isSent ? 'sent' : 'received';
+        const timeStr = msgDate.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
+
+        html += `
+            <div class="message ${messageClass}">
+                <div class="message-bubble">
+                    ${escapeHtml(msg.text)}
+                    <span class="message-time">${timeStr}</span>
+                </div>
+            </div>
+        `;
+    });
+
+    messagesContainer.innerHTML = html;
+}
+
+// Format chat date
+function formatChatDate(date) {
+    const today = new Date();
+    const yesterday = new Date(today);
+    yesterday.setDate(yesterday.getDate() - 1);
+
+    if (date.toDateString() === today.toDateString()) {
+        return 'Today';
+    } else if (date.toDateString() === yesterday.toDateString()) {
+        return 'Yesterday';
+    } else {
+        return date.toLocaleDateString([], { month: 'short', day: 'numeric', year: 'numeric' });
+    }
+}
+
+// Send chat message
+window.sendChatMessage = async function (event) {
+    event.preventDefault();
+
+    const input = document.getElementById('chat-message-input');
+    const partnerId = document.getElementById('chat-partner-id').value;
+
+    if (!input || !partnerId) return;
+
+    const text = input.value.trim();
+    if (!text) return;
+
+    try {
+        const res = await fetch('/api/messages/send/', {
+            method: 'POST',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                recipient_id: partnerId,
+                message: text
+            })
+        });
+
+        if (!res.ok) {
+            throw new Error('Failed to send message');
+        }
+
+        const data = await res.json();
+
+        // Clear input
+        input.value = '';
+        input.style.height = 'auto';
+
+        // Reload messages
+        await loadChatMessages(partnerId);
+
+        showToast('Message sent!', 'success');
+
+    } catch (error) {
+        console.error('Error sending message:', error);
+        showToast('Failed to send message. Please try again.', 'error');
+    }
+};
+
+// Handle Enter key in chat input
+window.handleChatKeyPress = function (event) {
+    if (event.key === 'Enter' && !event.shiftKey) {
+        event.preventDefault();
+        const form = document.getElementById('chat-form');
+        if (form) form.dispatchEvent(new Event('submit'));
+    }
+};
+
+// Auto-resize textarea
+ready(function () {
+    const chatInput = document.getElementById('chat-message-input');
+    if (chatInput) {
+        chatInput.addEventListener('input', function () {
+            this.style.height = 'auto';
+            this.style.height = Math.min(this.scrollHeight, 100) + 'px';
+        });
+    }
+});
+
+// Scroll chat to bottom
+function scrollChatToBottom() {
+    const messagesContainer = document.getElementById('chat-messages');
+    if (messagesContainer) {
+        setTimeout(() => {
+            messagesContainer.scrollTop = messagesContainer.scrollHeight;
+        }, 100);
+    }
+}
+
+// Start polling for new messages
+function startChatPolling(partnerId) {
+    stopChatPolling(); // Clear any existing interval
+
+    chatPollInterval = setInterval(async () => {
+        try {
+            const res = await fetch(`/api/messages/?partner_id=${partnerId}`, {
+                credentials: 'include'
+            });
+
+            if (res.ok) {
+                const data = await res.json();
+                const messages = data.results || [];
+
+                if (messages.length > 0) {
+                    const latestId = messages[messages.length - 1].id;
+                    if (latestId > lastMessageId) {
+                        // New messages available
+                        lastMessageId = latestId;
+                        renderChatMessages(messages, partnerId);
+                        scrollChatToBottom();
+                    }
+                }
+            }
+        } catch (error) {
+            console.error('Error polling messages:', error);
+        }
+    }, 2000); // Poll every 2 seconds
+}
+
+// Stop polling
+function stopChatPolling() {
+    if (chatPollInterval) {
+        clearInterval(chatPollInterval);
+        chatPollInterval = null;
+    }
+}
+
+// Close chat modal when clicking outside
+document.addEventListener('click', function (event) {
+    const modal = document.getElementById('chat-modal');
+    if (modal && event.target === modal) {
+        closeChatModal();
+    }
+});
@@ -0,0 +1,485 @@
+// EventFlex - v2.1 (ES modules)
+// Shared core loaded on every page: session, navbar, helpers and toasts.
+// Dashboard features live in their own modules (see partials/scripts.html);
+// the ones that are only needed after an interaction are imported on demand
+// with loadFeature().
+
+export const API_BASE = '/api';
+export let currentUser = null;
+let toastContainer;
+
+export const ready = (callback) => {
+    if (document.readyState !== 'loading') {
+        callback();
+    } else {
+        document.addEventListener('DOMContentLoaded', callback, { once: true });
+    }
+};
+
+// Functions that core code calls when the page has loaded the module providing them
+export const hooks = {};
+
+// ============ PAGE INITIALIZATION ============
+// Module scripts run before DOMContentLoaded, so when it fires every module the
+// page includes has been evaluated (e.g. the dashboard fetch cache is installed)
+// and has registered its initializer.
+const pageInitializers = [];
+
+export function onPageReady(callback) {
+    pageInitializers.push(callback);
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    loadCurrentUser();
+    initMobileNav();
+    initSmoothScroll();
+    initMarketingTabs();
+    initToastTriggers();
+    pageInitializers.forEach((callback) => callback());
+}, { once: true });
+
+// ============ LAZY FEATURES ============
+const features = new Map();
+
+export function loadFeature(name) {
+    if (!features.has(name)) {
+        const promise = import(`eventflex/${name}`).catch((error) => {
+            features.delete(name);
+            console.error(`Failed to load ${name}.js:`, error);
+            throw error;
+        });
+        features.set(name, promise);
+    }
+    return features.get(name);
+}
+
+// Inline handlers (onclick="openChatModal(...)") call window functions that a
+// lazily loaded module defines. Until it is loaded each name is a stub that
+// imports the module and forwards the call to the real function it installs.
+export function registerLazyGlobals(name, globalNames) {
+    globalNames.forEach((globalName) => {
+        if (typeof window[globalName] === 'function') return;
+
+        const stub = function (...args) {
+            // The module arrives after the event has been dispatched: cancel form submits now
+            const event = args.find((arg) => arg instanceof Event);
+            if (event && event.type === 'submit') {
+                event.preventDefault();
+            }
+
+            return loadFeature(name).then(() => {
+                if (window[globalName] === stub) {
+                    throw new Error(`${name}.js does not define ${globalName}`);
+                }
+                return window[globalName].apply(this, args);
+            });
+        };
+        window[globalName] = stub;
+    });
+}
+
+// ============ USER SESSION MANAGEMENT ============
+function loadCurrentUser() {
+    const stored = localStorage.getItem('eventflex_user');
+    if (stored) {
+        try {
+            currentUser = JSON.parse(stored);
+            if (hooks.startDashboardBootstrap) {
+                hooks.startDashboardBootstrap();
+            }
+            updateUIForLoggedInUser();
+
+            // Fetch profile picture in background (not stored in localStorage)
+            fetchProfilePicture();
+        } catch (e) {
+            localStorage.removeItem('eventflex_user');
+        }
+    }
+
+    checkPageAuthentication();
+}
+
+// Fetch profile picture separately to avoid localStorage quota issues
+async function fetchProfilePicture() {
+    if (!currentUser || !currentUser.username) return;
+
+    try {
+        const response = await fetch(`${API_BASE}/profiles/me/`, {
+            credentials: 'include'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            if (data.profile && data.profile.profile_picture) {
+                currentUser.profile_picture = data.profile.profile_picture;
+
+                // Update avatar images if they exist
+                updateAvatarImages();
+            }
+        }
+    } catch (error) {
+        console.log('Could not fetch profile picture:', error);
+    }
+}
+
+// Update all avatar images on the page
+function updateAvatarImages() {
+    if (!currentUser) return;
+
+    const avatarUrl = currentUser.profile_picture ||
+        `https://ui-avatars.com/api/?name=${encodeURIComponent(currentUser.username || 'User')}&background=6366f1&color=fff`;
+
+    const profileImages = document.querySelectorAll('.profile-image-large, .user-avatar img, .nav-user img, .profile-header img, #user-avatar, #organizer-profile-image');
+    profileImages.forEach(img => {
+        if (img) {
+            img.src = avatarUrl;
+            img.alt = currentUser.username;
+        }
+    });
+}
+
+function checkPageAuthentication() {
+    const body = document.body;
+    const requiresAuth = body.getAttribute('data-requires-auth') === 'true';
+    const requiredUserType = body.getAttribute('data-user-type');
+
+    if (requiresAuth) {
+        if (!currentUser) {
+            console.log('Protected page requires authentication - redirecting to login');
+            window.location.href = '/login';
+            return;
+        }
+
+        if (requiredUserType && currentUser.user_type !== requiredUserType) {
+            console.log(`Page requires ${requiredUserType} access but user is ${currentUser.user_type}`);
+            if (currentUser.user_type === 'organizer') {
+                window.location.href = '/organizer-dashboard/';
+            } else if (currentUser.user_type === 'staff') {
+                window.location.href = '/staff-portal/';
+            } else {
+                window.location.href = '/';
+            }
+        }
+    }
+}
+
+export function saveCurrentUser(user) {
+    currentUser = user;
+    if (user) {
+        // Create a copy without profile_picture to avoid localStorage quota issues
+        const userForStorage = { ...user };
+        delete userForStorage.profile_picture;
+        localStorage.setItem('eventflex_user', JSON.stringify(userForStorage));
+        updateUIForLoggedInUser();
+    } else {
+        localStorage.removeItem('eventflex_user');
+    }
+}
+
+// Refresh current user profile from server
+export async function refreshUserProfile() {
+    if (!currentUser || !currentUser.username) {
+        console.log('No user to refresh');
+        return;
+    }
+
+    try {
+        const response = await fetch(`${API_BASE}/profiles/me/`, {
+            credentials: 'include'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            if (data.profile) {
+                // Store profile_picture in memory only (not in localStorage)
+                if (data.profile.profile_picture) {
+                    currentUser.profile_picture = data.profile.profile_picture;
+                }
+
+                // Save rest of profile to localStorage (without profile_picture)
+                saveCurrentUser(data.profile);
+                console.log('Profile refreshed from server:', data.profile);
+
+                // Reload profile data if on dashboard
+                if (hooks.loadProfileData) {
+                    await hooks.loadProfileData();
+                }
+
+                return data.profile;
+            }
+        }
+    } catch (error) {
+        console.error('Error refreshing profile:', error);
+    }
+}
+
+// Make globally accessible
+window.refreshUserProfile = refreshUserProfile;
+
+function updateUIForLoggedInUser() {
+    const welcomeElements = document.querySelectorAll('.user-welcome');
+    welcomeElements.forEach(el => {
+        if (currentUser) {
+            el.textContent = `Welcome, ${currentUser.username}!`;
+        }
+    });
+
+    if (currentUser) {
+        const userNameDisplay = document.getElementById('user-name-display');
+        const userAvatar = document.getElementById('user-avatar');
+        const navLinkText = document.querySelector('.nav-link-text');
+
+        if (userNameDisplay) {
+            userNameDisplay.textContent = currentUser.username || 'User';
+        }
+
+        if (userAvatar) {
+            const fullName = currentUser.first_name && currentUser.last_name
+                ? `${currentUser.first_name} ${currentUser.last_name}`
+                : currentUser.username;
+            userAvatar.src = `https://ui-avatars.com/api/?name=${encodeURIComponent(fullName)}&background=6366f1&color=fff`;
+            userAvatar.alt = fullName;
+        }
+
+        if (navLinkText) {
+            navLinkText.style.display = 'none';
+        }
+        const signUpBtn = document.querySelector('.btn-primary-small');
+        if (signUpBtn && signUpBtn.textContent.includes('Sign Up')) {
+            signUpBtn.style.display = 'none';
+        }
+
+        updateHomepageNavbar();
+    }
+}
+
+function updateHomepageNavbar() {
+    if (!currentUser) return;
+
+    const navLoginItem = document.getElementById('nav-login-item');
+    const navSignupItem = document.getElementById('nav-signup-item');
+    const navUserItem = document.getElementById('nav-user-item');
+    const navDashboardItem = document.getElementById('nav-dashboard-item');
+    const navUserAvatar = document.getElementById('nav-user-avatar');
+    const navUserName = document.getElementById('nav-user-name');
+    const navDashboardLink = document.getElementById('nav-dashboard-link');
+
+    if (navLoginItem) navLoginItem.style.display = 'none';
+    if (navSignupItem) navSignupItem.style.display = 'none';
+
+    if (navUserItem) navUserItem.style.display = 'block';
+    if (navDashboardItem) navDashboardItem.style.display = 'block';
+
+    if (navUserName) {
+        navUserName.textContent = currentUser.username || 'User';
+    }
+
+    if (navUserAvatar) {
+        const fullName = currentUser.first_name && currentUser.last_name
+            ? `${currentUser.first_name} ${currentUser.last_name}`
+            : currentUser.username;
+        navUserAvatar.src = `https://ui-avatars.com/api/?name=${encodeURIComponent(fullName)}&background=6366f1&color=fff`;
+        navUserAvatar.alt = fullName;
+    }
+
+    if (navDashboardLink && currentUser.user_type) {
+        if (currentUser.user_type === 'organizer') {
+            navDashboardLink.href = '/organizer-dashboard/';
+            navDashboardLink.textContent = 'Organizer Dashboard';
+        } else if (currentUser.user_type === 'staff') {
+            navDashboardLink.href = '/staff-portal/';
+            navDashboardLink.textContent = 'My Portal';
+        }
+    }
+}
+
+export function getTimeAgo(dateString) {
+    const date = new Date(dateString);
+    const now = new Date();
+    const seconds = Math.floor((now - date) / 1000);
+
+    if (seconds < 60) return 'just now';
+    const minutes = Math.floor(seconds / 60);
+    if (minutes < 60) return `${minutes} minute${minutes > 1 ? 's' : ''} ago`;
+    const hours = Math.floor(minutes / 60);
+    if (hours < 24) return `${hours} hour${hours > 1 ? 's' : ''} ago`;
+    const days = Math.floor(hours / 24);
+    if (days < 7) return `${days} day${days > 1 ? 's' : ''} ago`;
+    const weeks = Math.floor(days / 7);
+    if (weeks < 4) return `${weeks} week${weeks > 1 ? 's' : ''} ago`;
+    return formatDate(dateString);
+}
+
+export function formatNumber(num) {
+    const number = parseFloat(num);
+    return number.toLocaleString('en-IN', { maximumFractionDigits: 0 });
+}
+
+// ============ HELPER FUNCTIONS ============
+export function escapeHtml(text) {
+    if (!text) return '';
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+// Make globally accessible for event handlers
+window.escapeHtml = escapeHtml;
+
+export function formatDate(dateStr) {
+    if (!dateStr) return 'N/A';
+    const date = new Date(dateStr);
+    return date.toLocaleDateString('en-IN', { year: 'numeric', month: 'short', day: 'numeric' });
+}
+
+function formatDateTime(dateStr) {
+    if (!dateStr) return 'N/A';
+    const date = new Date(dateStr);
+    return date.toLocaleString('en-IN', {
+        year: 'numeric', month: 'short', day: 'numeric',
+        hour: '2-digit', minute: '2-digit'
+    });
+}
+
+export function capitalize(str) {
+    if (!str) return '';
+    return str.charAt(0).toUpperCase() + str.slice(1);
+}
+
+// Make utility functions globally accessible
+window.formatDate = formatDate;
+window.formatDateTime = formatDateTime;
+window.capitalize = capitalize;
+
+// ============ MOBILE NAVIGATION ============
+function initMobileNav() {
+    const hamburger = document.querySelector('.hamburger');
+    const navMenu = document.querySelector('.nav-menu');
+    if (!hamburger || !navMenu) return;
+
+    const closeMenu = () => {
+        navMenu.classList.remove('open');
+        hamburger.classList.remove('active');
+        document.body.classList.remove('menu-open');
+    };
+
+    const toggleMenu = () => {
+        navMenu.classList.toggle('open');
+        hamburger.classList.toggle('active');
+        document.body.classList.toggle('menu-open', navMenu.classList.contains('open'));
+    };
+
+    hamburger.addEventListener('click', toggleMenu);
+
+    navMenu.querySelectorAll('a').forEach((link) => {
+        link.addEventListener('click', () => closeMenu());
+    });
+
+    window.addEventListener('resize', () => {
+        if (window.innerWidth > 1024) {
+            closeMenu();
+        }
+    });
+
+    window.addEventListener('keydown', (event) => {
+        if (event.key === 'Escape') {
+            closeMenu();
+        }
+    });
+}
+
+function initSmoothScroll() {
+    const links = document.querySelectorAll('a[href^="#"]');
+    if (!links.length) return;
+
+    links.forEach((link) => {
+        const href = link.getAttribute('href');
+        if (!href || href.length <= 1) return;
+        if (link.closest('.sidebar-menu')) return;
+
+        const target = document.getElementById(href.substring(1));
+        if (!target) return;
+
+        link.addEventListener('click', (event) => {
+            event.preventDefault();
+            target.scrollIntoView({ behavior: 'smooth', block: 'start' });
+        });
+    });
+}
+
+function initMarketingTabs() {
+    const buttons = document.querySelectorAll('.tab-btn');
+    const contents = document.querySelectorAll('.tab-content');
+    if (!buttons.length || !contents.length) return;
+
+    buttons.forEach((button) => {
+        button.addEventListener('click', () => {
+            const targetId = button.dataset.tab;
+            if (!targetId) return;
+
+            buttons.forEach((btn) => btn.classList.toggle('active', btn === button));
+            contents.forEach((content) => content.classList.toggle('active', content.id === targetId));
+        });
+    });
+}
+
+export function handleLogout() {
+    localStorage.removeItem('eventflex_user');
+    localStorage.clear(); // Clear all localStorage to be safe
+    sessionStorage.removeItem('eventflex_sync_snapshot');
+    currentUser = null;
+
+    showToast('Logged out successfully', 'success');
+
+    setTimeout(() => {
+        window.location.href = '/';
+        window.location.reload();
+    }, 800);
+}
+
+function initToastTriggers() {
+    document.addEventListener('click', (event) => {
+        const trigger = event.target.closest('[data-toast]');
+        if (!trigger) return;
+
+        const message = trigger.getAttribute('data-toast');
+        if (!message) return;
+
+        const variant = trigger.getAttribute('data-toast-variant') || 'info';
+        showToast(message, variant);
+    });
+}
+
+export function showToast(message, variant = 'info') {
+    const container = getToastContainer();
+    const toast = document.createElement('div');
+    toast.className = `toast toast-${variant}`;
+
+    const text = document.createElement('span');
+    text.textContent = message;
+    toast.appendChild(text);
+
+    container.appendChild(toast);
+
+    requestAnimationFrame(() => {
+        toast.classList.add('visible');
+    });
+
+    const hide = () => {
+        toast.classList.remove('visible');
+        toast.addEventListener('transitionend', () => toast.remove(), { once: true });
+    };
+
+    setTimeout(hide, 3200);
+}
+
+// Make showToast globally accessible
+window.showToast = showToast;
+
+function getToastContainer() {
+    if (toastContainer) return toastContainer;
+    toastContainer = document.createElement('div');
+    toastContainer.className = 'toast-container';
+    document.body.appendChild(toastContainer);
+    return toastContainer;
+}
@@ -0,0 +1,481 @@
+// EventFlex - dashboard shell shared by the staff portal and the organizer dashboard:
+// bootstrap fetch cache, sidebar sections, secondary tabs, skill tags and
+// verification polling. staff.js / organizer.js call initDashboard().
+import {
+    API_BASE,
+    currentUser,
+    handleLogout,
+    hooks,
+    loadFeature,
+    refreshUserProfile,
+    registerLazyGlobals,
+    saveCurrentUser,
+    showToast,
+} from 'eventflex/core';
+import {
+    initProfileForms,
+    loadProfileData,
+} from 'eventflex/profile';
+
+// ============ DASHBOARD BOOTSTRAP ============
+// The dashboards load everything the first screen needs with one request to
+// /api/dashboard/<role>/bootstrap/. The compact response is expanded into the
+// shapes of the individual endpoints and served to the existing loaders from a
+// short-lived cache, so the many GETs fired on page load never hit the network.
+//
+// The snapshot and its cursor are kept in sessionStorage. A reload in the same
+// tab asks /api/sync/ only for what changed since, merges that into the stored
+// jobs, applications and transactions and leaves the small per-user panels
+// (profile, wallet stats, verification, job board, talent, reviews) to their
+// own endpoints. A reset or a long backlog falls back to the full bootstrap.
+const BOOTSTRAP_TTL_MS = 15000;
+const SNAPSHOT_KEY = 'eventflex_sync_snapshot';
+const SYNC_MAX_PAGES = 5;
+// Bootstrap keys /api/sync/ keeps current; everything else is refetched after a delta load
+const SYNCED_KEYS = ['role', 'cursor', 'profiles', 'applications', 'transactions', 'jobs'];
+const bootstrapCache = new Map();
+let bootstrapPromise = null;
+let bootstrapExpires = 0;
+const nativeFetch = window.fetch.bind(window);
+
+window.fetch = function (input, init) {
+    const url = typeof input === 'string' ? input : input.url;
+    const method = ((init && init.method) || (typeof input === 'string' ? 'GET' : input.method) || 'GET').toUpperCase();
+
+    if (method !== 'GET') {
+        // Any mutation invalidates the bootstrap snapshot
+        bootstrapCache.clear();
+        return nativeFetch(input, init);
+    }
+    if (!bootstrapPromise || !url.startsWith(API_BASE)) {
+        return nativeFetch(input, init);
+    }
+    return bootstrapPromise.then(() => {
+        if (bootstrapCache.has(url) && Date.now() < bootstrapExpires) {
+            return new Response(JSON.stringify(bootstrapCache.get(url)), {
+                status: 200,
+                headers: { 'Content-Type': 'application/json' }
+            });
+        }
+        return nativeFetch(input, init);
+    });
+};
+
+function startDashboardBootstrap() {
+    const path = window.location.pathname;
+    let role = null;
+    if (path.startsWith('/organizer-dashboard')) role = 'organizer';
+    else if (path.startsWith('/staff-portal')) role = 'staff';
+    if (!role || !currentUser || currentUser.user_type !== role) return;
+
+    bootstrapPromise = loadFromSnapshot(role)
+        .catch(() => null)
+        .then((data) => data || nativeFetch(`${API_BASE}/dashboard/${role}/bootstrap/`, { credentials: 'include' })
+            .then((res) => (res.ok ? res.json() : null)))
+        .then((data) => {
+            if (!data) return;
+            saveSnapshot(data);
+            primeBootstrapCache(data);
+        })
+        .catch((err) => console.error('Dashboard bootstrap failed:', err));
+}
+
+function saveSnapshot(data) {
+    const snapshot = { username: currentUser.username };
+    SYNCED_KEYS.forEach((key) => { snapshot[key] = data[key]; });
+    try {
+        sessionStorage.setItem(SNAPSHOT_KEY, JSON.stringify(snapshot));
+    } catch (err) {
+        // Over quota: the next load simply fetches the full bootstrap
+        sessionStorage.removeItem(SNAPSHOT_KEY);
+    }
+}
+
+// The stored snapshot brought up to date through /api/sync/, or null to fetch the full bootstrap
+async function loadFromSnapshot(role) {
+    const snapshot = JSON.parse(sessionStorage.getItem(SNAPSHOT_KEY) || 'null');
+    if (!snapshot || snapshot.role !== role || snapshot.username !== currentUser.username) return null;
+
+    for (let page = 0; page < SYNC_MAX_PAGES; page++) {
+        const res = await nativeFetch(`${API_BASE}/sync/?cursor=${snapshot.cursor}`, { credentials: 'include' });
+        if (!res.ok) return null;
+        const delta = await res.json();
+        if (delta.reset) return null;
+        applyDelta(snapshot, delta);
+        if (!delta.has_more) return snapshot;
+    }
+    return null;
+}
+
+function applyDelta(snapshot, delta) {
+    const keep = (profile) => {
+        if (profile) snapshot.profiles[String(profile.id)] = profile;
+        return profile ? profile.id : null;
+    };
+    const compactJob = ({ organizer, ...job }) => ({ ...job, organizer_id: keep(organizer) });
+    const compactApp = ({ applicant, job, ...app }) => ({ ...app, applicant_id: keep(applicant), job: compactJob(job) });
+    // Changed rows replace their stored copies in place; new ones go first, newest first
+    const merge = (rows, changed, removed) => {
+        const gone = new Set(removed);
+        const updates = new Map(changed.map((row) => [row.id, row]));
+        const known = new Set(rows.map((row) => row.id));
+        const added = changed.filter((row) => !known.has(row.id) && !gone.has(row.id)).sort((a, b) => b.id - a.id);
+        return [...added, ...rows.filter((row) => !gone.has(row.id)).map((row) => updates.get(row.id) || row)];
+    };
+
+    // Application cards embed a subset of their job's fields
+    const jobs = new Map(delta.jobs.map((job) => [job.id, compactJob(job)]));
+    const withJob = (app) => {
+        const job = jobs.get(app.job.id);
+        if (!job) return app;
+        const fields = Object.keys(app.job).map((key) => [key, key in job ? job[key] : app.job[key]]);
+        return { ...app, job: Object.fromEntries(fields) };
+    };
+
+    snapshot.applications = merge(
+        snapshot.applications, delta.applications.map(compactApp), delta.deleted.application || []
+    ).map(withJob);
+    snapshot.transactions = merge(snapshot.transactions, delta.transactions, []).slice(0, 50);
+    if (snapshot.role === 'organizer') {
+        snapshot.jobs = merge(snapshot.jobs, [...jobs.values()], delta.deleted.job || []);
+    }
+    snapshot.cursor = delta.cursor;
+}
+
+function primeBootstrapCache(data) {
+    const profileOf = (id) => data.profiles[String(id)] || null;
+    const expandJob = (job) => ({ ...job, organizer: profileOf(job.organizer_id) });
+    const expandApp = (app) => ({
+        ...app,
+        job: { ...app.job, organizer: profileOf(app.job.organizer_id) },
+        applicant: profileOf(app.applicant_id)
+    });
+
+    // A snapshot restored through /api/sync/ carries only SYNCED_KEYS; the rest is fetched as usual
+    bootstrapCache.set(`${API_BASE}/applications/`, { results: data.applications.map(expandApp) });
+    bootstrapCache.set(`${API_BASE}/transactions/`, { results: data.transactions });
+    if (data.profile) {
+        bootstrapCache.set(`${API_BASE}/profiles/me/`, { profile: data.profile });
+        bootstrapCache.set(`${API_BASE}/wallet/stats/`, data.wallet);
+        bootstrapCache.set(`${API_BASE}/verification/status/`, data.verification);
+    }
+
+    if (data.role === 'staff') {
+        if (data.job_listings) {
+            bootstrapCache.set(`${API_BASE}/jobs/`, { results: data.job_listings.map(expandJob) });
+            bootstrapCache.set(`${API_BASE}/reviews/staff/${data.profile.id}/`, {
+                staff: data.profile,
+                reviews: data.reviews,
+                total_reviews: data.reviews.length
+            });
+        }
+    } else {
+        const activeJobs = data.jobs
+            .filter((job) => !job.is_draft && job.status !== 'completed')
+            .map(expandJob);
+        bootstrapCache.set(`${API_BASE}/jobs/my/`, { results: activeJobs });
+        bootstrapCache.set(`${API_BASE}/jobs/my/?status=active`, { results: activeJobs });
+        if (data.talent) {
+            bootstrapCache.set(`${API_BASE}/talent/`, { results: data.talent.map(profileOf) });
+        }
+    }
+
+    bootstrapExpires = Date.now() + BOOTSTRAP_TTL_MS;
+}
+
+// Periodic verification status check
+let verificationCheckInterval = null;
+
+function startVerificationStatusCheck() {
+    // Clear any existing interval
+    if (verificationCheckInterval) {
+        clearInterval(verificationCheckInterval);
+    }
+
+    // Check every 30 seconds
+    verificationCheckInterval = setInterval(async () => {
+        if (!currentUser || currentUser.kyc_verified) {
+            clearInterval(verificationCheckInterval);
+            return;
+        }
+
+        try {
+            const response = await fetch(`${API_BASE}/verification/status/`, {
+                credentials: 'include'
+            });
+
+            if (response.ok) {
+                const data = await response.json();
+
+                // If just got approved, refresh profile and show success message
+                if (data.kyc_verified && !currentUser.kyc_verified) {
+                    currentUser.kyc_verified = true;
+                    saveCurrentUser(currentUser);
+
+                    showToast('🎉 Congratulations! Your verification has been approved!', 'success');
+
+                    // Refresh profile data to show badge
+                    await refreshUserProfile();
+                    if (typeof loadProfileData === 'function') {
+                        await loadProfileData();
+                    }
+
+                    // Stop checking
+                    clearInterval(verificationCheckInterval);
+                }
+            }
+        } catch (error) {
+            console.error('Error checking verification status:', error);
+        }
+    }, 30000); // Check every 30 seconds
+}
+
+function initDashboardNavigation(sectionLoaders) {
+    const sidebar = document.querySelector('.sidebar-menu');
+    const sections = document.querySelectorAll('.dashboard-section');
+    if (!sidebar || !sections.length) return;
+
+    const links = Array.from(sidebar.querySelectorAll('a')).filter((link) => {
+        const href = link.getAttribute('href');
+        return href && href.startsWith('#');
+    });
+
+    const activateSection = (targetId) => {
+        sections.forEach((section) => {
+            section.classList.toggle('active', section.id === targetId);
+        });
+
+        links.forEach((link) => {
+            const listItem = link.parentElement;
+            if (!listItem) return;
+            const matches = link.getAttribute('href') === `#${targetId}`;
+            listItem.classList.toggle('active', matches);
+        });
+
+        window.scrollTo({ top: 0, behavior: 'smooth' });
+
+        const load = sectionLoaders[targetId];
+        if (load) {
+            load();
+        }
+    };
+
+    links.forEach((link) => {
+        const href = link.getAttribute('href');
+        if (!href) return;
+        const targetId = href.substring(1);
+        const targetSection = document.getElementById(targetId);
+        if (!targetSection) return;
+
+        link.addEventListener('click', (event) => {
+            event.preventDefault();
+            activateSection(targetId);
+            if (history.replaceState) {
+                history.replaceState(null, '', `#${targetId}`);
+            }
+        });
+    });
+
+    const initialLink = links.find((link) => link.parentElement?.classList.contains('active')) || links[0];
+    if (initialLink) {
+        const initialId = initialLink.getAttribute('href').substring(1);
+        activateSection(initialId);
+    }
+}
+
+function initSecondaryTabs(onTabShown) {
+    const tabGroups = document.querySelectorAll('.tabs-secondary');
+    if (!tabGroups.length) return;
+
+    tabGroups.forEach((group) => {
+        const buttons = group.querySelectorAll('.tab-btn-secondary');
+        if (!buttons.length) return;
+
+        const section = group.closest('.dashboard-section');
+        const panels = section ? section.querySelectorAll('[data-tab-content]') : [];
+
+        const showPanel = (target) => {
+            panels.forEach((panel) => {
+                panel.style.display = panel.dataset.tabContent === target ? 'block' : 'none';
+            });
+
+            if (section && onTabShown) {
+                onTabShown(section.id, target);
+            }
+        };
+
+        buttons.forEach((button) => {
+            button.addEventListener('click', () => {
+                const target = button.dataset.tab;
+                buttons.forEach((btn) => btn.classList.toggle('active', btn === button));
+                if (target) {
+                    showPanel(target);
+                }
+            });
+        });
+
+        const initialButton = group.querySelector('.tab-btn-secondary.active') || buttons[0];
+        if (initialButton) {
+            const target = initialButton.dataset.tab;
+            showPanel(target);
+        }
+    });
+}
+
+function initSkillTags() {
+    const skillAreas = document.querySelectorAll('.skill-tags');
+    if (!skillAreas.length) return;
+
+    skillAreas.forEach((area) => {
+        const input = area.querySelector('input');
+        if (!input) return;
+
+        normalizeExistingTags(area);
+
+        input.addEventListener('keydown', (event) => {
+            if (event.key === 'Enter' || event.key === ',') {
+                event.preventDefault();
+                const value = input.value.trim().replace(/,$/, '');
+                if (!value) return;
+                addSkillTag(area, value);
+                input.value = '';
+            }
+        });
+
+        area.addEventListener('click', (event) => {
+            const target = event.target;
+            if (target.classList.contains('remove-skill')) {
+                target.parentElement?.remove();
+                return;
+            }
+            input.focus();
+        });
+    });
+}
+
+function normalizeExistingTags(area) {
+    area.querySelectorAll('.skill-tag').forEach((tag) => {
+        const label = getSkillTagLabel(tag);
+        tag.dataset.value = label;
+
+        let icon = tag.querySelector('i.fa-times');
+        if (!icon) {
+            icon = document.createElement('i');
+            icon.className = 'fas fa-times';
+            tag.appendChild(icon);
+        }
+
+        let labelElement = tag.querySelector('.skill-label');
+        if (!labelElement) {
+            labelElement = document.createElement('span');
+            labelElement.className = 'skill-label';
+            labelElement.textContent = label;
+            tag.insertBefore(labelElement, icon);
+        } else {
+            labelElement.textContent = label;
+        }
+
+        Array.from(tag.childNodes)
+            .filter((node) => node.nodeType === Node.TEXT_NODE && node.textContent.trim())
+            .forEach((node) => node.parentNode?.removeChild(node));
+
+        icon.classList.add('remove-skill');
+        icon.setAttribute('role', 'button');
+        icon.setAttribute('tabindex', '0');
+        icon.setAttribute('aria-label', `Remove ${label}`);
+    });
+}
+
+function addSkillTag(area, value) {
+    const normalized = value.trim();
+    if (!normalized) return;
+
+    const exists = Array.from(area.querySelectorAll('.skill-tag')).some(
+        (tag) => getSkillTagLabel(tag).toLowerCase() === normalized.toLowerCase()
+    );
+
+    if (exists) {
+        showToast(`"${normalized}" is already added.`, 'info');
+        return;
+    }
+
+    const tag = document.createElement('span');
+    tag.className = 'skill-tag';
+    tag.dataset.value = normalized;
+
+    const labelSpan = document.createElement('span');
+    labelSpan.className = 'skill-label';
+    labelSpan.textContent = normalized;
+
+    const icon = document.createElement('i');
+    icon.className = 'fas fa-times remove-skill';
+    icon.setAttribute('role', 'button');
+    icon.setAttribute('tabindex', '0');
+    icon.setAttribute('aria-label', `Remove ${normalized}`);
+
+    tag.append(labelSpan, icon);
+    area.insertBefore(tag, area.querySelector('input'));
+}
+
+export function getSkillTagLabel(tag) {
+    const explicitLabel = tag.querySelector('.skill-label');
+    if (explicitLabel) return explicitLabel.textContent.trim();
+
+    const clone = tag.cloneNode(true);
+    clone.querySelectorAll('i').forEach((icon) => icon.remove());
+    return clone.textContent.replace(/×/, '').trim();
+}
+
+// ============ PAGE INITIALIZATION ============
+// Fields whose datalists autocomplete.js fills; it is loaded when one is first focused
+const AUTOCOMPLETE_FIELDS = '#skillInput, #apply-role, #apply-skills, #apply-previous-events, ' +
+    '[name="event_type"], [name="role"], [name="location"]';
+
+function initLazyAutocomplete() {
+    const onFocus = (event) => {
+        if (!(event.target instanceof Element) || !event.target.matches(AUTOCOMPLETE_FIELDS)) return;
+        document.removeEventListener('focusin', onFocus);
+        loadFeature('autocomplete');
+    };
+    document.addEventListener('focusin', onFocus);
+}
+
+// Set up the parts both dashboards share. sectionLoaders maps a sidebar section id
+// to the loader run when it is shown; onTabShown(sectionId, tab) is called when a
+// secondary tab is shown.
+export function initDashboard({ sectionLoaders = {}, onTabShown = null } = {}) {
+    // Conversations are only fetched once the messages section is opened
+    const loadConversations = () => loadFeature('messaging').then((messaging) => messaging.loadMessages());
+
+    registerLazyGlobals('messaging', ['selectConversation', 'openChat', 'sendMessage']);
+    registerLazyGlobals('chat', ['openChatModal', 'closeChatModal', 'goToMessagesSection', 'sendChatMessage', 'handleChatKeyPress']);
+    registerLazyGlobals('verification', ['showVerificationModal', 'closeVerificationModal', 'handleVerificationSubmit']);
+    registerLazyGlobals('invoices', ['downloadInvoice', 'downloadOrganizerInvoice']);
+
+    initDashboardNavigation({ messages: loadConversations, ...sectionLoaders });
+    initSecondaryTabs(onTabShown);
+    initSkillTags();
+    initProfileForms();
+    initLazyAutocomplete();
+
+    const logoutBtn = document.getElementById('logout-btn');
+    if (logoutBtn) {
+        logoutBtn.addEventListener('click', (event) => {
+            event.preventDefault();
+            handleLogout();
+        });
+    }
+}
+
+// Greeting and verification polling, once the role module has loaded its data
+export function finishDashboardLoad() {
+    const welcomeMsg = document.getElementById('welcome-message');
+    if (welcomeMsg) {
+        welcomeMsg.textContent = `Welcome back, ${currentUser.username}! 👋`;
+    }
+
+    // Start periodic verification status check (every 30 seconds)
+    if (currentUser && !currentUser.kyc_verified) {
+        startVerificationStatusCheck();
+    }
+}
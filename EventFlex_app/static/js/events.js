@@ -0,0 +1,375 @@
+// EventFlex - organizer event management: details modal, drafts, cancelling and
+// finishing events. Loaded on the first call to one of its window functions.
+import {
+    escapeHtml,
+    formatDate,
+    showToast,
+} from 'eventflex/core';
+import {
+    loadWalletStats,
+} from 'eventflex/wallet';
+import {
+    loadDashboardStats,
+    loadMyJobs,
+} from 'eventflex/organizer';
+
+// =========================================
+// EVENT MANAGEMENT FUNCTIONS
+// =========================================
+window.cancelEvent = async function (jobId) {
+    if (!confirm('Are you sure you want to cancel this event? This action cannot be undone and will remove the event from the database.')) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/jobs/${jobId}/delete/`, {
+            method: 'DELETE',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json'
+            }
+        });
+
+        const data = await response.json();
+
+        if (response.ok) {
+            alert('Event cancelled and removed successfully');
+            await loadMyJobs();
+            await loadDashboardStats();
+        } else {
+            alert(data.error || 'Failed to cancel event');
+        }
+    } catch (error) {
+        console.error('Error cancelling event:', error);
+        alert('Error cancelling event');
+    }
+};
+
+// Draft management functions
+window.editDraft = async function (jobId) {
+    try {
+        const response = await fetch(`/api/jobs/${jobId}/details/`, {
+            credentials: 'include'
+        });
+
+        if (!response.ok) {
+            showToast('Failed to load draft details', 'error');
+            return;
+        }
+
+        const job = await response.json();
+
+        // Populate the form with draft data
+        const form = document.getElementById('jobPostForm');
+        if (!form) return;
+
+        form.querySelector('[name="title"]').value = job.title || '';
+        form.querySelector('[name="event_type"]').value = job.event_type || '';
+        form.querySelector('[name="role"]').value = job.role || '';
+        form.querySelector('[name="number_of_staff"]').value = job.number_of_staff || '';
+        form.querySelector('[name="date"]').value = job.date || '';
+        form.querySelector('[name="start_time"]').value = job.start_time || '';
+        form.querySelector('[name="end_time"]').value = job.end_time || '';
+        form.querySelector('[name="location"]').value = job.location || '';
+        form.querySelector('[name="pay_rate"]').value = job.pay_rate || '';
+        form.querySelector('[name="payment_type"]').value = job.payment_type || 'daily';
+        form.querySelector('[name="description"]').value = job.description || '';
+
+        // Handle skills
+        if (job.skills) {
+            const skillTags = form.querySelector('.skill-tags');
+            const skills = job.skills.split(',').map(s => s.trim()).filter(s => s);
+            skills.forEach(skill => {
+                const tag = document.createElement('span');
+                tag.className = 'skill-tag';
+                tag.dataset.value = skill;
+                tag.innerHTML = `${skill} <i class="fas fa-times"></i>`;
+                skillTags.insertBefore(tag, skillTags.querySelector('#skillInput'));
+            });
+        }
+
+        // Handle requirements checkboxes
+        if (job.requirements) {
+            const requirements = job.requirements.split(',').map(r => r.trim());
+            requirements.forEach(req => {
+                const checkbox = form.querySelector(`input[name="requirements"][value="${req}"]`);
+                if (checkbox) checkbox.checked = true;
+            });
+        }
+
+        // Store the draft ID for updating
+        form.dataset.draftId = jobId;
+
+        // Delete the old draft after loading data
+        await deleteDraft(jobId, true);
+
+        // Navigate to post job section
+        window.location.hash = 'post-job';
+        showToast('Draft loaded. Edit and save or post the job.', 'success');
+    } catch (error) {
+        console.error('Error loading draft:', error);
+        showToast('Error loading draft', 'error');
+    }
+};
+
+window.deleteDraft = async function (jobId, silent = false) {
+    if (!silent && !confirm('Are you sure you want to delete this draft?')) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/jobs/${jobId}/delete/`, {
+            method: 'DELETE',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json'
+            }
+        });
+
+        const data = await response.json();
+
+        if (response.ok) {
+            if (!silent) {
+                showToast('Draft deleted successfully', 'success');
+                await loadMyJobs('draft');
+            }
+        } else {
+            if (!silent) showToast(data.error || 'Failed to delete draft', 'error');
+        }
+    } catch (error) {
+        console.error('Error deleting draft:', error);
+        if (!silent) showToast('Error deleting draft', 'error');
+    }
+};
+
+window.openEventDetailsModal = async function (jobId) {
+    try {
+        const response = await fetch(`/api/jobs/${jobId}/details/`, {
+            credentials: 'include'
+        });
+
+        if (!response.ok) {
+            alert('Failed to load event details');
+            return;
+        }
+
+        const job = await response.json();
+        console.log('Job details received:', job);
+        console.log('Hired staff:', job.hired_staff);
+
+        // Store job ID for finish event function
+        const modal = document.getElementById('event-details-modal');
+        modal.dataset.jobId = jobId;
+
+        document.getElementById('event-detail-title').textContent = job.title;
+        document.getElementById('event-detail-type').textContent = job.event_type;
+        document.getElementById('event-detail-role').textContent = job.role;
+        document.getElementById('event-detail-date').textContent = formatDate(job.date);
+        document.getElementById('event-detail-time').textContent = `${job.start_time} - ${job.end_time}`;
+        document.getElementById('event-detail-location').textContent = job.location;
+        document.getElementById('event-detail-pay').textContent = `₹${job.pay_rate}/${job.payment_type}`;
+        document.getElementById('event-detail-staff-needed').textContent = job.number_of_staff;
+        document.getElementById('event-detail-description').textContent = job.description;
+        document.getElementById('event-detail-requirements').textContent = job.requirements || 'None specified';
+        document.getElementById('event-detail-skills').textContent = job.skills || 'None specified';
+
+        // Use hired_staff data from job details response (no separate API call needed)
+        if (job.hired_staff && job.hired_staff.length > 0) {
+            renderHiredStaff(job.hired_staff, jobId, job.status, job.title);
+        } else {
+            document.getElementById('hired-staff-list').innerHTML = '<p class="empty-state">No staff hired yet</p>';
+        }
+
+        // Update button based on job status
+        const finishEventBtn = document.getElementById('finish-event-btn');
+        console.log('Job status:', job.status);
+        console.log('Finish event button found:', !!finishEventBtn);
+        if (finishEventBtn) {
+            if (job.status === 'completed') {
+                console.log('Setting button to "Rate Staff" for completed event');
+                // Change to "Rate Staff" button for completed events
+                finishEventBtn.style.display = 'inline-flex';
+                finishEventBtn.style.pointerEvents = 'auto';
+                finishEventBtn.disabled = false;
+                finishEventBtn.style.background = '#DAA520';
+                finishEventBtn.style.borderColor = '#DAA520';
+                finishEventBtn.innerHTML = '<i class="fas fa-star"></i> Rate Staff';
+                finishEventBtn.onclick = () => showRateStaffInfo(job.hired_staff, jobId, job.title);
+            } else {
+                console.log('Setting button to "Finish Event" for active event');
+                // Show Finish Event button for active events
+                finishEventBtn.style.display = 'inline-flex';
+                finishEventBtn.style.pointerEvents = 'auto';
+                finishEventBtn.disabled = false;
+                finishEventBtn.style.background = '#10b981';
+                finishEventBtn.style.borderColor = '#10b981';
+                finishEventBtn.innerHTML = '<i class="fas fa-check-circle"></i> Finish Event';
+                finishEventBtn.onclick = handleFinishEvent;
+            }
+        }
+
+        modal.style.display = 'flex';
+        document.body.style.overflow = 'hidden';
+
+    } catch (error) {
+        console.error('Error loading event details:', error);
+        alert('Error loading event details');
+    }
+};
+
+function renderHiredStaff(staff, jobId, jobStatus, jobTitle) {
+    console.log('renderHiredStaff called with:', staff, 'jobId:', jobId, 'jobStatus:', jobStatus);
+    const container = document.getElementById('hired-staff-list');
+
+    if (!staff || staff.length === 0) {
+        console.log('No staff to display');
+        container.innerHTML = '<p class="empty-state">No staff hired yet</p>';
+        return;
+    }
+
+    const isCompleted = jobStatus === 'completed';
+
+    console.log('Rendering', staff.length, 'staff members');
+    container.innerHTML = staff.map(person => {
+        // hired_staff from get_job_details has simple structure: {id, name, email, phone, user_id, profile_id}
+        const fullName = person.name || 'Unknown';
+        const email = person.email || 'Not provided';
+        const phone = person.phone || 'Not provided';
+        const userId = person.user_id || person.id;
+        const profileId = person.profile_id || userId;  // Use profile_id for reviews
+
+        return `
+            <div class="staff-card">
+                <div class="staff-header">
+                    <img src="https://ui-avatars.com/api/?name=${encodeURIComponent(fullName)}&background=6366f1&color=fff" alt="${escapeHtml(fullName)}">
+                    <div class="staff-info">
+                        <h4>${escapeHtml(fullName)}</h4>
+                        <p><i class="fas fa-envelope"></i> ${escapeHtml(email)}</p>
+                        <p><i class="fas fa-phone"></i> ${escapeHtml(phone)}</p>
+                    </div>
+                </div>
+                <div style="display: flex; gap: 0.5rem; margin-top: 0.5rem;">
+                    <button class="btn-outline" onclick="openChatModal(${userId}, '${escapeHtml(fullName)}', 'https://ui-avatars.com/api/?name=${encodeURIComponent(fullName)}&background=6366f1&color=fff')" style="flex: 1;">
+                        <i class="fas fa-comment"></i> Message
+                    </button>
+                    ${isCompleted ? `
+                        <button class="btn-primary" onclick="openReviewModal(${profileId}, '${escapeHtml(fullName)}', ${jobId}, '${escapeHtml(jobTitle)}')" style="flex: 1;">
+                            <i class="fas fa-star"></i> Rate
+                        </button>
+                    ` : `
+                        <button class="btn-outline" onclick="fireStaff(${person.id}, ${jobId})" style="background: #dc3545; border-color: #dc3545; color: white; flex: 1;">
+                            <i class="fas fa-user-times"></i> Fire Staff
+                        </button>
+                    `}
+                </div>
+            </div>
+        `;
+    }).join('');
+}
+
+window.fireStaff = async function (applicationId, jobId) {
+    if (!confirm('Are you sure you want to fire this staff member? This will change their application status to rejected.')) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/applications/${applicationId}/reject/`, {
+            method: 'POST',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json'
+            }
+        });
+
+        if (response.ok) {
+            alert('Staff member removed successfully');
+            openEventDetailsModal(jobId);
+        } else {
+            alert('Failed to remove staff member');
+        }
+    } catch (error) {
+        console.error('Error removing staff:', error);
+        alert('Error removing staff member');
+    }
+};
+
+window.closeEventDetailsModal = function () {
+    const modal = document.getElementById('event-details-modal');
+    if (modal) {
+        modal.style.display = 'none';
+        document.body.style.overflow = 'auto';
+    }
+};
+
+window.handleFinishEvent = async function () {
+    const modal = document.getElementById('event-details-modal');
+    const jobId = modal.dataset.jobId;
+    const jobTitle = document.getElementById('event-detail-title').textContent;
+
+    if (!jobId) {
+        showToast('Event ID not found', 'error');
+        return;
+    }
+
+    if (!confirm(`Are you sure you want to mark "${jobTitle}" as finished? This will close the event and release payments to all hired staff.`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/jobs/${jobId}/finish/`, {
+            method: 'POST',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json'
+            }
+        });
+
+        const data = await response.json();
+
+        if (response.ok) {
+            let message = 'Event marked as finished successfully!';
+            if (data.payments_released > 0) {
+                message = `Event finished! ₹${data.total_amount} released to ${data.payments_released} staff members.`;
+            }
+            showToast(message, 'success');
+            closeEventDetailsModal();
+
+            // Refresh the jobs list and wallet stats
+            if (typeof loadMyJobs === 'function') {
+                await loadMyJobs();
+            }
+            if (typeof loadDashboardStats === 'function') {
+                await loadDashboardStats();
+            }
+            if (typeof loadWalletStats === 'function') {
+                await loadWalletStats();
+            }
+        } else {
+            // Show detailed error message if it's a balance issue
+            if (data.required && data.available) {
+                showToast(`Insufficient funds! Required: ₹${data.required}, Available: ₹${data.available}. Please add funds first.`, 'error');
+            } else {
+                showToast(data.error || 'Failed to finish event', 'error');
+            }
+        }
+    } catch (error) {
+        console.error('Error finishing event:', error);
+        showToast('Error finishing event. Please try again.', 'error');
+    }
+};
+
+// Function to show info about rating staff
+window.showRateStaffInfo = function (hiredStaff, jobId, jobTitle) {
+    if (!hiredStaff || hiredStaff.length === 0) {
+        showToast('No staff to rate for this event', 'info');
+        return;
+    }
+
+    showToast(`Click the "Rate" button next to each staff member below to rate them individually`, 'info');
+
+    // Scroll to the hired staff section
+    const hiredStaffSection = document.querySelector('.hired-staff-section');
+    if (hiredStaffSection) {
+        hiredStaffSection.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+    }
+};
@@ -0,0 +1,637 @@
+// EventFlex - printable invoices (loaded when an invoice is first downloaded)
+import {
+    API_BASE,
+    currentUser,
+    escapeHtml,
+    formatNumber,
+    showToast,
+} from 'eventflex/core';
+
+window.downloadInvoice = async function (applicationId) {
+    try {
+        // Check if user is logged in
+        if (!currentUser) {
+            showToast('Please log in to download invoice', 'error');
+            return;
+        }
+
+        // Fetch application details
+        const response = await fetch(`${API_BASE}/applications/${applicationId}/`, {
+            credentials: 'include'
+        });
+
+        if (!response.ok) {
+            throw new Error('Failed to fetch booking details');
+        }
+
+        const application = await response.json();
+
+        // Generate invoice HTML
+        generateInvoiceHTML(application, currentUser);
+
+    } catch (error) {
+        console.error('Error generating invoice:', error);
+        showToast('Failed to generate invoice', 'error');
+    }
+};
+
+function generateInvoiceHTML(application, user) {
+    const job = application.job;
+    const invoiceNumber = `INV-${String(application.id).padStart(6, '0')}`;
+    const invoiceDate = new Date().toLocaleDateString('en-IN', {
+        year: 'numeric',
+        month: 'long',
+        day: 'numeric'
+    });
+    const eventDate = new Date(job.date).toLocaleDateString('en-IN', {
+        year: 'numeric',
+        month: 'long',
+        day: 'numeric'
+    });
+
+    // Calculate amounts
+    const subtotal = parseFloat(job.pay_rate);
+    const platformFee = 0; // No platform fee for demo
+    const tax = 0; // No tax for demo
+    const total = subtotal + platformFee + tax;
+
+    // Create invoice HTML
+    const invoiceHTML = `
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Invoice ${invoiceNumber}</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            padding: 40px;
+            background: #f5f5f5;
+        }
+        .invoice-container {
+            max-width: 800px;
+            margin: 0 auto;
+            background: white;
+            padding: 40px;
+            box-shadow: 0 0 20px rgba(0,0,0,0.1);
+        }
+        .header {
+            display: flex;
+            justify-content: space-between;
+            align-items: start;
+            border-bottom: 3px solid #DAA520;
+            padding-bottom: 20px;
+            margin-bottom: 30px;
+        }
+        .logo {
+            font-size: 32px;
+            font-weight: bold;
+            color: #DAA520;
+        }
+        .invoice-title {
+            text-align: right;
+        }
+        .invoice-title h1 {
+            color: #333;
+            font-size: 28px;
+            margin-bottom: 5px;
+        }
+        .invoice-title .invoice-number {
+            color: #666;
+            font-size: 14px;
+        }
+        .info-section {
+            display: flex;
+            justify-content: space-between;
+            margin-bottom: 30px;
+        }
+        .info-box {
+            flex: 1;
+        }
+        .info-box h3 {
+            color: #DAA520;
+            font-size: 12px;
+            text-transform: uppercase;
+            margin-bottom: 10px;
+            letter-spacing: 1px;
+        }
+        .info-box p {
+            color: #333;
+            line-height: 1.6;
+            font-size: 14px;
+        }
+        .info-box p strong {
+            display: inline-block;
+            width: 80px;
+        }
+        .items-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-bottom: 30px;
+        }
+        .items-table th {
+            background: #DAA520;
+            color: white;
+            padding: 12px;
+            text-align: left;
+            font-weight: 600;
+            font-size: 13px;
+            text-transform: uppercase;
+        }
+        .items-table td {
+            padding: 15px 12px;
+            border-bottom: 1px solid #e0e0e0;
+            color: #333;
+            font-size: 14px;
+        }
+        .items-table tr:last-child td {
+            border-bottom: 2px solid #DAA520;
+        }
+        .totals {
+            margin-left: auto;
+            width: 300px;
+        }
+        .total-row {
+            display: flex;
+            justify-content: space-between;
+            padding: 8px 0;
+            font-size: 14px;
+        }
+        .total-row.grand-total {
+            border-top: 2px solid #DAA520;
+            margin-top: 10px;
+            padding-top: 15px;
+            font-size: 18px;
+            font-weight: bold;
+            color: #DAA520;
+        }
+        .footer {
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 1px solid #e0e0e0;
+            text-align: center;
+            color: #666;
+            font-size: 12px;
+        }
+        .payment-status {
+            display: inline-block;
+            padding: 6px 15px;
+            background: #10b981;
+            color: white;
+            border-radius: 20px;
+            font-size: 12px;
+            font-weight: 600;
+            margin-top: 10px;
+        }
+        .notes {
+            background: #f9f9f9;
+            padding: 20px;
+            border-left: 4px solid #DAA520;
+            margin: 20px 0;
+            font-size: 13px;
+            color: #666;
+        }
+        @media print {
+            body { padding: 0; background: white; }
+            .no-print { display: none; }
+        }
+        .print-button {
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            padding: 12px 24px;
+            background: #DAA520;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            cursor: pointer;
+            font-size: 14px;
+            font-weight: 600;
+            box-shadow: 0 2px 10px rgba(218, 165, 32, 0.3);
+        }
+        .print-button:hover {
+            background: #c79400;
+        }
+    </style>
+</head>
+<body>
+    <button class="print-button no-print" onclick="window.print()">
+        🖨️ Print / Download PDF
+    </button>
+    
+    <div class="invoice-container">
+        <div class="header">
+            <div class="logo">
+                ✨ EventFlex
+            </div>
+            <div class="invoice-title">
+                <h1>INVOICE</h1>
+                <p class="invoice-number">${invoiceNumber}</p>
+                <p class="invoice-number">Date: ${invoiceDate}</p>
+            </div>
+        </div>
+
+        <div class="info-section">
+            <div class="info-box">
+                <h3>Billed To</h3>
+                <p><strong>Name:</strong> ${escapeHtml(user.first_name || user.username)} ${escapeHtml(user.last_name || '')}</p>
+                <p><strong>Email:</strong> ${escapeHtml(user.email || 'N/A')}</p>
+                <p><strong>Phone:</strong> ${escapeHtml(user.phone || 'N/A')}</p>
+                <p><strong>City:</strong> ${escapeHtml(user.city || 'N/A')}</p>
+            </div>
+            <div class="info-box">
+                <h3>Event Organizer</h3>
+                <p><strong>Name:</strong> ${escapeHtml(job.organizer?.username || 'N/A')}</p>
+                <p><strong>Email:</strong> ${escapeHtml(job.organizer?.email || 'N/A')}</p>
+                <p><strong>Phone:</strong> ${escapeHtml(job.organizer?.phone || 'N/A')}</p>
+            </div>
+        </div>
+
+        <div class="notes">
+            <strong>📋 Event Details:</strong><br>
+            <strong>Event Name:</strong> ${escapeHtml(job.title)}<br>
+            <strong>Event Date:</strong> ${eventDate}<br>
+            <strong>Location:</strong> ${escapeHtml(job.location)}<br>
+            <strong>Role:</strong> ${escapeHtml(job.role)}<br>
+            <strong>Time:</strong> ${job.start_time || 'TBD'} - ${job.end_time || 'TBD'}
+        </div>
+
+        <table class="items-table">
+            <thead>
+                <tr>
+                    <th>Description</th>
+                    <th style="text-align: center;">Quantity</th>
+                    <th style="text-align: right;">Rate</th>
+                    <th style="text-align: right;">Amount</th>
+                </tr>
+            </thead>
+            <tbody>
+                <tr>
+                    <td>
+                        <strong>${escapeHtml(job.role)}</strong><br>
+                        <small style="color: #666;">${escapeHtml(job.title)} - ${eventDate}</small>
+                    </td>
+                    <td style="text-align: center;">1</td>
+                    <td style="text-align: right;">₹${formatNumber(subtotal)}</td>
+                    <td style="text-align: right;">₹${formatNumber(subtotal)}</td>
+                </tr>
+            </tbody>
+        </table>
+
+        <div class="totals">
+            <div class="total-row">
+                <span>Subtotal:</span>
+                <span>₹${formatNumber(subtotal)}</span>
+            </div>
+            <div class="total-row">
+                <span>Platform Fee:</span>
+                <span>₹${formatNumber(platformFee)}</span>
+            </div>
+            <div class="total-row">
+                <span>Tax (GST):</span>
+                <span>₹${formatNumber(tax)}</span>
+            </div>
+            <div class="total-row grand-total">
+                <span>TOTAL:</span>
+                <span>₹${formatNumber(total)}</span>
+            </div>
+        </div>
+
+        <div style="text-align: center;">
+            <span class="payment-status">✓ PAYMENT RECEIVED</span>
+        </div>
+
+        <div class="footer">
+            <p><strong>EventFlex - Your Event Staffing Partner</strong></p>
+            <p>Thank you for using EventFlex! For any queries, contact us at support@eventflex.com</p>
+            <p style="margin-top: 10px;">This is a computer-generated invoice and does not require a signature.</p>
+        </div>
+    </div>
+</body>
+</html>`;
+
+    // Open invoice in new window
+    const invoiceWindow = window.open('', '_blank');
+    invoiceWindow.document.write(invoiceHTML);
+    invoiceWindow.document.close();
+
+    showToast('Invoice generated successfully! You can now print or save as PDF.', 'success');
+}
+
+window.downloadOrganizerInvoice = async function (jobId) {
+    try {
+        // Check if user is logged in
+        if (!currentUser) {
+            showToast('Please log in to download invoice', 'error');
+            return;
+        }
+
+        // Fetch job details
+        const response = await fetch(`${API_BASE}/jobs/${jobId}/details/`, {
+            credentials: 'include'
+        });
+
+        if (!response.ok) {
+            throw new Error('Failed to fetch job details');
+        }
+
+        const job = await response.json();
+
+        // Generate organizer invoice HTML
+        generateOrganizerInvoiceHTML(job, currentUser);
+
+    } catch (error) {
+        console.error('Error generating organizer invoice:', error);
+        showToast('Failed to generate invoice', 'error');
+    }
+};
+
+function generateOrganizerInvoiceHTML(job, user) {
+    const invoiceNumber = `INV-ORG-${String(job.id).padStart(6, '0')}`;
+    const invoiceDate = new Date().toLocaleDateString('en-IN', {
+        year: 'numeric',
+        month: 'long',
+        day: 'numeric'
+    });
+    const eventDate = new Date(job.date).toLocaleDateString('en-IN', {
+        year: 'numeric',
+        month: 'long',
+        day: 'numeric'
+    });
+
+    // Calculate total payment to staff
+    const hiredStaff = job.hired_staff || [];
+    const totalStaffPayment = hiredStaff.length * parseFloat(job.pay_rate);
+    const platformFee = 0; // No platform fee for demo
+    const tax = 0; // No tax for demo
+    const grandTotal = totalStaffPayment + platformFee + tax;
+
+    // Create invoice HTML
+    const invoiceHTML = `
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Invoice ${invoiceNumber}</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            padding: 40px;
+            background: #f5f5f5;
+        }
+        .invoice-container {
+            max-width: 800px;
+            margin: 0 auto;
+            background: white;
+            padding: 40px;
+            box-shadow: 0 0 20px rgba(0,0,0,0.1);
+        }
+        .header {
+            display: flex;
+            justify-content: space-between;
+            align-items: start;
+            border-bottom: 3px solid #DAA520;
+            padding-bottom: 20px;
+            margin-bottom: 30px;
+        }
+        .logo {
+            font-size: 32px;
+            font-weight: bold;
+            color: #DAA520;
+        }
+        .invoice-title {
+            text-align: right;
+        }
+        .invoice-title h1 {
+            color: #333;
+            font-size: 28px;
+            margin-bottom: 5px;
+        }
+        .invoice-title .invoice-number {
+            color: #666;
+            font-size: 14px;
+        }
+        .info-section {
+            display: flex;
+            justify-content: space-between;
+            margin-bottom: 30px;
+        }
+        .info-box {
+            flex: 1;
+        }
+        .info-box h3 {
+            color: #DAA520;
+            font-size: 12px;
+            text-transform: uppercase;
+            margin-bottom: 10px;
+            letter-spacing: 1px;
+        }
+        .info-box p {
+            color: #333;
+            line-height: 1.6;
+            font-size: 14px;
+        }
+        .info-box p strong {
+            display: inline-block;
+            width: 80px;
+        }
+        .items-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-bottom: 30px;
+        }
+        .items-table th {
+            background: #DAA520;
+            color: white;
+            padding: 12px;
+            text-align: left;
+            font-weight: 600;
+            font-size: 13px;
+            text-transform: uppercase;
+        }
+        .items-table td {
+            padding: 15px 12px;
+            border-bottom: 1px solid #e0e0e0;
+            color: #333;
+            font-size: 14px;
+        }
+        .items-table tr:last-child td {
+            border-bottom: 2px solid #DAA520;
+        }
+        .totals {
+            margin-left: auto;
+            width: 300px;
+        }
+        .total-row {
+            display: flex;
+            justify-content: space-between;
+            padding: 8px 0;
+            font-size: 14px;
+        }
+        .total-row.grand-total {
+            border-top: 2px solid #DAA520;
+            margin-top: 10px;
+            padding-top: 15px;
+            font-size: 18px;
+            font-weight: bold;
+            color: #DAA520;
+        }
+        .footer {
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 1px solid #e0e0e0;
+            text-align: center;
+            color: #666;
+            font-size: 12px;
+        }
+        .payment-status {
+            display: inline-block;
+            padding: 6px 15px;
+            background: #ef4444;
+            color: white;
+            border-radius: 20px;
+            font-size: 12px;
+            font-weight: 600;
+            margin-top: 10px;
+        }
+        .notes {
+            background: #f9f9f9;
+            padding: 20px;
+            border-left: 4px solid #DAA520;
+            margin: 20px 0;
+            font-size: 13px;
+            color: #666;
+        }
+        @media print {
+            body { padding: 0; background: white; }
+            .no-print { display: none; }
+        }
+        .print-button {
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            padding: 12px 24px;
+            background: #DAA520;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            cursor: pointer;
+            font-size: 14px;
+            font-weight: 600;
+            box-shadow: 0 2px 10px rgba(218, 165, 32, 0.3);
+        }
+        .print-button:hover {
+            background: #c79400;
+        }
+    </style>
+</head>
+<body>
+    <button class="print-button no-print" onclick="window.print()">
+        🖨️ Print / Download PDF
+    </button>
+    
+    <div class="invoice-container">
+        <div class="header">
+            <div class="logo">
+                ✨ EventFlex
+            </div>
+            <div class="invoice-title">
+                <h1>PAYMENT INVOICE</h1>
+                <p class="invoice-number">${invoiceNumber}</p>
+                <p class="invoice-number">Date: ${invoiceDate}</p>
+            </div>
+        </div>
+
+        <div class="info-section">
+            <div class="info-box">
+                <h3>Billed From</h3>
+                <p><strong>Company:</strong> ${escapeHtml(user.username)}</p>
+                <p><strong>Email:</strong> ${escapeHtml(user.email || 'N/A')}</p>
+                <p><strong>Phone:</strong> ${escapeHtml(user.phone || 'N/A')}</p>
+                <p><strong>City:</strong> ${escapeHtml(user.city || 'N/A')}</p>
+            </div>
+            <div class="info-box">
+                <h3>Payment Summary</h3>
+                <p><strong>Event ID:</strong> #${job.id}</p>
+                <p><strong>Event Date:</strong> ${eventDate}</p>
+                <p><strong>Staff Hired:</strong> ${hiredStaff.length}</p>
+                <p><strong>Status:</strong> <span style="color: #10b981;">Completed</span></p>
+            </div>
+        </div>
+
+        <div class="notes">
+            <strong>📋 Event Details:</strong><br>
+            <strong>Event Name:</strong> ${escapeHtml(job.title)}<br>
+            <strong>Event Date:</strong> ${eventDate}<br>
+            <strong>Location:</strong> ${escapeHtml(job.location)}<br>
+            <strong>Role Required:</strong> ${escapeHtml(job.role)}<br>
+            <strong>Time:</strong> ${job.start_time || 'TBD'} - ${job.end_time || 'TBD'}
+        </div>
+
+        <table class="items-table">
+            <thead>
+                <tr>
+                    <th>Staff Member</th>
+                    <th>Role</th>
+                    <th style="text-align: center;">Quantity</th>
+                    <th style="text-align: right;">Rate</th>
+                    <th style="text-align: right;">Amount</th>
+                </tr>
+            </thead>
+            <tbody>
+                ${hiredStaff.map(staff => `
+                    <tr>
+                        <td>
+                            <strong>${escapeHtml(staff.name || 'Staff Member')}</strong><br>
+                            <small style="color: #666;">${escapeHtml(staff.email || '')}</small>
+                        </td>
+                        <td>${escapeHtml(job.role)}</td>
+                        <td style="text-align: center;">1</td>
+                        <td style="text-align: right;">₹${formatNumber(job.pay_rate)}</td>
+                        <td style="text-align: right;">₹${formatNumber(job.pay_rate)}</td>
+                    </tr>
+                `).join('')}
+            </tbody>
+        </table>
+
+        <div class="totals">
+            <div class="total-row">
+                <span>Subtotal:</span>
+                <span>₹${formatNumber(totalStaffPayment)}</span>
+            </div>
+            <div class="total-row">
+                <span>Platform Fee:</span>
+                <span>₹${formatNumber(platformFee)}</span>
+            </div>
+            <div class="total-row">
+                <span>Tax (GST):</span>
+                <span>₹${formatNumber(tax)}</span>
+            </div>
+            <div class="total-row grand-total">
+                <span>TOTAL PAID:</span>
+                <span>₹${formatNumber(grandTotal)}</span>
+            </div>
+        </div>
+
+        <div style="text-align: center;">
+            <span class="payment-status">✓ PAYMENT RELEASED</span>
+        </div>
+
+        <div class="footer">
+            <p><strong>EventFlex - Your Event Staffing Partner</strong></p>
+            <p>This invoice confirms payment release to hired staff for completed event.</p>
+            <p style="margin-top: 10px;">This is a computer-generated invoice and does not require a signature.</p>
+        </div>
+    </div>
+</body>
+</html>`;
+
+    // Open invoice in new window
+    const invoiceWindow = window.open('', '_blank');
+    invoiceWindow.document.write(invoiceHTML);
+    invoiceWindow.document.close();
+
+    showToast('Invoice generated successfully! You can now print or save as PDF.', 'success');
+}
@@ -0,0 +1,199 @@
+// EventFlex - "Current Location" button of the job form (loaded on first click)
+import {
+    showToast,
+} from 'eventflex/core';
+
+const getCurrentLocationBtn = document.getElementById('get-current-location-btn');
+const locationInput = document.getElementById('job-location-input');
+
+async function reverseGeocode(latitude, longitude) {
+    try {
+
+        try {
+            const bdcResponse = await fetch(
+                `https://api.bigdatacloud.net/data/reverse-geocode-client?latitude=${latitude}&longitude=${longitude}&localityLanguage=en`
+            );
+
+            if (bdcResponse.ok) {
+                const bdcData = await bdcResponse.json();
+
+                let formattedAddress = '';
+
+                if (bdcData.locality) {
+                    formattedAddress += bdcData.locality;
+                }
+                if (bdcData.city && bdcData.city !== bdcData.locality) {
+                    formattedAddress += (formattedAddress ? ', ' : '') + bdcData.city;
+                }
+                if (bdcData.principalSubdivision) {
+                    formattedAddress += (formattedAddress ? ', ' : '') + bdcData.principalSubdivision;
+                }
+                if (bdcData.countryName) {
+                    formattedAddress += (formattedAddress ? ', ' : '') + bdcData.countryName;
+                }
+
+                if (formattedAddress) {
+                    console.log('BigDataCloud address:', formattedAddress);
+                    return formattedAddress;
+                }
+            }
+        } catch (bdcError) {
+            console.log('BigDataCloud failed, trying OpenStreetMap...');
+        }
+
+        const osmResponse = await fetch(
+            `https://nominatim.openstreetmap.org/reverse?format=json&lat=${latitude}&lon=${longitude}&zoom=18&addressdetails=1`,
+            {
+                headers: {
+                    'User-Agent': 'EventFlex-App/1.0'
+                }
+            }
+        );
+
+        if (!osmResponse.ok) {
+            throw new Error('Geocoding service unavailable');
+        }
+
+        const osmData = await osmResponse.json();
+        const address = osmData.address;
+
+        let formattedAddress = '';
+
+        if (address.amenity || address.building) {
+            formattedAddress += (address.amenity || address.building) + ', ';
+        }
+
+        if (address.suburb || address.neighbourhood) {
+            formattedAddress += (address.suburb || address.neighbourhood) + ', ';
+        }
+
+        const cityName = address.city || address.town || address.village || address.municipality;
+        if (cityName) {
+            formattedAddress += cityName + ', ';
+        }
+
+        if (address.state || address.province) {
+            formattedAddress += (address.state || address.province) + ', ';
+        }
+
+        if (address.country) {
+            formattedAddress += address.country;
+        }
+
+        formattedAddress = formattedAddress.replace(/,\s*$/, '').replace(/,\s*,/g, ',').trim();
+
+        if (formattedAddress) {
+            console.log('OpenStreetMap address:', formattedAddress);
+            return formattedAddress;
+        }
+
+        return osmData.display_name;
+
+    } catch (error) {
+        console.error('Reverse geocoding error:', error);
+
+        try {
+            const geoResponse = await fetch(
+                `https://geocode.xyz/${latitude},${longitude}?json=1`
+            );
+
+            if (geoResponse.ok) {
+                const geoData = await geoResponse.json();
+                if (geoData.city && geoData.country) {
+                    const fallbackAddress = `${geoData.city}, ${geoData.state || geoData.region || ''}, ${geoData.country}`.replace(/,\s*,/g, ',').trim();
+                    console.log('Geocode.xyz address:', fallbackAddress);
+                    return fallbackAddress;
+                }
+            }
+        } catch (fallbackError) {
+            console.log('All geocoding services failed');
+        }
+
+        return `Lat: ${latitude.toFixed(6)}, Long: ${longitude.toFixed(6)}`;
+    }
+}
+
+// Click handler of the button (organizer.js checks that both elements exist)
+export async function fillCurrentLocation() {
+    if (!navigator.geolocation) {
+        showToast('Geolocation is not supported by your browser', 'error');
+        return;
+    }
+
+    getCurrentLocationBtn.disabled = true;
+    getCurrentLocationBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Getting Location...';
+
+    try {
+        console.log('🔍 Requesting GPS location...');
+
+        const position = await new Promise((resolve, reject) => {
+            navigator.geolocation.getCurrentPosition(resolve, reject, {
+                enableHighAccuracy: true,  // Use GPS if available
+                timeout: 20000,            // Wait up to 20 seconds
+                maximumAge: 0              // Don't use cached position
+            });
+        });
+
+        const { latitude, longitude, accuracy } = position.coords;
+        console.log(`📍 Location: ${latitude}, ${longitude} (accuracy: ${accuracy}m)`);
+
+        getCurrentLocationBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Finding Address...';
+
+        const address = await reverseGeocode(latitude, longitude);
+        console.log(`✅ Address: ${address}`);
+
+        locationInput.value = address;
+        locationInput.focus();
+
+        locationInput.dispatchEvent(new Event('input', { bubbles: true }));
+
+        setTimeout(() => {
+            if (address && address.length > 3) {
+                fetch('/api/autocomplete/save/', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    },
+                    credentials: 'include',
+                    body: JSON.stringify({
+                        field_type: 'location',
+                        value: address
+                    })
+                }).catch(err => console.error('Failed to save location suggestion:', err));
+            }
+        }, 500);
+
+        if (accuracy <= 100) {
+            showToast('📍 Location detected successfully!', 'success');
+        } else {
+            showToast(`📍 Location detected (${Math.round(accuracy)}m accuracy)`, 'success');
+        }
+
+    } catch (error) {
+        console.error('❌ Location error:', error);
+
+        let errorMessage = 'Unable to get location';
+
+        if (error.code) {
+            switch (error.code) {
+                case error.PERMISSION_DENIED:
+                    errorMessage = 'Location access denied. Please allow location in browser settings.';
+                    break;
+                case error.POSITION_UNAVAILABLE:
+                    errorMessage = 'Location unavailable. Please enable GPS/Location services.';
+                    break;
+                case error.TIMEOUT:
+                    errorMessage = 'Location request timed out. Please try again.';
+                    break;
+                default:
+                    errorMessage = 'Error getting location. Please try again.';
+            }
+        }
+
+        showToast(errorMessage, 'error');
+
+    } finally {
+        getCurrentLocationBtn.disabled = false;
+        getCurrentLocationBtn.innerHTML = '<i class="fas fa-crosshairs"></i> Current Location';
+    }
+}
@@ -0,0 +1,364 @@
+// EventFlex - messages section (conversation list and chat panel).
+// Loaded by dashboard.js when the section is first opened.
+import {
+    API_BASE,
+    currentUser,
+    escapeHtml,
+    getTimeAgo,
+    showToast,
+} from 'eventflex/core';
+
+export async function loadMessages() {
+    // This function now loads conversations list
+    await loadConversations();
+}
+
+let currentChatPartner = null;
+let messagePollingInterval = null;
+
+// Message Polling Strategy:
+// - Poll every 15 seconds (reduced from 5s to minimize server load)
+// - Only poll when tab is visible (using document.hidden check)
+// - Stop polling when leaving messages section
+// - Immediate refresh when sending a message
+// This balances real-time updates with server resource efficiency
+
+export async function loadConversations() {
+    try {
+        const res = await fetch(`${API_BASE}/messages/conversations/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) {
+            console.error('Failed to load conversations');
+            return;
+        }
+
+        const data = await res.json();
+        renderConversations(data.conversations || []);
+    } catch (err) {
+        console.error('Failed to load conversations:', err);
+    }
+}
+
+function renderConversations(conversations) {
+    const container = document.getElementById('conversation-list');
+    if (!container) return;
+
+    if (conversations.length === 0) {
+        container.innerHTML = `
+                <p class="empty-state" style="padding: 2rem; text-align: center; color: #999;">
+                    <i class="fas fa-comments" style="font-size: 3rem; margin-bottom: 1rem; display: block;"></i>
+                    No messages yet
+                </p>
+            `;
+
+        // Hide chat area and show no-chat-selected message
+        const chatArea = document.getElementById('chat-area');
+        const noChatSelected = document.getElementById('no-chat-selected');
+        if (chatArea) chatArea.style.display = 'none';
+        if (noChatSelected) noChatSelected.style.display = 'flex';
+        return;
+    }
+
+    container.innerHTML = conversations.map((conv, index) => {
+        const partner = conv.partner;
+        const avatarUrl = partner.profile_picture || `https://ui-avatars.com/api/?name=${encodeURIComponent(partner.username)}&background=${index % 2 === 0 ? '6366f1' : '10b981'}&color=fff`;
+        const isActive = currentChatPartner && currentChatPartner.id === partner.id;
+
+        return `
+                <div class="conversation-item ${isActive ? 'active' : ''}" onclick="selectConversation(${partner.id}, '${escapeHtml(partner.username)}', '${avatarUrl}')" data-partner-id="${partner.id}">
+                    <img src="${avatarUrl}" alt="${escapeHtml(partner.username)}">
+                    <div class="conversation-info">
+                        <h4>${escapeHtml(partner.username)}</h4>
+                        <p>${escapeHtml(conv.last_message || 'No messages yet')}</p>
+                    </div>
+                    <span class="time">${conv.last_message_time ? getTimeAgo(conv.last_message_time) : ''}</span>
+                </div>
+            `;
+    }).join('');
+}
+
+window.selectConversation = async function (partnerId, partnerName, avatarUrl) {
+    currentChatPartner = { id: partnerId, username: partnerName, avatar: avatarUrl };
+
+    // Update active conversation
+    document.querySelectorAll('.conversation-item').forEach(item => {
+        item.classList.remove('active');
+    });
+    document.querySelector(`.conversation-item[data-partner-id="${partnerId}"]`)?.classList.add('active');
+
+    // Show chat area and hide no-chat-selected
+    const chatArea = document.getElementById('chat-area');
+    const noChatSelected = document.getElementById('no-chat-selected');
+    if (chatArea) chatArea.style.display = 'flex';
+    if (noChatSelected) noChatSelected.style.display = 'none';
+
+    // Update chat header
+    const chatOrganizerAvatar = document.getElementById('chat-organizer-avatar');
+    const chatOrganizerName = document.getElementById('chat-organizer-name');
+    if (chatOrganizerAvatar) chatOrganizerAvatar.src = avatarUrl;
+    if (chatOrganizerName) chatOrganizerName.textContent = partnerName;
+
+    // Load messages for this conversation
+    await loadChatMessages(partnerId);
+
+    // Start polling for new messages (optimized interval)
+    if (messagePollingInterval) {
+        clearInterval(messagePollingInterval);
+    }
+    // Poll every 15 seconds instead of 5 to reduce server load
+    messagePollingInterval = setInterval(() => {
+        // Only poll if the page is visible
+        if (!document.hidden) {
+            loadChatMessages(partnerId, true);
+        }
+    }, 15000);
+};
+
+window.openChat = async function (partnerId, partnerName, avatarUrl) {
+    // Use selectConversation for consistency
+    await selectConversation(partnerId, partnerName, avatarUrl);
+};
+
+async function loadChatMessages(partnerId, silent = false) {
+    try {
+        const res = await fetch(`${API_BASE}/messages/?partner_id=${partnerId}`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) return;
+
+        const data = await res.json();
+        renderChatMessages(data.results || [], silent);
+    } catch (err) {
+        if (!silent) {
+            console.error('Failed to load chat messages:', err);
+        }
+    }
+}
+
+function renderChatMessages(messages, silent = false) {
+    const container = document.getElementById('messages-display');
+    if (!container) return;
+
+    if (messages.length === 0) {
+        container.innerHTML = '<p class="empty-state">No messages yet. Start the conversation!</p>';
+        return;
+    }
+
+    const previousScrollHeight = container.scrollHeight;
+    const wasScrolledToBottom = container.scrollHeight - container.clientHeight <= container.scrollTop + 100;
+
+    container.innerHTML = messages.map(msg => {
+        const isSent = currentUser && msg.sender.id === currentUser.id;
+        return `
+                <div class="message ${isSent ? 'sent' : 'received'}">
+                    <p>${escapeHtml(msg.text)}</p>
+                    <span class="time">${formatTime(msg.created_at)}</span>
+                </div>
+            `;
+    }).join('');
+
+    // Auto-scroll to bottom if user was already at bottom or if this is the first load
+    if (wasScrolledToBottom || !silent) {
+        container.scrollTop = container.scrollHeight;
+    }
+}
+function formatTime(isoString) {
+    const date = new Date(isoString);
+    const now = new Date();
+    const diffMs = now - date;
+    const diffMins = Math.floor(diffMs / 60000);
+
+    if (diffMins < 1) return 'Just now';
+    if (diffMins < 60) return `${diffMins}m ago`;
+
+    const diffHours = Math.floor(diffMins / 60);
+    if (diffHours < 24) return `${diffHours}h ago`;
+
+    return date.toLocaleTimeString('en-US', { hour: '2-digit', minute: '2-digit' });
+}
+
+// Send message function
+window.sendMessage = async function () {
+    const messageInput = document.getElementById('message-input');
+    if (!messageInput) return;
+
+    const text = messageInput.value.trim();
+    if (!text || !currentChatPartner) {
+        if (!currentChatPartner) {
+            showToast('Please select a conversation first', 'warning');
+        }
+        return;
+    }
+
+    if (!currentUser) {
+        showToast('Please log in to send messages', 'warning');
+        return;
+    }
+
+    try {
+        const res = await fetch(`${API_BASE}/messages/send/`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            credentials: 'include',
+            body: JSON.stringify({
+                recipient_id: currentChatPartner.id,
+                message: text
+            })
+        });
+
+        if (res.ok) {
+            messageInput.value = '';
+            await loadChatMessages(currentChatPartner.id);
+            await loadConversations();
+        } else {
+            const data = await res.json();
+            showToast(data.error || 'Failed to send message', 'error');
+        }
+    } catch (err) {
+        console.error('Failed to send message:', err);
+        showToast('Failed to send message', 'error');
+    }
+};
+
+// Initialize chat input functionality
+function initChatInput() {
+    const chatInput = document.getElementById('message-input');
+    const chatButton = document.querySelector('.chat-input button');
+
+    if (!chatInput || !chatButton) return;
+
+    // Handle Enter key
+    chatInput.addEventListener('keypress', (e) => {
+        if (e.key === 'Enter' && !e.shiftKey) {
+            e.preventDefault();
+            sendMessage();
+        }
+    });
+
+    // Button is already wired via onclick in HTML
+}
+
+// Call initChatInput when DOM is ready
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', initChatInput);
+} else {
+    initChatInput();
+}
+
+// Initialize chat input functionality (OLD - for backward compatibility)
+function initChatInputOld() {
+    const chatInput = document.querySelector('.chat-input input');
+    const chatButton = document.querySelector('.chat-input button');
+
+    if (!chatInput || !chatButton) return;
+
+    const sendMessage = async () => {
+        const text = chatInput.value.trim();
+        if (!text || !currentChatPartner) {
+            if (!currentChatPartner) {
+                showToast('Please select a conversation first', 'warning');
+            }
+            return;
+        }
+
+        if (!currentUser) {
+            showToast('Please log in to send messages', 'warning');
+            return;
+        }
+
+        try {
+            const res = await fetch(`${API_BASE}/messages/send/`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                credentials: 'include',
+                body: JSON.stringify({
+                    recipient_id: currentChatPartner.id,
+                    message: text
+                })
+            });
+
+            if (!res.ok) {
+                const data = await res.json();
+                showToast(data.error || 'Failed to send message', 'error');
+                return;
+            }
+
+            chatInput.value = '';
+
+            // Immediately reload messages to show the sent message
+            await loadChatMessages(currentChatPartner.id);
+
+            // Also reload conversations to update last message
+            await loadConversations();
+
+        } catch (err) {
+            console.error('Error sending message:', err);
+            showToast('Failed to send message', 'error');
+        }
+    };
+
+    chatButton.addEventListener('click', (event) => {
+        event.preventDefault();
+        sendMessage();
+    });
+
+    chatInput.addEventListener('keydown', (event) => {
+        if (event.key === 'Enter' && !event.shiftKey) {
+            event.preventDefault();
+            sendMessage();
+        }
+    });
+}
+
+// Initialize chat functionality when page loads
+if (document.querySelector('.chat-input')) {
+    initChatInput();
+}
+
+// Initialize conversation search
+function initConversationSearch() {
+    const searchInput = document.querySelector('.message-search input');
+    if (!searchInput) return;
+
+    searchInput.addEventListener('input', (e) => {
+        const searchTerm = e.target.value.toLowerCase().trim();
+        const conversations = document.querySelectorAll('.conversation-item');
+
+        conversations.forEach(conv => {
+            const name = conv.querySelector('h4')?.textContent.toLowerCase() || '';
+            const message = conv.querySelector('p')?.textContent.toLowerCase() || '';
+
+            if (name.includes(searchTerm) || message.includes(searchTerm)) {
+                conv.style.display = '';
+            } else {
+                conv.style.display = 'none';
+            }
+        });
+    });
+}
+
+// Initialize search when conversations are loaded
+setTimeout(initConversationSearch, 1000);
+
+// Clean up polling when leaving messages section
+window.addEventListener('hashchange', () => {
+    if (!window.location.hash.includes('messages') && messagePollingInterval) {
+        clearInterval(messagePollingInterval);
+        messagePollingInterval = null;
+        currentChatPartner = null;
+    }
+});
+
+// Pause polling when tab is hidden, resume when visible
+document.addEventListener('visibilitychange', () => {
+    if (document.hidden && messagePollingInterval) {
+        // Don't stop completely, just let the interval handle it
+        console.log('Tab hidden - polling will pause automatically');
+    } else if (!document.hidden && currentChatPartner && window.location.hash.includes('messages')) {
+        // Tab visible again - force immediate refresh
+        loadChatMessages(currentChatPartner.id, true);
+    }
+});
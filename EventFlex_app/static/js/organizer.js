@@ -0,0 +1,1141 @@
+// EventFlex - organizer dashboard: jobs, talent discovery and applications
+import {
+    API_BASE,
+    currentUser,
+    escapeHtml,
+    formatDate,
+    loadFeature,
+    onPageReady,
+    registerLazyGlobals,
+    showToast,
+} from 'eventflex/core';
+import {
+    finishDashboardLoad,
+    getSkillTagLabel,
+    initDashboard,
+} from 'eventflex/dashboard';
+import {
+    initOrganizerPhotoUpload,
+    loadProfileData,
+} from 'eventflex/profile';
+import {
+    loadOrganizerWalletStats,
+    loadWalletStats,
+} from 'eventflex/wallet';
+
+export async function loadDashboardStats() {
+    try {
+        const res = await fetch(`${API_BASE}/jobs/my/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) return;
+
+        const data = await res.json();
+        const jobs = data.results || [];
+
+        const activeJobs = jobs.length;
+
+        const appsRes = await fetch(`${API_BASE}/applications/`, {
+            credentials: 'include'
+        });
+        let hiredStaff = 0;
+        let totalSpent = 0;
+
+        if (appsRes.ok) {
+            const appsData = await appsRes.json();
+            hiredStaff = (appsData.results || []).filter(app => app.status === 'accepted').length;
+
+            (appsData.results || []).filter(app => app.status === 'accepted').forEach(app => {
+                totalSpent += parseFloat(app.job.pay_rate || 0);
+            });
+        }
+
+        const now = new Date();
+        const upcomingEvents = jobs.filter(job => {
+            if (!job.date) return false;
+            const jobDate = new Date(job.date);
+            return jobDate >= now;
+        }).length;
+
+        document.getElementById('stat-active-jobs').textContent = activeJobs;
+        document.getElementById('stat-hired-staff').textContent = hiredStaff;
+        document.getElementById('stat-upcoming-events').textContent = upcomingEvents;
+        document.getElementById('stat-total-spent').textContent = `₹${(totalSpent / 1000).toFixed(1)}K`;
+
+    } catch (err) {
+        console.error('Failed to load dashboard stats:', err);
+    }
+}
+
+// Make globally accessible for event handlers
+window.loadDashboardStats = loadDashboardStats;
+
+export async function loadUpcomingEvents() {
+    try {
+        const res = await fetch(`${API_BASE}/jobs/my/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) return;
+
+        const data = await res.json();
+        const jobs = data.results || [];
+
+        const now = new Date();
+        const upcoming = jobs.filter(job => {
+            if (!job.date) return false;
+            const jobDate = new Date(job.date);
+            return jobDate >= now;
+        }).slice(0, 3);
+
+        renderUpcomingEvents(upcoming);
+    } catch (err) {
+        console.error('Failed to load upcoming events:', err);
+    }
+}
+
+function renderUpcomingEvents(events) {
+    const container = document.getElementById('upcoming-events-list');
+    if (!container) return;
+
+    if (events.length === 0) {
+        container.innerHTML = '<p class="empty-state">No upcoming events scheduled.</p>';
+        return;
+    }
+
+    container.innerHTML = events.map(job => {
+        const date = new Date(job.date);
+        const day = date.getDate();
+        const month = date.toLocaleDateString('en-US', { month: 'short' });
+
+        return `
+                <div class="event-item">
+                    <div class="event-date">
+                        <span class="day">${day}</span>
+                        <span class="month">${month}</span>
+                    </div>
+                    <div class="event-details">
+                        <h4>${escapeHtml(job.title)}</h4>
+                        <p><i class="fas fa-map-marker-alt"></i> ${escapeHtml(job.location)}</p>
+                        <p><i class="fas fa-users"></i> ${job.number_of_staff} Staff Needed</p>
+                    </div>
+                    <span class="status-badge pending">Active</span>
+                </div>
+            `;
+    }).join('');
+}
+
+export async function loadRecentApplications() {
+    try {
+        const res = await fetch(`${API_BASE}/applications/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) return;
+
+        const data = await res.json();
+        const applications = (data.results || []).filter(app => app.status === 'pending').slice(0, 3);
+
+        renderRecentApplications(applications);
+    } catch (err) {
+        console.error('Failed to load recent applications:', err);
+    }
+}
+
+function renderRecentApplications(applications) {
+    const container = document.getElementById('recent-applications-list');
+    if (!container) return;
+
+    if (applications.length === 0) {
+        container.innerHTML = '<p class="empty-state">No pending applications.</p>';
+        return;
+    }
+
+    container.innerHTML = applications.map(app => {
+        const avatarUrl = `https://ui-avatars.com/api/?name=${encodeURIComponent(app.applicant.username)}&background=6366f1&color=fff`;
+        const badge = app.applicant.badge || '';
+        const fullName = app.full_name || app.applicant.username;
+
+        let ratingHTML = '';
+        if (app.ai_rating !== null && app.ai_rating !== undefined) {
+            const fullStars = Math.floor(app.ai_rating);
+            const hasHalfStar = (app.ai_rating % 1) >= 0.5;
+            const emptyStars = 5 - fullStars - (hasHalfStar ? 1 : 0);
+
+            ratingHTML = '<div style="display: flex; align-items: center; gap: 0.5rem; margin-top: 0.25rem;">';
+            ratingHTML += '<span style="color: #FFD700; font-size: 0.9rem;">';
+            for (let i = 0; i < fullStars; i++) {
+                ratingHTML += '<i class="fas fa-star"></i>';
+            }
+            if (hasHalfStar) {
+                ratingHTML += '<i class="fas fa-star-half-alt"></i>';
+            }
+            for (let i = 0; i < emptyStars; i++) {
+                ratingHTML += '<i class="far fa-star"></i>';
+            }
+            ratingHTML += '</span>';
+            ratingHTML += `<span style="font-size: 0.85rem; color: #888;">${app.ai_rating.toFixed(1)}/5</span>`;
+            ratingHTML += '</div>';
+        }
+
+        return `
+                <div class="application-item">
+                    <img src="${avatarUrl}" alt="${escapeHtml(app.applicant.username)}">
+                    <div class="application-details">
+                        <h4>${escapeHtml(fullName)}</h4>
+                        <p>${escapeHtml(app.job.role)}</p>
+                        ${badge ? `<span class="badge-pro">${escapeHtml(badge)}</span>` : ''}
+                        ${ratingHTML}
+                    </div>
+                    <div class="application-actions">
+                        <button class="btn-sm btn-primary" onclick="viewApplicationDetail(${app.id})" style="margin-right: 0.5rem;">
+                            <i class="fas fa-eye"></i> View Details
+                        </button>
+                    </div>
+                </div>
+            `;
+    }).join('');
+}
+
+window.updateApplicationStatus = async function (appId, status) {
+    try {
+        const res = await fetch(`${API_BASE}/applications/${appId}/status/`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ status }),
+            credentials: 'include',
+        });
+
+        if (res.ok) {
+            showToast(`Application ${status}!`, 'success');
+            await loadRecentApplications();
+            await loadDashboardStats();
+        } else {
+            showToast('Failed to update application', 'error');
+        }
+    } catch (err) {
+        console.error('Error updating application:', err);
+        showToast('Error updating application', 'error');
+    }
+};
+
+async function loadTalentGrid() {
+    try {
+        const res = await fetch(`${API_BASE}/talent/`);
+        const data = await res.json();
+        renderTalentGrid(data.results || []);
+    } catch (err) {
+        console.error('Failed to load talent:', err);
+    }
+}
+
+function renderTalentGrid(talents) {
+    const container = document.getElementById('talentGrid');
+    if (!container) return;
+
+    if (talents.length === 0) {
+        container.innerHTML = '<p class="empty-state">No talent profiles found.</p>';
+        return;
+    }
+
+    container.innerHTML = talents.map(talent => `
+            <div class="talent-card">
+                <div class="talent-avatar">
+                    <i class="fas fa-user-circle"></i>
+                </div>
+                <h3>${escapeHtml(talent.username)}</h3>
+                <p class="talent-city"><i class="fas fa-map-marker-alt"></i> ${escapeHtml(talent.city)}</p>
+                ${talent.badge ? `<span class="badge badge-pro">${escapeHtml(talent.badge)}</span>` : ''}
+                <p class="talent-bio">${escapeHtml(talent.bio || 'No bio available')}</p>
+                <div class="talent-verification">
+                    ${talent.kyc_verified ? '<span class="verified"><i class="fas fa-check-circle"></i> KYC</span>' : ''}
+                    ${talent.video_verified ? '<span class="verified"><i class="fas fa-video"></i> Video</span>' : ''}
+                </div>
+                <button class="btn-secondary" data-profile-id="${talent.id}">View Profile</button>
+            </div>
+        `).join('');
+}
+
+export async function loadOrganizerTalentGrid() {
+    try {
+        const res = await fetch(`${API_BASE}/talent/`);
+        const data = await res.json();
+        renderOrganizerTalentGrid(data.results || []);
+    } catch (err) {
+        console.error('Failed to load talent:', err);
+    }
+}
+
+function renderOrganizerTalentGrid(talents) {
+    const container = document.getElementById('talent-grid-organizer');
+    if (!container) return;
+
+    if (talents.length === 0) {
+        container.innerHTML = '<p class="empty-state">No talent profiles found.</p>';
+        return;
+    }
+
+    container.innerHTML = talents.map(talent => {
+        const skills = talent.bio ? talent.bio.split(',').slice(0, 3) : [];
+        const rating = talent.rating || 4.5;
+        const stars = '★'.repeat(Math.floor(rating)) + (rating % 1 >= 0.5 ? '★' : '☆').repeat(5 - Math.ceil(rating));
+        const completedEvents = talent.events_completed || 0;
+        const badgeClass = talent.badge === 'Elite Pro' ? 'elite' : talent.badge === 'Pro' ? 'pro' : 'rising';
+        const firstName = talent.first_name || talent.username.split(' ')[0];
+        const lastName = talent.last_name || talent.username.split(' ')[1] || '';
+        const fullName = `${firstName} ${lastName}`.trim();
+
+        return `
+                <div class="talent-card">
+                    <div class="talent-header">
+                        <img src="https://ui-avatars.com/api/?name=${encodeURIComponent(fullName)}&background=6366f1&color=fff" alt="${escapeHtml(fullName)}">
+                        ${talent.badge ? `<div class="talent-badge ${badgeClass}">${escapeHtml(talent.badge)}</div>` : ''}
+                    </div>
+                    <h3>${escapeHtml(fullName)}</h3>
+                    <p class="talent-role">${escapeHtml(talent.bio ? talent.bio.split(',')[0] : 'Event Professional')}</p>
+                    <div class="talent-rating">
+                        <span class="stars">${stars}</span>
+                        <span>${rating.toFixed(1)} (${completedEvents} reviews)</span>
+                    </div>
+                    ${skills.length > 0 ? `
+                    <div class="talent-skills">
+                        ${skills.map(skill => `<span>${escapeHtml(skill.trim())}</span>`).join('')}
+                    </div>
+                    ` : ''}
+                    <div class="talent-info">
+                        <p><i class="fas fa-map-marker-alt"></i> ${escapeHtml(talent.city || 'India')}</p>
+                        <p><i class="fas fa-briefcase"></i> ${completedEvents} Events</p>
+                        <p><i class="fas fa-rupee-sign"></i> ₹${talent.expected_pay || 2000}/day</p>
+                    </div>
+                    <div class="talent-actions">
+                        <button class="btn-outline view-profile-btn" data-profile-id="${talent.id}">
+                            <i class="fas fa-eye"></i> View
+                        </button>
+                        <button class="btn-success" onclick="openChatModal(${talent.user_id || talent.id}, '${escapeHtml(fullName)}', 'https://ui-avatars.com/api/?name=${encodeURIComponent(fullName)}&background=6366f1&color=fff')">
+                            <i class="fas fa-comment"></i> Message
+                        </button>
+                        <button class="btn-primary hire-talent-btn" data-talent-id="${talent.id}" data-talent-name="${escapeHtml(fullName)}">
+                            <i class="fas fa-user-plus"></i> Hire
+                        </button>
+                    </div>
+                </div>
+            `;
+    }).join('');
+
+    setupTalentFilters();
+}
+
+function setupTalentFilters() {
+    const searchInput = document.getElementById('talent-search-input');
+    const skillsFilter = document.getElementById('filter-talent-skills');
+    const ratingFilter = document.getElementById('filter-talent-rating');
+    const badgeFilter = document.getElementById('filter-talent-badge');
+
+    if (!searchInput) return;
+
+    const filterTalent = () => {
+        const searchTerm = searchInput.value.toLowerCase();
+        const skills = skillsFilter?.value.toLowerCase();
+        const rating = ratingFilter?.value;
+        const badge = badgeFilter?.value;
+
+        const talentCards = document.querySelectorAll('.talent-card');
+
+        talentCards.forEach(card => {
+            const text = card.textContent.toLowerCase();
+            const cardRating = parseFloat(card.querySelector('.talent-rating span:last-child')?.textContent || '0');
+            const cardBadge = card.querySelector('.talent-badge')?.textContent || '';
+
+            let show = true;
+
+            if (searchTerm && !text.includes(searchTerm)) {
+                show = false;
+            }
+
+            if (skills && !text.includes(skills)) {
+                show = false;
+            }
+
+            if (rating) {
+                const minRating = parseFloat(rating);
+                if (cardRating < minRating) {
+                    show = false;
+                }
+            }
+
+            if (badge && !cardBadge.includes(badge)) {
+                show = false;
+            }
+
+            card.style.display = show ? 'block' : 'none';
+        });
+    };
+
+    searchInput.addEventListener('input', filterTalent);
+    skillsFilter?.addEventListener('change', filterTalent);
+    ratingFilter?.addEventListener('change', filterTalent);
+    badgeFilter?.addEventListener('change', filterTalent);
+}
+
+export async function loadMyJobs(status = 'active') {
+    try {
+        const res = await fetch(`${API_BASE}/jobs/my/?status=${status}`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) return;
+
+        const data = await res.json();
+
+        if (status === 'completed') {
+            renderCompletedJobs(data.results || []);
+        } else if (status === 'draft') {
+            renderDraftJobs(data.results || []);
+        } else {
+            renderMyJobs(data.results || []);
+        }
+    } catch (err) {
+        console.error('Failed to load jobs:', err);
+    }
+}
+
+// Make globally accessible for event handlers
+window.loadMyJobs = loadMyJobs;
+
+function renderMyJobs(jobs) {
+    const container = document.querySelector('[data-tab-content="active-jobs"]');
+    if (!container) return;
+
+    if (jobs.length === 0) {
+        container.innerHTML = '<p class="empty-state">No active jobs. Create your first job posting!</p>';
+        return;
+    }
+
+    container.innerHTML = jobs.map(job => `
+            <div class="job-card">
+                <div class="job-header">
+                    <h3>${escapeHtml(job.title)}</h3>
+                    <span class="badge badge-${job.event_type}">${escapeHtml(job.event_type)}</span>
+                </div>
+                <div class="job-meta">
+                    <span><i class="fas fa-briefcase"></i> ${escapeHtml(job.role)}</span>
+                    <span><i class="fas fa-users"></i> ${job.number_of_staff} needed</span>
+                    <span><i class="fas fa-calendar"></i> ${formatDate(job.date)}</span>
+                    <span><i class="fas fa-map-marker-alt"></i> ${escapeHtml(job.location)}</span>
+                </div>
+                <p>${escapeHtml(job.description)}</p>
+                <div class="job-footer">
+                    <div class="pay-rate">₹${job.pay_rate}/${job.payment_type}</div>
+                    <div class="job-actions" style="display: flex; gap: 0.5rem; margin-top: 1rem;">
+                        <button class="btn-primary" onclick="openEventDetailsModal(${job.id})" style="flex: 1;">
+                            <i class="fas fa-info-circle"></i> View Details
+                        </button>
+                        <button class="btn-outline" onclick="cancelEvent(${job.id})" style="flex: 1; background: #dc3545; border-color: #dc3545; color: white;">
+                            <i class="fas fa-times-circle"></i> Cancel Event
+                        </button>
+                    </div>
+                </div>
+            </div>
+        `).join('');
+}
+
+function renderCompletedJobs(jobs) {
+    const container = document.querySelector('[data-tab-content="completed-jobs"]');
+    if (!container) return;
+
+    if (jobs.length === 0) {
+        container.innerHTML = '<p class="empty-state">No completed events yet.</p>';
+        return;
+    }
+
+    container.innerHTML = jobs.map(job => `
+            <div class="job-card" style="opacity: 0.9; border-left: 4px solid #10b981;">
+                <div class="job-header">
+                    <h3>${escapeHtml(job.title)}</h3>
+                    <span class="badge" style="background: #10b981; color: white;">
+                        <i class="fas fa-check-circle"></i> Completed
+                    </span>
+                </div>
+                <div class="job-meta">
+                    <span><i class="fas fa-briefcase"></i> ${escapeHtml(job.role)}</span>
+                    <span><i class="fas fa-users"></i> ${job.number_of_staff} staff</span>
+                    <span><i class="fas fa-calendar"></i> ${formatDate(job.date)}</span>
+                    <span><i class="fas fa-map-marker-alt"></i> ${escapeHtml(job.location)}</span>
+                </div>
+                <p>${escapeHtml(job.description)}</p>
+                <div class="job-footer">
+                    <div class="pay-rate">₹${job.pay_rate}/${job.payment_type}</div>
+                    <div class="job-actions" style="display: flex; gap: 0.5rem; margin-top: 1rem;">
+                        <button class="btn-primary" onclick="openEventDetailsModal(${job.id})" style="flex: 1;">
+                            <i class="fas fa-info-circle"></i> View Details
+                        </button>
+                    </div>
+                </div>
+            </div>
+        `).join('');
+}
+
+function renderDraftJobs(jobs) {
+    const container = document.querySelector('[data-tab-content="draft-jobs"]');
+    if (!container) return;
+
+    if (jobs.length === 0) {
+        container.innerHTML = '<p class="empty-state">No draft jobs yet. Save your work as a draft to continue later.</p>';
+        return;
+    }
+
+    container.innerHTML = jobs.map(job => `
+            <div class="job-card" style="opacity: 0.85; border-left: 4px solid #f59e0b;">
+                <div class="job-header">
+                    <h3>${escapeHtml(job.title || 'Untitled Draft')}</h3>
+                    <span class="badge" style="background: #f59e0b; color: white;">
+                        <i class="fas fa-file-alt"></i> Draft
+                    </span>
+                </div>
+                <div class="job-meta">
+                    <span><i class="fas fa-briefcase"></i> ${escapeHtml(job.role || 'Not specified')}</span>
+                    <span><i class="fas fa-users"></i> ${job.number_of_staff} staff</span>
+                    <span><i class="fas fa-calendar"></i> ${formatDate(job.date) || 'Not set'}</span>
+                    <span><i class="fas fa-map-marker-alt"></i> ${escapeHtml(job.location || 'Not specified')}</span>
+                </div>
+                <p>${escapeHtml(job.description || 'No description yet')}</p>
+                <div class="job-footer">
+                    <div class="pay-rate">₹${job.pay_rate}/${job.payment_type}</div>
+                    <div class="job-actions" style="display: flex; gap: 0.5rem; margin-top: 1rem;">
+                        <button class="btn-outline" onclick="editDraft(${job.id})" style="flex: 1;">
+                            <i class="fas fa-edit"></i> Edit Draft
+                        </button>
+                        <button class="btn-outline" onclick="deleteDraft(${job.id})" style="flex: 1; background: #ef4444; color: white;">
+                            <i class="fas fa-trash"></i> Delete
+                        </button>
+                    </div>
+                </div>
+            </div>
+        `).join('');
+}
+
+async function handleJobPost(form) {
+    if (!currentUser) {
+        showToast('Please log in to post a job.', 'warning');
+        return;
+    }
+
+    const formData = new FormData(form);
+
+    const skillTags = Array.from(form.querySelectorAll('.skill-tag'))
+        .map(tag => tag.dataset.value || getSkillTagLabel(tag))
+        .filter(s => s);
+
+    const requirementsChecked = Array.from(form.querySelectorAll('input[name="requirements"]:checked'))
+        .map(cb => cb.value)
+        .join(', ');
+
+    const payload = {
+        title: formData.get('title'),
+        role: formData.get('role'),
+        event_type: formData.get('event_type'),
+        number_of_staff: formData.get('number_of_staff'),
+        skills: skillTags.join(', '),
+        date: formData.get('date'),
+        start_time: formData.get('start_time'),
+        end_time: formData.get('end_time'),
+        location: formData.get('location'),
+        pay_rate: formData.get('pay_rate'),
+        payment_type: formData.get('payment_type'),
+        description: formData.get('description'),
+        requirements: requirementsChecked
+    };
+
+    console.log('Job post payload:', payload); // Debug log
+
+    try {
+        const res = await fetch(`${API_BASE}/jobs/create/`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload),
+            credentials: 'include',
+        });
+
+        const data = await res.json();
+
+        if (!res.ok) {
+            showToast(data.error || 'Failed to create job', 'error');
+            console.error('Job creation error:', data);
+            return;
+        }
+
+        showToast('Job posted successfully!', 'success');
+        form.reset();
+
+        setTimeout(() => loadMyJobs(), 500);
+    } catch (err) {
+        showToast('Network error while creating job', 'error');
+        console.error(err);
+    }
+}
+
+async function handleSaveDraft() {
+    if (!currentUser) {
+        showToast('Please log in to save a draft.', 'warning');
+        return;
+    }
+
+    const form = document.getElementById('jobPostForm');
+    if (!form) return;
+
+    const formData = new FormData(form);
+
+    const skillTags = Array.from(form.querySelectorAll('.skill-tag'))
+        .map(tag => tag.dataset.value || getSkillTagLabel(tag))
+        .filter(s => s);
+
+    const requirementsChecked = Array.from(form.querySelectorAll('input[name="requirements"]:checked'))
+        .map(cb => cb.value)
+        .join(', ');
+
+    const payload = {
+        title: formData.get('title') || '',
+        role: formData.get('role') || '',
+        event_type: formData.get('event_type') || '',
+        number_of_staff: formData.get('number_of_staff') || '',
+        skills: skillTags.join(', '),
+        date: formData.get('date') || null,
+        start_time: formData.get('start_time') || null,
+        end_time: formData.get('end_time') || null,
+        location: formData.get('location') || '',
+        pay_rate: formData.get('pay_rate') || '0',
+        payment_type: formData.get('payment_type') || 'daily',
+        description: formData.get('description') || '',
+        requirements: requirementsChecked,
+        is_draft: true
+    };
+
+    console.log('Draft save payload:', payload); // Debug log
+
+    try {
+        const res = await fetch(`${API_BASE}/jobs/create/`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload),
+            credentials: 'include',
+        });
+
+        const data = await res.json();
+
+        if (!res.ok) {
+            showToast(data.error || 'Failed to save draft', 'error');
+            console.error('Draft save error:', data);
+            return;
+        }
+
+        showToast('Draft saved successfully!', 'success');
+        form.reset();
+
+        // Switch to draft tab and reload
+        setTimeout(() => {
+            const draftTab = document.querySelector('[data-tab="draft-jobs"]');
+            if (draftTab) draftTab.click();
+            loadMyJobs('draft');
+        }, 500);
+    } catch (err) {
+        showToast('Network error while saving draft', 'error');
+        console.error(err);
+    }
+}
+
+async function handleViewProfile(button) {
+    const profileId = button.dataset.profileId;
+
+    if (!profileId) {
+        showToast('Profile ID missing', 'error');
+        return;
+    }
+
+    try {
+        const res = await fetch(`${API_BASE}/profiles/${profileId}/`);
+
+        if (!res.ok) {
+            showToast('Failed to load profile', 'error');
+            return;
+        }
+
+        const profile = await res.json();
+        showProfileModal(profile);
+    } catch (err) {
+        showToast('Network error while loading profile', 'error');
+        console.error(err);
+    }
+}
+
+function showProfileModal(profile) {
+    const firstName = profile.first_name || profile.username.split(' ')[0];
+    const lastName = profile.last_name || profile.username.split(' ')[1] || '';
+    const fullName = `${firstName} ${lastName}`.trim();
+
+    const modalHTML = `
+            <div class="modal-overlay" id="profileModal">
+                <div class="modal-content" style="max-width: 600px;">
+                    <button class="modal-close" onclick="closeProfileModal()">&times;</button>
+                    <div style="text-align: center; margin-bottom: 20px;">
+                        <img src="https://ui-avatars.com/api/?name=${encodeURIComponent(fullName)}&background=6366f1&color=fff&size=120" 
+                             alt="${escapeHtml(fullName)}" 
+                             style="width: 120px; height: 120px; border-radius: 50%; margin-bottom: 15px;">
+                        <h2 style="margin: 10px 0;">${escapeHtml(fullName)}</h2>
+                        ${profile.badge ? `<span class="badge badge-pro">${escapeHtml(profile.badge)}</span>` : ''}
+                        <p style="color: #666; margin: 5px 0;"><i class="fas fa-map-marker-alt"></i> ${escapeHtml(profile.city || 'India')}</p>
+                    </div>
+                    
+                    <div style="margin: 20px 0;">
+                        <h3 style="margin-bottom: 10px;">About</h3>
+                        <p style="color: #555;">${escapeHtml(profile.bio || 'No bio available')}</p>
+                    </div>
+                    
+                    <div style="margin: 20px 0;">
+                        <h3 style="margin-bottom: 10px;">Verification Status</h3>
+                        <div style="display: flex; gap: 15px; flex-wrap: wrap;">
+                            ${profile.kyc_verified ? '<span class="badge badge-success"><i class="fas fa-check-circle"></i> KYC Verified</span>' : '<span class="badge"><i class="fas fa-times-circle"></i> KYC Pending</span>'}
+                            ${profile.video_verified ? '<span class="badge badge-success"><i class="fas fa-video"></i> Video Verified</span>' : '<span class="badge"><i class="fas fa-times-circle"></i> Video Pending</span>'}
+                        </div>
+                    </div>
+                    
+                    <div style="margin: 20px 0;">
+                        <h3 style="margin-bottom: 10px;">Expected Pay</h3>
+                        <p style="font-size: 18px; color: #0066ff; font-weight: 600;">₹${profile.expected_pay || 2000}/day</p>
+                    </div>
+                    
+                    <div style="margin-top: 30px; display: flex; gap: 10px; justify-content: center;">
+                        <button class="btn-outline" onclick="closeProfileModal()">Close</button>
+                        <button class="btn-primary hire-talent-btn" data-talent-id="${profile.id}" data-talent-name="${escapeHtml(fullName)}" onclick="closeProfileModal()">Hire Now</button>
+                    </div>
+                </div>
+            </div>
+        `;
+
+    const existingModal = document.getElementById('profileModal');
+    if (existingModal) {
+        existingModal.remove();
+    }
+
+    document.body.insertAdjacentHTML('beforeend', modalHTML);
+}
+
+window.closeProfileModal = function () {
+    const modal = document.getElementById('profileModal');
+    if (modal) {
+        modal.remove();
+    }
+};
+
+async function handleHireTalent(button) {
+    const talentId = button.dataset.talentId;
+    const talentName = button.dataset.talentName;
+
+    if (!talentId) {
+        showToast('Talent ID missing', 'error');
+        return;
+    }
+
+    if (!currentUser || !currentUser.username) {
+        showToast('Please log in to hire talent.', 'warning');
+        setTimeout(() => {
+            window.location.href = '/login/';
+        }, 1500);
+        return;
+    }
+
+    const confirmed = confirm(`Would you like to send a job offer to ${talentName}?\n\nYou can select a specific job or send a general invitation.`);
+
+    if (!confirmed) return;
+
+    showToast('Direct hiring feature coming soon! For now, please post a job and wait for applications.', 'info');
+
+    setTimeout(() => {
+        window.location.href = '/organizer-dashboard/#post-job';
+    }, 2000);
+}
+
+let currentApplicationId = null;
+
+window.viewApplicationDetail = async function (applicationId) {
+    currentApplicationId = applicationId;
+
+    try {
+        const res = await fetch(`${API_BASE}/applications/${applicationId}/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) {
+            showToast('Failed to load application details', 'error');
+            return;
+        }
+
+        const app = await res.json();
+
+        document.getElementById('applicant-name').textContent = app.full_name || app.applicant.username;
+        document.getElementById('application-job-title').textContent = `${app.job.role} - ${app.job.title}`;
+        document.getElementById('applicant-email').textContent = app.email || app.applicant.email || 'Not provided';
+        document.getElementById('applicant-phone').textContent = app.phone || app.applicant.phone || 'Not provided';
+        document.getElementById('application-date').textContent = formatDate(app.created_at);
+
+        const statusBadge = document.getElementById('application-status-badge');
+        statusBadge.textContent = app.status.toUpperCase();
+        statusBadge.className = `badge badge-${app.status}`;
+
+        document.getElementById('applicant-experience').textContent = app.experience_years || '0';
+        document.getElementById('applicant-compensation').textContent = app.expected_compensation
+            ? `₹${app.expected_compensation}`
+            : 'Not specified';
+
+        document.getElementById('applicant-skills').textContent = app.relevant_skills || 'Not provided';
+        document.getElementById('applicant-availability').textContent = app.availability || 'Not provided';
+        document.getElementById('applicant-previous-events').textContent = app.previous_events || 'Not provided';
+        document.getElementById('applicant-why-interested').textContent = app.why_interested || 'Not provided';
+
+        const portfolioSection = document.getElementById('portfolio-section');
+        if (app.portfolio_link) {
+            portfolioSection.style.display = 'block';
+            const portfolioLink = document.getElementById('applicant-portfolio');
+            portfolioLink.href = app.portfolio_link;
+            portfolioLink.textContent = app.portfolio_link;
+        } else {
+            portfolioSection.style.display = 'none';
+        }
+
+        const resumeSection = document.getElementById('resume-section');
+        if (app.resume) {
+            resumeSection.style.display = 'block';
+            const resumeLink = document.getElementById('applicant-resume');
+            resumeLink.href = app.resume;
+
+            const filename = app.resume.split('/').pop();
+            document.getElementById('resume-filename').textContent = filename || 'Download Resume';
+        } else {
+            resumeSection.style.display = 'none';
+        }
+
+        const coverMessageSection = document.getElementById('cover-message-section');
+        if (app.cover_message) {
+            coverMessageSection.style.display = 'block';
+            document.getElementById('applicant-cover-message').textContent = app.cover_message;
+        } else {
+            coverMessageSection.style.display = 'none';
+        }
+
+        const aiRatingSection = document.getElementById('ai-rating-section');
+        if (app.ai_rating !== null && app.ai_rating !== undefined) {
+            aiRatingSection.style.display = 'block';
+
+            const ratingScore = document.getElementById('ai-rating-score');
+            ratingScore.textContent = app.ai_rating.toFixed(1) + '/5.0';
+
+            const starsContainer = document.getElementById('ai-rating-stars');
+            const fullStars = Math.floor(app.ai_rating);
+            const hasHalfStar = (app.ai_rating % 1) >= 0.5;
+            const emptyStars = 5 - fullStars - (hasHalfStar ? 1 : 0);
+
+            let starsHTML = '';
+            for (let i = 0; i < fullStars; i++) {
+                starsHTML += '<i class="fas fa-star"></i>';
+            }
+            if (hasHalfStar) {
+                starsHTML += '<i class="fas fa-star-half-alt"></i>';
+            }
+            for (let i = 0; i < emptyStars; i++) {
+                starsHTML += '<i class="far fa-star"></i>';
+            }
+            starsContainer.innerHTML = starsHTML;
+
+            const ratingDetails = document.getElementById('ai-rating-details');
+            ratingDetails.textContent = app.ai_rating_details || 'No detailed feedback available.';
+        } else {
+            aiRatingSection.style.display = 'none';
+        }
+
+        const actionsDiv = document.getElementById('application-actions');
+        if (app.status === 'pending') {
+            actionsDiv.style.display = 'flex';
+        } else {
+            actionsDiv.style.display = 'none';
+        }
+
+        const modal = document.getElementById('application-detail-modal');
+        modal.style.display = 'flex';
+        document.body.style.overflow = 'hidden';
+
+    } catch (err) {
+        console.error('Error loading application details:', err);
+        showToast('Error loading application details', 'error');
+    }
+};
+
+window.closeApplicationDetailModal = function () {
+    const modal = document.getElementById('application-detail-modal');
+    if (modal) {
+        modal.style.display = 'none';
+        document.body.style.overflow = 'auto';
+    }
+    currentApplicationId = null;
+};
+
+window.handleAcceptApplication = async function () {
+    if (!currentApplicationId) return;
+
+    if (!confirm('Are you sure you want to accept this application? Funds will be committed for payment.')) {
+        return;
+    }
+
+    try {
+        const res = await fetch(`${API_BASE}/applications/${currentApplicationId}/accept/`, {
+            method: 'POST',
+            credentials: 'include'
+        });
+
+        const data = await res.json();
+
+        if (res.ok) {
+            let message = `Application accepted! ${data.applicant_name} has been notified.`;
+            if (data.payment_committed) {
+                message += ` Payment of ₹${data.payment_committed} committed.`;
+            }
+            showToast(message, 'success');
+            closeApplicationDetailModal();
+            if (typeof loadRecentApplications === 'function') {
+                await loadRecentApplications();
+            }
+            if (typeof loadDashboardStats === 'function') {
+                await loadDashboardStats();
+            }
+            if (typeof loadWalletStats === 'function') {
+                await loadWalletStats();
+            }
+        } else {
+            // Show detailed error for insufficient balance
+            if (data.required && data.available) {
+                showToast(`Insufficient balance! Required: ₹${data.required}, Available: ₹${data.available}. Please add funds first.`, 'error');
+            } else {
+                showToast(data.error || 'Failed to accept application', 'error');
+            }
+        }
+    } catch (err) {
+        console.error('Error accepting application:', err);
+        showToast('Error accepting application', 'error');
+    }
+};
+
+window.handleRejectApplication = async function () {
+    if (!currentApplicationId) return;
+
+    if (!confirm('Are you sure you want to reject this application?')) {
+        return;
+    }
+
+    try {
+        const res = await fetch(`${API_BASE}/applications/${currentApplicationId}/reject/`, {
+            method: 'POST',
+            credentials: 'include'
+        });
+
+        const data = await res.json();
+
+        if (res.ok) {
+            showToast('Application rejected', 'success');
+            closeApplicationDetailModal();
+            if (typeof loadRecentApplications === 'function') {
+                await loadRecentApplications();
+            }
+            if (typeof loadDashboardStats === 'function') {
+                await loadDashboardStats();
+            }
+        } else {
+            showToast(data.error || 'Failed to reject application', 'error');
+        }
+    } catch (err) {
+        console.error('Error rejecting application:', err);
+        showToast('Error rejecting application', 'error');
+    }
+};
+
+window.quickAcceptApplication = async function (appId) {
+    if (!confirm('Accept this application? Funds will be committed for payment.')) return;
+
+    try {
+        const res = await fetch(`${API_BASE}/applications/${appId}/accept/`, {
+            method: 'POST',
+            credentials: 'include'
+        });
+
+        const data = await res.json();
+
+        if (res.ok) {
+            let message = 'Application accepted!';
+            if (data.payment_committed) {
+                message += ` Payment of ₹${data.payment_committed} committed.`;
+            }
+            showToast(message, 'success');
+            if (typeof loadRecentApplications === 'function') {
+                await loadRecentApplications();
+            }
+            if (typeof loadDashboardStats === 'function') {
+                await loadDashboardStats();
+            }
+            if (typeof loadWalletStats === 'function') {
+                await loadWalletStats();
+            }
+        } else {
+            // Show detailed error for insufficient balance
+            if (data.required && data.available) {
+                showToast(`Insufficient balance! Required: ₹${data.required}, Available: ₹${data.available}. Please add funds first.`, 'error');
+            } else {
+                showToast(data.error || 'Failed to accept application', 'error');
+            }
+        }
+    } catch (err) {
+        console.error('Error accepting application:', err);
+        showToast('Error accepting application', 'error');
+    }
+};
+
+window.quickRejectApplication = async function (appId) {
+    if (!confirm('Reject this application?')) return;
+
+    try {
+        const res = await fetch(`${API_BASE}/applications/${appId}/reject/`, {
+            method: 'POST',
+            credentials: 'include'
+        });
+
+        if (res.ok) {
+            showToast('Application rejected', 'success');
+            if (typeof loadRecentApplications === 'function') {
+                await loadRecentApplications();
+            }
+            if (typeof loadDashboardStats === 'function') {
+                await loadDashboardStats();
+            }
+        } else {
+            showToast('Failed to reject application', 'error');
+        }
+    } catch (err) {
+        console.error('Error rejecting application:', err);
+        showToast('Error rejecting application', 'error');
+    }
+};
+
+// ============ PAGE INITIALIZATION ============
+function initOrganizerForms() {
+    const jobForm = document.getElementById('jobPostForm');
+    if (jobForm) {
+        jobForm.addEventListener('submit', async (event) => {
+            event.preventDefault();
+            await handleJobPost(jobForm);
+        });
+    }
+
+    const saveDraftBtn = document.getElementById('saveDraftBtn');
+    if (saveDraftBtn) {
+        saveDraftBtn.addEventListener('click', async (event) => {
+            event.preventDefault();
+            await handleSaveDraft();
+        });
+    }
+
+    document.addEventListener('click', async (event) => {
+        const btn = event.target.closest('.view-profile-btn');
+        if (btn) {
+            event.preventDefault();
+            await handleViewProfile(btn);
+        }
+    });
+
+    document.addEventListener('click', async (event) => {
+        const btn = event.target.closest('.hire-talent-btn');
+        if (btn) {
+            event.preventDefault();
+            await handleHireTalent(btn);
+        }
+    });
+}
+
+function initCurrentLocationButton() {
+    const button = document.getElementById('get-current-location-btn');
+    if (!button || !document.getElementById('job-location-input')) return;
+
+    // Geolocation and reverse geocoding are only fetched when the button is used
+    button.addEventListener('click', () => {
+        loadFeature('location').then((location) => location.fillCurrentLocation());
+    });
+}
+
+async function loadOrganizerDashboardData() {
+    if (document.getElementById('talentGrid')) {
+        await loadTalentGrid();
+    }
+
+    if (document.getElementById('talent-grid-organizer')) {
+        await loadOrganizerTalentGrid();
+    }
+
+    if (currentUser) {
+        if (document.getElementById('stat-active-jobs')) {
+            await loadDashboardStats();
+        }
+
+        if (document.getElementById('upcoming-events-list')) {
+            await loadUpcomingEvents();
+        }
+
+        if (document.getElementById('recent-applications-list')) {
+            await loadRecentApplications();
+        }
+
+        // Load organizer wallet stats
+        if (document.getElementById('organizer-wallet-balance')) {
+            await loadOrganizerWalletStats();
+        }
+
+        if (document.getElementById('profile')) {
+            await loadProfileData();
+        }
+
+        if (document.querySelector('[data-tab-content="active-jobs"]')) {
+            await loadMyJobs();
+        }
+
+        finishDashboardLoad();
+    }
+}
+
+onPageReady(() => {
+    registerLazyGlobals('events', [
+        'cancelEvent', 'editDraft', 'deleteDraft', 'openEventDetailsModal', 'fireStaff',
+        'closeEventDetailsModal', 'handleFinishEvent', 'showRateStaffInfo',
+    ]);
+    registerLazyGlobals('reviews', ['openReviewModal', 'closeReviewModal', 'setRating', 'updateRangeValue', 'submitReview']);
+
+    initDashboard({
+        sectionLoaders: {
+            discover: loadOrganizerTalentGrid,
+            dashboard: () => {
+                loadDashboardStats();
+                loadUpcomingEvents();
+                loadRecentApplications();
+            },
+        },
+        // Load jobs based on tab selection for My Jobs section
+        onTabShown: (sectionId, target) => {
+            if (sectionId !== 'my-jobs') return;
+            if (target === 'active-jobs') {
+                loadMyJobs('active');
+            } else if (target === 'completed-jobs') {
+                loadMyJobs('completed');
+            } else if (target === 'draft-jobs') {
+                loadMyJobs('draft');
+            }
+        },
+    });
+    initOrganizerForms();
+    initOrganizerPhotoUpload();
+    initCurrentLocationButton();
+    loadOrganizerDashboardData();
+});
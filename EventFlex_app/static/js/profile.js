@@ -0,0 +1,502 @@
+// EventFlex - profile section of both dashboards: profile data, verification
+// status, profile forms and photo/video uploads.
+import {
+    API_BASE,
+    currentUser,
+    formatDate,
+    hooks,
+    saveCurrentUser,
+    showToast,
+} from 'eventflex/core';
+
+export async function loadProfileData() {
+    if (!currentUser) {
+        console.log('No currentUser found in loadProfileData');
+        return;
+    }
+
+    console.log('Loading profile data for:', currentUser); // Debug log
+
+    const profileName = document.querySelector('.profile-header-info h2');
+    if (profileName) {
+        profileName.textContent = currentUser.username || 'User';
+    }
+
+    const navUserName = document.querySelector('.nav-user .user-profile span');
+    if (navUserName) {
+        navUserName.textContent = currentUser.username || 'User';
+    }
+
+    // Use profile picture if available, otherwise use UI Avatars placeholder
+    const profileImages = document.querySelectorAll('.profile-image-large, .user-avatar img, .nav-user img, .profile-header img');
+    const avatarUrl = currentUser.profile_picture || `https://ui-avatars.com/api/?name=${encodeURIComponent(currentUser.username || 'User')}&background=6366f1&color=fff`;
+    profileImages.forEach(img => {
+        img.src = avatarUrl;
+        img.alt = currentUser.username;
+    });
+
+    const profileRole = document.querySelector('.profile-role');
+    if (profileRole) {
+        profileRole.textContent = currentUser.user_type === 'organizer' ? 'Event Organizer' : 'Event Professional';
+    }
+
+    const profileForm = document.querySelector('.profile-form');
+    if (profileForm) {
+        console.log('Populating profile form with:', currentUser); // Debug log
+
+        const nameInput = profileForm.querySelector('input[name="username"]');
+        if (nameInput) {
+            nameInput.value = currentUser.username || '';
+            console.log('Set username to:', currentUser.username);
+        }
+
+        const contactInput = profileForm.querySelector('input[name="contact_person"]');
+        if (contactInput) {
+            contactInput.value = currentUser.contact_person || currentUser.username || '';
+            console.log('Set contact_person to:', currentUser.contact_person || currentUser.username);
+        }
+
+        const emailInput = profileForm.querySelector('input[name="email"]');
+        if (emailInput) {
+            emailInput.value = currentUser.email || '';
+            console.log('Set email to:', currentUser.email);
+        }
+
+        const phoneInput = profileForm.querySelector('input[name="phone"]');
+        if (phoneInput) {
+            phoneInput.value = currentUser.phone || '';
+            console.log('Set phone to:', currentUser.phone);
+        }
+
+        const citySelect = profileForm.querySelector('select[name="city"]');
+        if (citySelect && currentUser.city) {
+            citySelect.value = currentUser.city.toLowerCase();
+            console.log('Set city to:', currentUser.city);
+        }
+
+        const bioTextarea = profileForm.querySelector('textarea[name="bio"]');
+        if (bioTextarea) {
+            bioTextarea.value = currentUser.bio || '';
+            console.log('Set bio to:', currentUser.bio || '(empty)');
+        }
+    } else {
+        console.log('Profile form not found');
+    }
+
+    const badgesContainer = document.querySelector('.profile-badges');
+    if (badgesContainer && currentUser.kyc_verified !== undefined) {
+        let badgesHTML = '';
+
+        if (currentUser.badge) {
+            const badgeIcons = {
+                'elite': 'crown',
+                'pro': 'star',
+                'verified': 'check-circle'
+            };
+            const icon = badgeIcons[currentUser.badge.toLowerCase()] || 'check-circle';
+            badgesHTML += `<span class="badge-elite"><i class="fas fa-${icon}"></i> ${currentUser.badge}</span>`;
+        }
+
+        if (currentUser.kyc_verified) {
+            badgesHTML += `<span class="badge-verified"><i class="fas fa-check-circle"></i> KYC Verified</span>`;
+        }
+
+        if (currentUser.video_verified) {
+            badgesHTML += `<span class="badge-verified"><i class="fas fa-video"></i> Video Verified</span>`;
+        }
+
+        if (badgesHTML) {
+            badgesContainer.innerHTML = badgesHTML;
+        }
+    }
+
+    const welcomeUser = document.querySelector('.dashboard-main h1');
+    if (welcomeUser && welcomeUser.textContent.includes('Welcome')) {
+        welcomeUser.textContent = `Welcome back, ${currentUser.username}! 👋`;
+    }
+
+    // Load verification status if on staff portal
+    if (document.getElementById('verification-status-container')) {
+        await loadVerificationStatus();
+    }
+}
+
+// Load and display verification status
+async function loadVerificationStatus() {
+    if (!currentUser) return;
+
+    try {
+        const response = await fetch(`${API_BASE}/verification/status/`, {
+            credentials: 'include'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            updateVerificationUI(data);
+        }
+    } catch (error) {
+        console.error('Error loading verification status:', error);
+    }
+}
+
+// Update verification UI elements
+function updateVerificationUI(data) {
+    const kycItem = document.getElementById('kyc-verification-item');
+    const kycStatusText = document.getElementById('kyc-status-text');
+    const kycActionBtn = document.getElementById('kyc-action-btn');
+    const policeItem = document.getElementById('police-verification-item');
+    const policeStatusText = document.getElementById('police-status-text');
+    const policeActionBtn = document.getElementById('police-action-btn');
+    const videoItem = document.getElementById('video-verification-item');
+    const videoStatusText = document.getElementById('video-status-text');
+
+    // Update KYC/Police Verification Status (same verification)
+    if (data.kyc_verified || (data.has_verification && data.verification.status === 'approved')) {
+        // Approved
+        if (kycItem) {
+            kycItem.className = 'verification-item completed';
+            kycItem.querySelector('i').className = 'fas fa-check-circle';
+        }
+        if (policeItem) {
+            policeItem.className = 'verification-item completed';
+            policeItem.querySelector('i').className = 'fas fa-check-circle';
+        }
+
+        const verifiedDate = data.verification?.verified_at ? formatDate(data.verification.verified_at) : 'Recently';
+        if (kycStatusText) kycStatusText.textContent = `Verified on ${verifiedDate}`;
+        if (policeStatusText) policeStatusText.textContent = `Verified on ${verifiedDate}`;
+
+        if (kycActionBtn) kycActionBtn.style.display = 'none';
+        if (policeActionBtn) policeActionBtn.style.display = 'none';
+
+    } else if (data.has_verification && data.verification.status === 'pending') {
+        // Pending
+        if (kycItem) {
+            kycItem.className = 'verification-item pending';
+            kycItem.querySelector('i').className = 'fas fa-clock';
+        }
+        if (policeItem) {
+            policeItem.className = 'verification-item pending';
+            policeItem.querySelector('i').className = 'fas fa-clock';
+        }
+
+        if (kycStatusText) kycStatusText.textContent = 'Pending admin approval';
+        if (policeStatusText) policeStatusText.textContent = 'Pending admin approval';
+
+        if (kycActionBtn) {
+            kycActionBtn.textContent = 'View Status';
+            kycActionBtn.style.display = 'inline-block';
+        }
+        if (policeActionBtn) {
+            policeActionBtn.textContent = 'View Status';
+            policeActionBtn.style.display = 'inline-block';
+        }
+
+    } else if (data.has_verification && data.verification.status === 'rejected') {
+        // Rejected
+        if (kycItem) {
+            kycItem.className = 'verification-item pending';
+            kycItem.querySelector('i').className = 'fas fa-exclamation-circle';
+        }
+        if (policeItem) {
+            policeItem.className = 'verification-item pending';
+            policeItem.querySelector('i').className = 'fas fa-exclamation-circle';
+        }
+
+        if (kycStatusText) kycStatusText.textContent = 'Rejected - Resubmit required';
+        if (policeStatusText) policeStatusText.textContent = 'Rejected - Resubmit required';
+
+        if (kycActionBtn) {
+            kycActionBtn.textContent = 'Resubmit';
+            kycActionBtn.style.display = 'inline-block';
+        }
+        if (policeActionBtn) {
+            policeActionBtn.textContent = 'Resubmit';
+            policeActionBtn.style.display = 'inline-block';
+        }
+
+    } else {
+        // Not submitted
+        if (kycStatusText) kycStatusText.textContent = 'Not verified - Complete verification to unlock more jobs';
+        if (policeStatusText) policeStatusText.textContent = 'Optional - Increases trust and job opportunities';
+
+        if (kycActionBtn) {
+            kycActionBtn.textContent = 'Start Verification';
+            kycActionBtn.style.display = 'inline-block';
+        }
+        if (policeActionBtn) {
+            policeActionBtn.textContent = 'Start Verification';
+            policeActionBtn.style.display = 'inline-block';
+        }
+    }
+
+    // Update video verification status
+    if (currentUser.video_verified) {
+        if (videoItem) {
+            videoItem.className = 'verification-item completed';
+            videoItem.querySelector('i').className = 'fas fa-check-circle';
+        }
+        if (videoStatusText) videoStatusText.textContent = 'Video uploaded and verified';
+    } else {
+        if (videoStatusText) videoStatusText.textContent = 'Not uploaded - Optional';
+    }
+}
+
+// Make globally accessible
+window.loadVerificationStatus = loadVerificationStatus;
+hooks.loadProfileData = loadProfileData;
+
+export function initProfileForms() {
+    document.querySelectorAll('.profile-form').forEach((form) => {
+        form.addEventListener('submit', async (event) => {
+            event.preventDefault();
+            await handleProfileUpdate(form);
+        });
+    });
+}
+
+async function handleProfileUpdate(form) {
+    if (!currentUser) {
+        showToast('Please log in to update profile.', 'warning');
+        return;
+    }
+
+    const formData = new FormData(form);
+    const payload = {
+        phone: formData.get('phone'),
+        bio: formData.get('bio'),
+        city: formData.get('city')
+    };
+
+    try {
+        const res = await fetch(`${API_BASE}/profiles/update/`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload),
+            credentials: 'include',
+        });
+
+        const data = await res.json();
+
+        if (!res.ok) {
+            showToast(data.error || 'Profile update failed', 'error');
+            return;
+        }
+
+        saveCurrentUser(data.profile);
+        showToast('Profile updated successfully!', 'success');
+    } catch (err) {
+        showToast('Network error while updating profile', 'error');
+        console.error(err);
+    }
+}
+
+window.showPhotoModal = function () {
+    const modal = document.getElementById('photo-modal');
+    modal.style.display = 'flex';
+    document.body.style.overflow = 'hidden';
+};
+
+window.closePhotoModal = function () {
+    const modal = document.getElementById('photo-modal');
+    modal.style.display = 'none';
+    document.body.style.overflow = 'auto';
+};
+
+window.handlePhotoUpload = async function (event) {
+    event.preventDefault();
+
+    const fileInput = document.getElementById('photo-input');
+    const formData = new FormData();
+    formData.append('photo', fileInput.files[0]);
+
+    try {
+        const res = await fetch(`${API_BASE}/upload/photo/`, {
+            method: 'POST',
+            credentials: 'include',
+            body: formData
+        });
+
+        const data = await res.json();
+
+        if (res.ok) {
+            showToast(data.message, 'success');
+            closePhotoModal();
+
+            // Store photo in memory only (not localStorage to avoid quota issues)
+            if (currentUser && data.photo_url) {
+                currentUser.profile_picture = data.photo_url;
+            }
+
+            // Update all avatar images immediately
+            if (data.photo_url) {
+                const profileImages = document.querySelectorAll('.profile-image-large, .user-avatar img, .nav-user img, .profile-header img, #user-avatar, #organizer-profile-image');
+                profileImages.forEach(img => {
+                    img.src = data.photo_url;
+                });
+            }
+        } else {
+            showToast(data.error || 'Upload failed', 'error');
+        }
+    } catch (err) {
+        console.error('Photo upload error:', err);
+        showToast('Failed to upload photo', 'error');
+    }
+};
+
+window.showVideoModal = function () {
+    const modal = document.getElementById('video-modal');
+    modal.style.display = 'flex';
+    document.body.style.overflow = 'hidden';
+};
+
+window.closeVideoModal = function () {
+    const modal = document.getElementById('video-modal');
+    modal.style.display = 'none';
+    document.body.style.overflow = 'auto';
+};
+
+window.handleVideoUpload = async function (event) {
+    event.preventDefault();
+
+    const fileInput = document.getElementById('video-input');
+    const formData = new FormData();
+    formData.append('video', fileInput.files[0]);
+
+    try {
+        const res = await fetch(`${API_BASE}/upload/video/`, {
+            method: 'POST',
+            credentials: 'include',
+            body: formData
+        });
+
+        const data = await res.json();
+
+        if (res.ok) {
+            showToast(data.message, 'success');
+            closeVideoModal();
+        } else {
+            showToast(data.error || 'Upload failed', 'error');
+        }
+    } catch (err) {
+        console.error('Video upload error:', err);
+        showToast('Failed to upload video', 'error');
+    }
+};
+
+window.handleProfileSave = async function (event) {
+    event.preventDefault();
+
+    const form = document.getElementById('profile-form');
+    const formData = new FormData(form);
+
+    const data = {
+        username: formData.get('username') || '',
+        first_name: formData.get('first_name') || '',
+        last_name: formData.get('last_name') || '',
+        email: formData.get('email') || '',
+        phone: formData.get('phone') || '',
+        city: formData.get('city') || '',
+        bio: formData.get('bio') || ''
+    };
+
+    try {
+        const res = await fetch(`${API_BASE}/profile/save/`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            credentials: 'include',
+            body: JSON.stringify(data)
+        });
+
+        const result = await res.json();
+
+        if (res.ok) {
+            // Update currentUser with the new profile data
+            if (result.profile) {
+                saveCurrentUser(result.profile);
+
+                // Reload the profile data to update all UI elements
+                await loadProfileData();
+            }
+
+            showToast(result.message, 'success');
+        } else {
+            showToast(result.error || 'Failed to save profile', 'error');
+        }
+    } catch (err) {
+        console.error('Profile save error:', err);
+        showToast('Failed to save profile', 'error');
+    }
+};
+
+// Organizer profile photo: uploaded as soon as a file is picked
+export function initOrganizerPhotoUpload() {
+    const photoInput = document.getElementById('organizer-photo-input');
+    const profileImage = document.getElementById('organizer-profile-image');
+    const userAvatar = document.getElementById('user-avatar');
+
+    if (!photoInput) return;
+
+    photoInput.addEventListener('change', async function (event) {
+        const file = event.target.files[0];
+        if (!file) return;
+
+        if (!file.type.startsWith('image/')) {
+            showToast('Please select an image file', 'error');
+            return;
+        }
+
+        if (file.size > 5 * 1024 * 1024) {
+            showToast('Image size should be less than 5MB', 'error');
+            return;
+        }
+
+        if (profileImage) {
+            profileImage.style.opacity = '0.5';
+        }
+
+        const formData = new FormData();
+        formData.append('photo', file);
+
+        try {
+            const response = await fetch('/api/upload/photo/', {
+                method: 'POST',
+                credentials: 'include',
+                body: formData
+            });
+
+            const data = await response.json();
+
+            if (response.ok) {
+                // Store photo in memory only (not localStorage to avoid quota issues)
+                if (currentUser && data.photo_url) {
+                    currentUser.profile_picture = data.photo_url;
+                }
+
+                if (data.photo_url) {
+                    if (profileImage) profileImage.src = data.photo_url;
+                    if (userAvatar) userAvatar.src = data.photo_url;
+
+                    // Update all profile images on the page
+                    const allProfileImages = document.querySelectorAll('.profile-image-large, .user-avatar img, .nav-user img, .profile-header img, #organizer-profile-image');
+                    allProfileImages.forEach(img => {
+                        img.src = data.photo_url;
+                    });
+                }
+                showToast('Profile photo updated successfully!', 'success');
+            } else {
+                showToast(data.error || 'Failed to upload photo', 'error');
+            }
+        } catch (error) {
+            console.error('Photo upload error:', error);
+            showToast('Error uploading photo. Please try again.', 'error');
+        } finally {
+            if (profileImage) {
+                profileImage.style.opacity = '1';
+            }
+            photoInput.value = '';
+        }
+    });
+}
@@ -0,0 +1,111 @@
+// EventFlex - staff review modal (loaded when it is first opened)
+import {
+    showToast,
+} from 'eventflex/core';
+
+// Review System Functions
+window.openReviewModal = function (staffId, staffName, jobId, jobTitle) {
+    const modal = document.getElementById('review-modal');
+    if (!modal) return;
+
+    document.getElementById('review-staff-id').value = staffId;
+    document.getElementById('review-job-id').value = jobId;
+    document.getElementById('review-staff-name').textContent = staffName;
+    document.getElementById('review-job-title').textContent = `Event: ${jobTitle}`;
+
+    // Reset form
+    document.getElementById('review-form').reset();
+    document.querySelectorAll('.rating-input .star').forEach(star => {
+        star.textContent = '☆';
+        star.style.color = '#ddd';
+    });
+
+    modal.style.display = 'flex';
+    document.body.style.overflow = 'hidden';
+};
+
+window.closeReviewModal = function () {
+    const modal = document.getElementById('review-modal');
+    if (modal) {
+        modal.style.display = 'none';
+        document.body.style.overflow = 'auto';
+    }
+};
+
+window.setRating = function (rating) {
+    document.getElementById('review-rating').value = rating;
+    const stars = document.querySelectorAll('.rating-input .star');
+    stars.forEach((star, index) => {
+        if (index < rating) {
+            star.textContent = '★';
+            star.style.color = '#fbbf24';
+        } else {
+            star.textContent = '☆';
+            star.style.color = '#ddd';
+        }
+    });
+};
+
+window.updateRangeValue = function (input, valueId) {
+    const valueEl = document.getElementById(valueId);
+    if (valueEl) {
+        valueEl.textContent = `${input.value}/5`;
+    }
+};
+
+window.submitReview = async function (event) {
+    event.preventDefault();
+
+    const staffId = document.getElementById('review-staff-id').value;
+    const jobId = document.getElementById('review-job-id').value;
+    const rating = document.getElementById('review-rating').value;
+    const reviewText = document.getElementById('review-text').value;
+    const professionalism = document.getElementById('review-professionalism').value;
+    const punctuality = document.getElementById('review-punctuality').value;
+    const quality = document.getElementById('review-quality').value;
+    const communication = document.getElementById('review-communication').value;
+
+    if (!rating) {
+        showToast('Please select an overall rating', 'error');
+        return;
+    }
+
+    try {
+        const res = await fetch(`/api/reviews/submit/${jobId}/`, {
+            method: 'POST',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                staff_id: staffId,
+                rating: rating,
+                review_text: reviewText,
+                professionalism: parseInt(professionalism),
+                punctuality: parseInt(punctuality),
+                quality_of_work: parseInt(quality),
+                communication: parseInt(communication)
+            })
+        });
+
+        const data = await res.json();
+
+        if (data.success) {
+            const newBadge = data.staff_new_badge || '';
+            const newRating = data.staff_new_rating || '';
+            const badgeText = newBadge === 'elite' ? 'Elite 👑' : newBadge === 'pro' ? 'Pro 🏆' : 'Rising Star ⭐';
+            showToast(`Rating submitted! Staff rating: ${newRating}/5.0 | Badge: ${badgeText}`, 'success');
+            closeReviewModal();
+
+            // Reload job details to show updated review status
+            if (typeof openEventDetailsModal === 'function') {
+                await openEventDetailsModal(jobId);
+            }
+        } else {
+            showToast(data.error || 'Failed to submit review', 'error');
+        }
+    } catch (error) {
+        console.error('Error submitting review:', error);
+        showToast('Error submitting review. Please try again.', 'error');
+    }
+};
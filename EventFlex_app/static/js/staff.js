@@ -0,0 +1,1427 @@
+// EventFlex - staff portal: job discovery, applications, bookings and reputation
+import {
+    API_BASE,
+    capitalize,
+    currentUser,
+    escapeHtml,
+    formatDate,
+    getTimeAgo,
+    onPageReady,
+    saveCurrentUser,
+    showToast,
+} from 'eventflex/core';
+import {
+    finishDashboardLoad,
+    initDashboard,
+} from 'eventflex/dashboard';
+import {
+    loadProfileData,
+} from 'eventflex/profile';
+import {
+    loadTransactions,
+    loadWalletData,
+} from 'eventflex/wallet';
+
+export async function loadStaffDashboardStats() {
+    try {
+        const res = await fetch(`${API_BASE}/applications/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) return;
+
+        const data = await res.json();
+        const applications = data.results || [];
+
+        const completedEvents = applications.filter(app => app.status === 'accepted').length;
+
+        let totalEarned = 0;
+        applications.filter(app => app.status === 'accepted').forEach(app => {
+            totalEarned += parseFloat(app.job.pay_rate || 0);
+        });
+
+        const now = new Date();
+        const upcoming = applications.filter(app => {
+            if (app.status !== 'accepted') return false;
+            if (!app.job.date) return false;
+            const jobDate = new Date(app.job.date);
+            return jobDate >= now;
+        }).length;
+
+        const completedEl = document.getElementById('stat-events-completed');
+        const earnedEl = document.getElementById('stat-total-earned');
+        const ratingEl = document.getElementById('stat-rating');
+        const upcomingEl = document.getElementById('stat-upcoming');
+
+        if (completedEl) completedEl.textContent = completedEvents;
+        if (earnedEl) earnedEl.textContent = `₹${totalEarned.toLocaleString()}`;
+        if (ratingEl && currentUser) ratingEl.textContent = currentUser.average_rating || '0.0';
+        if (upcomingEl) upcomingEl.textContent = upcoming;
+
+        // Load reputation data
+        await loadReputationData();
+
+    } catch (err) {
+        console.error('Failed to load staff dashboard stats:', err);
+    }
+}
+
+async function loadReputationData() {
+    try {
+        if (!currentUser || !currentUser.id) return;
+
+        console.log('Loading reputation data for user ID:', currentUser.id);
+
+        // Fetch reviews for current user (this also returns updated profile data)
+        const res = await fetch(`${API_BASE}/reviews/staff/${currentUser.id}/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) {
+            console.error('Failed to fetch reviews:', res.status);
+            return;
+        }
+
+        const data = await res.json();
+        console.log('Reviews API response:', data);
+
+        const reviews = data.reviews || [];
+        const staffProfile = data.staff || {};
+
+        console.log('Staff profile data:', staffProfile);
+        console.log('Badge:', staffProfile.badge);
+        console.log('Average rating:', staffProfile.average_rating);
+        console.log('Total reviews:', staffProfile.total_reviews);
+        console.log('Events completed:', staffProfile.total_events_completed);
+
+        // Update currentUser with fresh reputation data from the staff profile
+        if (staffProfile) {
+            currentUser.badge = staffProfile.badge;
+            currentUser.average_rating = staffProfile.average_rating;
+            currentUser.total_reviews = staffProfile.total_reviews;
+            currentUser.total_events_completed = staffProfile.total_events_completed;
+            // Save updated user to localStorage
+            saveCurrentUser(currentUser);
+        }
+
+        // Update badge display
+        updateBadgeDisplay(currentUser.badge, currentUser.average_rating);
+
+        // Update stats
+        const avgRatingEl = document.getElementById('avg-rating');
+        const totalReviewsEl = document.getElementById('total-reviews');
+        const totalEventsEl = document.getElementById('total-events');
+        const ratingStarsEl = document.getElementById('rating-stars');
+
+        if (avgRatingEl) {
+            const rating = parseFloat(currentUser.average_rating || 0);
+            avgRatingEl.textContent = `${rating.toFixed(1)}/5.0`;
+            console.log('Updated avg rating display to:', rating.toFixed(1));
+        }
+
+        if (totalReviewsEl) {
+            totalReviewsEl.textContent = currentUser.total_reviews || 0;
+            console.log('Updated total reviews display to:', currentUser.total_reviews);
+        }
+
+        if (totalEventsEl) {
+            totalEventsEl.textContent = currentUser.total_events_completed || 0;
+            console.log('Updated total events display to:', currentUser.total_events_completed);
+        }
+
+        if (ratingStarsEl) {
+            const rating = parseFloat(currentUser.average_rating || 0);
+            ratingStarsEl.innerHTML = generateStars(rating);
+        }
+
+        // Render recent reviews
+        renderRecentReviews(reviews.slice(0, 3));
+
+    } catch (err) {
+        console.error('Failed to load reputation data:', err);
+    }
+}
+
+function updateBadgeDisplay(badge, rating) {
+    const badgeDisplay = document.getElementById('badge-display');
+    const badgeText = document.getElementById('badge-text');
+    const badgeDescription = document.getElementById('badge-description');
+
+    if (!badgeDisplay || !badgeText || !badgeDescription) return;
+
+    // Remove all badge classes
+    badgeDisplay.classList.remove('rising-star', 'pro', 'elite');
+
+    // Badge configuration
+    const badgeConfig = {
+        'rising_star': {
+            class: 'rising-star',
+            icon: 'fa-star',
+            text: 'Rising Star',
+            description: 'Keep building your reputation!'
+        },
+        'pro': {
+            class: 'pro',
+            icon: 'fa-award',
+            text: 'Pro',
+            description: 'You\'re a trusted professional!'
+        },
+        'elite': {
+            class: 'elite',
+            icon: 'fa-crown',
+            text: 'Elite',
+            description: 'You\'re in the top tier of Event Pros!'
+        }
+    };
+
+    const config = badgeConfig[badge] || badgeConfig['rising_star'];
+
+    badgeDisplay.classList.add(config.class);
+    badgeDisplay.querySelector('i').className = `fas ${config.icon}`;
+    badgeText.textContent = config.text;
+    badgeDescription.textContent = config.description;
+}
+
+function generateStars(rating) {
+    const fullStars = Math.floor(rating);
+    const hasHalfStar = rating % 1 >= 0.5;
+    const emptyStars = 5 - fullStars - (hasHalfStar ? 1 : 0);
+
+    let stars = '';
+    for (let i = 0; i < fullStars; i++) stars += '★';
+    if (hasHalfStar) stars += '⯨';
+    for (let i = 0; i < emptyStars; i++) stars += '☆';
+
+    return stars;
+}
+
+function renderRecentReviews(reviews) {
+    const container = document.getElementById('recent-reviews-list');
+    if (!container) return;
+
+    if (reviews.length === 0) {
+        container.innerHTML = '<p class="empty-state">No reviews yet. Complete events to receive reviews!</p>';
+        return;
+    }
+
+    container.innerHTML = reviews.map(review => `
+            <div class="review-item">
+                <div class="review-header">
+                    <span class="stars">${generateStars(parseFloat(review.rating))}</span>
+                    <span class="date">${formatRelativeTime(review.created_at)}</span>
+                </div>
+                <p>"${escapeHtml(review.review_text || 'No comment provided')}"</p>
+                <span class="reviewer">- ${escapeHtml(review.organizer_name)}</span>
+                <div class="review-details" style="font-size: 0.85rem; color: var(--text-secondary); margin-top: 0.5rem;">
+                    <span>Professionalism: ${review.professionalism}/5</span> | 
+                    <span>Punctuality: ${review.punctuality}/5</span> | 
+                    <span>Quality: ${review.quality_of_work}/5</span> | 
+                    <span>Communication: ${review.communication}/5</span>
+                </div>
+            </div>
+        `).join('');
+}
+
+function formatRelativeTime(dateStr) {
+    const date = new Date(dateStr);
+    const now = new Date();
+    const diffMs = now - date;
+    const diffDays = Math.floor(diffMs / (1000 * 60 * 60 * 24));
+
+    if (diffDays === 0) return 'Today';
+    if (diffDays === 1) return '1 day ago';
+    if (diffDays < 7) return `${diffDays} days ago`;
+    if (diffDays < 30) return `${Math.floor(diffDays / 7)} weeks ago`;
+    if (diffDays < 365) return `${Math.floor(diffDays / 30)} months ago`;
+    return `${Math.floor(diffDays / 365)} years ago`;
+}
+
+function updateApplicationBadge(badge, rating, totalReviews) {
+    const badgeTextEl = document.getElementById('apply-badge-text');
+    const badgeRatingEl = document.getElementById('apply-badge-rating');
+    const badgeReviewsEl = document.getElementById('apply-badge-reviews');
+    const badgeIcon = document.querySelector('#apply-badge-display i');
+
+    if (!badgeTextEl || !badgeRatingEl || !badgeReviewsEl) return;
+
+    // Badge configuration
+    const badgeConfig = {
+        'rising_star': {
+            icon: 'fa-star',
+            text: 'Rising Star',
+            color: '#f59e0b'
+        },
+        'pro': {
+            icon: 'fa-award',
+            text: 'Pro',
+            color: '#3b82f6'
+        },
+        'elite': {
+            icon: 'fa-crown',
+            text: 'Elite',
+            color: '#DAA520'
+        }
+    };
+
+    const config = badgeConfig[badge] || badgeConfig['rising_star'];
+
+    if (badgeIcon) {
+        badgeIcon.className = `fas ${config.icon}`;
+        badgeIcon.style.color = config.color;
+    }
+
+    badgeTextEl.textContent = config.text;
+    badgeTextEl.style.color = config.color;
+    badgeRatingEl.textContent = parseFloat(rating || 0).toFixed(1);
+    badgeReviewsEl.textContent = totalReviews || 0;
+}
+export async function loadStaffUpcomingEvents() {
+    try {
+        const res = await fetch(`${API_BASE}/applications/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) return;
+
+        const data = await res.json();
+        const applications = data.results || [];
+
+        const now = new Date();
+        const upcoming = applications.filter(app => {
+            if (app.status !== 'accepted') return false;
+            if (!app.job.date) return false;
+            const jobDate = new Date(app.job.date);
+            return jobDate >= now;
+        }).slice(0, 3);
+
+        renderStaffUpcomingEvents(upcoming);
+    } catch (err) {
+        console.error('Failed to load staff upcoming events:', err);
+    }
+}
+
+function renderStaffUpcomingEvents(applications) {
+    const container = document.getElementById('staff-upcoming-events');
+    if (!container) return;
+
+    if (applications.length === 0) {
+        container.innerHTML = '<p class="empty-state">No upcoming events. <a href="#find-jobs">Find jobs</a> to apply!</p>';
+        return;
+    }
+
+    container.innerHTML = applications.map(app => {
+        const job = app.job;
+        const date = new Date(job.date);
+        const day = date.getDate();
+        const month = date.toLocaleDateString('en-US', { month: 'short' });
+
+        return `
+                <div class="event-item">
+                    <div class="event-date">
+                        <span class="day">${day}</span>
+                        <span class="month">${month}</span>
+                    </div>
+                    <div class="event-details">
+                        <h4>${escapeHtml(job.title)}</h4>
+                        <p><i class="fas fa-map-marker-alt"></i> ${escapeHtml(job.location)}</p>
+                        <p><i class="fas fa-rupee-sign"></i> ₹${job.pay_rate} • ${job.start_time || 'TBD'} - ${job.end_time || 'TBD'}</p>
+                    </div>
+                    <span class="status-badge confirmed">Confirmed</span>
+                </div>
+            `;
+    }).join('');
+}
+
+export async function loadJobListings() {
+    try {
+        const res = await fetch(`${API_BASE}/jobs/`);
+        const data = await res.json();
+        const jobs = data.results || [];
+
+        let appliedJobIds = [];
+        if (currentUser) {
+            try {
+                const appsRes = await fetch(`${API_BASE}/applications/`, {
+                    credentials: 'include'
+                });
+                if (appsRes.ok) {
+                    const appsData = await appsRes.json();
+                    appliedJobIds = (appsData.results || []).map(app => app.job.id);
+                }
+            } catch (err) {
+                console.error('Failed to fetch applications:', err);
+            }
+        }
+
+        renderJobListings(jobs, appliedJobIds);
+    } catch (err) {
+        console.error('Failed to load jobs:', err);
+    }
+}
+
+function renderJobListings(jobs, appliedJobIds = []) {
+    const container = document.getElementById('jobListings');
+    if (!container) return;
+
+    if (jobs.length === 0) {
+        container.innerHTML = '<p class="empty-state">No jobs available at the moment. Check back soon!</p>';
+        return;
+    }
+
+    const isStaffPortal = document.getElementById('discover-jobs') !== null;
+
+    if (isStaffPortal) {
+        container.innerHTML = jobs.map(job => {
+            const skills = job.skills ? job.skills.split(',').map(s => s.trim()) : [];
+            const organizerName = job.organizer?.username || 'Unknown Organizer';
+            const isVerified = job.organizer?.kyc_verified || false;
+            const hasApplied = appliedJobIds.includes(job.id);
+
+            return `
+                    <div class="job-listing-card">
+                        <div class="job-listing-header">
+                            <div>
+                                <h3>${escapeHtml(job.title)}</h3>
+                                <p class="organizer"><i class="fas fa-building"></i> ${escapeHtml(organizerName)}</p>
+                            </div>
+                            <div class="job-pay">₹${job.pay_rate}<span>/${job.payment_type}</span></div>
+                        </div>
+                        <div class="job-listing-details">
+                            <span><i class="fas fa-map-marker-alt"></i> ${escapeHtml(job.location)}</span>
+                            <span><i class="fas fa-calendar"></i> ${formatDate(job.date)}</span>
+                            <span><i class="fas fa-clock"></i> ${job.start_time || 'TBD'} - ${job.end_time || 'TBD'}</span>
+                            <span><i class="fas fa-users"></i> ${job.number_of_staff} position${job.number_of_staff > 1 ? 's' : ''}</span>
+                        </div>
+                        ${skills.length > 0 ? `
+                        <div class="job-listing-skills">
+                            ${skills.slice(0, 5).map(skill => `<span>${escapeHtml(skill)}</span>`).join('')}
+                        </div>
+                        ` : ''}
+                        <p class="job-listing-description">
+                            ${escapeHtml(job.description || 'No description available.')}
+                        </p>
+                        <div class="job-listing-footer">
+                            <div class="job-listing-meta">
+                                ${isVerified ? '<span class="badge-verified"><i class="fas fa-check-circle"></i> Verified Organizer</span>' : ''}
+                                <span><i class="fas fa-briefcase"></i> ${escapeHtml(job.role)}</span>
+                            </div>
+                            ${hasApplied
+                    ? '<button class="btn-primary" disabled style="opacity: 0.6; cursor: not-allowed;">Applied</button>'
+                    : `<button class="btn-primary apply-job-btn" data-job-id="${job.id}">Apply Now</button>`
+                }
+                        </div>
+                    </div>
+                `;
+        }).join('');
+    } else {
+        container.innerHTML = jobs.map(job => {
+            const hasApplied = appliedJobIds.includes(job.id);
+
+            return `
+                <div class="job-card">
+                    <div class="job-header">
+                        <h3>${escapeHtml(job.title)}</h3>
+                        <span class="badge badge-${job.event_type}">${escapeHtml(job.event_type)}</span>
+                    </div>
+                    <div class="job-meta">
+                        <span><i class="fas fa-briefcase"></i> ${escapeHtml(job.role)}</span>
+                        <span><i class="fas fa-users"></i> ${job.number_of_staff} needed</span>
+                        <span><i class="fas fa-calendar"></i> ${formatDate(job.date)}</span>
+                        <span><i class="fas fa-map-marker-alt"></i> ${escapeHtml(job.location)}</span>
+                    </div>
+                    <p class="job-description">${escapeHtml(job.description)}</p>
+                    <div class="job-skills">
+                        ${job.skills ? job.skills.split(',').map(s => `<span class="skill-tag">${escapeHtml(s.trim())}</span>`).join('') : ''}
+                    </div>
+                    <div class="job-footer">
+                        <div class="pay-rate">₹${job.pay_rate}/${job.payment_type}</div>
+                        ${hasApplied
+                    ? '<button class="btn-primary" disabled style="opacity: 0.6; cursor: not-allowed;">Applied</button>'
+                    : `<button class="btn-primary apply-job-btn" data-job-id="${job.id}">Apply Now</button>`
+                }
+                    </div>
+                </div>
+            `;
+        }).join('');
+    }
+
+    if (isStaffPortal) {
+        setupJobFilters();
+    }
+}
+
+function setupJobFilters() {
+    const searchInput = document.getElementById('job-search-input');
+    const locationFilter = document.getElementById('filter-location');
+    const eventTypeFilter = document.getElementById('filter-event-type');
+    const payRangeFilter = document.getElementById('filter-pay-range');
+
+    if (!searchInput) return;
+
+    const filterJobs = () => {
+        const searchTerm = searchInput.value.toLowerCase().trim();
+        const locationTerm = locationFilter?.value.toLowerCase().trim();
+        const eventType = eventTypeFilter?.value.toLowerCase();
+        const payRange = payRangeFilter?.value;
+
+        const jobCards = document.querySelectorAll('.job-listing-card');
+
+        jobCards.forEach(card => {
+            const text = card.textContent.toLowerCase();
+
+            const locationElement = card.querySelector('[class*="location"], [class*="detail"]');
+            const jobLocation = locationElement ? locationElement.textContent.toLowerCase() : text;
+
+            const payElement = card.querySelector('.job-pay');
+            const pay = payElement ? parseInt(payElement.textContent.replace(/[^0-9]/g, '')) : 0;
+
+            let show = true;
+
+            if (searchTerm && !text.includes(searchTerm)) {
+                show = false;
+            }
+
+            if (locationTerm && locationTerm.length > 0) {
+                const locationWords = locationTerm.split(/[\s,]+/).filter(word => word.length > 2);
+
+                const hasLocationMatch = locationWords.some(word =>
+                    jobLocation.includes(word) || word.includes(jobLocation)
+                );
+
+                if (!hasLocationMatch) {
+                    show = false;
+                }
+            }
+
+            if (eventType && !text.includes(eventType)) {
+                show = false;
+            }
+
+            if (payRange) {
+                if (payRange === '0-2000' && pay > 2000) show = false;
+                if (payRange === '2000-3000' && (pay < 2000 || pay > 3000)) show = false;
+                if (payRange === '3000-5000' && (pay < 3000 || pay > 5000)) show = false;
+                if (payRange === '5000+' && pay < 5000) show = false;
+            }
+
+            card.style.display = show ? 'block' : 'none';
+        });
+    };
+
+    searchInput.addEventListener('input', filterJobs);
+    locationFilter?.addEventListener('input', filterJobs);
+    eventTypeFilter?.addEventListener('change', filterJobs);
+    payRangeFilter?.addEventListener('change', filterJobs);
+}
+
+export async function loadMyApplications() {
+    try {
+        const res = await fetch(`${API_BASE}/applications/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) {
+            if (res.status === 401) {
+                console.log('User not authenticated');
+            }
+            return;
+        }
+
+        const data = await res.json();
+        renderApplications(data.results || []);
+    } catch (err) {
+        console.error('Failed to load applications:', err);
+    }
+}
+
+export async function loadStaffApplications() {
+    try {
+        const res = await fetch(`${API_BASE}/applications/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) {
+            if (res.status === 401) {
+                console.log('User not authenticated - redirecting to login');
+                localStorage.removeItem('eventflex_user');
+                window.location.href = '/login';
+            }
+            return;
+        }
+
+        const data = await res.json();
+        const applications = data.results || [];
+
+        renderStaffApplications(applications);
+    } catch (err) {
+        console.error('Failed to load applications:', err);
+    }
+}
+
+function renderStaffApplications(applications) {
+    const pending = applications.filter(app => app.status === 'pending');
+    const accepted = applications.filter(app => app.status === 'accepted');
+    const rejected = applications.filter(app => app.status === 'rejected');
+
+    document.getElementById('pending-count').textContent = `(${pending.length})`;
+    document.getElementById('accepted-count').textContent = `(${accepted.length})`;
+    document.getElementById('rejected-count').textContent = `(${rejected.length})`;
+
+    const pendingContainer = document.getElementById('pending-applications');
+    if (pendingContainer) {
+        if (pending.length === 0) {
+            pendingContainer.innerHTML = '<p class="empty-state">No pending applications.</p>';
+        } else {
+            pendingContainer.innerHTML = pending.map(app => renderApplicationCard(app, 'pending')).join('');
+        }
+    }
+
+    const acceptedContainer = document.getElementById('accepted-applications');
+    if (acceptedContainer) {
+        if (accepted.length === 0) {
+            acceptedContainer.innerHTML = '<p class="empty-state">No accepted applications. Accepted applications move to "My Bookings".</p>';
+        } else {
+            acceptedContainer.innerHTML = accepted.map(app => renderApplicationCard(app, 'accepted')).join('');
+        }
+    }
+
+    const rejectedContainer = document.getElementById('rejected-applications');
+    if (rejectedContainer) {
+        if (rejected.length === 0) {
+            rejectedContainer.innerHTML = '<p class="empty-state">No rejected applications.</p>';
+        } else {
+            rejectedContainer.innerHTML = rejected.map(app => renderApplicationCard(app, 'rejected')).join('');
+        }
+    }
+}
+
+function renderApplicationCard(app, status) {
+    const statusBadgeClass = status === 'pending' ? 'pending' : status === 'accepted' ? 'confirmed' : 'pending';
+    const statusText = status === 'pending' ? 'Under Review' : status === 'accepted' ? 'Accepted' : 'Closed';
+    const organizerName = app.job.organizer?.username || 'Unknown Organizer';
+
+    return `
+            <div class="application-card">
+                <div class="application-header">
+                    <div>
+                        <h3>${escapeHtml(app.job.title)}</h3>
+                        <p>${escapeHtml(organizerName)} • ${escapeHtml(app.job.location)}</p>
+                    </div>
+                    <span class="status-badge ${statusBadgeClass}">${statusText}</span>
+                </div>
+                <div class="application-details">
+                    <p><i class="fas fa-calendar"></i> ${formatDate(app.job.date)} • ${app.job.start_time || 'TBD'} - ${app.job.end_time || 'TBD'}</p>
+                    <p><i class="fas fa-rupee-sign"></i> ₹${app.job.pay_rate}/${app.job.payment_type}</p>
+                </div>
+                <div class="application-footer">
+                    <span class="applied-date">Applied ${getTimeAgo(app.created_at)}</span>
+                    ${status === 'pending' ? '<button class="btn-outline btn-sm" onclick="withdrawApplication(' + app.id + ')">Withdraw</button>' : ''}
+                </div>
+            </div>
+        `;
+}
+
+export async function loadStaffBookings() {
+    try {
+        const res = await fetch(`${API_BASE}/applications/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) {
+            if (res.status === 401) {
+                console.log('User not authenticated - redirecting to login');
+                localStorage.removeItem('eventflex_user');
+                window.location.href = '/login';
+            }
+            return;
+        }
+
+        const data = await res.json();
+        const applications = data.results || [];
+
+        const acceptedApplications = applications.filter(app => app.status === 'accepted');
+
+        renderStaffBookings(acceptedApplications);
+    } catch (err) {
+        console.error('Failed to load bookings:', err);
+    }
+}
+
+function renderStaffBookings(applications) {
+    console.log('Total accepted applications:', applications.length);
+
+    // Filter by job status instead of date
+    const upcoming = applications.filter(app => app.job.status === 'active');
+    const completed = applications.filter(app => app.job.status === 'completed');
+
+    console.log('Upcoming bookings (active):', upcoming.length);
+    console.log('Completed bookings:', completed.length);
+
+    // Debug: log a sample application if available
+    if (applications.length > 0) {
+        console.log('Sample application:', applications[0]);
+    }
+
+    document.getElementById('upcoming-bookings-count').textContent = `(${upcoming.length})`;
+    document.getElementById('completed-bookings-count').textContent = `(${completed.length})`;
+    document.getElementById('cancelled-bookings-count').textContent = `(0)`;
+
+    const upcomingContainer = document.getElementById('upcoming-bookings');
+    if (upcomingContainer) {
+        if (upcoming.length === 0) {
+            upcomingContainer.innerHTML = '<p class="empty-state">No upcoming bookings.</p>';
+        } else {
+            upcomingContainer.innerHTML = upcoming.map(app => renderBookingCard(app, 'upcoming')).join('');
+        }
+    }
+
+    const completedContainer = document.getElementById('completed-bookings');
+    if (completedContainer) {
+        if (completed.length === 0) {
+            completedContainer.innerHTML = '<p class="empty-state">No completed bookings.</p>';
+        } else {
+            completedContainer.innerHTML = completed.map(app => renderBookingCard(app, 'completed')).join('');
+        }
+    }
+}
+
+function renderBookingCard(app, type) {
+    const jobDate = new Date(app.job.date);
+    const day = jobDate.getDate();
+    const month = jobDate.toLocaleDateString('en-US', { month: 'short' });
+    const organizerName = app.job.organizer?.username || 'Unknown Organizer';
+    const organizerEmail = app.job.organizer?.email || '';
+    const organizerPhone = app.job.organizer?.phone || '';
+    const statusBadgeClass = type === 'upcoming' ? 'confirmed' : 'completed';
+    const statusText = type === 'upcoming' ? 'Confirmed' : 'Completed';
+
+    return `
+            <div class="booking-card">
+                <div class="booking-header">
+                    <div class="booking-date-badge">
+                        <span class="day">${day}</span>
+                        <span class="month">${month}</span>
+                    </div>
+                    <div class="booking-info">
+                        <h3>${escapeHtml(app.job.title)}</h3>
+                        <p class="organizer">${escapeHtml(organizerName)}</p>
+                        <p><i class="fas fa-map-marker-alt"></i> ${escapeHtml(app.job.location)}</p>
+                    </div>
+                    <span class="status-badge ${statusBadgeClass}">${statusText}</span>
+                </div>
+                <div class="booking-details">
+                    <div class="detail-item">
+                        <span class="label">Time:</span>
+                        <span class="value">${app.job.start_time || 'TBD'} - ${app.job.end_time || 'TBD'}</span>
+                    </div>
+                    <div class="detail-item">
+                        <span class="label">Role:</span>
+                        <span class="value">${escapeHtml(app.job.role)}</span>
+                    </div>
+                    <div class="detail-item">
+                        <span class="label">Payment:</span>
+                        <span class="value">₹${app.job.pay_rate}</span>
+                    </div>
+                    ${type === 'upcoming' ? `
+                    <div class="detail-item">
+                        <span class="label">Check-in:</span>
+                        <span class="value"><button class="btn-sm btn-primary" onclick="generateQRCode(${app.id}, '${escapeHtml(app.job.title)}', '${formatDate(app.job.date)}', '${escapeHtml(app.job.location)}')">Generate QR</button></span>
+                    </div>
+                    ` : ''}
+                </div>
+                <div class="booking-actions">
+                    <button class="btn-outline" onclick="viewBookingDetails(${app.job.id})">
+                        <i class="fas fa-info-circle"></i> View Details
+                    </button>
+                    ${type === 'upcoming' ? `
+                    <button class="btn-outline" onclick="contactOrganizer('${escapeHtml(organizerName)}', '${escapeHtml(organizerEmail)}', '${escapeHtml(organizerPhone)}')">
+                        <i class="fas fa-envelope"></i> Contact Organizer
+                    </button>
+                    <button class="btn-outline" onclick="withdrawFromEvent(${app.id}, '${escapeHtml(app.job.title)}')" style="background: rgba(239, 68, 68, 0.1); border-color: #ef4444; color: #ef4444;">
+                        <i class="fas fa-times-circle"></i> Withdraw
+                    </button>
+                    ` : ''}
+                    ${type === 'completed' ? '<button class="btn-outline" onclick="downloadInvoice(' + app.id + ')"><i class="fas fa-file-invoice"></i> Download Invoice</button>' : ''}
+                </div>
+            </div>
+        `;
+}
+
+window.withdrawApplication = async function (appId) {
+    if (!confirm('Are you sure you want to withdraw this application?')) {
+        return;
+    }
+
+    showToast('Withdraw functionality coming soon', 'info');
+};
+
+function renderApplications(applications) {
+    const tabs = ['pending', 'accepted', 'rejected'];
+
+    tabs.forEach(status => {
+        const container = document.querySelector(`[data-tab-content="${status}-applications"]`);
+        if (!container) return;
+
+        const filtered = applications.filter(app => app.status === status);
+
+        if (filtered.length === 0) {
+            container.innerHTML = '<p class="empty-state">No ' + status + ' applications found.</p>';
+            return;
+        }
+
+        container.innerHTML = filtered.map(app => `
+                <div class="application-card">
+                    <h3>${escapeHtml(app.job.title)}</h3>
+                    <div class="application-meta">
+                        <span><i class="fas fa-briefcase"></i> ${escapeHtml(app.job.role)}</span>
+                        <span><i class="fas fa-calendar"></i> ${formatDate(app.job.date)}</span>
+                        <span><i class="fas fa-map-marker-alt"></i> ${escapeHtml(app.job.location)}</span>
+                    </div>
+                    <p><strong>Cover:</strong> ${escapeHtml(app.cover_message)}</p>
+                    <p><strong>Pay:</strong> ₹${app.job.pay_rate}/${app.job.payment_type}</p>
+                    <p class="application-date">Applied: ${formatDate(app.created_at)}</p>
+                    <span class="badge badge-${status}">${capitalize(status)}</span>
+                </div>
+            `).join('');
+    });
+}
+
+async function handleJobApply(button) {
+    const jobId = button.dataset.jobId;
+
+    console.log('handleJobApply called with jobId:', jobId);
+
+    if (!jobId) {
+        showToast('Job ID missing', 'error');
+        return;
+    }
+
+    if (!currentUser || !currentUser.username) {
+        showToast('Please log in to apply for jobs.', 'warning');
+        setTimeout(() => {
+            window.location.href = '/login/';
+        }, 1500);
+        return;
+    }
+
+    console.log('Calling showApplicationModal...');
+    showApplicationModal(jobId, button);
+}
+
+function showApplicationModal(jobId, button) {
+    console.log('showApplicationModal called with jobId:', jobId);
+
+    const modal = document.getElementById('application-modal');
+    const jobIdInput = document.getElementById('apply-job-id');
+    const modalJobTitle = document.getElementById('modal-job-title');
+    const roleInput = document.getElementById('apply-role');
+
+    console.log('Modal element:', modal);
+    console.log('Job ID input:', jobIdInput);
+
+    if (!modal || !jobIdInput) {
+        console.error('Application modal or job ID input not found');
+        return;
+    }
+
+    const jobCard = button.closest('.job-listing-card, .job-card');
+    let jobTitle = 'Job Application';
+    let jobRole = '';
+
+    if (jobCard) {
+        const titleElement = jobCard.querySelector('h3');
+        if (titleElement) {
+            jobTitle = titleElement.textContent.trim();
+        }
+
+        const roleElement = jobCard.querySelector('.job-role, [class*="role"]');
+        if (roleElement) {
+            jobRole = roleElement.textContent.trim();
+        } else {
+            const metaSpans = jobCard.querySelectorAll('.job-meta span');
+            metaSpans.forEach(span => {
+                const text = span.textContent.toLowerCase();
+                if (text.includes('photographer') || text.includes('videographer') ||
+                    text.includes('security') || text.includes('coordinator')) {
+                    jobRole = span.textContent.trim();
+                }
+            });
+        }
+    }
+
+    jobIdInput.value = jobId;
+    if (modalJobTitle) {
+        modalJobTitle.textContent = `Applying for: ${jobTitle}`;
+    }
+
+    if (currentUser) {
+        const fullNameInput = document.getElementById('apply-full-name');
+        const emailInput = document.getElementById('apply-email');
+        const phoneInput = document.getElementById('apply-phone');
+        const cityInput = document.getElementById('apply-city');
+
+        if (fullNameInput && currentUser.first_name && currentUser.last_name) {
+            fullNameInput.value = `${currentUser.first_name} ${currentUser.last_name}`.trim();
+        } else if (fullNameInput && currentUser.username) {
+            fullNameInput.value = currentUser.username;
+        }
+
+        if (emailInput && currentUser.email) {
+            emailInput.value = currentUser.email;
+        }
+
+        if (phoneInput && currentUser.phone) {
+            phoneInput.value = currentUser.phone;
+        }
+
+        if (cityInput && currentUser.city) {
+            cityInput.value = currentUser.city;
+        }
+
+        // Update badge display in application form
+        updateApplicationBadge(currentUser.badge, currentUser.average_rating, currentUser.total_reviews);
+    }
+
+    if (roleInput && jobRole) {
+        roleInput.value = jobRole;
+    }
+
+    console.log('About to show modal...');
+    modal.style.display = 'flex';
+    document.body.style.overflow = 'hidden';
+    console.log('Modal should now be visible');
+}
+
+function closeApplicationModal() {
+    const modal = document.getElementById('application-modal');
+    const form = document.getElementById('application-form');
+
+    if (modal) {
+        modal.style.display = 'none';
+        document.body.style.overflow = 'auto';
+    }
+
+    if (form) {
+        form.reset();
+    }
+}
+
+async function handleJobApplication(event) {
+    event.preventDefault();
+
+    const form = event.target;
+    const formData = new FormData(form);
+    const jobId = formData.get('job_id');
+
+    if (!jobId) {
+        showToast('Job ID missing', 'error');
+        return;
+    }
+
+    if (!currentUser || !currentUser.username) {
+        showToast('Please log in to submit application', 'warning');
+        return;
+    }
+
+    const cvFile = formData.get('cv');
+    if (!cvFile || cvFile.size === 0) {
+        showToast('Please upload your resume/CV', 'error');
+        return;
+    }
+
+    if (cvFile.size > 5 * 1024 * 1024) {
+        showToast('CV file size must be less than 5MB', 'error');
+        return;
+    }
+
+    const allowedTypes = ['.pdf', '.doc', '.docx'];
+    const fileName = cvFile.name.toLowerCase();
+    const isValidType = allowedTypes.some(type => fileName.endsWith(type));
+    if (!isValidType) {
+        showToast('Please upload PDF, DOC, or DOCX file only', 'error');
+        return;
+    }
+
+    const cvData = {
+        name: cvFile.name,
+        size: cvFile.size,
+        type: cvFile.type
+    };
+
+    const payload = {
+        username: currentUser.username,
+        full_name: formData.get('full_name'),
+        email: formData.get('email'),
+        phone: formData.get('phone'),
+        city: formData.get('city'),
+        role: formData.get('role'),
+        experience_years: formData.get('experience_years'),
+        portfolio_link: formData.get('portfolio_link') || '',
+        relevant_skills: formData.get('relevant_skills'),
+        certifications: formData.get('certifications') || '',
+        availability: formData.get('availability'),
+        notice_period: formData.get('notice_period') || '',
+        previous_events: formData.get('previous_events'),
+        references: formData.get('references') || '',
+        why_interested: formData.get('why_interested'),
+        expected_compensation: formData.get('expected_compensation') || '',
+        cover_message: formData.get('cover_message'),
+        cv_info: JSON.stringify(cvData)
+    };
+
+    try {
+        const res = await fetch(`${API_BASE}/jobs/${jobId}/apply/`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload),
+            credentials: 'include',
+        });
+
+        const data = await res.json();
+
+        if (!res.ok) {
+            if (data.already_applied) {
+                showToast('You have already applied to this job', 'warning');
+            } else {
+                showToast(data.error || 'Failed to submit application', 'error');
+            }
+            closeApplicationModal();
+            return;
+        }
+
+        showToast('Application submitted successfully!', 'success');
+        closeApplicationModal();
+
+        const applyButtons = document.querySelectorAll(`[data-job-id="${jobId}"]`);
+        applyButtons.forEach(btn => {
+            btn.disabled = true;
+            btn.textContent = 'Applied';
+            btn.style.opacity = '0.6';
+            btn.style.cursor = 'not-allowed';
+        });
+
+        setTimeout(() => {
+            if (typeof loadStaffApplications === 'function') {
+                loadStaffApplications();
+            }
+        }, 1000);
+    } catch (err) {
+        showToast('Network error while submitting application', 'error');
+        console.error(err);
+    }
+}
+
+window.showApplicationModal = showApplicationModal;
+window.closeApplicationModal = closeApplicationModal;
+window.handleJobApplication = handleJobApplication;
+
+window.generateQRCode = function (applicationId, eventTitle, eventDate, eventLocation) {
+    const modal = document.getElementById('qr-modal');
+    const qrContainer = document.getElementById('qr-code-container');
+    const eventTitleElement = document.getElementById('qr-event-title');
+    const eventDetailsElement = document.getElementById('qr-event-details');
+
+    qrContainer.innerHTML = '';
+
+    eventTitleElement.textContent = eventTitle;
+    eventDetailsElement.innerHTML = `
+            <strong>Date:</strong> ${eventDate}<br>
+            <strong>Location:</strong> ${eventLocation}<br>
+            <strong>Booking ID:</strong> #${applicationId}
+        `;
+
+    const qrData = JSON.stringify({
+        applicationId: applicationId,
+        eventTitle: eventTitle,
+        eventDate: eventDate,
+        eventLocation: eventLocation,
+        timestamp: new Date().toISOString()
+    });
+
+    try {
+        new QRCode(qrContainer, {
+            text: qrData,
+            width: 256,
+            height: 256,
+            colorDark: "#0f172a",
+            colorLight: "#ffffff",
+            correctLevel: QRCode.CorrectLevel.H
+        });
+
+        modal.style.display = 'flex';
+        document.body.style.overflow = 'hidden';
+
+        showToast('QR code generated successfully!', 'success');
+    } catch (error) {
+        console.error('QR code generation failed:', error);
+        showToast('Failed to generate QR code. Please try again.', 'error');
+    }
+};
+
+window.viewBookingDetails = async function (jobId) {
+    try {
+        const response = await fetch(`${API_BASE}/jobs/${jobId}/details/`, {
+            credentials: 'include'
+        });
+
+        if (!response.ok) {
+            showToast('Failed to load booking details', 'error');
+            return;
+        }
+
+        const job = await response.json();
+
+        // Create and show a modal with booking details
+        const modalHTML = `
+                <div id="booking-details-modal" class="modal" style="display: flex;">
+                    <div class="modal-content" style="max-width: 600px;">
+                        <span class="close" onclick="closeBookingDetailsModal()">&times;</span>
+                        <h2 style="color: #DAA520; margin-bottom: 1rem;">
+                            <i class="fas fa-calendar-check"></i> Booking Details
+                        </h2>
+                        
+                        <div style="background: rgba(218, 165, 32, 0.1); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
+                            <h3 style="margin-bottom: 1rem; font-size: 1.4rem;">${escapeHtml(job.title)}</h3>
+                            <div style="display: grid; gap: 0.75rem;">
+                                <div style="display: flex; align-items: center; gap: 0.5rem;">
+                                    <i class="fas fa-briefcase" style="color: #DAA520; width: 20px;"></i>
+                                    <strong>Role:</strong> ${escapeHtml(job.role)}
+                                </div>
+                                <div style="display: flex; align-items: center; gap: 0.5rem;">
+                                    <i class="fas fa-tag" style="color: #DAA520; width: 20px;"></i>
+                                    <strong>Event Type:</strong> ${escapeHtml(job.event_type)}
+                                </div>
+                                <div style="display: flex; align-items: center; gap: 0.5rem;">
+                                    <i class="fas fa-calendar" style="color: #DAA520; width: 20px;"></i>
+                                    <strong>Date:</strong> ${formatDate(job.date)}
+                                </div>
+                                <div style="display: flex; align-items: center; gap: 0.5rem;">
+                                    <i class="fas fa-clock" style="color: #DAA520; width: 20px;"></i>
+                                    <strong>Time:</strong> ${job.start_time || 'TBD'} - ${job.end_time || 'TBD'}
+                                </div>
+                                <div style="display: flex; align-items: center; gap: 0.5rem;">
+                                    <i class="fas fa-map-marker-alt" style="color: #DAA520; width: 20px;"></i>
+                                    <strong>Location:</strong> ${escapeHtml(job.location)}
+                                </div>
+                                <div style="display: flex; align-items: center; gap: 0.5rem;">
+                                    <i class="fas fa-money-bill-wave" style="color: #DAA520; width: 20px;"></i>
+                                    <strong>Payment:</strong> ₹${job.pay_rate}/${job.payment_type}
+                                </div>
+                                <div style="display: flex; align-items: center; gap: 0.5rem;">
+                                    <i class="fas fa-users" style="color: #DAA520; width: 20px;"></i>
+                                    <strong>Staff Needed:</strong> ${job.number_of_staff}
+                                </div>
+                            </div>
+                        </div>
+
+                        <div style="margin-bottom: 1.5rem;">
+                            <h4 style="color: #DAA520; margin-bottom: 0.5rem;">
+                                <i class="fas fa-info-circle"></i> Description
+                            </h4>
+                            <p style="line-height: 1.6; color: #94a3b8;">${escapeHtml(job.description) || 'No description provided'}</p>
+                        </div>
+
+                        ${job.skills ? `
+                        <div style="margin-bottom: 1.5rem;">
+                            <h4 style="color: #DAA520; margin-bottom: 0.5rem;">
+                                <i class="fas fa-star"></i> Required Skills
+                            </h4>
+                            <p style="line-height: 1.6; color: #94a3b8;">${escapeHtml(job.skills)}</p>
+                        </div>
+                        ` : ''}
+
+                        ${job.requirements ? `
+                        <div style="margin-bottom: 1.5rem;">
+                            <h4 style="color: #DAA520; margin-bottom: 0.5rem;">
+                                <i class="fas fa-clipboard-check"></i> Requirements
+                            </h4>
+                            <p style="line-height: 1.6; color: #94a3b8;">${escapeHtml(job.requirements)}</p>
+                        </div>
+                        ` : ''}
+
+                        <div style="background: rgba(34, 197, 94, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #22c55e;">
+                            <strong style="color: #22c55e;">
+                                <i class="fas fa-check-circle"></i> You are confirmed for this event!
+                            </strong>
+                        </div>
+                    </div>
+                </div>
+            `;
+
+        // Remove any existing modal
+        const existingModal = document.getElementById('booking-details-modal');
+        if (existingModal) {
+            existingModal.remove();
+        }
+
+        // Add modal to body
+        document.body.insertAdjacentHTML('beforeend', modalHTML);
+        document.body.style.overflow = 'hidden';
+
+    } catch (error) {
+        console.error('Error loading booking details:', error);
+        showToast('Error loading booking details', 'error');
+    }
+};
+
+window.closeBookingDetailsModal = function () {
+    const modal = document.getElementById('booking-details-modal');
+    if (modal) {
+        modal.remove();
+        document.body.style.overflow = 'auto';
+    }
+};
+
+window.contactOrganizer = function (organizerName, organizerEmail, organizerPhone) {
+    const contactHTML = `
+            <div id="contact-organizer-modal" class="modal" style="display: flex;">
+                <div class="modal-content" style="max-width: 500px;">
+                    <span class="close" onclick="closeContactOrganizerModal()">&times;</span>
+                    <h2 style="color: #DAA520; margin-bottom: 1.5rem;">
+                        <i class="fas fa-address-book"></i> Contact Organizer
+                    </h2>
+                    
+                    <div style="background: rgba(218, 165, 32, 0.1); padding: 1.5rem; border-radius: 8px; margin-bottom: 1.5rem;">
+                        <h3 style="margin-bottom: 1rem; font-size: 1.3rem;">
+                            <i class="fas fa-user-circle"></i> ${escapeHtml(organizerName)}
+                        </h3>
+                        
+                        <div style="display: flex; flex-direction: column; gap: 1rem;">
+                            ${organizerEmail ? `
+                            <div style="display: flex; align-items: center; gap: 0.75rem;">
+                                <i class="fas fa-envelope" style="color: #DAA520; width: 20px;"></i>
+                                <div style="flex: 1;">
+                                    <strong style="display: block; font-size: 0.85rem; color: #94a3b8; margin-bottom: 0.25rem;">Email</strong>
+                                    <a href="mailto:${escapeHtml(organizerEmail)}" 
+                                       style="color: #DAA520; text-decoration: none; font-size: 1rem;"
+                                       onmouseover="this.style.textDecoration='underline'"
+                                       onmouseout="this.style.textDecoration='none'">
+                                        ${escapeHtml(organizerEmail)}
+                                    </a>
+                                </div>
+                                <button onclick="copyToClipboard('${escapeHtml(organizerEmail)}')" 
+                                        class="btn-sm" 
+                                        style="padding: 0.5rem; background: rgba(218, 165, 32, 0.2); border: 1px solid #DAA520;"
+                                        title="Copy email">
+                                    <i class="fas fa-copy"></i>
+                                </button>
+                            </div>
+                            ` : '<p style="color: #94a3b8;"><i class="fas fa-envelope"></i> No email available</p>'}
+                            
+                            ${organizerPhone ? `
+                            <div style="display: flex; align-items: center; gap: 0.75rem;">
+                                <i class="fas fa-phone" style="color: #DAA520; width: 20px;"></i>
+                                <div style="flex: 1;">
+                                    <strong style="display: block; font-size: 0.85rem; color: #94a3b8; margin-bottom: 0.25rem;">Phone</strong>
+                                    <a href="tel:${escapeHtml(organizerPhone)}" 
+                                       style="color: #DAA520; text-decoration: none; font-size: 1rem;"
+                                       onmouseover="this.style.textDecoration='underline'"
+                                       onmouseout="this.style.textDecoration='none'">
+                                        ${escapeHtml(organizerPhone)}
+                                    </a>
+                                </div>
+                                <button onclick="copyToClipboard('${escapeHtml(organizerPhone)}')" 
+                                        class="btn-sm" 
+                                        style="padding: 0.5rem; background: rgba(218, 165, 32, 0.2); border: 1px solid #DAA520;"
+                                        title="Copy phone">
+                                    <i class="fas fa-copy"></i>
+                                </button>
+                            </div>
+                            ` : '<p style="color: #94a3b8;"><i class="fas fa-phone"></i> No phone number available</p>'}
+                        </div>
+                    </div>
+
+                    <div style="background: rgba(59, 130, 246, 0.1); padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6;">
+                        <p style="margin: 0; color: #94a3b8; font-size: 0.9rem;">
+                            <i class="fas fa-info-circle" style="color: #3b82f6;"></i>
+                            Contact the organizer for any questions about the event, venue details, or special instructions.
+                        </p>
+                    </div>
+                </div>
+            </div>
+        `;
+
+    // Remove any existing modal
+    const existingModal = document.getElementById('contact-organizer-modal');
+    if (existingModal) {
+        existingModal.remove();
+    }
+
+    // Add modal to body
+    document.body.insertAdjacentHTML('beforeend', contactHTML);
+    document.body.style.overflow = 'hidden';
+};
+
+window.closeContactOrganizerModal = function () {
+    const modal = document.getElementById('contact-organizer-modal');
+    if (modal) {
+        modal.remove();
+        document.body.style.overflow = 'auto';
+    }
+};
+
+window.copyToClipboard = function (text) {
+    if (navigator.clipboard && navigator.clipboard.writeText) {
+        navigator.clipboard.writeText(text).then(() => {
+            showToast('Copied to clipboard!', 'success');
+        }).catch(err => {
+            console.error('Failed to copy:', err);
+            showToast('Failed to copy', 'error');
+        });
+    } else {
+        // Fallback for older browsers
+        const textarea = document.createElement('textarea');
+        textarea.value = text;
+        textarea.style.position = 'fixed';
+        textarea.style.opacity = '0';
+        document.body.appendChild(textarea);
+        textarea.select();
+        try {
+            document.execCommand('copy');
+            showToast('Copied to clipboard!', 'success');
+        } catch (err) {
+            console.error('Failed to copy:', err);
+            showToast('Failed to copy', 'error');
+        }
+        document.body.removeChild(textarea);
+    }
+};
+
+window.withdrawFromEvent = async function (applicationId, eventTitle) {
+    const confirmMessage = `Are you sure you want to withdraw from "${eventTitle}"?\n\nThis action will:\n• Remove you from the event\n• Notify the organizer\n• Cannot be undone\n\nYou can apply again if the position is still available.`;
+
+    if (!confirm(confirmMessage)) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`${API_BASE}/applications/${applicationId}/withdraw/`, {
+            method: 'POST',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json'
+            }
+        });
+
+        const data = await response.json();
+
+        if (response.ok) {
+            showToast('Successfully withdrawn from event', 'success');
+            // Reload bookings to reflect the change
+            await loadStaffBookings();
+        } else {
+            showToast(data.error || 'Failed to withdraw from event', 'error');
+        }
+    } catch (error) {
+        console.error('Error withdrawing from event:', error);
+        showToast('Error withdrawing from event', 'error');
+    }
+};
+
+window.closeQRModal = function () {
+    const modal = document.getElementById('qr-modal');
+    modal.style.display = 'none';
+    document.body.style.overflow = 'auto';
+};
+
+window.addEventListener('click', function (event) {
+    const qrModal = document.getElementById('qr-modal');
+    if (event.target === qrModal) {
+        closeQRModal();
+    }
+
+    const bookingDetailsModal = document.getElementById('booking-details-modal');
+    if (event.target === bookingDetailsModal) {
+        closeBookingDetailsModal();
+    }
+
+    const contactOrganizerModal = document.getElementById('contact-organizer-modal');
+    if (event.target === contactOrganizerModal) {
+        closeContactOrganizerModal();
+    }
+});
+
+// ============ PAGE INITIALIZATION ============
+function initStaffForms() {
+    const applicationForm = document.getElementById('application-form');
+    if (applicationForm) {
+        applicationForm.addEventListener('submit', async (event) => {
+            await handleJobApplication(event);
+        });
+    }
+
+    document.addEventListener('click', async (event) => {
+        const btn = event.target.closest('.apply-job-btn');
+        if (btn) {
+            event.preventDefault();
+            await handleJobApply(btn);
+        }
+    });
+
+    const applicationModal = document.getElementById('application-modal');
+    if (applicationModal) {
+        applicationModal.addEventListener('click', (event) => {
+            if (event.target === applicationModal) {
+                closeApplicationModal();
+            }
+        });
+    }
+}
+
+async function loadStaffPortalData() {
+    if (document.getElementById('jobListings')) {
+        await loadJobListings();
+    }
+
+    if (currentUser) {
+        if (document.getElementById('stat-events-completed')) {
+            await loadStaffDashboardStats();
+        }
+
+        if (document.getElementById('staff-upcoming-events')) {
+            await loadStaffUpcomingEvents();
+        }
+
+        if (document.getElementById('pending-applications')) {
+            await loadStaffApplications();
+        }
+
+        if (document.getElementById('upcoming-bookings')) {
+            await loadStaffBookings();
+        }
+
+        if (document.getElementById('available-balance')) {
+            await loadWalletData();
+        }
+
+        if (document.getElementById('profile')) {
+            await loadProfileData();
+        }
+
+        if (document.querySelector('[data-tab-content="pending-applications"]')) {
+            await loadMyApplications();
+        }
+
+        if (document.getElementById('transactionsList')) {
+            await loadTransactions();
+        }
+
+        finishDashboardLoad();
+    }
+}
+
+onPageReady(() => {
+    initDashboard({
+        sectionLoaders: {
+            'discover-jobs': loadJobListings,
+            'my-applications': loadStaffApplications,
+            'my-bookings': loadStaffBookings,
+            dashboard: () => {
+                loadStaffDashboardStats();
+                loadStaffUpcomingEvents();
+            },
+        },
+    });
+    initStaffForms();
+    loadStaffPortalData();
+});
@@ -0,0 +1,141 @@
+// EventFlex - identity verification modal (loaded when it is first opened)
+import {
+    API_BASE,
+    currentUser,
+    refreshUserProfile,
+    saveCurrentUser,
+    showToast,
+} from 'eventflex/core';
+import {
+    loadProfileData,
+} from 'eventflex/profile';
+
+// ============ VERIFICATION MODAL FUNCTIONS ============
+window.showVerificationModal = async function () {
+    // Check verification status first and refresh profile
+    try {
+        // Refresh profile to get latest KYC status
+        await refreshUserProfile();
+
+        const response = await fetch(`${API_BASE}/verification/status/`, {
+            credentials: 'include'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+
+            // Update currentUser with latest KYC status from response
+            if (currentUser && data.kyc_verified !== undefined) {
+                currentUser.kyc_verified = data.kyc_verified;
+                saveCurrentUser(currentUser);
+            }
+
+            if (data.has_verification) {
+                const verification = data.verification;
+
+                if (verification.status === 'approved') {
+                    showToast('✅ You are already verified!', 'success');
+                    // Refresh profile data to show badge
+                    await loadProfileData();
+                    return;
+                } else if (verification.status === 'pending') {
+                    showToast('⏳ Your verification is pending review. Please wait for admin approval.', 'info');
+                    return;
+                } else if (verification.status === 'rejected') {
+                    showToast(`❌ Your previous verification was rejected: ${verification.rejection_reason || 'No reason provided'}. You can submit again.`, 'warning');
+                }
+            }
+        }
+    } catch (error) {
+        console.error('Error checking verification status:', error);
+    }
+
+    const modal = document.getElementById('verification-modal');
+    modal.style.display = 'flex';
+    document.body.style.overflow = 'hidden';
+};
+
+window.closeVerificationModal = function () {
+    const modal = document.getElementById('verification-modal');
+    modal.style.display = 'none';
+    document.body.style.overflow = 'auto';
+
+    // Reset form
+    const form = document.getElementById('verification-form');
+    if (form) {
+        form.reset();
+    }
+};
+
+window.handleVerificationSubmit = async function (event) {
+    event.preventDefault();
+
+    const form = event.target;
+    const formData = new FormData(form);
+
+    // Helper function to convert file to base64
+    const fileToBase64 = (file) => {
+        return new Promise((resolve, reject) => {
+            if (!file) {
+                resolve('');
+                return;
+            }
+            const reader = new FileReader();
+            reader.readAsDataURL(file);
+            reader.onload = () => resolve(reader.result);
+            reader.onerror = error => reject(error);
+        });
+    };
+
+    try {
+        // Convert images to base64
+        const docFront = formData.get('document_front');
+        const docBack = formData.get('document_back');
+        const selfie = formData.get('selfie_photo');
+
+        const payload = {
+            full_name: formData.get('full_name'),
+            date_of_birth: formData.get('date_of_birth'),
+            gender: formData.get('gender'),
+            address: formData.get('address'),
+            document_type: formData.get('document_type'),
+            document_number: formData.get('document_number'),
+            document_front: docFront ? await fileToBase64(docFront) : '',
+            document_back: docBack ? await fileToBase64(docBack) : '',
+            selfie_photo: selfie ? await fileToBase64(selfie) : '',
+            emergency_contact_name: formData.get('emergency_contact_name') || '',
+            emergency_contact_phone: formData.get('emergency_contact_phone') || '',
+            emergency_contact_relation: formData.get('emergency_contact_relation') || '',
+            years_of_experience: formData.get('years_of_experience') || '',
+            specialization: formData.get('specialization') || '',
+            previous_companies: formData.get('previous_companies') || '',
+            certifications: formData.get('certifications') || '',
+        };
+
+        const response = await fetch(`${API_BASE}/verification/submit/`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            credentials: 'include',
+            body: JSON.stringify(payload)
+        });
+
+        const data = await response.json();
+
+        if (response.ok) {
+            showToast('✓ Verification submitted successfully! We will review and update your status within 24-48 hours.', 'success');
+            closeVerificationModal();
+
+            // Reload profile data to update verification status
+            if (typeof loadProfileData === 'function') {
+                await loadProfileData();
+            }
+        } else {
+            showToast(data.error || 'Failed to submit verification', 'error');
+        }
+    } catch (error) {
+        console.error('Error submitting verification:', error);
+        showToast('Error submitting verification. Please try again.', 'error');
+    }
+};
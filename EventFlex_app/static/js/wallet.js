@@ -0,0 +1,716 @@
+// EventFlex - wallets of both roles: balances, transactions, add funds, payment
+// release, withdrawals and bank details
+import {
+    API_BASE,
+    currentUser,
+    escapeHtml,
+    formatDate,
+    formatNumber,
+    refreshUserProfile,
+    showToast,
+} from 'eventflex/core';
+
+export async function loadWalletData() {
+    await loadWalletStats();
+    await loadTransactionHistory();
+}
+
+export async function loadWalletStats() {
+    try {
+        const res = await fetch(`${API_BASE}/wallet/stats/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) {
+            if (res.status === 401) {
+                console.log('User not authenticated - redirecting to login');
+                localStorage.removeItem('eventflex_user');
+                window.location.href = '/login';
+            }
+            return;
+        }
+
+        const data = await res.json();
+
+        const availableBalanceEl = document.getElementById('available-balance');
+        const pendingAmountEl = document.getElementById('pending-amount');
+        const pendingTextEl = document.getElementById('pending-text');
+        const totalEarnedEl = document.getElementById('total-earned');
+        const totalEventsTextEl = document.getElementById('total-events-text');
+
+        if (availableBalanceEl) availableBalanceEl.textContent = `₹${formatNumber(data.available_balance)}`;
+        if (pendingAmountEl) pendingAmountEl.textContent = `₹${formatNumber(data.pending_amount)}`;
+        if (pendingTextEl) pendingTextEl.textContent = `From ${data.pending_count} completed event${data.pending_count !== 1 ? 's' : ''}`;
+        if (totalEarnedEl) totalEarnedEl.textContent = `₹${formatNumber(data.total_earned)}`;
+        if (totalEventsTextEl) totalEventsTextEl.textContent = `Across ${data.total_events} event${data.total_events !== 1 ? 's' : ''}`;
+
+        if (data.monthly_earnings) {
+            renderEarningsChart(data.monthly_earnings);
+        }
+    } catch (err) {
+        console.error('Failed to load wallet stats:', err);
+    }
+}
+
+function renderEarningsChart(monthlyData) {
+    const chartBars = document.getElementById('earnings-chart');
+    const chartLabels = document.getElementById('chart-labels');
+
+    if (!chartBars || !chartLabels) return;
+
+    if (monthlyData.length === 0) {
+        chartBars.innerHTML = '<p class="empty-state">No earnings data available</p>';
+        chartLabels.innerHTML = '';
+        return;
+    }
+
+    const maxAmount = Math.max(...monthlyData.map(m => parseFloat(m.amount)), 1);
+
+    chartBars.innerHTML = monthlyData.map(item => {
+        const amount = parseFloat(item.amount);
+        const height = (amount / maxAmount) * 100;
+        const displayAmount = amount >= 1000 ? `₹${(amount / 1000).toFixed(0)}k` : `₹${amount}`;
+
+        return `<div class="chart-bar" style="height: ${height}%"><span>${displayAmount}</span></div>`;
+    }).join('');
+
+    chartLabels.innerHTML = monthlyData.map(item =>
+        `<span>${item.month}</span>`
+    ).join('');
+}
+
+async function loadTransactionHistory() {
+    try {
+        const res = await fetch(`${API_BASE}/transactions/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) {
+            if (res.status === 401) {
+                console.log('User not authenticated - redirecting to login');
+                localStorage.removeItem('eventflex_user');
+                window.location.href = '/login';
+            }
+            return;
+        }
+
+        const data = await res.json();
+        const transactions = data.results || [];
+
+        renderTransactionHistory(transactions);
+    } catch (err) {
+        console.error('Failed to load transactions:', err);
+    }
+}
+
+function renderTransactionHistory(transactions) {
+    const container = document.getElementById('transactions-list');
+    if (!container) return;
+
+    if (transactions.length === 0) {
+        container.innerHTML = '<tr><td colspan="5" class="empty-state">No transactions found</td></tr>';
+        return;
+    }
+
+    container.innerHTML = transactions.map(txn => {
+        const date = formatDate(txn.created_at);
+        const statusClass = txn.status === 'completed' ? 'completed' : 'pending';
+        const statusText = txn.status === 'completed' ? 'Paid' : 'Pending';
+        const eventTitle = txn.event_title || 'Payment';
+        const organizerName = txn.organizer_name || '-';
+
+        return `
+                <tr>
+                    <td>${date}</td>
+                    <td>${escapeHtml(eventTitle)}</td>
+                    <td>${escapeHtml(organizerName)}</td>
+                    <td>₹${formatNumber(txn.amount)}</td>
+                    <td><span class="status-badge ${statusClass}">${statusText}</span></td>
+                </tr>
+            `;
+    }).join('');
+}
+
+// ===== Wallet Management Functions =====
+
+window.showAddFundsModal = function () {
+    document.getElementById('add-funds-modal').style.display = 'flex';
+    document.getElementById('add-funds-amount').value = '';
+    document.getElementById('add-funds-amount').focus();
+};
+
+window.closeAddFundsModal = function () {
+    document.getElementById('add-funds-modal').style.display = 'none';
+};
+
+window.handleAddFunds = async function (event) {
+    event.preventDefault();
+
+    const amount = parseFloat(document.getElementById('add-funds-amount').value);
+
+    if (amount < 100) {
+        showToast('Minimum amount is ₹100', 'error');
+        return;
+    }
+
+    try {
+        const response = await fetch(`${API_BASE}/wallet/add-funds/`, {
+            method: 'POST',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ amount: amount })
+        });
+
+        const data = await response.json();
+
+        if (response.ok) {
+            showToast(data.message || `₹${amount} added successfully!`, 'success');
+            closeAddFundsModal();
+
+            // Refresh wallet stats
+            await loadOrganizerWalletStats();
+
+            // Refresh transactions if on that tab
+            if (typeof loadTransactionHistory === 'function') {
+                await loadTransactionHistory();
+            }
+        } else {
+            showToast(data.error || 'Failed to add funds', 'error');
+        }
+    } catch (error) {
+        console.error('Error adding funds:', error);
+        showToast('Error adding funds. Please try again.', 'error');
+    }
+};
+
+window.showPendingPaymentsModal = async function () {
+    const modal = document.getElementById('pending-payments-modal');
+    modal.style.display = 'flex';
+
+    const listContainer = document.getElementById('pending-payments-list');
+    listContainer.innerHTML = '<p style="text-align: center; padding: 2rem;">Loading...</p>';
+
+    try {
+        // Get all applications for active jobs
+        const response = await fetch(`${API_BASE}/applications/`, {
+            credentials: 'include'
+        });
+
+        if (!response.ok) {
+            throw new Error('Failed to load applications');
+        }
+
+        const data = await response.json();
+        const applications = data.results || [];
+
+        // Filter for accepted applications in active jobs
+        const pendingPayments = applications.filter(app =>
+            app.status === 'accepted' &&
+            app.job &&
+            app.job.status === 'active'
+        );
+
+        if (pendingPayments.length === 0) {
+            listContainer.innerHTML = '<p class="empty-state">No pending payments. All hired staff have been paid.</p>';
+            return;
+        }
+
+        // Group by job
+        const jobGroups = {};
+        pendingPayments.forEach(app => {
+            const jobId = app.job.id;
+            if (!jobGroups[jobId]) {
+                jobGroups[jobId] = {
+                    job: app.job,
+                    staff: []
+                };
+            }
+            jobGroups[jobId].staff.push(app);
+        });
+
+        // Render grouped payments
+        listContainer.innerHTML = Object.values(jobGroups).map(group => {
+            const totalPayment = group.staff.reduce((sum, app) => sum + parseFloat(app.job.pay_rate), 0);
+
+            return `
+                    <div style="border: 1px solid #ddd; border-radius: 8px; padding: 1.5rem; margin-bottom: 1rem; background: #fafafa;">
+                        <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 1rem;">
+                            <div>
+                                <h3 style="color: var(--gold); margin-bottom: 0.5rem;">${escapeHtml(group.job.title)}</h3>
+                                <p style="color: #666; font-size: 0.9rem;">
+                                    <i class="fas fa-calendar"></i> ${formatDate(group.job.date)} | 
+                                    <i class="fas fa-map-marker-alt"></i> ${escapeHtml(group.job.location)}
+                                </p>
+                            </div>
+                            <div style="text-align: right;">
+                                <div style="font-size: 1.5rem; font-weight: bold; color: var(--gold);">₹${formatNumber(totalPayment)}</div>
+                                <div style="font-size: 0.9rem; color: #666;">${group.staff.length} staff member${group.staff.length !== 1 ? 's' : ''}</div>
+                            </div>
+                        </div>
+                        <div style="background: white; border-radius: 6px; padding: 1rem;">
+                            ${group.staff.map(app => `
+                                <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #f0f0f0;">
+                                    <div>
+                                        <strong>${escapeHtml(app.full_name || app.applicant.user.username)}</strong>
+                                        <div style="font-size: 0.85rem; color: #666;">${escapeHtml(app.job.role)}</div>
+                                    </div>
+                                    <div style="font-weight: bold; color: var(--gold);">₹${formatNumber(app.job.pay_rate)}</div>
+                                </div>
+                            `).join('')}
+                        </div>
+                        <div style="margin-top: 1rem; padding-top: 1rem; border-top: 1px solid #e0e0e0; display: flex; justify-content: space-between; align-items: center;">
+                            <p style="margin: 0; font-size: 0.85rem; color: #999;">
+                                💡 Click "Release Payment" to complete this event and pay staff
+                            </p>
+                            <button 
+                                class="btn-primary" 
+                                style="background: #10b981; border-color: #10b981; padding: 0.6rem 1.2rem; font-size: 0.9rem;"
+                                onclick="handleReleasePaymentForJob(${group.job.id}, '${escapeHtml(group.job.title)}', ${totalPayment})">
+                                <i class="fas fa-check-circle"></i> Release Payment
+                            </button>
+                        </div>
+                    </div>
+                `;
+        }).join('');
+
+    } catch (error) {
+        console.error('Error loading pending payments:', error);
+        listContainer.innerHTML = '<p class="empty-state" style="color: red;">Error loading pending payments</p>';
+    }
+};
+
+window.closePendingPaymentsModal = function () {
+    document.getElementById('pending-payments-modal').style.display = 'none';
+};
+
+window.handleReleasePaymentForJob = async function (jobId, jobTitle, totalAmount) {
+    if (!confirm(`Are you sure you want to release ₹${formatNumber(totalAmount)} for "${jobTitle}"?\n\nThis will:\n✓ Mark the event as finished\n✓ Deduct ₹${formatNumber(totalAmount)} from your wallet\n✓ Pay all hired staff immediately`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`${API_BASE}/jobs/${jobId}/finish/`, {
+            method: 'POST',
+            credentials: 'include',
+            headers: {
+                'Content-Type': 'application/json',
+            }
+        });
+
+        const data = await response.json();
+
+        if (!response.ok) {
+            throw new Error(data.error || 'Failed to release payment');
+        }
+
+        // Success
+        showToast(`✓ Successfully released ₹${formatNumber(totalAmount)} for "${jobTitle}"`, 'success');
+
+        // Close the pending payments modal
+        closePendingPaymentsModal();
+
+        // Refresh wallet stats and jobs list
+        loadOrganizerWalletStats();
+        loadOrganizerJobs();
+
+    } catch (error) {
+        console.error('Payment release error:', error);
+
+        // Show detailed error message
+        if (error.message.includes('insufficient')) {
+            showToast('⚠️ Insufficient balance. Please add funds to your wallet first.', 'error');
+        } else {
+            showToast(`❌ Failed to release payment: ${error.message}`, 'error');
+        }
+    }
+};
+
+window.showReleasedPaymentsModal = async function () {
+    const modal = document.getElementById('released-payments-modal');
+    modal.style.display = 'flex';
+
+    const listContainer = document.getElementById('released-payments-list');
+    listContainer.innerHTML = '<p style="text-align: center; padding: 2rem;">Loading...</p>';
+
+    try {
+        // Get transactions of type 'escrow_release'
+        const response = await fetch(`${API_BASE}/transactions/`, {
+            credentials: 'include'
+        });
+
+        if (!response.ok) {
+            throw new Error('Failed to load transactions');
+        }
+
+        const data = await response.json();
+        const transactions = data.results || [];
+
+        // Filter for escrow_release transactions
+        const releasedPayments = transactions.filter(txn =>
+            txn.transaction_type === 'escrow_release'
+        );
+
+        if (releasedPayments.length === 0) {
+            listContainer.innerHTML = '<p class="empty-state">No payments released yet.</p>';
+            return;
+        }
+
+        listContainer.innerHTML = releasedPayments.map(txn => `
+                <div style="border: 1px solid #ddd; border-radius: 8px; padding: 1.5rem; margin-bottom: 1rem; background: #fafafa;">
+                    <div style="display: flex; justify-content: space-between; align-items: start;">
+                        <div style="flex: 1;">
+                            <h3 style="color: var(--gold); margin-bottom: 0.5rem;">
+                                ${escapeHtml(txn.event_title || 'Event Payment')}
+                            </h3>
+                            <p style="color: #666; font-size: 0.9rem; margin-bottom: 0.5rem;">
+                                ${escapeHtml(txn.note || 'Payment released to staff')}
+                            </p>
+                            <p style="font-size: 0.85rem; color: #999;">
+                                <i class="fas fa-calendar"></i> ${formatDate(txn.created_at)}
+                            </p>
+                        </div>
+                        <div style="text-align: right;">
+                            <div style="font-size: 1.5rem; font-weight: bold; color: #e74c3c;">-₹${formatNumber(txn.amount)}</div>
+                            <div style="font-size: 0.85rem; color: #666; margin-top: 0.25rem;">
+                                Balance: ₹${formatNumber(txn.balance_after)}
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `).join('');
+
+    } catch (error) {
+        console.error('Error loading released payments:', error);
+        listContainer.innerHTML = '<p class="empty-state" style="color: red;">Error loading payment history</p>';
+    }
+};
+
+window.closeReleasedPaymentsModal = function () {
+    document.getElementById('released-payments-modal').style.display = 'none';
+};
+
+export async function loadOrganizerWalletStats() {
+    try {
+        const res = await fetch(`${API_BASE}/wallet/stats/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) {
+            return;
+        }
+
+        const data = await res.json();
+
+        // Update wallet balance
+        const balanceEl = document.getElementById('organizer-wallet-balance');
+        if (balanceEl) {
+            balanceEl.textContent = `₹${formatNumber(data.available_balance)}`;
+        }
+
+        // Update pending payments (committed but not yet released)
+        const pendingEl = document.getElementById('organizer-pending-payments');
+        if (pendingEl) {
+            pendingEl.textContent = `₹${formatNumber(data.pending_amount)}`;
+        }
+
+        // Calculate total released (from transactions)
+        const transRes = await fetch(`${API_BASE}/transactions/`, {
+            credentials: 'include'
+        });
+
+        if (transRes.ok) {
+            const transData = await transRes.json();
+            const transactions = transData.results || [];
+
+            // Sum all escrow_release transactions
+            const totalReleased = transactions
+                .filter(txn => txn.transaction_type === 'escrow_release')
+                .reduce((sum, txn) => sum + parseFloat(txn.amount), 0);
+
+            const releasedEl = document.getElementById('organizer-total-released');
+            if (releasedEl) {
+                releasedEl.textContent = `₹${formatNumber(totalReleased)}`;
+            }
+        }
+
+    } catch (err) {
+        console.error('Failed to load organizer wallet stats:', err);
+    }
+}
+
+export async function loadTransactions() {
+    try {
+        const res = await fetch(`${API_BASE}/transactions/`, {
+            credentials: 'include'
+        });
+
+        if (!res.ok) return;
+
+        const data = await res.json();
+        renderTransactions(data.results || []);
+    } catch (err) {
+        console.error('Failed to load transactions:', err);
+    }
+}
+
+function renderTransactions(transactions) {
+    const container = document.getElementById('transactionsList');
+    if (!container) return;
+
+    if (transactions.length === 0) {
+        container.innerHTML = '<p class="empty-state">No transactions yet.</p>';
+        return;
+    }
+
+    container.innerHTML = transactions.map(txn => {
+        const amount = parseFloat(txn.amount);
+        const isPositive = amount >= 0;
+
+        // Determine transaction icon and description based on type
+        let icon = '💰';
+        let typeLabel = '';
+
+        switch (txn.transaction_type) {
+            case 'deposit':
+                icon = '💳';
+                typeLabel = 'Deposit';
+                break;
+            case 'payment':
+                icon = '💵';
+                typeLabel = 'Payment Received';
+                break;
+            case 'withdrawal':
+                icon = '🏦';
+                typeLabel = 'Withdrawal';
+                break;
+            case 'escrow_hold':
+                icon = '🔒';
+                typeLabel = 'Funds Held';
+                break;
+            case 'escrow_release':
+                icon = '📤';
+                typeLabel = 'Payment Released';
+                break;
+            case 'refund':
+                icon = '↩️';
+                typeLabel = 'Refund';
+                break;
+            default:
+                typeLabel = txn.note || 'Transaction';
+        }
+
+        return `
+                <div class="transaction-item">
+                    <div style="display: flex; align-items: center; gap: 10px;">
+                        <span style="font-size: 24px;">${icon}</span>
+                        <div>
+                            <strong>${escapeHtml(typeLabel)}</strong>
+                            ${txn.event_title ? `<div style="font-size: 12px; color: #666;">${escapeHtml(txn.event_title)}</div>` : ''}
+                            ${txn.note ? `<div style="font-size: 11px; color: #999;">${escapeHtml(txn.note)}</div>` : ''}
+                            <span class="date">${formatDate(txn.created_at)}</span>
+                        </div>
+                    </div>
+                    <div style="text-align: right;">
+                        <div class="amount ${isPositive ? 'positive' : 'negative'}" style="font-size: 18px; font-weight: bold;">
+                            ${isPositive ? '+' : ''}₹${Math.abs(amount).toFixed(2)}
+                        </div>
+                        <div style="font-size: 11px; color: #666; margin-top: 2px;">
+                            Balance: ₹${parseFloat(txn.balance_after).toFixed(2)}
+                        </div>
+                    </div>
+                </div>
+            `;
+    }).join('');
+}
+
+window.showWithdrawModal = async function () {
+    const modal = document.getElementById('withdraw-modal');
+    const balanceInput = document.getElementById('withdraw-balance');
+    const availableBalance = document.getElementById('available-balance');
+
+    if (availableBalance) {
+        balanceInput.value = availableBalance.textContent;
+    }
+
+    // Check if user has bank details
+    try {
+        const response = await fetch(`${API_BASE}/wallet/bank-details/`, {
+            credentials: 'include'
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+
+            const bankDetailsDisplay = document.getElementById('bank-details-display');
+            const addBankBtn = document.getElementById('add-bank-btn');
+            const confirmWithdrawBtn = document.getElementById('confirm-withdraw-btn');
+            const bankAccountInput = document.getElementById('withdraw-bank-account');
+            const bankNameText = document.getElementById('withdraw-bank-name');
+
+            if (data.has_bank_details) {
+                // Show bank details
+                bankDetailsDisplay.style.display = 'block';
+                addBankBtn.style.display = 'none';
+                confirmWithdrawBtn.style.display = 'inline-block';
+
+                bankAccountInput.value = data.bank_account_number || '****';
+                bankNameText.textContent = data.bank_name ? `${data.bank_name} - ${data.bank_ifsc_code}` : data.bank_ifsc_code;
+            } else {
+                // No bank details - prompt to add
+                bankDetailsDisplay.style.display = 'none';
+                addBankBtn.style.display = 'inline-block';
+                confirmWithdrawBtn.style.display = 'none';
+                showToast('Please add your bank details to withdraw funds', 'info');
+            }
+        }
+    } catch (error) {
+        console.error('Error checking bank details:', error);
+    }
+
+    modal.style.display = 'flex';
+    document.body.style.overflow = 'hidden';
+};
+
+window.closeWithdrawModal = function () {
+    const modal = document.getElementById('withdraw-modal');
+    modal.style.display = 'none';
+    document.body.style.overflow = 'auto';
+};
+
+window.openBankDetailsFromWithdraw = function () {
+    closeWithdrawModal();
+    showBankDetailsModal();
+};
+
+window.showBankDetailsModal = function () {
+    const modal = document.getElementById('bank-details-modal');
+
+    // Pre-fill bank details if they exist
+    if (currentUser) {
+        document.getElementById('bank-account-holder').value = currentUser.bank_account_holder || '';
+        document.getElementById('bank-account-number').value = currentUser.bank_account_number || '';
+        document.getElementById('bank-account-number-confirm').value = currentUser.bank_account_number || '';
+        document.getElementById('bank-ifsc-code').value = currentUser.bank_ifsc_code || '';
+        document.getElementById('bank-name').value = currentUser.bank_name || '';
+        document.getElementById('bank-branch').value = currentUser.bank_branch || '';
+    }
+
+    modal.style.display = 'flex';
+    document.body.style.overflow = 'hidden';
+};
+
+window.closeBankDetailsModal = function () {
+    const modal = document.getElementById('bank-details-modal');
+    modal.style.display = 'none';
+    document.body.style.overflow = 'auto';
+};
+
+window.handleSaveBankDetails = async function (event) {
+    event.preventDefault();
+
+    const accountHolder = document.getElementById('bank-account-holder').value;
+    const accountNumber = document.getElementById('bank-account-number').value;
+    const accountNumberConfirm = document.getElementById('bank-account-number-confirm').value;
+    const ifscCode = document.getElementById('bank-ifsc-code').value;
+    const bankName = document.getElementById('bank-name').value;
+    const bankBranch = document.getElementById('bank-branch').value;
+
+    // Validate account numbers match
+    if (accountNumber !== accountNumberConfirm) {
+        showToast('Account numbers do not match', 'error');
+        return;
+    }
+
+    // Validate IFSC code format (11 characters)
+    if (ifscCode.length !== 11) {
+        showToast('IFSC code must be 11 characters', 'error');
+        return;
+    }
+
+    try {
+        const response = await fetch(`${API_BASE}/wallet/bank-details/update/`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            credentials: 'include',
+            body: JSON.stringify({
+                bank_account_holder: accountHolder,
+                bank_account_number: accountNumber,
+                bank_ifsc_code: ifscCode.toUpperCase(),
+                bank_name: bankName,
+                bank_branch: bankBranch
+            })
+        });
+
+        const data = await response.json();
+
+        if (response.ok) {
+            showToast(data.message || 'Bank details saved successfully!', 'success');
+
+            // Refresh user profile to get updated bank details
+            await refreshUserProfile();
+
+            closeBankDetailsModal();
+
+            // Clear form
+            document.getElementById('bank-account-holder').value = '';
+            document.getElementById('bank-account-number').value = '';
+            document.getElementById('bank-account-number-confirm').value = '';
+            document.getElementById('bank-ifsc-code').value = '';
+            document.getElementById('bank-name').value = '';
+            document.getElementById('bank-branch').value = '';
+        } else {
+            showToast(data.error || 'Failed to save bank details', 'error');
+        }
+    } catch (error) {
+        console.error('Error saving bank details:', error);
+        showToast('Failed to save bank details', 'error');
+    }
+};
+
+window.handleWithdraw = async function (event) {
+    event.preventDefault();
+
+    const amount = document.getElementById('withdraw-amount').value;
+
+    try {
+        const res = await fetch(`${API_BASE}/wallet/withdraw/`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            credentials: 'include',
+            body: JSON.stringify({ amount })
+        });
+
+        const data = await res.json();
+
+        if (res.ok) {
+            showToast(data.message, 'success');
+            closeWithdrawModal();
+            if (typeof loadWalletData === 'function') {
+                await loadWalletData();
+            }
+            if (typeof loadTransactions === 'function') {
+                await loadTransactions();
+            }
+        } else {
+            // Check if bank details are required
+            if (data.requires_bank_details) {
+                showToast(data.message || 'Please add your bank details first', 'error');
+                setTimeout(() => {
+                    closeWithdrawModal();
+                    showBankDetailsModal();
+                }, 1500);
+            } else {
+                showToast(data.error || 'Withdrawal failed', 'error');
+            }
+        }
+    } catch (err) {
+        console.error('Withdrawal error:', err);
+        showToast('Failed to process withdrawal', 'error');
+    }
+};
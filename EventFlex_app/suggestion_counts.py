@@ -0,0 +1,194 @@
+"""
+Suggestion Usage Counters for EventFlex
+Write-behind usage_count increments for AutocompleteSuggestion
+
+save_autocomplete_suggestion and create_job used to get_or_create each
+suggestion and then save() it with usage_count + 1: two or three statements
+per value (up to four values per job), and concurrent increments of the
+same row overwrote each other.
+
+increment() now only adds to a per-process buffer keyed by
+(field_type, value). flush() writes the whole buffer as one
+INSERT ... ON CONFLICT DO UPDATE SET usage_count = usage_count + n per batch,
+so concurrent writers add up instead of racing. A flush runs:
+
+    - AUTOCOMPLETE_FLUSH_SECONDS after the first buffered increment (timer thread)
+    - inline when the buffer holds MAX_PENDING values
+    - when the server process exits (flush_at_exit(), registered in wsgi.py)
+    - inline on every increment when AUTOCOMPLETE_FLUSH_SECONDS is 0, the
+      default on Vercel (settings.py), whose functions are frozen between
+      requests and killed without running exit hooks; each create_job or
+      save_autocomplete_suggestion is then still a single upsert
+
+Counts still in the buffer when a process is killed are lost; that is the
+price of keeping suggestion writes off the request path on long-lived
+servers. Flushed rows are
+passed to the process's autocomplete index straight away; other processes
+pick them up on their next refresh.
+"""
+
+import atexit
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, connection
+from django.db.models import F
+from django.utils import timezone
+
+from . import autocomplete
+
+# Distinct (field_type, value) pairs buffered before a flush is forced inline
+MAX_PENDING = 1000
+
+CHUNK_SIZE = 500
+
+_pending = {}
+_lock = threading.Lock()
+_timer = None
+
+
+def _flush_seconds():
+    return getattr(settings, 'AUTOCOMPLETE_FLUSH_SECONDS', 5)
+
+
+def increment(field_type, value, created_by=None):
+    """Count one use of a suggestion (see increment_many)"""
+    increment_many([(field_type, value)], created_by)
+
+
+def increment_many(pairs, created_by=None):
+    """
+    Count one use of each (field_type, value) pair
+
+    With AUTOCOMPLETE_FLUSH_SECONDS set to 0 all pairs are written by one flush.
+
+    Args:
+        pairs: Iterable of (field_type, value); blank values are skipped
+        created_by: UserProfile recorded on suggestions this creates
+    """
+    from .models import AutocompleteSuggestion
+
+    global _timer
+    created_by_id = created_by.id if created_by is not None else None
+    # An over-long value would fail the whole batch on PostgreSQL, and it would be retried forever
+    max_length = AutocompleteSuggestion._meta.get_field('value').max_length
+
+    with _lock:
+        for field_type, value in pairs:
+            value = (value or '').strip()[:max_length]
+            if not value:
+                continue
+            entry = _pending.setdefault((field_type, value), [0, created_by_id])
+            entry[0] += 1
+        flush_now = _flush_seconds() <= 0 or len(_pending) >= MAX_PENDING
+        if not flush_now and _timer is None and _pending:
+            _timer = threading.Timer(_flush_seconds(), _timed_flush)
+            _timer.daemon = True
+            _timer.start()
+
+    if flush_now:
+        flush()
+
+
+def _timed_flush():
+    global _timer
+    with _lock:
+        _timer = None
+    try:
+        flush()
+    except DatabaseError:
+        # The counts were put back; the next increment schedules another attempt
+        pass
+    finally:
+        connection.close()
+
+
+def flush():
+    """
+    Write every buffered increment to the database
+
+    Returns:
+        int: Number of suggestions written
+    """
+    global _pending
+    with _lock:
+        batch, _pending = _pending, {}
+    if not batch:
+        return 0
+
+    try:
+        _upsert(batch)
+    except Exception:
+        with _lock:
+            for key, (count, created_by_id) in batch.items():
+                entry = _pending.setdefault(key, [0, created_by_id])
+                entry[0] += count
+        raise
+    return len(batch)
+
+
+def _upsert(batch):
+    """Add the batch's counts to their rows, creating missing ones, and update this process's index"""
+    from .models import AutocompleteSuggestion
+
+    now = timezone.now()
+    rows = [(field_type, value, count, created_by_id) for (field_type, value), (count, created_by_id) in batch.items()]
+
+    if connection.vendor not in ('sqlite', 'postgresql'):
+        for field_type, value, count, created_by_id in rows:
+            updated = AutocompleteSuggestion.objects.filter(field_type=field_type, value=value).update(
+                usage_count=F('usage_count') + count, updated_at=now
+            )
+            if not updated:
+                try:
+                    AutocompleteSuggestion.objects.create(
+                        field_type=field_type, value=value, usage_count=count, created_by_id=created_by_id
+                    )
+                except IntegrityError:
+                    # Created by another process since the update
+                    AutocompleteSuggestion.objects.filter(field_type=field_type, value=value).update(
+                        usage_count=F('usage_count') + count, updated_at=now
+                    )
+        return
+
+    qn = connection.ops.quote_name
+    table = qn(AutocompleteSuggestion._meta.db_table)
+    stamp = connection.ops.adapt_datetimefield_value(now)
+    returning = ' RETURNING id, field_type, value, usage_count' if connection.features.can_return_rows_from_bulk_insert else ''
+    for start in range(0, len(rows), CHUNK_SIZE):
+        chunk = rows[start:start + CHUNK_SIZE]
+        placeholders = ', '.join(['(%s, %s, %s, %s, %s, %s)'] * len(chunk))
+        sql = (
+            f'INSERT INTO {table} (field_type, value, usage_count, created_by_id, created_at, updated_at) '
+            f'VALUES {placeholders} '
+            f'ON CONFLICT (field_type, value) DO UPDATE SET '
+            f'usage_count = {table}.usage_count + excluded.usage_count, '
+            f'updated_at = excluded.updated_at'
+            f'{returning}'
+        )
+        params = [value for row in chunk for value in (*row, stamp, stamp)]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            written = cursor.fetchall() if returning else []
+        for pk, field_type, value, usage_count in written:
+            autocomplete.record(AutocompleteSuggestion(
+                id=pk, field_type=field_type, value=value, usage_count=usage_count, updated_at=now,
+            ))
+
+
+def _flush_quietly():
+    try:
+        flush()
+    except Exception:
+        # Nothing left to retry with at exit
+        pass
+
+
+def flush_at_exit():
+    """
+    Flush the buffer when the interpreter exits
+
+    Only the server registers this: a test run or management command must
+    not write its leftovers to whatever database is configured at exit.
+    """
+    atexit.register(_flush_quietly)
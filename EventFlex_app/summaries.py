@@ -0,0 +1,404 @@
+"""
+Wallet Summaries for EventFlex
+Keeps one materialized WalletSummary row per profile so wallet_stats is a single-row read
+
+Two kinds of fields live on the summary:
+
+    - ledger fields (balance, total_earned, monthly_earnings) are folded in
+      incrementally by apply_transactions(), which record_transactions()
+      calls for every ledger write
+    - activity fields (pending_amount, pending_count, total_events) depend on
+      application and job state; the change-log hooks mark them stale and
+      they are recomputed with grouped queries on the next read
+
+rebuild_wallet_summaries() re-derives everything from the source tables
+(see the rebuild_wallet_summaries management command).
+
+The same ledger hook also maintains MonthlyTransactionRollup, completed
+totals per (user, month, transaction type). Reports over any month range
+read only the rollup, so a yearly report touches at most 12 rows per type
+instead of every transaction (see rebuild_monthly_rollups for re-deriving).
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+# Monthly earning buckets older than this are dropped from the summary row
+MONTHLY_BUCKETS_KEPT = 13
+
+# wallet_stats charts the last six months (same window as before materialization)
+CHART_WINDOW_DAYS = 180
+
+CHUNK_SIZE = 500
+
+CENTS = Decimal('0.01')
+
+
+def _month_key(value):
+    return timezone.localtime(value).strftime('%Y-%m')
+
+
+def _bucket_cutoff():
+    return (timezone.now() - timedelta(days=31 * MONTHLY_BUCKETS_KEPT)).replace(day=1)
+
+
+def _is_earning(txn):
+    return txn.transaction_type == 'payment' and txn.status == 'completed'
+
+
+def _activity_totals(profile_ids):
+    """
+    Compute pending pay and completed event counts for many profiles with grouped queries
+
+    Returns:
+        dict: {profile_id: (pending_amount, pending_count, total_events)}
+    """
+    from .models import UserProfile, Job, Application
+
+    user_types = dict(UserProfile.objects.filter(id__in=profile_ids).values_list('id', 'user_type'))
+    organizer_ids = [pid for pid, user_type in user_types.items() if user_type == 'organizer']
+    staff_ids = [pid for pid, user_type in user_types.items() if user_type != 'organizer']
+
+    pending = {}
+    events = {}
+    accepted_active = Application.objects.filter(status='accepted', job__status='active')
+    if staff_ids:
+        for row in (accepted_active.filter(applicant_id__in=staff_ids)
+                    .values('applicant_id').annotate(total=Sum('job__pay_rate'), count=Count('id'))):
+            pending[row['applicant_id']] = (row['total'], row['count'])
+        events.update(
+            Application.objects.filter(applicant_id__in=staff_ids, status='accepted', job__status='completed')
+            .values('applicant_id').annotate(count=Count('id')).values_list('applicant_id', 'count')
+        )
+    if organizer_ids:
+        for row in (accepted_active.filter(job__organizer_id__in=organizer_ids)
+                    .values('job__organizer_id').annotate(total=Sum('job__pay_rate'), count=Count('id'))):
+            pending[row['job__organizer_id']] = (row['total'], row['count'])
+        events.update(
+            Job.objects.filter(organizer_id__in=organizer_ids, status='completed')
+            .values('organizer_id').annotate(count=Count('id')).values_list('organizer_id', 'count')
+        )
+
+    return {
+        pid: (*pending.get(pid, (Decimal('0'), 0)), events.get(pid, 0))
+        for pid in user_types
+    }
+
+
+def _ledger_totals(profile_ids):
+    """
+    Compute balance, total earned and monthly buckets from the ledger
+
+    Returns:
+        dict: {profile_id: (balance, total_earned, monthly_earnings)}
+    """
+    from .models import UserProfile, Transaction
+
+    balances = dict(UserProfile.objects.filter(id__in=profile_ids).values_list('id', 'wallet_balance'))
+    earned = Transaction.objects.filter(user_id__in=profile_ids, transaction_type='payment', status='completed')
+    totals = dict(earned.values('user_id').annotate(total=Sum('amount')).values_list('user_id', 'total'))
+
+    monthly = defaultdict(dict)
+    rows = (earned.filter(created_at__gte=_bucket_cutoff())
+            .annotate(month=TruncMonth('created_at'))
+            .values('user_id', 'month').annotate(total=Sum('amount')))
+    for row in rows:
+        monthly[row['user_id']][row['month'].strftime('%Y-%m')] = str(Decimal(row['total']).quantize(CENTS))
+
+    return {
+        pid: (balance, totals.get(pid) or Decimal('0'), monthly.get(pid, {}))
+        for pid, balance in balances.items()
+    }
+
+
+def rebuild_wallet_summaries(profile_ids=None):
+    """
+    Re-derive wallet summaries from the source tables (upsert)
+
+    Args:
+        profile_ids: Iterable of UserProfile ids, or None for every profile
+
+    Returns:
+        int: Number of summaries written
+    """
+    from .models import UserProfile, WalletSummary
+
+    if profile_ids is None:
+        profile_ids = UserProfile.objects.order_by('id').values_list('id', flat=True).iterator()
+    profile_ids = list(profile_ids)
+
+    written = 0
+    for start in range(0, len(profile_ids), CHUNK_SIZE):
+        chunk = profile_ids[start:start + CHUNK_SIZE]
+        ledger = _ledger_totals(chunk)
+        activity = _activity_totals(chunk)
+        now = timezone.now()
+        summaries = [
+            WalletSummary(
+                profile_id=pid,
+                balance=balance,
+                total_earned=total_earned,
+                monthly_earnings=monthly,
+                pending_amount=activity[pid][0],
+                pending_count=activity[pid][1],
+                total_events=activity[pid][2],
+                activity_stale=False,
+                updated_at=now,
+            )
+            for pid, (balance, total_earned, monthly) in ledger.items()
+        ]
+        WalletSummary.objects.bulk_create(
+            summaries,
+            update_conflicts=True,
+            unique_fields=['profile'],
+            update_fields=[
+                'balance', 'total_earned', 'monthly_earnings', 'pending_amount',
+                'pending_count', 'total_events', 'activity_stale', 'updated_at',
+            ],
+        )
+        written += len(summaries)
+    return written
+
+
+def apply_transactions(transactions):
+    """
+    Fold newly written ledger rows into their owners' summaries
+
+    Runs inside the caller's transaction: summary rows are locked, updated in
+    Python and written back with one bulk UPDATE per batch. Profiles without
+    a summary yet get a full rebuild (which already sees the new rows).
+    """
+    from .models import UserProfile, WalletSummary
+
+    by_profile = defaultdict(list)
+    for txn in transactions:
+        by_profile[txn.user_id].append(txn)
+    if not by_profile:
+        return
+
+    with transaction.atomic():
+        summaries = list(
+            WalletSummary.objects.select_for_update().filter(profile_id__in=by_profile).order_by('profile_id')
+        )
+        missing = set(by_profile) - {summary.profile_id for summary in summaries}
+        if missing:
+            rebuild_wallet_summaries(missing)
+        if not summaries:
+            return
+
+        balances = dict(
+            UserProfile.objects.filter(id__in=[s.profile_id for s in summaries]).values_list('id', 'wallet_balance')
+        )
+        cutoff = _month_key(_bucket_cutoff())
+        now = timezone.now()
+        for summary in summaries:
+            summary.balance = balances[summary.profile_id]
+            buckets = dict(summary.monthly_earnings or {})
+            for txn in by_profile[summary.profile_id]:
+                if not _is_earning(txn):
+                    continue
+                summary.total_earned = Decimal(summary.total_earned) + txn.amount
+                key = _month_key(txn.created_at)
+                buckets[key] = str(Decimal(buckets.get(key, '0')) + txn.amount)
+            summary.monthly_earnings = {key: value for key, value in buckets.items() if key >= cutoff}
+            summary.updated_at = now
+
+        WalletSummary.objects.bulk_update(
+            summaries, ['balance', 'total_earned', 'monthly_earnings', 'updated_at'], batch_size=CHUNK_SIZE
+        )
+
+
+def mark_activity_stale(profile_ids):
+    """Flag pending/event counts for recomputation after an application or job changed"""
+    from .models import WalletSummary
+
+    profile_ids = {pid for pid in profile_ids if pid}
+    if profile_ids:
+        WalletSummary.objects.filter(profile_id__in=profile_ids, activity_stale=False).update(activity_stale=True)
+
+
+def get_wallet_summary(profile_id):
+    """
+    Fetch a profile's summary, building or refreshing it if needed
+
+    Steady state is one SELECT. The stale flag is cleared before recomputing,
+    so a change that lands mid-refresh re-flags the row for the next read.
+    """
+    from .models import WalletSummary
+
+    summary = WalletSummary.objects.filter(profile_id=profile_id).first()
+    if summary is None:
+        rebuild_wallet_summaries([profile_id])
+        return WalletSummary.objects.get(profile_id=profile_id)
+
+    if summary.activity_stale:
+        WalletSummary.objects.filter(profile_id=profile_id).update(activity_stale=False)
+        pending_amount, pending_count, total_events = _activity_totals([profile_id])[profile_id]
+        WalletSummary.objects.filter(profile_id=profile_id).update(
+            pending_amount=pending_amount, pending_count=pending_count, total_events=total_events
+        )
+        summary.pending_amount = pending_amount
+        summary.pending_count = pending_count
+        summary.total_events = total_events
+        summary.activity_stale = False
+    return summary
+
+
+def wallet_stats_from_summary(summary):
+    """Shape a WalletSummary like the wallet_stats API response"""
+    chart_start = _month_key(timezone.now() - timedelta(days=CHART_WINDOW_DAYS))
+    monthly_earnings = [
+        {'month': datetime.strptime(key, '%Y-%m').strftime('%b'), 'amount': amount}
+        for key, amount in sorted((summary.monthly_earnings or {}).items())
+        if key >= chart_start
+    ]
+    pending_amount = Decimal(summary.pending_amount).quantize(CENTS) if summary.pending_count else 0
+
+    return {
+        'available_balance': str(summary.balance),
+        'pending_amount': str(pending_amount),
+        'pending_count': summary.pending_count,
+        'total_earned': str(summary.total_earned),
+        'total_events': summary.total_events,
+        'monthly_earnings': monthly_earnings,
+    }
+
+
+def _month_start(value):
+    return timezone.localtime(value).date().replace(day=1)
+
+
+def _increment_rollups(deltas):
+    """
+    Add (amount, count) deltas to rollup rows, creating missing ones
+
+    Uses a single INSERT ... ON CONFLICT DO UPDATE per batch on SQLite and
+    PostgreSQL so concurrent writers add to the same row instead of racing.
+    """
+    from .models import MonthlyTransactionRollup
+
+    rows = [(user_id, month, txn_type, amount, count) for (user_id, month, txn_type), (amount, count) in deltas.items()]
+    if not rows:
+        return
+
+    if connection.vendor not in ('sqlite', 'postgresql'):
+        for user_id, month, txn_type, amount, count in rows:
+            updated = MonthlyTransactionRollup.objects.filter(
+                user_id=user_id, month=month, transaction_type=txn_type
+            ).update(total_amount=F('total_amount') + amount, transaction_count=F('transaction_count') + count)
+            if not updated:
+                MonthlyTransactionRollup.objects.create(
+                    user_id=user_id, month=month, transaction_type=txn_type,
+                    total_amount=amount, transaction_count=count
+                )
+        return
+
+    qn = connection.ops.quote_name
+    table = qn(MonthlyTransactionRollup._meta.db_table)
+    for start in range(0, len(rows), CHUNK_SIZE):
+        batch = rows[start:start + CHUNK_SIZE]
+        placeholders = ', '.join(['(%s, %s, %s, %s, %s)'] * len(batch))
+        sql = (
+            f'INSERT INTO {table} (user_id, month, transaction_type, total_amount, transaction_count) '
+            f'VALUES {placeholders} '
+            f'ON CONFLICT (user_id, month, transaction_type) DO UPDATE SET '
+            f'total_amount = {table}.total_amount + excluded.total_amount, '
+            f'transaction_count = {table}.transaction_count + excluded.transaction_count'
+        )
+        params = [value for row in batch for value in row]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+
+def apply_to_monthly_rollups(transactions):
+    """Add newly written completed ledger rows to the (user, month, type) rollup"""
+    deltas = defaultdict(lambda: [Decimal('0'), 0])
+    for txn in transactions:
+        if txn.status != 'completed':
+            continue
+        delta = deltas[(txn.user_id, _month_start(txn.created_at), txn.transaction_type)]
+        delta[0] += Decimal(txn.amount)
+        delta[1] += 1
+    _increment_rollups(deltas)
+
+
+def rebuild_monthly_rollups(profile_ids=None):
+    """
+    Re-derive the monthly rollup from Transaction with one grouped query
+
+    Args:
+        profile_ids: Iterable of UserProfile ids, or None for everyone
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    from .models import Transaction, MonthlyTransactionRollup
+
+    completed = Transaction.objects.filter(status='completed')
+    existing = MonthlyTransactionRollup.objects.all()
+    if profile_ids is not None:
+        profile_ids = list(profile_ids)
+        completed = completed.filter(user_id__in=profile_ids)
+        existing = existing.filter(user_id__in=profile_ids)
+
+    grouped = (completed.annotate(month_start=TruncMonth('created_at'))
+               .values('user_id', 'month_start', 'transaction_type')
+               .annotate(total=Sum('amount'), count=Count('id')))
+
+    with transaction.atomic():
+        existing.delete()
+        rollups = MonthlyTransactionRollup.objects.bulk_create(
+            (
+                MonthlyTransactionRollup(
+                    user_id=row['user_id'],
+                    month=row['month_start'].date(),
+                    transaction_type=row['transaction_type'],
+                    total_amount=row['total'],
+                    transaction_count=row['count'],
+                )
+                for row in grouped.iterator()
+            ),
+            batch_size=1000,
+        )
+    return len(rollups)
+
+
+def monthly_rollup_report(profile_id, first_month, last_month, transaction_types=None):
+    """
+    Per-month, per-type totals for a profile over an inclusive month range
+
+    Args:
+        profile_id: UserProfile id
+        first_month, last_month: dates on the first day of a month
+        transaction_types: Optional list restricting the types reported
+
+    Returns:
+        list: [{'month': 'YYYY-MM', 'totals': {type: {'amount', 'count'}}}, ...]
+              with an entry for every month in the range (empty totals when idle)
+    """
+    from .models import MonthlyTransactionRollup
+
+    rows = MonthlyTransactionRollup.objects.filter(
+        user_id=profile_id, month__gte=first_month, month__lte=last_month
+    )
+    if transaction_types:
+        rows = rows.filter(transaction_type__in=transaction_types)
+
+    by_month = defaultdict(dict)
+    for month, txn_type, amount, count in rows.values_list(
+        'month', 'transaction_type', 'total_amount', 'transaction_count'
+    ):
+        by_month[month][txn_type] = {'amount': str(Decimal(amount).quantize(CENTS)), 'count': count}
+
+    report = []
+    month = first_month
+    while month <= last_month:
+        report.append({'month': month.strftime('%Y-%m'), 'totals': by_month.get(month, {})})
+        month = (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return report
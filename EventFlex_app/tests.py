@@ -1,3 +1,536 @@
-from django.test import TestCase
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import DatabaseError
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from . import availability, landing_stats, roster, suggestion_counts, wallet
+from .models import (
+	Application, CalendarEntry, ChangeLogEntry, IdempotencyKey, Job, MonthlyTransactionRollup, RefreshLock, Transaction, UserProfile,
+	WalletSummary,
+)
+from .summaries import get_wallet_summary, rebuild_monthly_rollups, rebuild_wallet_summaries
+
+
+class MoneyTestCase(TestCase):
+	"""An organizer with ₹1000, a ₹300 job and three staff who applied to it"""
+
+	def setUp(self):
+		self.organizer_user = User.objects.create_user('organizer', password='test-pass-123')
+		self.organizer = UserProfile.objects.create(user=self.organizer_user, user_type='organizer')
+		wallet.credit(self.organizer.id, Decimal('1000'), 'deposit', note='Opening balance')
+
+		self.job = Job.objects.create(
+			organizer=self.organizer, title='Wedding reception', role='Usher', number_of_staff=3,
+			date=date(2030, 3, 14), pay_rate=Decimal('300'),
+		)
+		self.staff = []
+		self.applications = []
+		for index in range(3):
+			user = User.objects.create_user(f'staff{index}', password='test-pass-123')
+			profile = UserProfile.objects.create(user=user, user_type='staff')
+			self.staff.append(profile)
+			self.applications.append(Application.objects.create(job=self.job, applicant=profile))
+
+		self.client.force_login(self.organizer_user)
+
+	def post(self, url, data=None, **headers):
+		return self.client.post(url, json.dumps(data or {}), content_type='application/json', **headers)
+
+	def balances(self, profile):
+		profile.refresh_from_db(fields=['wallet_balance', 'escrow_balance'])
+		return profile.wallet_balance, profile.escrow_balance
+
+	def accept(self, application):
+		response = self.post(f'/api/applications/{application.id}/accept/')
+		self.assertEqual(response.status_code, 200, response.content)
+
+
+class WalletServiceTests(MoneyTestCase):
+	def test_credit_and_debit_write_ledger_rows(self):
+		txn = wallet.debit(self.organizer.id, Decimal('250'), 'withdrawal')
+		self.assertEqual(txn.balance_after, Decimal('750'))
+		txn = wallet.credit(self.organizer.id, Decimal('50'), 'deposit')
+		self.assertEqual(txn.balance_after, Decimal('800'))
+		self.assertEqual(self.balances(self.organizer), (Decimal('800'), Decimal('0')))
+		self.assertEqual(Transaction.objects.filter(user=self.organizer).count(), 3)
+
+	def test_debit_refuses_to_overdraw(self):
+		with self.assertRaises(wallet.InsufficientFunds) as raised:
+			wallet.debit(self.organizer.id, Decimal('1000.01'), 'withdrawal')
+		self.assertEqual(raised.exception.available, Decimal('1000'))
+		self.assertEqual(self.balances(self.organizer), (Decimal('1000'), Decimal('0')))
+		self.assertFalse(Transaction.objects.filter(user=self.organizer, transaction_type='withdrawal').exists())
+
+	def test_hold_refuses_more_than_the_wallet_holds(self):
+		wallet.debit(self.organizer.id, Decimal('500'), 'withdrawal')
+		response = self.post(f'/api/applications/{self.applications[0].id}/accept/')
+		self.assertEqual(response.status_code, 200, response.content)
+		response = self.post(f'/api/applications/{self.applications[1].id}/accept/')
+		self.assertEqual(response.status_code, 400)
+		self.assertEqual(self.balances(self.organizer), (Decimal('200'), Decimal('300')))
+		self.applications[1].refresh_from_db()
+		self.assertEqual(self.applications[1].status, 'pending')
+
+
+class EscrowTests(MoneyTestCase):
+	def test_hold_then_finish_pays_each_hire_once(self):
+		self.accept(self.applications[0])
+		self.accept(self.applications[1])
+		self.assertEqual(self.balances(self.organizer), (Decimal('400'), Decimal('600')))
+
+		response = self.post(f'/api/jobs/{self.job.id}/finish/')
+		self.assertEqual(response.status_code, 200, response.content)
+		self.assertEqual(self.balances(self.organizer), (Decimal('400'), Decimal('0')))
+		for profile, paid in zip(self.staff, (Decimal('300'), Decimal('300'), Decimal('0'))):
+			self.assertEqual(self.balances(profile), (paid, Decimal('0')))
+			self.assertEqual(Transaction.objects.filter(user=profile, transaction_type='payment').count(), 1 if paid else 0)
+
+		response = self.post(f'/api/jobs/{self.job.id}/finish/')
+		self.assertEqual(response.status_code, 400)
+		self.assertEqual(self.balances(self.staff[0]), (Decimal('300'), Decimal('0')))
+
+	def test_no_hires_after_finish(self):
+		self.accept(self.applications[0])
+		self.post(f'/api/jobs/{self.job.id}/finish/')
+
+		response = self.post(f'/api/applications/{self.applications[1].id}/accept/')
+		self.assertEqual(response.status_code, 400)
+		response = self.post(f'/api/applications/{self.applications[1].id}/status/', {'status': 'accepted'})
+		self.assertEqual(response.status_code, 400)
+		response = self.post('/api/applications/bulk-decision/', {'decisions': [{'id': self.applications[2].id, 'decision': 'accept'}]})
+		self.assertEqual(response.json()['results'][str(self.applications[2].id)]['outcome'], 'invalid_state')
+		self.assertEqual(self.balances(self.organizer), (Decimal('700'), Decimal('0')))
+
+	def test_reject_refunds_escrow(self):
+		self.accept(self.applications[0])
+		response = self.post(f'/api/applications/{self.applications[0].id}/status/', {'status': 'rejected'})
+		self.assertEqual(response.status_code, 200, response.content)
+		self.assertEqual(self.balances(self.organizer), (Decimal('1000'), Decimal('0')))
+		self.assertTrue(Transaction.objects.filter(application=self.applications[0], transaction_type='refund').exists())
+
+	def test_withdraw_refunds_escrow(self):
+		self.accept(self.applications[0])
+		self.client.force_login(self.staff[0].user)
+		response = self.post(f'/api/applications/{self.applications[0].id}/withdraw/')
+		self.assertEqual(response.status_code, 200, response.content)
+		self.assertEqual(self.balances(self.organizer), (Decimal('1000'), Decimal('0')))
+
+		# Finishing afterwards pays nobody and takes nothing more from the organizer
+		self.client.force_login(self.organizer_user)
+		self.post(f'/api/jobs/{self.job.id}/finish/')
+		self.assertEqual(self.balances(self.organizer), (Decimal('1000'), Decimal('0')))
+		self.assertEqual(self.balances(self.staff[0]), (Decimal('0'), Decimal('0')))
+
+	def test_complete_settles_escrow_like_finish(self):
+		self.accept(self.applications[0])
+		response = self.post(f'/api/jobs/{self.job.id}/complete/')
+		self.assertEqual(response.status_code, 200, response.content)
+		self.assertEqual(self.balances(self.organizer), (Decimal('700'), Decimal('0')))
+		self.assertEqual(self.balances(self.staff[0]), (Decimal('300'), Decimal('0')))
+
+		self.assertEqual(self.post(f'/api/jobs/{self.job.id}/finish/').status_code, 400)
+		self.assertEqual(self.post(f'/api/jobs/{self.job.id}/complete/').status_code, 400)
+		self.assertEqual(self.balances(self.staff[0]), (Decimal('300'), Decimal('0')))
+
+	def test_delete_refunds_escrow(self):
+		self.accept(self.applications[0])
+		self.accept(self.applications[1])
+		response = self.client.delete(f'/api/jobs/{self.job.id}/delete/')
+		self.assertEqual(response.status_code, 200, response.content)
+		self.assertEqual(self.balances(self.organizer), (Decimal('1000'), Decimal('0')))
+		self.assertFalse(Job.objects.filter(id=self.job.id).exists())
+
+	def test_finished_job_cannot_be_deleted(self):
+		self.accept(self.applications[0])
+		self.post(f'/api/jobs/{self.job.id}/finish/')
+		response = self.client.delete(f'/api/jobs/{self.job.id}/delete/')
+		self.assertEqual(response.status_code, 400)
+		self.assertTrue(Job.objects.filter(id=self.job.id).exists())
+		self.assertEqual(self.balances(self.organizer), (Decimal('700'), Decimal('0')))
+
+	def test_escrow_balance_is_only_shown_to_its_owner(self):
+		self.accept(self.applications[0])
+		self.assertEqual(self.client.get('/api/profiles/me/').json()['profile']['escrow_balance'], '300.00')
+		self.assertEqual(self.client.get('/api/wallet/stats/').json()['escrow_balance'], '300.00')
+
+		self.client.logout()
+		organizer = self.client.get('/api/jobs/').json()['results'][0]['organizer']
+		self.assertNotIn('escrow_balance', organizer)
+
+
+class BulkDecisionTests(MoneyTestCase):
+	def decide(self, *decisions):
+		response = self.post('/api/applications/bulk-decision/', {
+			'decisions': [{'id': application.id, 'decision': decision} for application, decision in decisions],
+		})
+		self.assertEqual(response.status_code, 200, response.content)
+		return response.json()
+
+	def outcomes(self, data):
+		return {int(app_id): result['outcome'] for app_id, result in data['results'].items()}
+
+	def booked(self, application):
+		return CalendarEntry.objects.filter(application=application, kind='booking').exists()
+
+	def test_mixed_batch_holds_accepts_and_refunds_released_hires(self):
+		first, second, third = self.applications
+		self.accept(third)
+
+		data = self.decide((first, 'accept'), (second, 'reject'), (third, 'reject'))
+		self.assertEqual(self.outcomes(data), {first.id: 'accepted', second.id: 'rejected', third.id: 'rejected'})
+		self.assertEqual((data['accepted'], data['rejected']), (1, 2))
+		self.assertEqual(self.balances(self.organizer), (Decimal('700'), Decimal('300')))
+		self.assertEqual((data['wallet_balance'], data['escrow_balance']), ('700.00', '300.00'))
+
+		statuses = dict(Application.objects.filter(job=self.job).values_list('id', 'status'))
+		self.assertEqual(statuses, {first.id: 'accepted', second.id: 'rejected', third.id: 'rejected'})
+		self.assertTrue(self.booked(first))
+		self.assertFalse(self.booked(third))
+		self.assertTrue(Transaction.objects.filter(application=third, transaction_type='refund').exists())
+
+	def test_batch_over_the_wallet_holds_nothing(self):
+		Job.objects.filter(id=self.job.id).update(pay_rate=Decimal('400'))
+		extra = UserProfile.objects.create(user=User.objects.create_user('staff3', password='test-pass-123'), user_type='staff')
+		rejected = Application.objects.create(job=self.job, applicant=extra)
+
+		data = self.decide(*[(application, 'accept') for application in self.applications], (rejected, 'reject'))
+		for application in self.applications:
+			self.assertEqual(self.outcomes(data)[application.id], 'insufficient_funds')
+		# Rejects are not money moves and still go through
+		self.assertEqual(self.outcomes(data)[rejected.id], 'rejected')
+		self.assertEqual((data['accepted'], data['rejected']), (0, 1))
+		self.assertEqual((data['required'], data['available']), ('1200.00', '1000.00'))
+
+		self.assertEqual(self.balances(self.organizer), (Decimal('1000'), Decimal('0')))
+		self.assertFalse(Transaction.objects.filter(transaction_type='escrow_hold').exists())
+		self.assertFalse(CalendarEntry.objects.filter(kind='booking').exists())
+		self.assertEqual(Application.objects.filter(job=self.job, status='pending').count(), 3)
+
+	def test_batch_after_finish_changes_nothing(self):
+		first, second, third = self.applications
+		self.accept(first)
+		self.post(f'/api/jobs/{self.job.id}/finish/')
+
+		data = self.decide((first, 'reject'), (second, 'accept'), (third, 'reject'))
+		self.assertEqual(set(self.outcomes(data).values()), {'invalid_state'})
+		self.assertEqual((data['accepted'], data['rejected']), (0, 0))
+		self.assertEqual(self.balances(self.organizer), (Decimal('700'), Decimal('0')))
+		self.assertEqual(self.balances(self.staff[0]), (Decimal('300'), Decimal('0')))
+
+		statuses = dict(Application.objects.filter(job=self.job).values_list('id', 'status'))
+		self.assertEqual(statuses, {first.id: 'accepted', second.id: 'pending', third.id: 'pending'})
+		self.assertTrue(self.booked(first))
+		self.assertFalse(Transaction.objects.filter(transaction_type='refund').exists())
+
+
+class CalendarTests(MoneyTestCase):
+	def moment(self, *args):
+		return timezone.make_aware(datetime(*args))
+
+	def bookings(self, profile):
+		return list(CalendarEntry.objects.filter(profile=profile, kind='booking').values_list('application_id', flat=True))
+
+	def test_job_interval(self):
+		overnight = Job(date=date(2030, 3, 14), start_time=time(22), end_time=time(2))
+		self.assertEqual(availability.job_interval(overnight), (self.moment(2030, 3, 14, 22), self.moment(2030, 3, 15, 2)))
+		# No times: the whole date
+		self.assertEqual(availability.job_interval(self.job), (self.moment(2030, 3, 14), self.moment(2030, 3, 15)))
+		no_end = Job(date=date(2030, 3, 14), start_time=time(9))
+		self.assertEqual(availability.job_interval(no_end), (self.moment(2030, 3, 14, 9), self.moment(2030, 3, 15)))
+		self.assertIsNone(availability.job_interval(Job()))
+
+	def test_long_unavailable_block_is_stored_in_max_span_pieces(self):
+		self.client.force_login(self.staff[0].user)
+		response = self.post('/api/calendar/unavailable/', {'starts_at': '2030-01-20', 'ends_at': '2030-03-14', 'note': 'Travelling'})
+		self.assertEqual(response.status_code, 200, response.content)
+
+		pieces = list(CalendarEntry.objects.filter(profile=self.staff[0], kind='unavailable').order_by('starts_at'))
+		self.assertEqual(len(pieces), 2)
+		self.assertEqual(pieces[0].starts_at, self.moment(2030, 1, 20))
+		self.assertEqual(pieces[0].ends_at, pieces[1].starts_at)
+		self.assertEqual(pieces[1].ends_at, self.moment(2030, 3, 15))
+		self.assertTrue(all(piece.ends_at - piece.starts_at <= availability.MAX_SPAN for piece in pieces))
+
+		calendar = self.client.get('/api/calendar/?from=2030-03-01&to=2030-03-31').json()
+		self.assertEqual([entry['id'] for entry in calendar['results']], [pieces[1].id])
+
+		# The job day falls in the last piece, so the bounded overlap check still finds it
+		self.client.force_login(self.organizer_user)
+		response = self.post(f'/api/applications/{self.applications[0].id}/accept/')
+		self.assertEqual(response.status_code, 409)
+		self.assertEqual(self.balances(self.organizer), (Decimal('1000'), Decimal('0')))
+
+	def test_find_conflicts_flags_the_later_of_two_overlapping_applications(self):
+		evening = Job.objects.create(
+			organizer=self.organizer, title='After party', number_of_staff=1, date=date(2030, 3, 14),
+			start_time=time(18), end_time=time(23), pay_rate=Decimal('100'),
+		)
+		day_shift = self.applications[0]
+		evening_shift = Application.objects.create(job=evening, applicant=self.staff[0])
+		other = self.applications[1]
+
+		self.assertEqual(list(availability.find_conflicts([day_shift, evening_shift, other])), [evening_shift.id])
+		self.assertEqual(list(availability.find_conflicts([evening_shift, day_shift, other])), [day_shift.id])
+
+		self.accept(evening_shift)
+		response = self.post(f'/api/applications/{day_shift.id}/accept/')
+		self.assertEqual(response.status_code, 409)
+		self.assertEqual(response.json()['conflicts'][0]['application_id'], day_shift.id)
+		self.assertEqual(self.bookings(self.staff[0]), [evening_shift.id])
+		self.assertEqual(self.balances(self.organizer), (Decimal('900'), Decimal('100')))
+
+	def test_accept_books_and_reject_or_withdraw_unbooks(self):
+		first, second, third = self.applications
+		for application in self.applications:
+			self.accept(application)
+		for profile, application in zip(self.staff, self.applications):
+			self.assertEqual(self.bookings(profile), [application.id])
+		booking = CalendarEntry.objects.get(application=first)
+		self.assertEqual((booking.starts_at, booking.ends_at), availability.job_interval(self.job))
+
+		self.post(f'/api/applications/{first.id}/status/', {'status': 'rejected'})
+		self.assertEqual(self.bookings(self.staff[0]), [])
+		self.post(f'/api/applications/{second.id}/reject/')
+		self.assertEqual(self.bookings(self.staff[1]), [])
+
+		self.client.force_login(self.staff[2].user)
+		response = self.post(f'/api/applications/{third.id}/withdraw/')
+		self.assertEqual(response.status_code, 200, response.content)
+		self.assertFalse(CalendarEntry.objects.filter(kind='booking').exists())
+
+		# Free again: the withdrawn staff member can block out the day
+		response = self.post('/api/calendar/unavailable/', {'starts_at': '2030-03-14', 'ends_at': '2030-03-14'})
+		self.assertEqual(response.status_code, 200, response.content)
+
+
+class RosterAssignTests(SimpleTestCase):
+	def opening(self, job_id, pay_rate, positions, interval=None):
+		return roster.Opening(job_id, f'Job {job_id}', 'Usher', Decimal(pay_rate), positions, interval)
+
+	def candidate(self, application_id, job_id, applicant_id, ai_rating):
+		# No reviews: every reputation is PRIOR_RATING, so ai_rating alone orders them
+		return roster.Candidate(application_id, job_id, applicant_id, f'Staff {applicant_id}', ai_rating, 0, 0)
+
+	def hired(self, result):
+		return {job_id: [candidate.application_id for candidate, _ in chosen] for job_id, chosen in result['hires'].items()}
+
+	def shift(self, start_hour, end_hour):
+		day = datetime(2030, 3, 14)
+		return timezone.make_aware(day.replace(hour=start_hour)), timezone.make_aware(day.replace(hour=end_hour))
+
+	def test_budget_covering_every_opening_takes_the_best_scores(self):
+		openings = [self.opening(1, '100', 2), self.opening(2, '200', 1)]
+		candidates = [
+			self.candidate(11, 1, 101, 3), self.candidate(12, 1, 102, 5), self.candidate(13, 1, 103, 4),
+			self.candidate(21, 2, 104, 1), self.candidate(22, 2, 105, 2),
+		]
+		result = roster.assign(openings, candidates, Decimal('400'))
+		self.assertFalse(result['by_density'])
+		self.assertEqual(self.hired(result), {1: [12, 13], 2: [22]})
+		self.assertEqual(result['cost'], Decimal('400'))
+		self.assertEqual(result['skipped'], {'calendar_conflict': 0, 'over_budget': 0})
+
+	def test_budget_shortfall_takes_score_per_rupee(self):
+		openings = [self.opening(1, '100', 2), self.opening(2, '1000', 1)]
+		candidates = [self.candidate(11, 1, 101, 3), self.candidate(12, 1, 102, 2), self.candidate(21, 2, 103, 5)]
+		result = roster.assign(openings, candidates, Decimal('1000'))
+		self.assertTrue(result['by_density'])
+		# By score alone the ₹1000 hire would come first and spend the whole budget on one position
+		self.assertEqual(self.hired(result), {1: [11, 12], 2: []})
+		self.assertEqual(result['cost'], Decimal('200'))
+		self.assertEqual(result['skipped']['over_budget'], 1)
+
+	def test_applicant_is_not_rostered_for_overlapping_jobs(self):
+		openings = [self.opening(1, '100', 1, self.shift(10, 18)), self.opening(2, '100', 1, self.shift(16, 22))]
+		candidates = [self.candidate(11, 1, 101, 5), self.candidate(21, 2, 101, 5), self.candidate(22, 2, 102, 1)]
+		result = roster.assign(openings, candidates, Decimal('1000'))
+		self.assertEqual(self.hired(result), {1: [11], 2: [22]})
+		self.assertEqual(result['skipped']['calendar_conflict'], 1)
+
+		# An existing entry in the calendar rules the applicant out of both
+		calendar = availability.CalendarIndex([CalendarEntry(
+			profile_id=101, kind='unavailable', starts_at=self.shift(0, 1)[0], ends_at=self.shift(0, 23)[1],
+		)])
+		result = roster.assign(openings, candidates, Decimal('1000'), calendar)
+		self.assertEqual(self.hired(result), {1: [], 2: [22]})
+		self.assertEqual(result['skipped']['calendar_conflict'], 2)
+
+
+class IdempotencyTests(MoneyTestCase):
+	def add_funds(self, amount, key):
+		return self.post('/api/wallet/add-funds/', {'amount': amount}, HTTP_IDEMPOTENCY_KEY=key)
+
+	def test_retry_replays_the_first_response(self):
+		first = self.add_funds(100, 'deposit-1')
+		self.assertEqual(first.status_code, 200, first.content)
+		retry = self.add_funds(100, 'deposit-1')
+		self.assertEqual(retry.status_code, 200)
+		self.assertEqual(retry['Idempotent-Replayed'], 'true')
+		self.assertEqual(retry.json(), first.json())
+		self.assertEqual(self.balances(self.organizer)[0], Decimal('1100'))
+
+	def test_same_key_with_a_different_payload_is_refused(self):
+		self.add_funds(100, 'deposit-1')
+		response = self.add_funds(200, 'deposit-1')
+		self.assertEqual(response.status_code, 422)
+		self.assertEqual(self.balances(self.organizer)[0], Decimal('1100'))
+
+	def test_unfinished_request_is_not_run_again(self):
+		self.add_funds(100, 'deposit-1')
+		# As left behind by a worker that died mid-request, however long ago
+		IdempotencyKey.objects.filter(key='deposit-1').update(status_code=None, response_body='', created_at=timezone.now() - timedelta(days=1))
+		response = self.add_funds(100, 'deposit-1')
+		self.assertEqual(response.status_code, 409)
+		self.assertEqual(self.balances(self.organizer)[0], Decimal('1100'))
+
+
+class SummaryTests(MoneyTestCase):
+	def test_incremental_summaries_match_a_rebuild(self):
+		self.accept(self.applications[0])
+		self.accept(self.applications[1])
+		self.post(f'/api/applications/{self.applications[1].id}/status/', {'status': 'rejected'})
+		self.accept(self.applications[2])
+		self.post('/api/wallet/add-funds/', {'amount': 150}, HTTP_IDEMPOTENCY_KEY='deposit-1')
+		self.post(f'/api/jobs/{self.job.id}/finish/')
+
+		profile_ids = [self.organizer.id, *(profile.id for profile in self.staff)]
+		fields = ['balance', 'total_earned', 'monthly_earnings', 'pending_amount', 'pending_count', 'total_events']
+		incremental = {pid: [getattr(get_wallet_summary(pid), name) for name in fields] for pid in profile_ids}
+		rollups = list(MonthlyTransactionRollup.objects.order_by('user_id', 'month', 'transaction_type').values_list(
+			'user_id', 'month', 'transaction_type', 'total_amount', 'transaction_count',
+		))
+
+		rebuild_wallet_summaries(profile_ids)
+		rebuild_monthly_rollups()
+
+		for pid in profile_ids:
+			rebuilt = WalletSummary.objects.get(profile_id=pid)
+			self.assertEqual(incremental[pid], [getattr(rebuilt, name) for name in fields], f'profile {pid}')
+		self.assertEqual(rollups, list(MonthlyTransactionRollup.objects.order_by('user_id', 'month', 'transaction_type').values_list(
+			'user_id', 'month', 'transaction_type', 'total_amount', 'transaction_count',
+		)))
+		self.assertEqual(incremental[self.organizer.id][0], Decimal('550'))
+		self.assertEqual(incremental[self.staff[0].id][1], Decimal('300'))
+
+
+@override_settings(SYNC_CURSOR_LAG_SECONDS=0)
+class SyncTests(MoneyTestCase):
+	def sync(self, **params):
+		return self.client.get('/api/sync/', params)
+
+	def test_missing_or_bad_cursor_asks_for_a_reset(self):
+		for params in ({}, {'cursor': 'abc'}, {'cursor': -1}):
+			data = self.sync(**params).json()
+			self.assertTrue(data['reset'], params)
+			self.assertEqual(data['cursor'], ChangeLogEntry.objects.order_by('-id').first().id)
+
+	def test_cursor_older_than_the_retained_log_asks_for_a_reset(self):
+		cursor = self.sync().json()['cursor']
+		self.accept(self.applications[0])
+		ChangeLogEntry.objects.filter(id__lte=cursor + 1).delete()
+		self.assertTrue(self.sync(cursor=cursor).json()['reset'])
+		self.assertFalse(self.sync(cursor=cursor + 1).json()['reset'])
+
+	def test_bad_limit_keeps_the_cursor(self):
+		cursor = self.sync().json()['cursor']
+		self.assertEqual(self.sync(cursor=cursor, limit='abc').status_code, 400)
+		data = self.sync(cursor=cursor, limit=0).json()
+		self.assertFalse(data['reset'])
+
+	def test_pages_through_changes(self):
+		cursor = self.sync().json()['cursor']
+		for application in self.applications:
+			self.accept(application)
+
+		seen = set()
+		for _ in range(10):
+			data = self.sync(cursor=cursor, limit=2).json()
+			self.assertFalse(data['reset'])
+			self.assertLessEqual(len(data['applications']) + len(data['transactions']), 2)
+			seen.update(application['id'] for application in data['applications'])
+			cursor = data['cursor']
+			if not data['has_more']:
+				break
+		self.assertEqual(seen, {application.id for application in self.applications})
+		self.assertEqual(self.sync(cursor=cursor).json()['applications'], [])
+
+	def test_deleted_rows_come_back_as_tombstones(self):
+		cursor = self.sync().json()['cursor']
+		self.client.delete(f'/api/jobs/{self.job.id}/delete/')
+		data = self.sync(cursor=cursor).json()
+		self.assertEqual(data['deleted']['job'], [self.job.id])
+		self.assertEqual(sorted(data['deleted']['application']), sorted(app.id for app in self.applications))
+		self.assertEqual(data['jobs'], [])
+
+	@override_settings(SYNC_CURSOR_LAG_SECONDS=60)
+	def test_cursor_never_passes_entries_that_may_have_unsettled_neighbours(self):
+		ChangeLogEntry.objects.update(created_at=timezone.now() - timedelta(minutes=5))
+		settled = ChangeLogEntry.objects.order_by('-id').first().id
+		self.assertEqual(self.sync().json()['cursor'], settled)
+
+		self.accept(self.applications[0])
+		data = self.sync(cursor=settled).json()
+		self.assertEqual([application['id'] for application in data['applications']], [self.applications[0].id])
+		# Sent, but the cursor stays put so an id still in flight below them is not skipped
+		self.assertEqual(data['cursor'], settled)
+		self.assertFalse(data['has_more'])
+
+	@override_settings(SYNC_CURSOR_LAG_SECONDS=60)
+	def test_bootstrap_cursor_is_the_safe_cursor(self):
+		ChangeLogEntry.objects.update(created_at=timezone.now() - timedelta(minutes=5))
+		settled = ChangeLogEntry.objects.order_by('-id').first().id
+		self.accept(self.applications[0])
+
+		data = self.client.get('/api/dashboard/organizer/bootstrap/').json()
+		self.assertEqual(data['cursor'], settled)
+		# The hire is in the snapshot and, since the cursor held back, in the next delta too
+		statuses = {application['id']: application['status'] for application in data['applications']}
+		self.assertEqual(statuses[self.applications[0].id], 'accepted')
+		delta = self.sync(cursor=data['cursor']).json()
+		self.assertIn(self.applications[0].id, [application['id'] for application in delta['applications']])
+
+
+@override_settings(AUTOCOMPLETE_FLUSH_SECONDS=0)
+class SuggestionCountTests(MoneyTestCase):
+
+	def setUp(self):
+		super().setUp()
+		self.addCleanup(setattr, suggestion_counts, '_pending', {})
+
+	def test_failed_count_write_does_not_fail_job_creation(self):
+		with mock.patch.object(suggestion_counts, '_upsert', side_effect=DatabaseError('locked')):
+			with self.assertLogs('EventFlex_app.views', 'ERROR'):
+				response = self.post('/api/jobs/create/', {'title': 'Gala', 'role': 'Usher', 'date': '2030-04-01', 'pay_rate': '200'})
+		self.assertEqual(response.status_code, 200, response.content)
+		self.assertTrue(Job.objects.filter(id=response.json()['job']['id']).exists())
+		# Kept for the next flush rather than dropped
+		self.assertIn(('role', 'Usher'), suggestion_counts._pending)
+
+
+class LandingStatsTests(MoneyTestCase):
+
+	def setUp(self):
+		super().setUp()
+		self.stale = {'total_professionals': 0, 'total_events': 0, 'success_rate': 98}
+		landing_stats.cache.set(landing_stats.CACHE_KEY, {'stats': self.stale, 'computed_at': 0}, 60)
+		self.addCleanup(landing_stats.cache.delete, landing_stats.CACHE_KEY)
+
+	def test_stale_stats_are_served_while_another_worker_refreshes(self):
+		RefreshLock.objects.create(name=landing_stats.LOCK_NAME, locked_until=timezone.now() + timedelta(seconds=30))
+		self.assertEqual(landing_stats.get_landing_stats(), self.stale)
+
+	def test_stale_stats_are_refreshed_once_the_lock_is_free(self):
+		RefreshLock.objects.create(name=landing_stats.LOCK_NAME, locked_until=timezone.now() - timedelta(seconds=1))
+		self.assertEqual(landing_stats.get_landing_stats()['total_professionals'], 3)
+		self.assertLessEqual(RefreshLock.objects.get(name=landing_stats.LOCK_NAME).locked_until, timezone.now())
+		# The refreshed values are cached for the next request
+		self.assertEqual(landing_stats.cache.get(landing_stats.CACHE_KEY)['stats']['total_events'], 1)
+
+	def test_first_refresh_creates_the_lock_row(self):
+		self.assertEqual(landing_stats.get_landing_stats()['total_events'], 1)
+		self.assertTrue(RefreshLock.objects.filter(name=landing_stats.LOCK_NAME).exists())
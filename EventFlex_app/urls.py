@@ -5,6 +5,8 @@ urlpatterns = [
     path('jobs/', views.jobs_list, name='jobs_list'),
     path('jobs/create/', views.create_job, name='create_job'),
     path('jobs/my/', views.my_jobs, name='my_jobs'),
+    path('jobs/nearby/', views.jobs_nearby, name='jobs_nearby'),
+    path('jobs/roster/', views.roster_proposal, name='roster_proposal'),
     path('jobs/<int:job_id>/', views.job_detail, name='job_detail'),
     path('jobs/<int:job_id>/apply/', views.apply_job, name='apply_job'),
     path('jobs/<int:job_id>/applications/', views.job_applications, name='job_applications'),
@@ -12,13 +14,16 @@ urlpatterns = [
     path('jobs/<int:job_id>/delete/', views.delete_job, name='delete_job'),
     path('jobs/<int:job_id>/details/', views.get_job_details, name='get_job_details'),
     path('jobs/<int:job_id>/finish/', views.finish_job, name='finish_job'),
+    path('jobs/<int:job_id>/roster/', views.roster_proposal, name='job_roster_proposal'),
 
     path('talent/', views.talent_list, name='talent_list'),
+    path('talent/nearby/', views.talent_nearby, name='talent_nearby'),
     path('profiles/me/', views.my_profile, name='my_profile'),
     path('profiles/<int:pk>/', views.profile_detail, name='profile_detail'),
     path('profiles/update/', views.update_profile, name='update_profile'),
 
     path('applications/', views.my_applications, name='my_applications'),
+    path('applications/bulk-decision/', views.bulk_application_decisions, name='bulk_application_decisions'),
     path('applications/<int:app_id>/', views.get_application_detail, name='get_application_detail'),
     path('applications/<int:app_id>/status/', views.update_application_status, name='update_application_status'),
     path('applications/<int:app_id>/accept/', views.accept_application, name='accept_application'),
@@ -31,17 +36,30 @@ urlpatterns = [
     path('messages/send-api/', views.send_message_api, name='send_message_api'),
 
     path('transactions/', views.my_transactions, name='my_transactions'),
+    path('transactions/export/', views.export_transactions, name='export_transactions'),
     path('wallet/stats/', views.wallet_stats, name='wallet_stats'),
+    path('wallet/monthly/', views.wallet_monthly_report, name='wallet_monthly_report'),
     path('wallet/withdraw/', views.withdraw_funds, name='withdraw_funds'),
     path('wallet/add-funds/', views.add_funds, name='add_funds'),
     path('wallet/bank-details/', views.get_bank_details, name='get_bank_details'),
     path('wallet/bank-details/update/', views.update_bank_details, name='update_bank_details'),
 
+    path('calendar/', views.my_calendar, name='my_calendar'),
+    path('calendar/unavailable/', views.add_unavailability, name='add_unavailability'),
+    path('calendar/<int:entry_id>/delete/', views.delete_calendar_entry, name='delete_calendar_entry'),
+    path('calendar/free-busy/', views.staff_free_busy, name='staff_free_busy'),
+
+    path('sync/', views.sync_changes, name='sync_changes'),
+    path('dashboard/<str:role>/bootstrap/', views.dashboard_bootstrap, name='dashboard_bootstrap'),
+    path('batch/', views.batch_requests, name='batch_requests'),
+
     path('upload/photo/', views.upload_profile_photo, name='upload_photo'),
     path('upload/video/', views.upload_video_intro, name='upload_video'),
     
     path('jobs/<int:job_id>/track-attendance/', views.track_attendance, name='track_attendance'),
     path('jobs/<int:job_id>/download-report/', views.download_report, name='download_report'),
+    path('jobs/<int:job_id>/report/export/', views.export_job_report, name='export_job_report'),
+    path('jobs/report/', views.jobs_report, name='jobs_report'),
     
     path('applications/<int:application_id>/release-payment/', views.release_payment, name='release_payment'),
     
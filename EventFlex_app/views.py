@@ -1,27 +1,53 @@
 from django.shortcuts import render, get_object_or_404, redirect
-from django.http import JsonResponse, HttpResponse
+from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.models import User
-from django.db import models as django_models
-from .models import UserProfile, Job, Application, Message, Transaction, AutocompleteSuggestion, VerificationDocument
+from django.db import models as django_models, DatabaseError
+from .models import UserProfile, Job, Application, Message, Transaction, AutocompleteSuggestion, VerificationDocument, ChangeLogEntry, CalendarEntry
+from .api_json import JsonResponse
 from .jwt_utils import generate_jwt_token, generate_refresh_token, get_token_from_request, blacklist_token
+from .changelog import record_job_change, record_application_changes, record_message, record_transactions, safe_cursor
+from . import wallet
+from .payouts import release_job_payouts, JobAlreadyFinished
+from .wallet import InsufficientFunds
+from . import availability, roster
+from .availability import CalendarConflict
+from .idempotency import idempotent
+from .summaries import get_wallet_summary, wallet_stats_from_summary, monthly_rollup_report
+from .reports import job_report, organizer_jobs_report
+from .landing_stats import get_landing_stats
+from .page_cache import cached_page
+from .conditional import conditional_json
+from .fieldsets import Resource, Field, Relation, FieldSelectionError
+from . import autocomplete, geo, suggestion_counts
+from .exports import (
+	export_response, transaction_rows, job_report_rows, ExportUnavailable,
+	TRANSACTION_COLUMNS, JOB_REPORT_COLUMNS,
+)
 import json
+import logging
 import re
 from datetime import datetime
 from decimal import Decimal
 from functools import wraps
 
+logger = logging.getLogger(__name__)
 
-def safe_isoformat(value):
-	"""Safely convert date/time to ISO format string"""
-	if value is None:
-		return None
-	if isinstance(value, str):
-		return value
-	if hasattr(value, 'isoformat'):
-		return value.isoformat()
-	return str(value)
+
+def _get_profile(request):
+	"""
+	Return the current user's profile, memoized on the request
+	
+	Raises UserProfile.DoesNotExist like a direct lookup. /api/batch/ seeds the
+	cache on its sub-requests so the profile is loaded once per batch.
+	"""
+	profile = getattr(request, '_cached_profile', None)
+	if profile is None:
+		profile = UserProfile.objects.get(user=request.user)
+		profile.user = request.user
+		request._cached_profile = profile
+	return profile
 
 
 def require_user_type(user_type):
@@ -41,7 +67,7 @@ def require_user_type(user_type):
 				return redirect('login_page')
 			
 			try:
-				profile = UserProfile.objects.get(user=request.user)
+				profile = _get_profile(request)
 				
 				# Check if user has the correct role
 				if profile.user_type != user_type:
@@ -67,17 +93,7 @@ def require_user_type(user_type):
 
 def index_view(request):
 	"""Landing page"""
-	total_professionals = UserProfile.objects.filter(user_type='staff').count()
-	total_events = Job.objects.count()
-	
-	jobs_with_accepted = Application.objects.filter(status='accepted').values('job').distinct().count()
-	success_rate = int(((jobs_with_accepted / total_events) * 100)) if total_events > 0 else 98
-	
-	context = {
-		'total_professionals': total_professionals,
-		'total_events': total_events,
-		'success_rate': success_rate,
-	}
+	context = get_landing_stats()
 	return render(request, 'index.html', context)
 
 
@@ -88,16 +104,11 @@ def login_page_view(request):
 
 def signup_page_view(request):
 	"""Signup page"""
-	total_professionals = UserProfile.objects.filter(user_type='staff').count()
-	total_events = Job.objects.count()
-	
-	jobs_with_accepted = Application.objects.filter(status='accepted').values('job').distinct().count()
-	success_rate = int(((jobs_with_accepted / total_events) * 100)) if total_events > 0 else 98
-	
+	stats = get_landing_stats()
 	context = {
-		'total_professionals': total_professionals,
-		'total_events': total_events,
-		'success_rate': f"{success_rate}%",
+		'total_professionals': stats['total_professionals'],
+		'total_events': stats['total_events'],
+		'success_rate': f"{stats['success_rate']}%",
 	}
 	return render(request, 'signup.html', context)
 
@@ -624,89 +635,172 @@ def home(request):
 	return HttpResponse(html)
 
 
+# Serializer shapes (see fieldsets.py): the entries below are the keys each
+# model serializes to, in output order, and the columns each key reads
+PROFILE_FIELDS = Resource([
+	Field('id'),
+	Field('username', ['user__username'], lambda p: p.user.username),
+	Field('email', ['user__email'], lambda p: p.user.email),
+	Field('first_name', ['user__first_name'], lambda p: p.user.first_name),
+	Field('last_name', ['user__last_name'], lambda p: p.user.last_name),
+	Field('user_type'),
+	Field('city'),
+	Field('latitude'),
+	Field('longitude'),
+	Field('phone'),
+	Field('bio'),
+	Field('profile_picture'),
+	Field('kyc_verified'),
+	Field('video_verified'),
+	Field('badge'),
+	Field('wallet_balance'),
+	Field('average_rating'),
+	Field('total_reviews'),
+	Field('total_events_completed'),
+	Field('bank_account_holder'),
+	Field('bank_account_number'),
+	Field('bank_ifsc_code'),
+	Field('bank_name'),
+	Field('bank_branch'),
+])
+
+JOB_FIELDS = Resource([
+	Field('id'),
+	Field('title'),
+	Field('role'),
+	Field('event_type'),
+	Field('number_of_staff'),
+	Field('skills'),
+	Field('date'),
+	Field('start_time'),
+	Field('end_time'),
+	Field('location'),
+	Field('city'),
+	Field('latitude'),
+	Field('longitude'),
+	Field('pay_rate'),
+	Field('payment_type'),
+	Field('description'),
+	Field('requirements'),
+	Field('status'),
+	Field('is_draft'),
+	Relation('organizer', PROFILE_FIELDS),
+], default_expand=['organizer'])
+
+# The job summary embedded in an application
+APPLICATION_JOB_FIELDS = Resource([
+	Field('id'),
+	Field('title'),
+	Field('role'),
+	Field('location'),
+	Field('date'),
+	Field('start_time'),
+	Field('end_time'),
+	Field('pay_rate'),
+	Field('payment_type'),
+	Field('status'),
+	Relation('organizer', PROFILE_FIELDS),
+], default_expand=['organizer'])
+
+APPLICATION_FIELDS = Resource([
+	Field('id'),
+	Relation('job', APPLICATION_JOB_FIELDS),
+	Field('status'),
+	Field('created_at'),
+	Field('cover_message'),
+	Field('full_name'),
+	Field('email'),
+	Field('phone'),
+	Field('experience_years'),
+	Field('relevant_skills'),
+	Field('availability'),
+	Field('portfolio_link'),
+	Field('previous_events'),
+	Field('why_interested'),
+	Field('expected_compensation', None, lambda a: a.expected_compensation or None),
+	Field('ai_rating', None, lambda a: float(a.ai_rating) if a.ai_rating else None),
+	Field('ai_rating_details'),
+	Field('resume', [], lambda a: None),  # kept for clients; applications have no resume upload
+	Relation('applicant', PROFILE_FIELDS),
+], default_expand=['job', 'applicant'])
+
+_PROFILE_DEFAULT = PROFILE_FIELDS.select()
+_JOB_DEFAULT = JOB_FIELDS.select()
+_JOB_IDS_ONLY = JOB_FIELDS.select(expand=[])
+_APPLICATION_DEFAULT = APPLICATION_FIELDS.select()
+_APPLICATION_IDS_ONLY = APPLICATION_FIELDS.select(expand=['job'])
+
+
 def _profile_to_dict(profile: UserProfile):
-	return {
-		'id': profile.id,
-		'username': profile.user.username,
-		'email': profile.user.email,
-		'first_name': profile.user.first_name,
-		'last_name': profile.user.last_name,
-		'user_type': profile.user_type,
-		'city': profile.city,
-		'phone': profile.phone,
-		'bio': profile.bio,
-		'profile_picture': profile.profile_picture,
-		'kyc_verified': profile.kyc_verified,
-		'video_verified': profile.video_verified,
-		'badge': profile.badge,
-		'wallet_balance': str(profile.wallet_balance),
-		'average_rating': str(profile.average_rating),
-		'total_reviews': profile.total_reviews,
-		'total_events_completed': profile.total_events_completed,
-		'bank_account_holder': profile.bank_account_holder,
-		'bank_account_number': profile.bank_account_number,
-		'bank_ifsc_code': profile.bank_ifsc_code,
-		'bank_name': profile.bank_name,
-		'bank_branch': profile.bank_branch,
-	}
+	return _PROFILE_DEFAULT.serialize(profile)
+
+
+def _job_to_dict(job: Job, embed_profiles=True):
+	return (_JOB_DEFAULT if embed_profiles else _JOB_IDS_ONLY).serialize(job)
+
+
+def _application_to_dict(application, embed_profiles=True):
+	"""
+	Convert Application model to dictionary with all details
+	
+	With embed_profiles=False the organizer/applicant profiles are replaced by
+	organizer_id/applicant_id so callers can ship each profile only once.
+	"""
+	return (_APPLICATION_DEFAULT if embed_profiles else _APPLICATION_IDS_ONLY).serialize(application)
+
+
+def _selection_or_error(resource, request):
+	"""(selection, None) for the request's ?fields=/?expand=, or (None, 400 response)"""
+	try:
+		return resource.select_from_request(request), None
+	except FieldSelectionError as e:
+		return None, JsonResponse({'error': str(e)}, status=400)
 
 
-def _job_to_dict(job: Job):
+def _message_to_dict(msg):
 	return {
-		'id': job.id,
-		'title': job.title,
-		'role': job.role,
-		'event_type': job.event_type,
-		'number_of_staff': job.number_of_staff,
-		'skills': job.skills,
-		'date': safe_isoformat(job.date),
-		'start_time': safe_isoformat(job.start_time),
-		'end_time': safe_isoformat(job.end_time),
-		'location': job.location,
-		'pay_rate': str(job.pay_rate),
-		'payment_type': job.payment_type,
-		'description': job.description,
-		'requirements': job.requirements,
-		'status': job.status,
-		'is_draft': job.is_draft,
-		'organizer': _profile_to_dict(job.organizer),
+		'id': msg.id,
+		'sender': _profile_to_dict(msg.sender),
+		'recipient': _profile_to_dict(msg.recipient),
+		'text': msg.text,
+		'created_at': msg.created_at
 	}
 
 
-def _application_to_dict(application):
-	"""Convert Application model to dictionary with all details"""
+def _transaction_to_dict(txn):
+	"""Convert Transaction to the dict shape used by the wallet history"""
+	event_title = ''
+	organizer_name = ''
+	event_date = None
+	
+	# Get event details from job or application
+	if txn.job:
+		event_title = txn.job.title
+		organizer_name = txn.job.organizer.user.username if txn.job.organizer else 'Unknown'
+		event_date = txn.job.date
+	elif txn.application and txn.application.job:
+		job = txn.application.job
+		event_title = job.title
+		organizer_name = job.organizer.user.username if job.organizer else 'Unknown'
+		event_date = job.date
+	
+	# Get related user (for payment transactions)
+	related_user_name = ''
+	if txn.related_user:
+		related_user_name = txn.related_user.user.username
+	
 	return {
-		'id': application.id,
-		'job': {
-			'id': application.job.id,
-			'title': application.job.title,
-			'role': application.job.role,
-			'location': application.job.location,
-			'date': safe_isoformat(application.job.date),
-			'start_time': safe_isoformat(application.job.start_time),
-			'end_time': safe_isoformat(application.job.end_time),
-			'pay_rate': str(application.job.pay_rate),
-			'payment_type': application.job.payment_type,
-			'status': application.job.status,
-			'organizer': _profile_to_dict(application.job.organizer),
-		},
-		'applicant': _profile_to_dict(application.applicant),
-		'status': application.status,
-		'created_at': safe_isoformat(application.created_at),
-		'cover_message': application.cover_message,
-		'full_name': application.full_name,
-		'email': application.email,
-		'phone': application.phone,
-		'experience_years': application.experience_years,
-		'relevant_skills': application.relevant_skills,
-		'availability': application.availability,
-		'portfolio_link': application.portfolio_link,
-		'previous_events': application.previous_events,
-		'why_interested': application.why_interested,
-		'expected_compensation': str(application.expected_compensation) if application.expected_compensation else None,
-		'ai_rating': float(application.ai_rating) if application.ai_rating else None,
-		'ai_rating_details': application.ai_rating_details,
-		'resume': application.resume.url if hasattr(application, 'resume') and application.resume else None,
+		'id': txn.id,
+		'amount': txn.amount,
+		'transaction_type': txn.transaction_type,
+		'status': txn.status,
+		'note': txn.note,
+		'event_title': event_title,
+		'organizer_name': organizer_name,
+		'related_user': related_user_name,
+		'event_date': event_date,
+		'balance_after': txn.balance_after,
+		'created_at': txn.created_at
 	}
 
 
@@ -852,15 +946,124 @@ def calculate_ai_rating(relevant_skills, why_interested, cover_message, job):
 	return rating, feedback
 
 
+def _jobs_list_versions(request):
+	return tuple(Job.objects.order_by('-created_at').values_list('id', 'updated_at', 'organizer__updated_at')[:50])
+
+
+@conditional_json(_jobs_list_versions)
 def jobs_list(request):
-	jobs = Job.objects.all().order_by('-created_at')[:50]
-	data = [_job_to_dict(j) for j in jobs]
+	selection, error = _selection_or_error(JOB_FIELDS, request)
+	if error:
+		return error
+	jobs = selection.apply(Job.objects.all()).order_by('-created_at')[:50]
+	data = [selection.serialize(j) for j in jobs]
 	return JsonResponse({'results': data})
 
 
+def _nearby_center(request):
+	"""
+	((latitude, longitude, city, radius_km), None) for a radius search, or (None, 400 response)
+	
+	The centre is ?lat=&lon=, else the place named by ?near= (geocoded like
+	Job.location), else the signed-in user's profile city.
+	"""
+	try:
+		radius_km = float(request.GET.get('radius_km', 20))
+	except ValueError:
+		return None, JsonResponse({'error': 'radius_km must be a number'}, status=400)
+	if not 0 < radius_km <= geo.MAX_RADIUS_KM:
+		return None, JsonResponse({'error': f'radius_km must be between 0 and {geo.MAX_RADIUS_KM}'}, status=400)
+
+	if 'lat' in request.GET or 'lon' in request.GET:
+		try:
+			latitude, longitude = float(request.GET['lat']), float(request.GET['lon'])
+		except (KeyError, ValueError):
+			return None, JsonResponse({'error': 'lat and lon must both be numbers'}, status=400)
+		if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+			return None, JsonResponse({'error': 'lat/lon out of range'}, status=400)
+		return (latitude, longitude, None, radius_km), None
+
+	if request.GET.get('near'):
+		place = geo.geocode(request.GET['near'])
+		if place is None:
+			return None, JsonResponse({'error': f"Unknown place: {request.GET['near']}"}, status=400)
+		return (place.latitude, place.longitude, place.name, radius_km), None
+
+	if request.user.is_authenticated:
+		profile = UserProfile.objects.filter(user=request.user).only('city', 'latitude', 'longitude').first()
+		if profile is not None and profile.latitude is not None:
+			return (profile.latitude, profile.longitude, profile.city, radius_km), None
+	return None, JsonResponse({'error': 'Pass lat and lon, or near=<city>'}, status=400)
+
+
+def _nearby_response(selection, queryset, center):
+	"""The rows of queryset within the radius, nearest first, each with its distance_km"""
+	latitude, longitude, city, radius_km = center
+	found = geo.nearby(queryset, latitude, longitude, radius_km, limit=50)
+	rows = selection.apply(queryset.model.objects.all()).in_bulk([pk for pk, _ in found])
+	results = []
+	for pk, distance_km in found:
+		item = selection.serialize(rows[pk])
+		item['distance_km'] = distance_km
+		results.append(item)
+	return JsonResponse({
+		'center': {'latitude': latitude, 'longitude': longitude, 'city': city},
+		'radius_km': radius_km,
+		'results': results,
+	})
+
+
+def jobs_nearby(request):
+	"""
+	Open jobs within radius_km (default 20) of a point, nearest first
+	
+	GET /api/jobs/nearby/?near=Bandra, Mumbai&radius_km=20
+	GET /api/jobs/nearby/?lat=19.07&lon=72.87
+	
+	Supports ?fields=/?expand= like /api/jobs/. Jobs are placed at the
+	centre of the city their location names (see geo.py).
+	"""
+	selection, error = _selection_or_error(JOB_FIELDS, request)
+	if error:
+		return error
+	center, error = _nearby_center(request)
+	if error:
+		return error
+	return _nearby_response(selection, Job.objects.filter(status='active', is_draft=False), center)
+
+
+def talent_nearby(request):
+	"""Staff within radius_km of a point, nearest first - PROTECTED: Organizers only (see jobs_nearby)"""
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'Authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+		if profile.user_type != 'organizer':
+			return JsonResponse({'error': 'Only Event Organizers can browse talent'}, status=403)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'Profile not found'}, status=404)
+	
+	selection, error = _selection_or_error(PROFILE_FIELDS, request)
+	if error:
+		return error
+	center, error = _nearby_center(request)
+	if error:
+		return error
+	return _nearby_response(selection, UserProfile.objects.filter(user_type='staff'), center)
+
+
+def _job_detail_versions(request, job_id):
+	return Job.objects.filter(id=job_id).values_list('updated_at', 'organizer__updated_at').first()
+
+
+@conditional_json(_job_detail_versions)
 def job_detail(request, job_id):
-	job = get_object_or_404(Job, id=job_id)
-	return JsonResponse(_job_to_dict(job))
+	selection, error = _selection_or_error(JOB_FIELDS, request)
+	if error:
+		return error
+	job = get_object_or_404(selection.apply(Job.objects.all()), id=job_id)
+	return JsonResponse(selection.serialize(job))
 
 
 @csrf_exempt
@@ -900,6 +1103,13 @@ def apply_job(request, job_id):
 			'application_id': existing_application.id
 		}, status=400)
 
+	clashes = availability.conflicts_for_job(profile.id, job)
+	if clashes:
+		return JsonResponse({
+			'error': 'You are already booked or unavailable during this job',
+			'conflicts': [availability.entry_to_dict(entry) for entry in clashes]
+		}, status=409)
+
 	relevant_skills = payload.get('relevant_skills', '')
 	why_interested = payload.get('why_interested', '')
 	cover_message_text = payload.get('cover_message', cover)
@@ -928,6 +1138,7 @@ def apply_job(request, job_id):
 		ai_rating=ai_rating,
 		ai_rating_details=ai_feedback
 	)
+	record_application_changes([app])
 	return JsonResponse({
 		'message': 'Application submitted successfully',
 		'application_id': app.id,
@@ -944,20 +1155,31 @@ def talent_list(request):
 		return JsonResponse({'error': 'Authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 		if profile.user_type != 'organizer':
 			return JsonResponse({'error': 'Only Event Organizers can browse talent'}, status=403)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'Profile not found'}, status=404)
 	
-	profiles = UserProfile.objects.filter(user_type='staff')[:50]
-	data = [_profile_to_dict(p) for p in profiles]
+	selection, error = _selection_or_error(PROFILE_FIELDS, request)
+	if error:
+		return error
+	profiles = selection.apply(UserProfile.objects.filter(user_type='staff'))[:50]
+	data = [selection.serialize(p) for p in profiles]
 	return JsonResponse({'results': data})
 
 
+def _profile_detail_versions(request, pk):
+	return UserProfile.objects.filter(id=pk).values_list('updated_at', flat=True).first()
+
+
+@conditional_json(_profile_detail_versions)
 def profile_detail(request, pk):
-	profile = get_object_or_404(UserProfile, id=pk)
-	return JsonResponse(_profile_to_dict(profile))
+	selection, error = _selection_or_error(PROFILE_FIELDS, request)
+	if error:
+		return error
+	profile = get_object_or_404(selection.apply(UserProfile.objects.all()), id=pk)
+	return JsonResponse(selection.serialize(profile))
 
 
 def my_profile(request):
@@ -966,8 +1188,11 @@ def my_profile(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
-		return JsonResponse({'profile': _profile_to_dict(profile)})
+		profile = _get_profile(request)
+		data = _profile_to_dict(profile)
+		# Held escrow is only shown to its owner, never in the embedded organizer shape
+		data['escrow_balance'] = profile.escrow_balance
+		return JsonResponse({'profile': data})
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 
@@ -1306,10 +1531,6 @@ def refresh_token_view(request):
 def create_job(request):
 	"""Create a new job posting (organizer only)"""
 	try:
-		print(f"DEBUG: create_job called - Method: {request.method}")
-		print(f"DEBUG: User authenticated: {request.user.is_authenticated}")
-		print(f"DEBUG: User: {request.user}")
-		
 		if request.method != 'POST':
 			return JsonResponse({'error': 'POST required'}, status=400)
 		
@@ -1317,8 +1538,7 @@ def create_job(request):
 			return JsonResponse({'error': 'authentication required'}, status=401)
 		
 		try:
-			profile = UserProfile.objects.get(user=request.user)
-			print(f"DEBUG: Profile found: {profile.user.username}, type: {profile.user_type}")
+			profile = _get_profile(request)
 			if profile.user_type != 'organizer':
 				return JsonResponse({'error': 'only organizers can post jobs'}, status=403)
 		except UserProfile.DoesNotExist:
@@ -1326,9 +1546,7 @@ def create_job(request):
 		
 		try:
 			payload = json.loads(request.body.decode('utf-8'))
-			print(f"DEBUG: Payload received: {payload}")
 		except Exception as e:
-			print(f"DEBUG: JSON parse error: {e}")
 			return JsonResponse({'error': f'invalid JSON: {str(e)}'}, status=400)
 		
 		try:
@@ -1343,65 +1561,30 @@ def create_job(request):
 				start_time=payload.get('start_time'),
 				end_time=payload.get('end_time'),
 				location=payload.get('location', ''),
-				pay_rate=payload.get('pay_rate', '0'),
+				pay_rate=Job._meta.get_field('pay_rate').to_python(payload.get('pay_rate', '0')),
 				payment_type=payload.get('payment_type', 'daily'),
 				description=payload.get('description', ''),
 				requirements=payload.get('requirements', ''),
 				is_draft=payload.get('is_draft', False)
 			)
 			
-			if job.event_type:
-				suggestion, created = AutocompleteSuggestion.objects.get_or_create(
-					field_type='event_type',
-					value=job.event_type,
-					defaults={'created_by': profile}
-				)
-				if not created:
-					suggestion.usage_count += 1
-					suggestion.save()
-					
-			if job.role:
-				suggestion, created = AutocompleteSuggestion.objects.get_or_create(
-					field_type='role',
-					value=job.role,
-					defaults={'created_by': profile}
-				)
-				if not created:
-					suggestion.usage_count += 1
-					suggestion.save()
-					
-			if job.location:
-				suggestion, created = AutocompleteSuggestion.objects.get_or_create(
-					field_type='location',
-					value=job.location,
-					defaults={'created_by': profile}
-				)
-				if not created:
-					suggestion.usage_count += 1
-					suggestion.save()
-					
-			if job.skills:
-				suggestion, created = AutocompleteSuggestion.objects.get_or_create(
-					field_type='skills',
-					value=job.skills,
-					defaults={'created_by': profile}
+			# Counted in memory and written with other increments in one upsert (see suggestion_counts.py).
+			# With AUTOCOMPLETE_FLUSH_SECONDS=0 the upsert runs here; counts are best-effort, the job is not.
+			try:
+				suggestion_counts.increment_many(
+					[(field_type, getattr(job, field_type)) for field_type in ('event_type', 'role', 'location', 'skills')],
+					created_by=profile
 				)
-				if not created:
-					suggestion.usage_count += 1
-					suggestion.save()
-
+			except DatabaseError:
+				logger.exception('Could not write autocomplete counts for job %s', job.id)
 			
-			print(f"DEBUG: Job created successfully: {job.id}")
+			record_job_change(job)
 			return JsonResponse({'message': 'job created', 'job': _job_to_dict(job)})
 		except Exception as e:
-			print(f"DEBUG: Job creation error: {type(e).__name__}: {e}")
-			import traceback
-			traceback.print_exc()
+			logger.exception('Job creation failed')
 			return JsonResponse({'error': f'Failed to create job: {str(e)}'}, status=500)
 	except Exception as e:
-		print(f"DEBUG: Unexpected error in create_job: {type(e).__name__}: {e}")
-		import traceback
-		traceback.print_exc()
+		logger.exception('Unexpected error in create_job')
 		return JsonResponse({'error': f'Server error: {str(e)}'}, status=500)
 
 
@@ -1411,7 +1594,7 @@ def my_jobs(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
@@ -1428,7 +1611,10 @@ def my_jobs(request):
 		# Show only jobs that are NOT completed and NOT draft
 		jobs = Job.objects.filter(organizer=profile, is_draft=False).exclude(status='completed').order_by('-created_at')
 	
-	data = [_job_to_dict(j) for j in jobs]
+	selection, error = _selection_or_error(JOB_FIELDS, request)
+	if error:
+		return error
+	data = [selection.serialize(j) for j in selection.apply(jobs)]
 	return JsonResponse({'results': data})
 
 
@@ -1438,7 +1624,7 @@ def my_applications(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
@@ -1447,7 +1633,10 @@ def my_applications(request):
 	else:
 		applications = Application.objects.filter(job__organizer=profile).order_by('-created_at')
 	
-	data = [_application_to_dict(app) for app in applications]
+	selection, error = _selection_or_error(APPLICATION_FIELDS, request)
+	if error:
+		return error
+	data = [selection.serialize(app) for app in selection.apply(applications)]
 	
 	return JsonResponse({'results': data})
 
@@ -1462,7 +1651,7 @@ def update_application_status(request, app_id):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 		if profile.user_type != 'organizer':
 			return JsonResponse({'error': 'only organizers can update status'}, status=403)
 	except UserProfile.DoesNotExist:
@@ -1482,8 +1671,33 @@ def update_application_status(request, app_id):
 	if status not in ['pending', 'accepted', 'rejected']:
 		return JsonResponse({'error': 'invalid status'}, status=400)
 	
-	app.status = status
-	app.save()
+	from django.db import transaction as db_transaction
+	
+	with db_transaction.atomic():
+		# Job first, then organizer (as finish_job does), so a hire cannot slip in after payouts
+		job = Job.objects.select_for_update().get(id=app.job_id)
+		app = Application.objects.select_for_update().select_related('job').get(id=app.id)
+		
+		# Keep escrow in step with the hire: hold on accept, refund when un-accepting
+		if status == 'accepted' and app.status != 'accepted':
+			if job.status != 'active':
+				return JsonResponse({'error': f'Job is {job.status}; only active jobs can hire staff'}, status=400)
+			try:
+				wallet.hold_for_applications([app])
+			except InsufficientFunds as e:
+				return JsonResponse({'error': str(e), 'required': e.required, 'available': e.available}, status=400)
+			try:
+				availability.book([app])
+			except CalendarConflict as e:
+				db_transaction.set_rollback(True)
+				return _calendar_conflict_response(e)
+		elif status != 'accepted' and app.status == 'accepted':
+			wallet.release_application_holds([app], note='Escrow refunded (hire cancelled)')
+			availability.unbook([app])
+		
+		Application.objects.filter(id=app.id).update(status=status)
+		app.status = status
+		record_application_changes([app])
 	
 	return JsonResponse({'message': 'status updated', 'application_id': app.id, 'status': status})
 
@@ -1494,20 +1708,27 @@ def get_application_detail(request, app_id):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
-	app = get_object_or_404(Application, id=app_id)
+	selection, error = _selection_or_error(APPLICATION_FIELDS, request)
+	if error:
+		return error
+	
+	organizer_id, applicant_id = get_object_or_404(
+		Application.objects.values_list('job__organizer_id', 'applicant_id'), id=app_id
+	)
 	
 	if profile.user_type == 'organizer':
-		if app.job.organizer != profile:
+		if organizer_id != profile.id:
 			return JsonResponse({'error': 'unauthorized'}, status=403)
 	elif profile.user_type == 'staff':
-		if app.applicant != profile:
+		if applicant_id != profile.id:
 			return JsonResponse({'error': 'unauthorized'}, status=403)
 	
-	return JsonResponse(_application_to_dict(app))
+	app = get_object_or_404(selection.apply(Application.objects.all()), id=app_id)
+	return JsonResponse(selection.serialize(app))
 
 
 @csrf_exempt
@@ -1520,45 +1741,62 @@ def accept_application(request, app_id):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 		if profile.user_type != 'organizer':
 			return JsonResponse({'error': 'only organizers can accept applications'}, status=403)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
-	app = get_object_or_404(Application, id=app_id)
-	
-	if app.job.organizer != profile:
-		return JsonResponse({'error': 'unauthorized'}, status=403)
-	
-	# Check if organizer has sufficient balance to cover this staff payment
-	payment_required = app.job.pay_rate
-	
-	# Calculate already accepted staff for this job
-	accepted_apps = Application.objects.filter(job=app.job, status='accepted')
-	total_committed = sum(a.job.pay_rate for a in accepted_apps)
+	from django.db import transaction as db_transaction
 	
-	new_total = total_committed + payment_required
-	
-	if profile.wallet_balance < new_total:
-		return JsonResponse({
-			'error': f'Insufficient balance. You need ₹{new_total} to hire this staff (₹{payment_required} for this hire + ₹{total_committed} already committed). Your balance: ₹{profile.wallet_balance}. Please add funds first.',
-			'required': str(new_total),
-			'available': str(profile.wallet_balance),
-			'this_hire': str(payment_required),
-			'already_committed': str(total_committed)
-		}, status=400)
+	with db_transaction.atomic():
+		# Job first, then organizer (as finish_job does), so a hire cannot slip in after payouts;
+		# the application lock stops a double-click from holding escrow twice
+		job_id = get_object_or_404(Application.objects.values_list('job_id', flat=True), id=app_id)
+		job = Job.objects.select_for_update().get(id=job_id)
+		app = get_object_or_404(Application.objects.select_for_update().select_related('job'), id=app_id)
+		
+		if app.job.organizer_id != profile.id:
+			return JsonResponse({'error': 'unauthorized'}, status=403)
+		
+		payment_required = app.job.pay_rate
+		
+		if app.status != 'accepted':
+			if job.status != 'active':
+				return JsonResponse({'error': f'Job is {job.status}; only active jobs can hire staff'}, status=400)
+			
+			# One conditional UPDATE moves the pay into escrow, or fails if the wallet can't cover it
+			try:
+				wallet.hold_for_applications([app])
+			except InsufficientFunds as e:
+				already_committed = UserProfile.objects.values_list('escrow_balance', flat=True).get(id=profile.id)
+				return JsonResponse({
+					'error': f'Insufficient balance. You need ₹{payment_required} to hire this staff. Your available balance is ₹{e.available} (₹{already_committed} is already held for accepted staff). Please add funds first.',
+					'required': payment_required,
+					'available': e.available,
+					'this_hire': payment_required,
+					'already_committed': already_committed
+				}, status=400)
+			
+			try:
+				availability.book([app])
+			except CalendarConflict as e:
+				db_transaction.set_rollback(True)
+				return _calendar_conflict_response(e)
+			
+			Application.objects.filter(id=app.id).update(status='accepted')
+			app.status = 'accepted'
+			record_application_changes([app])
 	
-	app.status = 'accepted'
-	app.save()
+	profile.refresh_from_db(fields=['wallet_balance', 'escrow_balance'])
 	
 	return JsonResponse({
 		'message': 'Application accepted successfully',
 		'application_id': app.id,
 		'status': 'accepted',
 		'applicant_name': app.full_name or app.applicant.user.username,
-		'payment_committed': str(payment_required),
-		'remaining_balance': str(profile.wallet_balance - new_total)
+		'payment_committed': payment_required,
+		'remaining_balance': profile.wallet_balance
 	})
 
 
@@ -1572,7 +1810,7 @@ def update_profile(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
@@ -1588,7 +1826,7 @@ def update_profile(request):
 	if 'city' in payload:
 		profile.city = payload['city']
 	
-	profile.save()
+	profile.save(update_fields=['phone', 'bio', 'city'])
 	
 	return JsonResponse({'message': 'profile updated', 'profile': _profile_to_dict(profile)})
 
@@ -1603,7 +1841,7 @@ def update_bank_details(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
@@ -1628,7 +1866,9 @@ def update_bank_details(request):
 	profile.bank_name = data.get('bank_name', '')
 	profile.bank_branch = data.get('bank_branch', '')
 	
-	profile.save()
+	profile.save(update_fields=[
+		'bank_account_holder', 'bank_account_number', 'bank_ifsc_code', 'bank_name', 'bank_branch'
+	])
 	
 	return JsonResponse({
 		'success': True,
@@ -1651,7 +1891,7 @@ def get_bank_details(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
@@ -1672,7 +1912,7 @@ def my_messages(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
@@ -1693,15 +1933,7 @@ def my_messages(request):
 		)
 		messages = messages.order_by('-created_at')[:100]
 	
-	data = []
-	for msg in messages:
-		data.append({
-			'id': msg.id,
-			'sender': _profile_to_dict(msg.sender),
-			'recipient': _profile_to_dict(msg.recipient),
-			'text': msg.text,
-			'created_at': msg.created_at.isoformat()
-		})
+	data = [_message_to_dict(msg) for msg in messages]
 	
 	return JsonResponse({'results': data})
 
@@ -1712,7 +1944,7 @@ def get_conversations(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
@@ -1735,7 +1967,7 @@ def get_conversations(request):
 			conversations[partner_id] = {
 				'partner': _profile_to_dict(partner),
 				'last_message': msg.text,
-				'last_message_time': msg.created_at.isoformat()
+				'last_message_time': msg.created_at
 			}
 	
 	# Convert to list and sort by last message time
@@ -1758,7 +1990,7 @@ def send_message(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		sender_profile = UserProfile.objects.get(user=request.user)
+		sender_profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
@@ -1784,11 +2016,12 @@ def send_message(request):
 		recipient=recipient_profile,
 		text=text
 	)
+	record_message(message)
 	
 	return JsonResponse({
 		'message': 'sent',
 		'id': message.id,
-		'created_at': message.created_at.isoformat()
+		'created_at': message.created_at
 	})
 
 
@@ -1798,147 +2031,150 @@ def my_transactions(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
 	transactions = Transaction.objects.filter(user=profile).select_related(
 		'application__job__organizer__user', 
-		'job', 
+		'job__organizer__user', 
 		'related_user__user'
 	).order_by('-created_at')[:50]
 	
-	data = []
-	for txn in transactions:
-		event_title = ''
-		organizer_name = ''
-		event_date = None
-		
-		# Get event details from job or application
-		if txn.job:
-			event_title = txn.job.title
-			organizer_name = txn.job.organizer.user.username if txn.job.organizer else 'Unknown'
-			event_date = safe_isoformat(txn.job.date)
-		elif txn.application and txn.application.job:
-			job = txn.application.job
-			event_title = job.title
-			organizer_name = job.organizer.user.username if job.organizer else 'Unknown'
-			event_date = safe_isoformat(job.date)
-		
-		# Get related user (for payment transactions)
-		related_user_name = ''
-		if txn.related_user:
-			related_user_name = txn.related_user.user.username
-		
-		data.append({
-			'id': txn.id,
-			'amount': str(txn.amount),
-			'transaction_type': txn.transaction_type,
-			'status': txn.status,
-			'note': txn.note,
-			'event_title': event_title,
-			'organizer_name': organizer_name,
-			'related_user': related_user_name,
-			'event_date': event_date,
-			'balance_after': str(txn.balance_after),
-			'created_at': txn.created_at.isoformat()
-		})
+	data = [_transaction_to_dict(txn) for txn in transactions]
 	
 	return JsonResponse({'results': data})
 
 
+def _export_options(request):
+	"""Read ?format=csv|xlsx and ?compress=gzip for export endpoints"""
+	file_format = request.GET.get('format', 'csv')
+	if file_format not in ('csv', 'xlsx'):
+		raise ValueError('format must be csv or xlsx')
+	return file_format, request.GET.get('compress') == 'gzip'
+
+
+def export_transactions(request):
+	"""Stream the current user's complete transaction history (CSV, optionally gzipped, or XLSX)"""
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+		file_format, compress = _export_options(request)
+		filename = f'eventflex-transactions-{request.user.username}-{datetime.now():%Y%m%d}'
+		return export_response(filename, TRANSACTION_COLUMNS, transaction_rows(profile), file_format, compress)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	except (ValueError, ExportUnavailable) as e:
+		return JsonResponse({'error': str(e)}, status=400)
+
+
+def _wallet_stats_data(profile):
+	"""Build the wallet statistics dict for a profile from its materialized WalletSummary"""
+	data = wallet_stats_from_summary(get_wallet_summary(profile.id))
+	data['escrow_balance'] = str(profile.escrow_balance)
+	return data
+
+
 def wallet_stats(request):
 	"""Get wallet statistics for current user"""
 	if not request.user.is_authenticated:
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
-	from django.db.models import Sum
-	from decimal import Decimal
+	return JsonResponse(_wallet_stats_data(profile))
+
+
+MONTHLY_REPORT_MAX_MONTHS = 120
+
+
+def _parse_month(value):
+	"""Parse 'YYYY-MM' into the first day of that month"""
+	return datetime.strptime(value, '%Y-%m').date()
+
+
+def wallet_monthly_report(request):
+	"""
+	Per-month ledger totals by transaction type, read from the monthly rollup
 	
-	# Get wallet balance from UserProfile
-	available_balance = profile.wallet_balance
+	Query params: from=YYYY-MM, to=YYYY-MM (default: the last 12 months),
+	types=payment,deposit,... (default: all), format=csv for a download.
+	"""
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
 	
-	# Calculate pending amount (accepted but not finished jobs)
-	if profile.user_type == 'organizer':
-		# Organizer: sum of pay for accepted staff (not yet finished)
-		from django.db.models import Q
-		accepted_apps = Application.objects.filter(
-			job__organizer=profile,
-			status='accepted',
-			job__status='active'
-		)
-		pending_amount = sum(app.job.pay_rate for app in accepted_apps)
-		pending_count = accepted_apps.count()
-	else:
-		# Staff: sum of pay from accepted jobs (not yet finished)
-		accepted_apps = Application.objects.filter(
-			applicant=profile,
-			status='accepted',
-			job__status='active'
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	
+	from django.utils import timezone
+	
+	this_month = timezone.localdate().replace(day=1)
+	try:
+		last_month = _parse_month(request.GET['to']) if request.GET.get('to') else this_month
+		if request.GET.get('from'):
+			first_month = _parse_month(request.GET['from'])
+		else:
+			# Eleven months before "to", so the default report covers a full year
+			month_index = last_month.year * 12 + last_month.month - 1 - 11
+			first_month = last_month.replace(year=month_index // 12, month=month_index % 12 + 1)
+	except ValueError:
+		return JsonResponse({'error': 'from/to must be months in YYYY-MM format'}, status=400)
+	
+	month_span = (last_month.year - first_month.year) * 12 + last_month.month - first_month.month + 1
+	if month_span < 1:
+		return JsonResponse({'error': '"from" must not be after "to"'}, status=400)
+	if month_span > MONTHLY_REPORT_MAX_MONTHS:
+		return JsonResponse({'error': f'Range is limited to {MONTHLY_REPORT_MAX_MONTHS} months'}, status=400)
+	
+	valid_types = {choice for choice, _ in Transaction.TRANSACTION_TYPES}
+	types = [t for t in request.GET.get('types', '').split(',') if t]
+	unknown = [t for t in types if t not in valid_types]
+	if unknown:
+		return JsonResponse({'error': f'Unknown transaction type(s): {", ".join(unknown)}'}, status=400)
+	
+	months = monthly_rollup_report(profile.id, first_month, last_month, types or None)
+	
+	if request.GET.get('format') == 'csv':
+		import csv
+		
+		response = HttpResponse(content_type='text/csv')
+		response['Content-Disposition'] = (
+			f'attachment; filename="eventflex-wallet-{first_month:%Y-%m}-to-{last_month:%Y-%m}.csv"'
 		)
-		pending_amount = sum(app.job.pay_rate for app in accepted_apps)
-		pending_count = accepted_apps.count()
-	
-	# Calculate total earned (only for staff - completed payments received)
-	earned_txns = Transaction.objects.filter(
-		user=profile,
-		transaction_type='payment',
-		status='completed'
-	)
-	total_earned = earned_txns.aggregate(total=Sum('amount'))['total'] or Decimal('0')
+		writer = csv.writer(response)
+		writer.writerow(['month', 'transaction_type', 'amount', 'count'])
+		for entry in months:
+			for txn_type, totals in sorted(entry['totals'].items()):
+				writer.writerow([entry['month'], txn_type, totals['amount'], totals['count']])
+		return response
 	
-	# Calculate total events (completed jobs)
-	if profile.user_type == 'staff':
-		total_events = Application.objects.filter(
-			applicant=profile,
-			status='accepted',
-			job__status='completed'
-		).count()
-	else:
-		total_events = Job.objects.filter(
-			organizer=profile,
-			status='completed'
-		).count()
-	
-	# Monthly earnings for last 6 months
-	from datetime import datetime, timedelta
-	from django.db.models.functions import TruncMonth
-	
-	six_months_ago = datetime.now() - timedelta(days=180)
-	monthly_data = Transaction.objects.filter(
-		user=profile,
-		transaction_type='payment',
-		status='completed',
-		created_at__gte=six_months_ago
-	).annotate(
-		month=TruncMonth('created_at')
-	).values('month').annotate(
-		total=Sum('amount')
-	).order_by('month')
-	
-	monthly_earnings = []
-	for item in monthly_data:
-		monthly_earnings.append({
-			'month': item['month'].strftime('%b'),
-			'amount': str(item['total'])
-		})
+	range_totals = {}
+	for entry in months:
+		for txn_type, totals in entry['totals'].items():
+			running = range_totals.setdefault(txn_type, {'amount': Decimal('0'), 'count': 0})
+			running['amount'] += Decimal(totals['amount'])
+			running['count'] += totals['count']
 	
 	return JsonResponse({
-		'available_balance': str(available_balance),
-		'pending_amount': str(pending_amount),
-		'pending_count': pending_count,
-		'total_earned': str(total_earned),
-		'total_events': total_events,
-		'monthly_earnings': monthly_earnings
+		'from': first_month.strftime('%Y-%m'),
+		'to': last_month.strftime('%Y-%m'),
+		'months': months,
+		'totals': {
+			txn_type: {'amount': totals['amount'], 'count': totals['count']}
+			for txn_type, totals in range_totals.items()
+		},
 	})
 
 
 @csrf_exempt
+@idempotent
 def withdraw_funds(request):
 	"""Withdraw funds to bank account"""
 	if request.method != 'POST':
@@ -1948,7 +2184,7 @@ def withdraw_funds(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
@@ -1961,38 +2197,26 @@ def withdraw_funds(request):
 		}, status=400)
 	
 	try:
-		from django.db import transaction as db_transaction
-		
 		data = json.loads(request.body)
 		amount = Decimal(str(data.get('amount', 0)))
 		
 		if amount <= 0:
 			return JsonResponse({'error': 'Invalid amount'}, status=400)
 		
-		if amount > profile.wallet_balance:
-			return JsonResponse({'error': 'Insufficient balance'}, status=400)
-		
-		# Atomic transaction to ensure consistency
-		with db_transaction.atomic():
-			# Deduct from wallet
-			profile.wallet_balance -= amount
-			new_balance = profile.wallet_balance
-			profile.save()
-			
-			# Record withdrawal transaction
-			Transaction.objects.create(
-				user=profile,
-				transaction_type='withdrawal',
-				amount=amount,
-				status='completed',
-				balance_after=new_balance,
+		# Conditional UPDATE: the balance check and the deduction happen in one statement
+		try:
+			txn = wallet.debit(
+				profile.id, amount, 'withdrawal',
 				note=f'Withdrawal to {profile.bank_name} A/C ending with {profile.bank_account_number[-4:]}'
 			)
+		except wallet.InsufficientFunds:
+			return JsonResponse({'error': 'Insufficient balance'}, status=400)
+		profile.wallet_balance = txn.balance_after
 		
 		return JsonResponse({
 			'success': True,
 			'message': f'₹{amount} withdrawn successfully',
-			'new_balance': str(new_balance)
+			'new_balance': txn.balance_after
 		})
 	except Exception as e:
 		return JsonResponse({'error': str(e)}, status=400)
@@ -2008,7 +2232,7 @@ def upload_profile_photo(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 		
 		if 'photo' in request.FILES:
 			# Read and encode the uploaded file as base64
@@ -2035,7 +2259,7 @@ def upload_profile_photo(request):
 			
 			# Save to profile
 			profile.profile_picture = photo_url
-			profile.save()
+			profile.save(update_fields=['profile_picture'])
 			
 			return JsonResponse({
 				'success': True,
@@ -2060,10 +2284,10 @@ def upload_video_intro(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 		
 		profile.video_verified = True
-		profile.save()
+		profile.save(update_fields=['video_verified'])
 		
 		return JsonResponse({
 			'success': True,
@@ -2084,7 +2308,7 @@ def send_message_api(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		sender_profile = UserProfile.objects.get(user=request.user)
+		sender_profile = _get_profile(request)
 		data = json.loads(request.body)
 		
 		recipient_id = data.get('recipient_id')
@@ -2100,12 +2324,13 @@ def send_message_api(request):
 			recipient=recipient_profile,
 			text=message_text
 		)
+		record_message(message)
 		
 		return JsonResponse({
 			'success': True,
 			'message': 'Message sent successfully',
 			'message_id': message.id,
-			'created_at': message.created_at.isoformat()
+			'created_at': message.created_at
 		})
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'User not found'}, status=404)
@@ -2119,13 +2344,13 @@ def track_attendance(request, job_id):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 		job = Job.objects.get(id=job_id, organizer=profile)
 		
 		attendance_data = {
 			'job_id': job.id,
 			'job_title': job.title,
-			'date': safe_isoformat(job.date),
+			'date': job.date,
 			'location': job.location,
 			'tracking_code': f'ATT-{job.id}-{datetime.now().strftime("%Y%m%d")}'
 		}
@@ -2146,25 +2371,12 @@ def download_report(request, job_id):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 		job = Job.objects.get(id=job_id, organizer=profile)
 		
-		applications = Application.objects.filter(job=job)
-		
-		report_data = {
-			'job_title': job.title,
-			'event_date': safe_isoformat(job.date),
-			'location': job.location,
-			'total_applications': applications.count(),
-			'accepted': applications.filter(status='accepted').count(),
-			'pending': applications.filter(status='pending').count(),
-			'rejected': applications.filter(status='rejected').count(),
-			'total_cost': str(job.pay_rate * applications.filter(status='accepted').count())
-		}
-		
 		return JsonResponse({
 			'success': True,
-			'report': report_data
+			'report': job_report(job)
 		})
 	except Job.DoesNotExist:
 		return JsonResponse({'error': 'Job not found'}, status=404)
@@ -2172,7 +2384,91 @@ def download_report(request, job_id):
 		return JsonResponse({'error': 'profile not found'}, status=404)
 
 
+JOBS_REPORT_DEFAULT_DAYS = 90
+JOBS_REPORT_MAX_DAYS = 366
+
+
+def jobs_report(request):
+	"""
+	Application summary for all of the organizer's jobs with an event date in a range
+	
+	Query params: from=YYYY-MM-DD, to=YYYY-MM-DD (default: the last 90 days),
+	format=csv for a download. One grouped query regardless of the number of jobs.
+	"""
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	
+	if profile.user_type != 'organizer':
+		return JsonResponse({'error': 'Only organizers can view job reports'}, status=403)
+	
+	from datetime import timedelta
+	from django.utils import timezone
+	
+	try:
+		date_to = datetime.strptime(request.GET['to'], '%Y-%m-%d').date() if request.GET.get('to') else timezone.localdate()
+		if request.GET.get('from'):
+			date_from = datetime.strptime(request.GET['from'], '%Y-%m-%d').date()
+		else:
+			date_from = date_to - timedelta(days=JOBS_REPORT_DEFAULT_DAYS - 1)
+	except ValueError:
+		return JsonResponse({'error': 'from/to must be dates in YYYY-MM-DD format'}, status=400)
+	
+	if date_from > date_to:
+		return JsonResponse({'error': '"from" must not be after "to"'}, status=400)
+	if (date_to - date_from).days + 1 > JOBS_REPORT_MAX_DAYS:
+		return JsonResponse({'error': f'Range is limited to {JOBS_REPORT_MAX_DAYS} days'}, status=400)
+	
+	report = organizer_jobs_report(profile.id, date_from, date_to)
+	
+	if request.GET.get('format') == 'csv':
+		import csv
+		
+		columns = ['job_id', 'job_title', 'event_date', 'location', 'status', 'total_applications',
+			'accepted', 'pending', 'rejected', 'withdrawn', 'escrow_held', 'total_cost']
+		response = HttpResponse(content_type='text/csv')
+		response['Content-Disposition'] = (
+			f'attachment; filename="eventflex-jobs-{date_from:%Y-%m-%d}-to-{date_to:%Y-%m-%d}.csv"'
+		)
+		writer = csv.writer(response)
+		writer.writerow(columns)
+		for row in report['jobs']:
+			writer.writerow([row[column] for column in columns])
+		return response
+	
+	return JsonResponse({
+		'success': True,
+		'from': date_from,
+		'to': date_to,
+		**report
+	})
+
+
+def export_job_report(request, job_id):
+	"""Stream the hire/payout report for one of the organizer's jobs (CSV, optionally gzipped, or XLSX)"""
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+		job = Job.objects.get(id=job_id, organizer=profile)
+		file_format, compress = _export_options(request)
+		filename = f'eventflex-job-{job.id}-report-{datetime.now():%Y%m%d}'
+		return export_response(filename, JOB_REPORT_COLUMNS, job_report_rows(job), file_format, compress)
+	except Job.DoesNotExist:
+		return JsonResponse({'error': 'Job not found'}, status=404)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	except (ValueError, ExportUnavailable) as e:
+		return JsonResponse({'error': str(e)}, status=400)
+
+
 @csrf_exempt
+@idempotent
 def add_funds(request):
 	"""Add funds to organizer wallet"""
 	if request.method != 'POST':
@@ -2182,7 +2478,7 @@ def add_funds(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 		
 		if profile.user_type != 'organizer':
 			return JsonResponse({'error': 'Only organizers can add funds'}, status=403)
@@ -2193,35 +2489,20 @@ def add_funds(request):
 		if amount <= 0:
 			return JsonResponse({'error': 'Invalid amount'}, status=400)
 		
-		from django.db import transaction as db_transaction
-		
-		# Atomic transaction to ensure consistency
-		with db_transaction.atomic():
-			# Add to wallet
-			profile.wallet_balance += amount
-			new_balance = profile.wallet_balance
-			profile.save()
-			
-			# Record deposit transaction
-			Transaction.objects.create(
-				user=profile,
-				transaction_type='deposit',
-				amount=amount,
-				status='completed',
-				balance_after=new_balance,
-				note='Funds added to wallet'
-			)
+		txn = wallet.credit(profile.id, amount, 'deposit', note='Funds added to wallet')
+		profile.wallet_balance = txn.balance_after
 		
 		return JsonResponse({
 			'success': True,
 			'message': f'₹{amount} added successfully',
-			'new_balance': str(new_balance)
+			'new_balance': txn.balance_after
 		})
 	except Exception as e:
 		return JsonResponse({'error': str(e)}, status=400)
 
 
 @csrf_exempt
+@idempotent
 def release_payment(request, application_id):
 	"""Release payment to staff member"""
 	if request.method != 'POST':
@@ -2231,28 +2512,36 @@ def release_payment(request, application_id):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		organizer_profile = UserProfile.objects.get(user=request.user)
-		application = Application.objects.get(id=application_id, job__organizer=organizer_profile)
-		
-		if application.status != 'accepted':
-			return JsonResponse({'error': 'Can only release payment for accepted applications'}, status=400)
-		
-		existing_payment = Transaction.objects.filter(
-			application=application,
-			user=application.applicant,
-			status='completed'
-		).exists()
+		from django.db import transaction as db_transaction
 		
-		if existing_payment:
-			return JsonResponse({'error': 'Payment already released'}, status=400)
+		organizer_profile = _get_profile(request)
 		
-		Transaction.objects.create(
-			user=application.applicant,
-			application=application,
-			amount=application.job.pay_rate,
-			status='completed',
-			note=f'Payment for {application.job.title}'
-		)
+		# Lock the application so two concurrent releases cannot both pass the "already paid" check
+		with db_transaction.atomic():
+			application = Application.objects.select_for_update().select_related('job').get(
+				id=application_id, job__organizer=organizer_profile
+			)
+			
+			if application.status != 'accepted':
+				return JsonResponse({'error': 'Can only release payment for accepted applications'}, status=400)
+			
+			existing_payment = Transaction.objects.filter(
+				application=application,
+				user=application.applicant,
+				status='completed'
+			).exists()
+			
+			if existing_payment:
+				return JsonResponse({'error': 'Payment already released'}, status=400)
+			
+			txn = Transaction.objects.create(
+				user=application.applicant,
+				application=application,
+				amount=application.job.pay_rate,
+				status='completed',
+				note=f'Payment for {application.job.title}'
+			)
+			record_transactions([txn])
 		
 		return JsonResponse({
 			'success': True,
@@ -2274,7 +2563,7 @@ def save_profile(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 		data = json.loads(request.body)
 		
 		# Update User model fields
@@ -2295,7 +2584,7 @@ def save_profile(request):
 			profile.city = data['city']
 		if 'bio' in data:
 			profile.bio = data['bio']
-		profile.save()
+		profile.save(update_fields=['phone', 'city', 'bio'])
 		
 		# Return updated profile data
 		return JsonResponse({
@@ -2310,7 +2599,7 @@ def save_profile(request):
 				'city': profile.city,
 				'bio': profile.bio,
 				'user_type': profile.user_type,
-				'wallet_balance': str(profile.wallet_balance),
+				'wallet_balance': profile.wallet_balance,
 			}
 		})
 	except Exception as e:
@@ -2329,15 +2618,13 @@ def get_autocomplete_suggestions(request):
 	if not field_type:
 		return JsonResponse({'error': 'field_type required'}, status=400)
 	
+	# Unknown field types have no rows; do not build an index for them
+	if field_type not in dict(AutocompleteSuggestion.FIELD_TYPES):
+		return JsonResponse({'suggestions': []})
+	
 	try:
-		suggestions = AutocompleteSuggestion.objects.filter(field_type=field_type)
-		
-		if query:
-			suggestions = suggestions.filter(value__icontains=query)
-		
-		suggestions = suggestions[:10]
-		
-		data = [{'value': s.value, 'usage_count': s.usage_count} for s in suggestions]
+		# Served from this process's in-memory index (see autocomplete.py), no query per keystroke
+		data = autocomplete.suggest(field_type, query)
 		
 		return JsonResponse({'suggestions': data})
 	except Exception as e:
@@ -2360,23 +2647,15 @@ def save_autocomplete_suggestion(request):
 		
 		user_profile = None
 		if request.user.is_authenticated:
-			user_profile = UserProfile.objects.get(user=request.user)
-		
-		suggestion, created = AutocompleteSuggestion.objects.get_or_create(
-			field_type=field_type,
-			value=value,
-			defaults={'created_by': user_profile}
-		)
+			user_profile = _get_profile(request)
 		
-		if not created:
-			suggestion.usage_count += 1
-			suggestion.save()
+		# Buffered and flushed in bulk; the row is created or incremented on the next flush
+		try:
+			suggestion_counts.increment(field_type, value, created_by=user_profile)
+		except DatabaseError:
+			logger.exception('Could not write autocomplete count for %s', field_type)
 		
-		return JsonResponse({
-			'success': True,
-			'created': created,
-			'usage_count': suggestion.usage_count
-		})
+		return JsonResponse({'success': True})
 	except Exception as e:
 		return JsonResponse({'error': str(e)}, status=400)
 
@@ -2396,7 +2675,7 @@ def job_applications(request, job_id):
 			return JsonResponse({'error': 'Authentication required'}, status=401)
 		
 		try:
-			profile = UserProfile.objects.get(user=request.user)
+			profile = _get_profile(request)
 			if profile.user_type != 'organizer':
 				return JsonResponse({'error': 'Only organizers can view applications'}, status=403)
 			
@@ -2417,7 +2696,7 @@ def job_applications(request, job_id):
 			app_dict = {
 				'id': app.id,
 				'status': app.status,
-				'created_at': app.created_at.isoformat() if app.created_at else None,
+				'created_at': app.created_at,
 				'cover_message': app.cover_message,
 				'full_name': app.full_name or app.applicant.user.username,
 				'email': app.email or app.applicant.user.email,
@@ -2456,7 +2735,7 @@ def complete_job(request, job_id):
 			return JsonResponse({'error': 'Authentication required'}, status=401)
 		
 		try:
-			profile = UserProfile.objects.get(user=request.user)
+			profile = _get_profile(request)
 			if profile.user_type != 'organizer':
 				return JsonResponse({'error': 'Only organizers can complete jobs'}, status=403)
 			
@@ -2465,14 +2744,22 @@ def complete_job(request, job_id):
 		except UserProfile.DoesNotExist:
 			return JsonResponse({'error': 'Profile not found'}, status=404)
 		
-		job.status = 'completed'
-		job.save()
+		# Completing settles escrow exactly like finish_job: held pay goes to the hires
+		try:
+			payout = release_job_payouts(job.id, profile.id)
+		except JobAlreadyFinished:
+			return JsonResponse({'error': 'This event has already been finished'}, status=400)
+		except InsufficientFunds as e:
+			return JsonResponse({'error': str(e), 'required': e.required, 'available': e.available}, status=400)
+		job = payout['job']
 		
 		return JsonResponse({
 			'success': True,
 			'message': 'Job marked as completed',
 			'job_id': job.id,
-			'status': job.status
+			'status': job.status,
+			'payments_released': payout['payments_released'],
+			'total_amount': payout['total_amount']
 		})
 		
 	except Exception as e:
@@ -2492,7 +2779,7 @@ def delete_job(request, job_id):
 			return JsonResponse({'error': 'Authentication required'}, status=401)
 		
 		try:
-			profile = UserProfile.objects.get(user=request.user)
+			profile = _get_profile(request)
 			if profile.user_type != 'organizer':
 				return JsonResponse({'error': 'Only organizers can delete jobs'}, status=403)
 			
@@ -2501,18 +2788,60 @@ def delete_job(request, job_id):
 		except UserProfile.DoesNotExist:
 			return JsonResponse({'error': 'Profile not found'}, status=404)
 		
+		from django.db import transaction as db_transaction
+		
 		job_title = job.title
-		job.delete()
 		
-		return JsonResponse({
-			'success': True,
-			'message': f'Job "{job_title}" has been deleted successfully'
+		with db_transaction.atomic():
+			# Job first, as every other escrow path does, so this cannot refund holds finish_job is paying out
+			job = Job.objects.select_for_update().get(id=job.id)
+			if job.status == 'completed':
+				return JsonResponse({'error': 'Finished events cannot be deleted'}, status=400)
+			applications = list(Application.objects.select_for_update().filter(job=job).select_related('job'))
+			
+			# Refund escrow for hires that were never paid out, then log deletions before the cascade
+			wallet.release_application_holds(
+				[app for app in applications if app.status == 'accepted'], note='Escrow refunded (event deleted)'
+			)
+			record_application_changes(applications, action='delete')
+			record_job_change(job, action='delete')
+			job.delete()
+		
+		return JsonResponse({
+			'success': True,
+			'message': f'Job "{job_title}" has been deleted successfully'
 		})
 		
 	except Exception as e:
 		return JsonResponse({'error': str(e)}, status=400)
 
 
+def _job_details_versions(request, job_id):
+	"""Row versions behind get_job_details, or None unless the caller may see the job"""
+	if not request.user.is_authenticated:
+		return None
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return None
+	
+	job = Job.objects.filter(id=job_id).values_list('organizer_id', 'updated_at').first()
+	if job is None:
+		return None
+	hired = tuple(
+		Application.objects.filter(job_id=job_id, status='accepted')
+		.order_by('id').values_list('id', 'applicant_id', 'applicant__updated_at')
+	)
+	
+	if profile.user_type == 'organizer' and job[0] == profile.id:
+		return (profile.id, job, hired)
+	if profile.user_type == 'staff' and any(applicant_id == profile.id for _, applicant_id, _ in hired):
+		# Staff don't see the hired list, only the job
+		return (profile.id, job)
+	return None
+
+
+@conditional_json(_job_details_versions)
 def get_job_details(request, job_id):
 	"""Get detailed job information including hired staff"""
 	if not request.user.is_authenticated:
@@ -2522,7 +2851,7 @@ def get_job_details(request, job_id):
 		job = get_object_or_404(Job, id=job_id)
 		
 		try:
-			profile = UserProfile.objects.get(user=request.user)
+			profile = _get_profile(request)
 			
 			# Allow organizers to view their own jobs, and staff to view jobs they're hired for
 			if profile.user_type == 'organizer':
@@ -2566,11 +2895,11 @@ def get_job_details(request, job_id):
 			'description': job.description,
 			'event_type': job.event_type,
 			'role': job.role,
-			'date': job.date.isoformat() if job.date else None,
+			'date': job.date,
 			'start_time': job.start_time.strftime('%H:%M') if job.start_time else 'TBD',
 			'end_time': job.end_time.strftime('%H:%M') if job.end_time else 'TBD',
 			'location': job.location,
-			'pay_rate': str(job.pay_rate),
+			'pay_rate': job.pay_rate,
 			'payment_type': job.payment_type,
 			'number_of_staff': job.number_of_staff,
 			'requirements': job.requirements,
@@ -2589,6 +2918,7 @@ def get_job_details(request, job_id):
 
 
 @csrf_exempt
+@idempotent
 def finish_job(request, job_id):
 	"""Mark a job/event as finished and release payments to staff"""
 	if request.method != 'POST':
@@ -2598,8 +2928,6 @@ def finish_job(request, job_id):
 		return JsonResponse({'error': 'Authentication required'}, status=401)
 	
 	try:
-		from django.db import transaction as db_transaction
-		
 		job = get_object_or_404(Job, id=job_id)
 		
 		# Check if job is already completed
@@ -2607,7 +2935,7 @@ def finish_job(request, job_id):
 			return JsonResponse({'error': 'This event has already been finished'}, status=400)
 		
 		try:
-			profile = UserProfile.objects.get(user=request.user)
+			profile = _get_profile(request)
 			if profile.user_type != 'organizer':
 				return JsonResponse({'error': 'Only organizers can finish jobs'}, status=403)
 			
@@ -2616,13 +2944,23 @@ def finish_job(request, job_id):
 		except UserProfile.DoesNotExist:
 			return JsonResponse({'error': 'Profile not found'}, status=404)
 		
-		# Get all accepted applications for this job
-		accepted_apps = Application.objects.filter(job=job, status='accepted')
+		try:
+			payout = release_job_payouts(job.id, profile.id)
+		except JobAlreadyFinished:
+			return JsonResponse({'error': 'This event has already been finished'}, status=400)
+		except InsufficientFunds as e:
+			return JsonResponse({
+				'error': str(e),
+				'required': e.required,
+				'available': e.available
+			}, status=400)
 		
-		if not accepted_apps.exists():
-			# No staff to pay, just mark as completed
-			job.status = 'completed'
-			job.save()
+		job = payout['job']
+		payments_released = payout['payments_released']
+		total_payment = payout['total_amount']
+		
+		if not payments_released:
+			# No staff to pay, just marked as completed
 			return JsonResponse({
 				'success': True,
 				'message': 'Event marked as finished successfully',
@@ -2631,73 +2969,13 @@ def finish_job(request, job_id):
 				'payments_released': 0
 			})
 		
-		# Calculate total amount needed
-		total_payment = sum(app.job.pay_rate for app in accepted_apps)
-		
-		# Check if organizer has enough balance
-		if profile.wallet_balance < total_payment:
-			return JsonResponse({
-				'error': f'Insufficient balance. Need ₹{total_payment}, but only have ₹{profile.wallet_balance}',
-				'required': str(total_payment),
-				'available': str(profile.wallet_balance)
-			}, status=400)
-		
-		# Atomic transaction to release all payments
-		with db_transaction.atomic():
-			payments_released = 0
-			
-			# Deduct from organizer's wallet
-			profile.wallet_balance -= total_payment
-			organizer_balance = profile.wallet_balance
-			profile.save()
-			
-			# Record organizer's payment transaction
-			Transaction.objects.create(
-				user=profile,
-				transaction_type='escrow_release',
-				amount=total_payment,
-				status='completed',
-				job=job,
-				balance_after=organizer_balance,
-				note=f'Payment released for event: {job.title}'
-			)
-			
-			# Pay each accepted staff member
-			for app in accepted_apps:
-				staff_profile = app.applicant
-				payment_amount = app.job.pay_rate
-				
-				# Add to staff wallet
-				staff_profile.wallet_balance += payment_amount
-				staff_balance = staff_profile.wallet_balance
-				staff_profile.save()
-				
-				# Record staff payment transaction
-				Transaction.objects.create(
-					user=staff_profile,
-					transaction_type='payment',
-					amount=payment_amount,
-					status='completed',
-					application=app,
-					job=job,
-					related_user=profile,
-					balance_after=staff_balance,
-					note=f'Payment received for: {job.title}'
-				)
-				
-				payments_released += 1
-			
-			# Mark job as completed
-			job.status = 'completed'
-			job.save()
-		
 		return JsonResponse({
 			'success': True,
 			'message': f'Event finished and ₹{total_payment} released to {payments_released} staff members',
 			'job_id': job.id,
 			'job_title': job.title,
 			'payments_released': payments_released,
-			'total_amount': str(total_payment)
+			'total_amount': total_payment
 		})
 		
 	except Exception as e:
@@ -2720,7 +2998,7 @@ def reject_application(request, app_id):
 			return JsonResponse({'error': 'Authentication required'}, status=401)
 		
 		try:
-			profile = UserProfile.objects.get(user=request.user)
+			profile = _get_profile(request)
 			if profile.user_type != 'organizer':
 				return JsonResponse({'error': 'Only organizers can reject applications'}, status=403)
 			
@@ -2729,8 +3007,16 @@ def reject_application(request, app_id):
 		except UserProfile.DoesNotExist:
 			return JsonResponse({'error': 'Profile not found'}, status=404)
 		
-		application.status = 'rejected'
-		application.save()
+		from django.db import transaction as db_transaction
+		
+		with db_transaction.atomic():
+			application = Application.objects.select_for_update().select_related('job').get(id=application.id)
+			if application.status == 'accepted':
+				wallet.release_application_holds([application], note='Escrow refunded (staff released)')
+				availability.unbook([application])
+			Application.objects.filter(id=application.id).update(status='rejected')
+			application.status = 'rejected'
+			record_application_changes([application])
 		
 		return JsonResponse({
 			'success': True,
@@ -2758,7 +3044,7 @@ def withdraw_application(request, app_id):
 			return JsonResponse({'error': 'Authentication required'}, status=401)
 		
 		try:
-			profile = UserProfile.objects.get(user=request.user)
+			profile = _get_profile(request)
 			if profile.user_type != 'staff':
 				return JsonResponse({'error': 'Only staff can withdraw from events'}, status=403)
 			
@@ -2770,9 +3056,18 @@ def withdraw_application(request, app_id):
 		except UserProfile.DoesNotExist:
 			return JsonResponse({'error': 'Profile not found'}, status=404)
 		
-		# Change status to withdrawn/cancelled
-		application.status = 'withdrawn'
-		application.save()
+		from django.db import transaction as db_transaction
+		
+		# Change status to withdrawn/cancelled and give the held pay back to the organizer
+		with db_transaction.atomic():
+			application = Application.objects.select_for_update().select_related('job').get(id=application.id)
+			if application.status != 'accepted':
+				return JsonResponse({'error': 'Can only withdraw from accepted applications'}, status=400)
+			wallet.release_application_holds([application], note='Escrow refunded (staff withdrew)')
+			availability.unbook([application])
+			Application.objects.filter(id=application.id).update(status='withdrawn')
+			application.status = 'withdrawn'
+			record_application_changes([application])
 		
 		return JsonResponse({
 			'success': True,
@@ -2786,42 +3081,777 @@ def withdraw_application(request, app_id):
 		return JsonResponse({'error': str(e)}, status=500)
 
 
+
+BULK_DECISION_MAX = 500
+
+
+@csrf_exempt
+def bulk_application_decisions(request):
+	"""
+	Accept or reject many applications in one request (organizer only)
+	
+	Body: {"decisions": [{"id": 12, "decision": "accept"}, {"id": 13, "decision": "reject"}, ...]}
+	
+	Ownership is checked with one query and all accepts are paid into escrow
+	with one conditional UPDATE for their combined pay. If the wallet cannot
+	cover them, every accept in the batch is refused (outcome
+	'insufficient_funds') while the rejects still go through. Accepts that
+	would double-book a staff member (see availability.py), including two
+	overlapping accepts of the same person in the batch, are refused first
+	with outcome 'calendar_conflict'. Once a job is finished its applications
+	are frozen: every decision on them is 'invalid_state', so a paid hire
+	cannot be rejected afterwards. Status changes are applied with one
+	UPDATE ... WHERE id IN per decision, all in one transaction. Returns an
+	outcome per id.
+	"""
+	if request.method != 'POST':
+		return JsonResponse({'error': 'POST required'}, status=405)
+	
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	
+	if profile.user_type != 'organizer':
+		return JsonResponse({'error': 'only organizers can accept or reject applications'}, status=403)
+	
+	try:
+		payload = json.loads(request.body.decode('utf-8'))
+		decisions = payload['decisions']
+		if not isinstance(decisions, list):
+			raise ValueError
+		requested = [(int(item['id']), item.get('decision')) for item in decisions]
+	except (ValueError, KeyError, TypeError, AttributeError):
+		return JsonResponse({'error': 'body must be {"decisions": [{"id": <int>, "decision": "accept"|"reject"}, ...]}'}, status=400)
+	
+	if len(requested) > BULK_DECISION_MAX:
+		return JsonResponse({'error': f'At most {BULK_DECISION_MAX} decisions per request'}, status=400)
+	
+	outcomes = {}
+	wanted = {}
+	for app_id, decision in requested:
+		if app_id in outcomes:
+			continue
+		if decision not in ('accept', 'reject'):
+			outcomes[app_id] = {'outcome': 'invalid_decision'}
+		elif wanted.get(app_id, decision) != decision:
+			outcomes[app_id] = {'outcome': 'conflicting_decisions'}
+			del wanted[app_id]
+		else:
+			wanted[app_id] = decision
+	
+	from django.db import transaction as db_transaction
+	
+	insufficient = None
+	with db_transaction.atomic():
+		# Lock the jobs before the applications, as the single-accept views and finish_job do
+		list(Job.objects.select_for_update().filter(
+			id__in=Application.objects.filter(id__in=list(wanted)).values('job_id'),
+		).order_by('id').values_list('id', flat=True))
+		applications = {
+			app.id: app
+			for app in Application.objects.select_for_update().select_related('job').filter(id__in=list(wanted))
+		}
+		
+		to_accept, to_reject = [], []
+		for app_id, decision in wanted.items():
+			app = applications.get(app_id)
+			if app is None:
+				outcomes[app_id] = {'outcome': 'not_found'}
+			elif app.job.organizer_id != profile.id:
+				outcomes[app_id] = {'outcome': 'unauthorized'}
+			elif app.job.status == 'completed':
+				outcomes[app_id] = {'outcome': 'invalid_state', 'status': app.status}
+			elif app.status == ('accepted' if decision == 'accept' else 'rejected'):
+				outcomes[app_id] = {'outcome': 'unchanged', 'status': app.status}
+			elif decision == 'reject' and app.status not in ('pending', 'accepted'):
+				outcomes[app_id] = {'outcome': 'invalid_state', 'status': app.status}
+			elif decision == 'accept' and (app.status == 'withdrawn' or app.job.status != 'active'):
+				outcomes[app_id] = {'outcome': 'invalid_state', 'status': app.status}
+			else:
+				(to_accept if decision == 'accept' else to_reject).append(app)
+		
+		clashes = availability.find_conflicts(to_accept)
+		for app in to_accept:
+			if app.id in clashes:
+				outcomes[app.id] = {'outcome': 'calendar_conflict', 'status': app.status}
+		to_accept = [app for app in to_accept if app.id not in clashes]
+		
+		if to_accept:
+			try:
+				wallet.hold_for_applications(to_accept)
+			except InsufficientFunds as e:
+				insufficient = e
+				for app in to_accept:
+					outcomes[app.id] = {'outcome': 'insufficient_funds', 'status': app.status}
+				to_accept = []
+		
+		try:
+			availability.book(to_accept)
+		except CalendarConflict as e:
+			# Booked by a concurrent request since find_conflicts(); nothing in this batch is kept
+			db_transaction.set_rollback(True)
+			return _calendar_conflict_response(e)
+		
+		released = [app for app in to_reject if app.status == 'accepted']
+		wallet.release_application_holds(released, note='Escrow refunded (staff released)')
+		availability.unbook(released)
+		
+		for apps, status in ((to_accept, 'accepted'), (to_reject, 'rejected')):
+			if not apps:
+				continue
+			Application.objects.filter(id__in=[app.id for app in apps]).update(status=status)
+			for app in apps:
+				app.status = status
+				outcomes[app.id] = {'outcome': status, 'status': status}
+		record_application_changes(to_accept + to_reject)
+	
+	profile.refresh_from_db(fields=['wallet_balance', 'escrow_balance'])
+	
+	response = {
+		'results': {str(app_id): result for app_id, result in outcomes.items()},
+		'accepted': len(to_accept),
+		'rejected': len(to_reject),
+		'wallet_balance': profile.wallet_balance,
+		'escrow_balance': profile.escrow_balance,
+	}
+	if insufficient is not None:
+		response['error'] = f'Insufficient balance. Need ₹{insufficient.required} to hire the selected staff, but only have ₹{insufficient.available}. Please add funds first.'
+		response['required'] = insufficient.required
+		response['available'] = insufficient.available
+	return JsonResponse(response)
+
+
+def roster_proposal(request, job_id=None):
+	"""
+	Proposed hires for one job or several of the organizer's jobs - PROTECTED: Organizers only
+	
+	GET /api/jobs/<id>/roster/
+	GET /api/jobs/roster/?date=2026-11-05          (all active jobs that day)
+	GET /api/jobs/roster/?job_ids=31,32,35
+	
+	Picks pending applicants by AI rating and reputation within each job's
+	open positions, the wallet balance and everyone's calendar (see
+	roster.py). Nothing is accepted: POST the returned "decisions" to
+	/api/applications/bulk-decision/ to hire the proposal.
+	"""
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	
+	if profile.user_type != 'organizer':
+		return JsonResponse({'error': 'Only Event Organizers can build rosters'}, status=403)
+	
+	jobs = Job.objects.filter(organizer=profile, status='active', is_draft=False)
+	if job_id is not None:
+		jobs = jobs.filter(id=job_id)
+	elif request.GET.get('job_ids'):
+		try:
+			job_ids = [int(value) for value in request.GET['job_ids'].split(',') if value.strip()]
+		except ValueError:
+			return JsonResponse({'error': 'job_ids must be a comma-separated list of job ids'}, status=400)
+		jobs = jobs.filter(id__in=job_ids)
+	elif request.GET.get('date'):
+		try:
+			jobs = jobs.filter(date=datetime.strptime(request.GET['date'], '%Y-%m-%d').date())
+		except ValueError:
+			return JsonResponse({'error': 'date must be in YYYY-MM-DD format'}, status=400)
+	else:
+		return JsonResponse({'error': 'Pass job_ids or date'}, status=400)
+	
+	jobs = list(jobs.only('id')[:roster.MAX_JOBS + 1])
+	if not jobs:
+		return JsonResponse({'error': 'No active jobs of yours match'}, status=404)
+	if len(jobs) > roster.MAX_JOBS:
+		return JsonResponse({'error': f'At most {roster.MAX_JOBS} jobs per roster'}, status=400)
+	
+	return JsonResponse(roster.propose(profile, jobs))
+
+
+def _calendar_conflict_response(conflict):
+	"""409 for a CalendarConflict; only the clashing times are shown, not whose events they are"""
+	return JsonResponse({
+		'error': str(conflict),
+		'conflicts': [
+			{'application_id': app_id, 'busy': [{'starts_at': e.starts_at, 'ends_at': e.ends_at} for e in entries]}
+			for app_id, entries in conflict.conflicts.items()
+		],
+	}, status=409)
+
+
+CALENDAR_DEFAULT_DAYS = 30
+CALENDAR_MAX_DAYS = 92
+FREE_BUSY_MAX_STAFF = 200
+
+
+def _parse_moment(value, end=False):
+	"""Aware datetime from an ISO date or datetime; a bare date is its midnight, or the next one when end=True"""
+	from datetime import timedelta
+	from django.utils import timezone
+	from django.utils.dateparse import parse_date, parse_datetime
+	
+	day = parse_date(value)
+	if day is not None:
+		moment = datetime.combine(day + timedelta(days=1) if end else day, datetime.min.time())
+	else:
+		moment = parse_datetime(value)
+		if moment is None:
+			raise ValueError(value)
+	return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+
+
+def _calendar_range(request, default=None):
+	"""
+	((starts_at, ends_at), None) for ?from=&to= (dates, to inclusive, or datetimes), or (None, 400 response)
+	
+	Without from, the range starts at default's start or today; without to,
+	it ends at default's end or CALENDAR_DEFAULT_DAYS later.
+	"""
+	from datetime import timedelta
+	from django.utils import timezone
+	
+	try:
+		if request.GET.get('from'):
+			starts_at = _parse_moment(request.GET['from'])
+		else:
+			starts_at = default[0] if default else _parse_moment(timezone.localdate().isoformat())
+		if request.GET.get('to'):
+			ends_at = _parse_moment(request.GET['to'], end=True)
+		else:
+			ends_at = default[1] if default else starts_at + timedelta(days=CALENDAR_DEFAULT_DAYS)
+	except ValueError:
+		return None, JsonResponse({'error': 'from/to must be YYYY-MM-DD dates or ISO datetimes'}, status=400)
+	
+	if ends_at <= starts_at:
+		return None, JsonResponse({'error': '"to" must be after "from"'}, status=400)
+	if ends_at - starts_at > timedelta(days=CALENDAR_MAX_DAYS):
+		return None, JsonResponse({'error': f'Range is limited to {CALENDAR_MAX_DAYS} days'}, status=400)
+	return (starts_at, ends_at), None
+
+
+def my_calendar(request):
+	"""
+	The signed-in staff member's bookings and unavailable blocks - PROTECTED: Staff only
+	
+	GET /api/calendar/?from=2026-11-01&to=2026-11-30 (default: the next 30 days)
+	"""
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	
+	if profile.user_type != 'staff':
+		return JsonResponse({'error': 'Only Event Pros (staff) have a calendar'}, status=403)
+	
+	window, error = _calendar_range(request)
+	if error:
+		return error
+	
+	entries = availability.overlapping([profile.id], *window).order_by('starts_at')
+	return JsonResponse({
+		'from': window[0],
+		'to': window[1],
+		'results': [availability.entry_to_dict(entry) for entry in entries],
+	})
+
+
+@csrf_exempt
+def add_unavailability(request):
+	"""
+	Block out time in the signed-in staff member's calendar - PROTECTED: Staff only
+	
+	POST /api/calendar/unavailable/
+	{"starts_at": "2026-11-01T09:00:00+05:30", "ends_at": "2026-11-03", "note": "Travelling"}
+	
+	A bare date starts at its midnight, or (as ends_at) ends at the next one.
+	Refused with 409 when the block overlaps an event the staff member is
+	booked for.
+	"""
+	if request.method != 'POST':
+		return JsonResponse({'error': 'POST required'}, status=405)
+	
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	
+	if profile.user_type != 'staff':
+		return JsonResponse({'error': 'Only Event Pros (staff) have a calendar'}, status=403)
+	
+	try:
+		payload = json.loads(request.body.decode('utf-8'))
+		starts_at = _parse_moment(payload['starts_at'])
+		ends_at = _parse_moment(payload['ends_at'], end=True)
+		note = str(payload.get('note', ''))[:200]
+	except (ValueError, KeyError, TypeError, AttributeError):
+		return JsonResponse({'error': 'body must be {"starts_at": <date or datetime>, "ends_at": <date or datetime>, "note": ""}'}, status=400)
+	
+	from django.db import transaction as db_transaction
+	
+	try:
+		with db_transaction.atomic():
+			entries = availability.add_unavailable(profile, starts_at, ends_at, note)
+	except CalendarConflict as e:
+		return JsonResponse({
+			'error': 'You are booked for an event during this time; withdraw from it first',
+			'conflicts': [availability.entry_to_dict(entry) for entry in e.conflicts[None]]
+		}, status=409)
+	except ValueError as e:
+		return JsonResponse({'error': str(e)}, status=400)
+	
+	return JsonResponse({'results': [availability.entry_to_dict(entry) for entry in entries]})
+
+
+@csrf_exempt
+def delete_calendar_entry(request, entry_id):
+	"""Remove one of the signed-in staff member's unavailable blocks (bookings go away by withdrawing)"""
+	if request.method != 'POST':
+		return JsonResponse({'error': 'POST required'}, status=405)
+	
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	
+	deleted, _ = CalendarEntry.objects.filter(id=entry_id, profile=profile, kind='unavailable').delete()
+	if not deleted:
+		return JsonResponse({'error': 'unavailable block not found'}, status=404)
+	return JsonResponse({'success': True, 'id': entry_id})
+
+
+def staff_free_busy(request):
+	"""
+	Busy time of several staff members - PROTECTED: Organizers only
+	
+	GET /api/calendar/free-busy/?staff=4,9,12&from=2026-11-01&to=2026-11-07
+	GET /api/calendar/free-busy/?staff=4,9,12&job_id=31
+	
+	Returns merged busy intervals per staff member (what they are busy with
+	is not shown) and "available": free for the whole range, or with job_id
+	free for that job's date and times (the default range). Read with one
+	query however many staff are asked about.
+	"""
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	
+	if profile.user_type != 'organizer':
+		return JsonResponse({'error': 'Only Event Organizers can check staff availability'}, status=403)
+	
+	try:
+		staff_ids = list(dict.fromkeys(int(value) for value in request.GET.get('staff', '').split(',') if value.strip()))
+	except ValueError:
+		return JsonResponse({'error': 'staff must be a comma-separated list of profile ids'}, status=400)
+	if not staff_ids:
+		return JsonResponse({'error': 'staff is required'}, status=400)
+	if len(staff_ids) > FREE_BUSY_MAX_STAFF:
+		return JsonResponse({'error': f'At most {FREE_BUSY_MAX_STAFF} staff per request'}, status=400)
+	
+	job_window = None
+	if request.GET.get('job_id'):
+		try:
+			job = Job.objects.only('date', 'start_time', 'end_time').get(id=int(request.GET['job_id']))
+		except (ValueError, Job.DoesNotExist):
+			return JsonResponse({'error': 'job not found'}, status=404)
+		job_window = availability.job_interval(job)
+		if job_window is None:
+			return JsonResponse({'error': 'job has no date'}, status=400)
+	
+	window, error = _calendar_range(request, default=job_window)
+	if error:
+		return error
+	
+	busy = availability.free_busy(staff_ids, *window)
+	check_from, check_until = job_window or window
+	return JsonResponse({
+		'from': window[0],
+		'to': window[1],
+		'results': [{
+			'id': staff_id,
+			'busy': [{'starts_at': starts_at, 'ends_at': ends_at} for starts_at, ends_at in intervals],
+			'available': not any(starts_at < check_until and ends_at > check_from for starts_at, ends_at in intervals),
+		} for staff_id, intervals in busy.items()],
+	})
+
+
+SYNC_PAGE_SIZE = 500
+
+
+def sync_changes(request):
+	"""
+	Delta sync for the dashboards
+	
+	Returns only the jobs, applications, messages and transactions that changed
+	for the current user since the given cursor (a ChangeLogEntry id).
+	
+	Query params:
+		cursor: last cursor returned by this endpoint (omit on first load)
+		limit: max change entries to consume per call (default/max 500)
+	
+	Response:
+	{
+		"cursor": 1234,          // pass back on the next call; it never passes entries younger than
+		                         // SYNC_CURSOR_LAG_SECONDS, so recent changes may arrive twice
+		"has_more": false,       // true if another call is needed to catch up
+		"reset": false,          // true if the client must do a full reload first
+		"jobs": [...], "applications": [...], "messages": [...], "transactions": [...],
+		"deleted": {"job": [ids], "application": [ids]},
+		"wallet_balance": "123.00"  // only present when transactions changed
+	}
+	"""
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	
+	try:
+		limit = max(1, min(int(request.GET.get('limit', SYNC_PAGE_SIZE)), SYNC_PAGE_SIZE))
+	except ValueError:
+		return JsonResponse({'error': 'limit must be an integer'}, status=400)
+	
+	try:
+		cursor = int(request.GET.get('cursor', ''))
+	except ValueError:
+		cursor = None
+	
+	log = ChangeLogEntry.objects.filter(profile=profile)
+	
+	# Entries past this may have uncommitted neighbours with lower ids (see changelog.safe_cursor)
+	settled = safe_cursor()
+	
+	# No cursor, or a cursor older than the retained log: client must full-load, then continue from here
+	oldest_id = ChangeLogEntry.objects.order_by('id').values_list('id', flat=True).first()
+	if cursor is None or cursor < 0 or (oldest_id is not None and cursor < oldest_id - 1):
+		return JsonResponse({'cursor': settled, 'has_more': False, 'reset': True})
+	
+	entries = list(log.filter(id__gt=cursor).order_by('id').values_list('id', 'entity_type', 'entity_id', 'action')[:limit + 1])
+	has_more = len(entries) > limit
+	entries = entries[:limit]
+	
+	next_cursor = entries[-1][0] if entries else cursor
+	if next_cursor > settled:
+		# Send the recent entries, but resume before them so a late commit below them is not skipped
+		next_cursor, has_more = max(cursor, settled), False
+	
+	# Collapse to the latest action per entity
+	latest = {}
+	for entry_id, entity_type, entity_id, action in entries:
+		latest[(entity_type, entity_id)] = action
+	
+	changed = {'job': [], 'application': [], 'message': [], 'transaction': []}
+	deleted = {'job': [], 'application': []}
+	for (entity_type, entity_id), action in latest.items():
+		if action == 'delete':
+			deleted.setdefault(entity_type, []).append(entity_id)
+		else:
+			changed[entity_type].append(entity_id)
+	
+	response_data = {
+		'cursor': next_cursor,
+		'has_more': has_more,
+		'reset': False,
+		'jobs': [],
+		'applications': [],
+		'messages': [],
+		'transactions': [],
+		'deleted': deleted,
+	}
+	
+	if changed['job']:
+		jobs = Job.objects.filter(id__in=changed['job']).select_related('organizer__user')
+		response_data['jobs'] = [_job_to_dict(j) for j in jobs]
+	
+	if changed['application']:
+		applications = Application.objects.filter(id__in=changed['application']).select_related(
+			'job__organizer__user', 'applicant__user'
+		).order_by('-created_at')
+		response_data['applications'] = [_application_to_dict(app) for app in applications]
+	
+	if changed['message']:
+		messages = Message.objects.filter(id__in=changed['message']).select_related(
+			'sender__user', 'recipient__user'
+		).order_by('created_at')
+		response_data['messages'] = [_message_to_dict(msg) for msg in messages]
+	
+	if changed['transaction']:
+		transactions = Transaction.objects.filter(id__in=changed['transaction']).select_related(
+			'application__job__organizer__user',
+			'job__organizer__user',
+			'related_user__user'
+		).order_by('-created_at')
+		response_data['transactions'] = [_transaction_to_dict(txn) for txn in transactions]
+		response_data['wallet_balance'] = profile.wallet_balance
+	
+	return JsonResponse(response_data)
+
+
+def _dashboard_bootstrap(profile, cursor):
+	"""
+	Everything the first dashboard screen needs, in a fixed number of queries
+	
+	cursor is changelog.safe_cursor(), read before the profile and anything
+	else: a change committed while the snapshot is read, or still in flight
+	with a lower id, is then replayed by /api/sync/ (harmless) instead of
+	falling between snapshot and cursor.
+	
+	Profiles are shipped once in a 'profiles' table keyed by id; jobs and
+	applications reference them through organizer_id/applicant_id.
+	"""
+	from .models import Review
+	
+	profiles = {profile.id: profile}
+	
+	if profile.user_type == 'staff':
+		applications = list(Application.objects.filter(applicant=profile).select_related(
+			'job__organizer__user'
+		).order_by('-created_at'))
+		for app in applications:
+			app.applicant = profile
+			profiles[app.job.organizer_id] = app.job.organizer
+	else:
+		jobs = list(Job.objects.filter(organizer=profile).order_by('-created_at'))
+		jobs_by_id = {job.id: job for job in jobs}
+		for job in jobs:
+			job.organizer = profile
+		applications = list(Application.objects.filter(job__organizer=profile).select_related(
+			'applicant__user'
+		).order_by('-created_at'))
+		for app in applications:
+			app.job = jobs_by_id[app.job_id]
+			profiles[app.applicant_id] = app.applicant
+	
+	transactions = Transaction.objects.filter(user=profile).select_related(
+		'application__job__organizer__user',
+		'job__organizer__user',
+		'related_user__user'
+	).order_by('-created_at')[:50]
+	
+	verification = VerificationDocument.objects.filter(user=profile).order_by('-submitted_at').first()
+	
+	data = {
+		'role': profile.user_type,
+		'cursor': cursor,
+		'profile': _profile_to_dict(profile),
+		'applications': [_application_to_dict(app, embed_profiles=False) for app in applications],
+		'wallet': _wallet_stats_data(profile),
+		'transactions': [_transaction_to_dict(txn) for txn in transactions],
+		'verification': _verification_status_data(profile, verification),
+	}
+	
+	if profile.user_type == 'staff':
+		# Job board and reputation panel
+		job_listings = list(Job.objects.all().select_related('organizer__user').order_by('-created_at')[:50])
+		for job in job_listings:
+			profiles.setdefault(job.organizer_id, job.organizer)
+		reviews = Review.objects.filter(staff=profile).select_related('job', 'organizer__user').order_by('-created_at')
+		data['job_listings'] = [_job_to_dict(job, embed_profiles=False) for job in job_listings]
+		data['reviews'] = [_review_to_dict(review) for review in reviews]
+	else:
+		# My jobs and the talent grid
+		talent = list(UserProfile.objects.filter(user_type='staff').select_related('user')[:50])
+		for staff_profile in talent:
+			profiles.setdefault(staff_profile.id, staff_profile)
+		data['jobs'] = [_job_to_dict(job, embed_profiles=False) for job in jobs]
+		data['talent'] = [staff_profile.id for staff_profile in talent]
+	
+	data['profiles'] = {str(pid): _profile_to_dict(p) for pid, p in profiles.items()}
+	return data
+
+
+def dashboard_bootstrap(request, role):
+	"""
+	Single-request bootstrap for the staff portal and organizer dashboard
+	
+	GET /api/dashboard/staff/bootstrap/ or /api/dashboard/organizer/bootstrap/
+	Returns profile, applications, jobs, wallet stats, transactions, verification
+	status and a delta-sync cursor for /api/sync/ in one compact document.
+	"""
+	if role not in ('staff', 'organizer'):
+		return JsonResponse({'error': 'unknown dashboard'}, status=404)
+	
+	if not request.user.is_authenticated:
+		return JsonResponse({'error': 'authentication required'}, status=401)
+	
+	cursor = safe_cursor()
+	
+	try:
+		profile = _get_profile(request)
+	except UserProfile.DoesNotExist:
+		return JsonResponse({'error': 'profile not found'}, status=404)
+	
+	if profile.user_type != role:
+		return JsonResponse({'error': f'Only {role} accounts can load this dashboard'}, status=403)
+	
+	return JsonResponse(_dashboard_bootstrap(profile, cursor))
+
+
+BATCH_MAX_REQUESTS = 20
+
+
+@csrf_exempt
+def batch_requests(request):
+	"""
+	Execute several read-only API calls in one round trip
+	
+	Each path is resolved through the URLconf and its view is called directly
+	with the already-authenticated user and profile, so auth and the profile
+	lookup happen once per batch instead of once per call.
+	
+	Request body:
+	{
+		"requests": ["/api/jobs/5/", "/api/applications/12/", "/api/reviews/staff/3/"]
+	}
+	
+	Response:
+	{
+		"results": {
+			"/api/jobs/5/": {"status": 200, "body": {...}},
+			...
+		}
+	}
+	"""
+	from django.http import HttpRequest, Http404, QueryDict
+	from django.urls import resolve, Resolver404
+	from urllib.parse import urlsplit
+	
+	if request.method != 'POST':
+		return JsonResponse({'error': 'POST required'}, status=405)
+	
+	try:
+		payload = json.loads(request.body.decode('utf-8'))
+	except Exception:
+		return JsonResponse({'error': 'invalid JSON'}, status=400)
+	
+	paths = payload.get('requests')
+	if not isinstance(paths, list) or not paths:
+		return JsonResponse({'error': 'requests must be a non-empty list of paths'}, status=400)
+	if len(paths) > BATCH_MAX_REQUESTS:
+		return JsonResponse({'error': f'at most {BATCH_MAX_REQUESTS} requests per batch'}, status=400)
+	
+	# Resolve the profile once and share it with every sub-call
+	if request.user.is_authenticated:
+		try:
+			_get_profile(request)
+		except UserProfile.DoesNotExist:
+			pass
+	
+	results = {}
+	for path in paths:
+		if not isinstance(path, str):
+			return JsonResponse({'error': 'each request must be a path string'}, status=400)
+		if path in results:
+			continue
+		
+		parts = urlsplit(path)
+		if not parts.path.startswith('/api/') or parts.path.startswith(('/api/batch/', '/api/auth/')):
+			results[path] = {'status': 400, 'body': {'error': 'only /api/ read endpoints can be batched'}}
+			continue
+		
+		try:
+			match = resolve(parts.path)
+		except Resolver404:
+			results[path] = {'status': 404, 'body': {'error': 'not found'}}
+			continue
+		
+		sub_request = HttpRequest()
+		sub_request.method = 'GET'
+		sub_request.path = sub_request.path_info = parts.path
+		sub_request.GET = QueryDict(parts.query)
+		sub_request.META = {**request.META, 'REQUEST_METHOD': 'GET', 'PATH_INFO': parts.path, 'QUERY_STRING': parts.query}
+		# Validators belong to the batch request; every sub-response needs its body
+		for header in ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE', 'HTTP_IF_MATCH', 'HTTP_IF_UNMODIFIED_SINCE'):
+			sub_request.META.pop(header, None)
+		sub_request.COOKIES = request.COOKIES
+		sub_request.user = request.user
+		sub_request.resolver_match = match
+		if hasattr(request, '_cached_profile'):
+			sub_request._cached_profile = request._cached_profile
+		
+		try:
+			response = match.func(sub_request, *match.args, **match.kwargs)
+		except Http404:
+			results[path] = {'status': 404, 'body': {'error': 'not found'}}
+			continue
+		except Exception as e:
+			results[path] = {'status': 500, 'body': {'error': str(e)}}
+			continue
+		
+		if not response.get('Content-Type', '').startswith('application/json'):
+			results[path] = {'status': 400, 'body': {'error': 'not a JSON endpoint'}}
+			continue
+		
+		results[path] = {'status': response.status_code, 'body': json.loads(response.content)}
+	
+	return JsonResponse({'results': results})
+
+
 # Footer Pages Views
+@cached_page('pricing.html')
 def pricing_page(request):
 	"""Pricing page"""
 	return render(request, 'pricing.html')
 
 
+@cached_page('success-stories.html')
 def success_stories_page(request):
 	"""Success Stories page"""
 	return render(request, 'success-stories.html')
 
 
+@cached_page('verification.html')
 def verification_page(request):
 	"""Verification page"""
 	return render(request, 'verification.html')
 
 
+@cached_page('faqs.html')
 def faqs_page(request):
 	"""FAQs page"""
 	return render(request, 'faqs.html')
 
 
+@cached_page('about-us.html')
 def about_us_page(request):
 	"""About Us page"""
 	return render(request, 'about-us.html')
 
 
+@cached_page('contact.html')
 def contact_page(request):
 	"""Contact page"""
 	return render(request, 'contact.html')
 
 
+@cached_page('privacy-policy.html')
 def privacy_policy_page(request):
 	"""Privacy Policy page"""
 	return render(request, 'privacy-policy.html')
 
 
+@cached_page('terms-of-service.html')
 def terms_page(request):
 	"""Terms of Service page"""
 	return render(request, 'terms-of-service.html')
@@ -2837,7 +3867,7 @@ def submit_verification(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
@@ -2903,32 +3933,36 @@ def get_verification_status(request):
 		return JsonResponse({'error': 'authentication required'}, status=401)
 	
 	try:
-		profile = UserProfile.objects.get(user=request.user)
+		profile = _get_profile(request)
 	except UserProfile.DoesNotExist:
 		return JsonResponse({'error': 'profile not found'}, status=404)
 	
 	# Get latest verification document
 	verification = VerificationDocument.objects.filter(user=profile).order_by('-submitted_at').first()
 	
+	return JsonResponse(_verification_status_data(profile, verification))
+
+
+def _verification_status_data(profile, verification):
 	if not verification:
-		return JsonResponse({
+		return {
 			'has_verification': False,
 			'kyc_verified': profile.kyc_verified
-		})
+		}
 	
-	return JsonResponse({
+	return {
 		'has_verification': True,
 		'verification': {
 			'id': verification.id,
 			'status': verification.status,
-			'submitted_at': safe_isoformat(verification.submitted_at),
-			'verified_at': safe_isoformat(verification.verified_at),
+			'submitted_at': verification.submitted_at,
+			'verified_at': verification.verified_at,
 			'rejection_reason': verification.rejection_reason,
 			'document_type': verification.document_type,
 			'full_name': verification.full_name,
 		},
 		'kyc_verified': profile.kyc_verified
-	})
+	}
 
 
 @csrf_exempt
@@ -2942,7 +3976,7 @@ def submit_review(request, job_id):
 	
 	try:
 		# Get organizer profile
-		organizer_profile = UserProfile.objects.get(user=request.user)
+		organizer_profile = _get_profile(request)
 		if organizer_profile.user_type != 'organizer':
 			return JsonResponse({'error': 'Only organizers can submit reviews'}, status=403)
 		
@@ -3010,14 +4044,16 @@ def submit_review(request, job_id):
 		
 		# Increment total_events_completed for staff if this is first review for this job
 		if created:
-			staff_profile.total_events_completed += 1
-			staff_profile.save()
+			UserProfile.objects.filter(id=staff_profile.id).update(
+				total_events_completed=django_models.F('total_events_completed') + 1
+			)
+			staff_profile.refresh_from_db()
 		
 		return JsonResponse({
 			'success': True,
 			'message': 'Review submitted successfully',
 			'review_id': review.id,
-			'staff_new_rating': str(staff_profile.average_rating),
+			'staff_new_rating': staff_profile.average_rating,
 			'staff_new_badge': staff_profile.badge,
 		})
 	
@@ -3025,7 +4061,35 @@ def submit_review(request, job_id):
 		return JsonResponse({'error': str(e)}, status=500)
 
 
+def _review_to_dict(review):
+	return {
+		'id': review.id,
+		'rating': review.rating,
+		'review_text': review.review_text,
+		'professionalism': review.professionalism,
+		'punctuality': review.punctuality,
+		'quality_of_work': review.quality_of_work,
+		'communication': review.communication,
+		'job_title': review.job.title,
+		'organizer_name': review.organizer.user.get_full_name() or review.organizer.user.username,
+		'created_at': review.created_at,
+	}
+
+
+def _reviews_versions(request, staff_id):
+	from .models import Review
+	staff = UserProfile.objects.filter(id=staff_id).values_list('updated_at', flat=True).first()
+	if staff is None:
+		return None
+	reviews = tuple(
+		Review.objects.filter(staff_id=staff_id).order_by('id')
+		.values_list('id', 'updated_at', 'job__updated_at', 'organizer__updated_at')
+	)
+	return (staff, reviews)
+
+
 @csrf_exempt
+@conditional_json(_reviews_versions)
 def get_reviews(request, staff_id):
 	"""Get all reviews for a staff member"""
 	try:
@@ -3034,20 +4098,7 @@ def get_reviews(request, staff_id):
 		from .models import Review
 		reviews = Review.objects.filter(staff=staff_profile).order_by('-created_at')
 		
-		reviews_data = []
-		for review in reviews:
-			reviews_data.append({
-				'id': review.id,
-				'rating': str(review.rating),
-				'review_text': review.review_text,
-				'professionalism': review.professionalism,
-				'punctuality': review.punctuality,
-				'quality_of_work': review.quality_of_work,
-				'communication': review.communication,
-				'job_title': review.job.title,
-				'organizer_name': review.organizer.user.get_full_name() or review.organizer.user.username,
-				'created_at': safe_isoformat(review.created_at),
-			})
+		reviews_data = [_review_to_dict(review) for review in reviews.select_related('job', 'organizer__user')]
 		
 		return JsonResponse({
 			'staff': _profile_to_dict(staff_profile),
@@ -3066,7 +4117,7 @@ def get_staff_to_review(request, job_id):
 		return JsonResponse({'error': 'Authentication required'}, status=401)
 	
 	try:
-		organizer_profile = UserProfile.objects.get(user=request.user)
+		organizer_profile = _get_profile(request)
 		if organizer_profile.user_type != 'organizer':
 			return JsonResponse({'error': 'Only organizers can review staff'}, status=403)
 		
@@ -3099,9 +4150,9 @@ def get_staff_to_review(request, job_id):
 				'has_review': existing_review is not None,
 				'review': {
 					'id': existing_review.id,
-					'rating': str(existing_review.rating),
+					'rating': existing_review.rating,
 					'review_text': existing_review.review_text,
-					'created_at': safe_isoformat(existing_review.created_at),
+					'created_at': existing_review.created_at,
 				} if existing_review else None
 			})
 		
@@ -0,0 +1,240 @@
+"""
+Wallet Service for EventFlex
+Concurrency-safe balance changes with a ledger row for every movement
+
+Balances are never read into Python, modified and saved back. Every change
+is a single conditional UPDATE (UPDATE ... SET wallet_balance =
+wallet_balance +/- x WHERE ...), so concurrent requests cannot lose updates
+and a debit can never take a wallet below zero. The matching Transaction
+row is written inside the same database transaction as the UPDATE.
+
+Escrow: accepting an application moves its pay from wallet_balance into
+escrow_balance (an escrow_hold ledger row) and records the amount on the
+application. finish_job pays staff out of escrow; rejected, withdrawn or
+deleted hires are refunded to the wallet.
+"""
+
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+
+
+class InsufficientFunds(ValueError):
+    """Raised when a wallet does not hold enough balance for a debit"""
+
+    def __init__(self, required, available):
+        self.required = required
+        self.available = available
+        super().__init__(f'Insufficient balance. Need ₹{required}, but only have ₹{available}')
+
+
+def _current_balance(profile_id):
+    from .models import UserProfile
+    return UserProfile.objects.values_list('wallet_balance', flat=True).get(id=profile_id)
+
+
+def credit_balance(profile_id, amount):
+    """
+    Atomically add to a wallet without writing a ledger row
+
+    Must run inside transaction.atomic(); the UPDATE holds the row lock until
+    commit, so the balance returned is the one this change produced.
+
+    Returns:
+        Decimal: Balance after the credit
+    """
+    from .models import UserProfile
+    UserProfile.objects.filter(id=profile_id).update(wallet_balance=F('wallet_balance') + amount)
+    return _current_balance(profile_id)
+
+
+def debit_balance(profile_id, amount):
+    """
+    Atomically subtract from a wallet if (and only if) it holds enough
+
+    Must run inside transaction.atomic().
+
+    Returns:
+        Decimal: Balance after the debit
+
+    Raises:
+        InsufficientFunds: if the balance is lower than amount
+    """
+    from .models import UserProfile
+    updated = UserProfile.objects.filter(id=profile_id, wallet_balance__gte=amount).update(
+        wallet_balance=F('wallet_balance') - amount
+    )
+    if not updated:
+        raise InsufficientFunds(required=amount, available=_current_balance(profile_id))
+    return _current_balance(profile_id)
+
+
+def _write_ledger(profile_id, amount, transaction_type, balance_after, **fields):
+    from .models import Transaction
+    from .changelog import record_transactions
+
+    txn = Transaction.objects.create(
+        user_id=profile_id,
+        transaction_type=transaction_type,
+        amount=amount,
+        status=fields.pop('status', 'completed'),
+        balance_after=balance_after,
+        **fields
+    )
+    record_transactions([txn])
+    return txn
+
+
+def credit(profile_id, amount, transaction_type='deposit', **fields):
+    """
+    Add funds to a wallet and record the ledger row
+
+    Args:
+        profile_id: UserProfile id
+        amount: Positive Decimal
+        transaction_type: Transaction.TRANSACTION_TYPES value (default: 'deposit')
+        **fields: Extra Transaction fields (note, job, application, related_user, ...)
+
+    Returns:
+        Transaction: The ledger row (balance_after holds the new balance)
+    """
+    with transaction.atomic():
+        balance = credit_balance(profile_id, amount)
+        return _write_ledger(profile_id, amount, transaction_type, balance, **fields)
+
+
+def debit(profile_id, amount, transaction_type='withdrawal', **fields):
+    """
+    Take funds from a wallet and record the ledger row
+
+    Args:
+        profile_id: UserProfile id
+        amount: Positive Decimal
+        transaction_type: Transaction.TRANSACTION_TYPES value (default: 'withdrawal')
+        **fields: Extra Transaction fields (note, job, application, related_user, ...)
+
+    Returns:
+        Transaction: The ledger row (balance_after holds the new balance)
+
+    Raises:
+        InsufficientFunds: if the wallet cannot cover amount (nothing is written)
+    """
+    with transaction.atomic():
+        balance = debit_balance(profile_id, amount)
+        return _write_ledger(profile_id, amount, transaction_type, balance, **fields)
+
+
+def _group_by_amount(applications, amount_of):
+    groups = {}
+    for app in applications:
+        groups.setdefault(amount_of(app), []).append(app.id)
+    return groups
+
+
+def hold_for_applications(applications):
+    """
+    Move each application's pay from the organizer's wallet into escrow
+
+    One conditional UPDATE checks and reserves the combined amount, so
+    concurrent accepts can never commit more than the wallet holds, however
+    many staff the organizer has already hired. Callers should lock the
+    applications (select_for_update) and pass them with job loaded; all
+    applications must belong to jobs of the same organizer.
+
+    Returns:
+        list: The escrow_hold ledger rows
+
+    Raises:
+        InsufficientFunds: if the wallet cannot cover the combined pay (nothing is written)
+    """
+    from .models import UserProfile, Application, Transaction
+    from .changelog import record_transactions
+
+    applications = list(applications)
+    if not applications:
+        return []
+    organizer_id = applications[0].job.organizer_id
+    total = sum((app.job.pay_rate for app in applications), Decimal('0'))
+
+    with transaction.atomic():
+        updated = UserProfile.objects.filter(id=organizer_id, wallet_balance__gte=total).update(
+            wallet_balance=F('wallet_balance') - total,
+            escrow_balance=F('escrow_balance') + total,
+        )
+        if not updated:
+            raise InsufficientFunds(required=total, available=_current_balance(organizer_id))
+
+        running = _current_balance(organizer_id) + total
+        ledger = []
+        for app in applications:
+            running -= app.job.pay_rate
+            ledger.append(Transaction(
+                user_id=organizer_id,
+                transaction_type='escrow_hold',
+                amount=app.job.pay_rate,
+                status='completed',
+                application_id=app.id,
+                job_id=app.job_id,
+                related_user_id=app.applicant_id,
+                balance_after=running,
+                note=f'Funds held for: {app.job.title}'
+            ))
+        Transaction.objects.bulk_create(ledger, batch_size=1000)
+        record_transactions(ledger)
+
+        for amount, ids in _group_by_amount(applications, lambda app: app.job.pay_rate).items():
+            Application.objects.filter(id__in=ids).update(escrow_amount=F('escrow_amount') + amount)
+        for app in applications:
+            app.escrow_amount = Decimal(app.escrow_amount) + app.job.pay_rate
+
+    return ledger
+
+
+def release_application_holds(applications, note='Escrow refunded'):
+    """
+    Return held funds to the organizer's wallet (rejected, withdrawn or deleted hires)
+
+    Applications without a hold (accepted before escrow existed) are skipped.
+    Callers should lock the applications and pass them with job loaded.
+
+    Returns:
+        list: The refund ledger rows
+    """
+    from .models import UserProfile, Application, Transaction
+    from .changelog import record_transactions
+
+    held = [app for app in applications if app.escrow_amount and app.escrow_amount > 0]
+    if not held:
+        return []
+    organizer_id = held[0].job.organizer_id
+    total = sum((Decimal(app.escrow_amount) for app in held), Decimal('0'))
+
+    with transaction.atomic():
+        UserProfile.objects.filter(id=organizer_id).update(
+            wallet_balance=F('wallet_balance') + total,
+            escrow_balance=F('escrow_balance') - total,
+        )
+        running = _current_balance(organizer_id) - total
+        ledger = []
+        for app in held:
+            running += app.escrow_amount
+            ledger.append(Transaction(
+                user_id=organizer_id,
+                transaction_type='refund',
+                amount=app.escrow_amount,
+                status='completed',
+                application_id=app.id,
+                job_id=app.job_id,
+                related_user_id=app.applicant_id,
+                balance_after=running,
+                note=f'{note}: {app.job.title}'
+            ))
+        Transaction.objects.bulk_create(ledger, batch_size=1000)
+        record_transactions(ledger)
+
+        Application.objects.filter(id__in=[app.id for app in held]).update(escrow_amount=0)
+        for app in held:
+            app.escrow_amount = Decimal('0')
+
+    return ledger
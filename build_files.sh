@@ -9,4 +9,7 @@ python3.9 manage.py makemigrations --noinput
 python3.9 manage.py migrate --noinput
 
 echo "Collect Static..."
-python3.9 manage.py collectstatic --noinput --clear
+# Optional: brotli variants are written next to gzip ones when the package is available
+python3.9 -m pip install brotli || echo "brotli not available, serving gzip variants only"
+# Minify, fingerprint and pre-compress (see EventFlex_app/assets.py)
+STATIC_ASSET_PIPELINE=True python3.9 manage.py collectstatic --noinput --clear